@@ -0,0 +1,38 @@
+-- Up
+-- Analytics aggregate buckets (E6.4)
+-- Privacy: counts per bucket/dimension only - no raw events, no PII (I6)
+
+CREATE TABLE IF NOT EXISTS analytics_aggregates (
+    id TEXT PRIMARY KEY,
+    bucket_type TEXT NOT NULL CHECK(bucket_type IN ('minute', 'hour', 'day')),
+    bucket_start DATETIME NOT NULL,
+    event_type TEXT NOT NULL,
+    content_id TEXT,
+    asset_id TEXT,
+    link_id TEXT,
+    utm_source TEXT,
+    utm_medium TEXT,
+    utm_campaign TEXT,
+    referrer_domain TEXT,
+    ua_class TEXT NOT NULL DEFAULT 'unknown',
+    dims_key TEXT NOT NULL,  -- Canonical encoding of the dimension columns
+    count_total INTEGER NOT NULL DEFAULT 0,
+    count_real INTEGER NOT NULL DEFAULT 0,
+    count_bot INTEGER NOT NULL DEFAULT 0,
+    created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL,
+    UNIQUE(bucket_type, bucket_start, event_type, dims_key)  -- Upsert key
+);
+
+-- Index for dashboard range queries
+CREATE INDEX IF NOT EXISTS idx_analytics_agg_range
+    ON analytics_aggregates(bucket_type, bucket_start, event_type);
+
+-- Index for per-content queries
+CREATE INDEX IF NOT EXISTS idx_analytics_agg_content
+    ON analytics_aggregates(content_id, bucket_type, bucket_start);
+
+-- Down
+DROP INDEX IF EXISTS idx_analytics_agg_content;
+DROP INDEX IF EXISTS idx_analytics_agg_range;
+DROP TABLE IF EXISTS analytics_aggregates;
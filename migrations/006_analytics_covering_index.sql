@@ -0,0 +1,19 @@
+-- Up
+-- Covering index for dashboard queries (E6.4)
+-- Range scans on (bucket_type, bucket_start) read every grouped dimension
+-- and count from the index, so dashboard GROUP BYs never touch the table.
+
+CREATE INDEX IF NOT EXISTS idx_analytics_agg_dashboard
+    ON analytics_aggregates(
+        bucket_type, bucket_start, event_type,
+        content_id, utm_source, utm_medium, referrer_domain,
+        count_total, count_real, count_bot
+    );
+
+-- Superseded: the covering index has the same leading columns
+DROP INDEX IF EXISTS idx_analytics_agg_range;
+
+-- Down
+CREATE INDEX IF NOT EXISTS idx_analytics_agg_range
+    ON analytics_aggregates(bucket_type, bucket_start, event_type);
+DROP INDEX IF EXISTS idx_analytics_agg_dashboard;
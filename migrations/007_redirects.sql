@@ -0,0 +1,22 @@
+-- Up
+-- URL redirects (E7.1, E7.2)
+-- Previously only created by seed_db.py; the redirect middleware reads this
+-- table on every fresh deployment, so it belongs in the schema.
+
+CREATE TABLE IF NOT EXISTS redirects (
+    id TEXT PRIMARY KEY,
+    source_path TEXT,
+    target_path TEXT,
+    status_code INTEGER,
+    enabled BOOLEAN,
+    created_at TEXT,
+    updated_at TEXT,
+    created_by TEXT,
+    notes TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_redirects_source ON redirects(source_path);
+
+-- Down
+DROP INDEX IF EXISTS idx_redirects_source;
+DROP TABLE IF EXISTS redirects;
@@ -0,0 +1,28 @@
+-- Up
+-- Audit log persistence (E8.1)
+-- audit_events gains the remaining AuditEntry fields so the admin audit API
+-- can be backed by SQLite instead of an in-memory list.
+
+ALTER TABLE audit_events ADD COLUMN actor_name TEXT;
+ALTER TABLE audit_events ADD COLUMN description TEXT NOT NULL DEFAULT '';
+ALTER TABLE audit_events ADD COLUMN ip_address TEXT;
+
+-- One index per query shape; each ends in (created_at, id) so newest-first
+-- keyset pagination walks the index without a sort step.
+CREATE INDEX IF NOT EXISTS idx_audit_events_target
+    ON audit_events(target_type, target_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_audit_events_actor
+    ON audit_events(actor_user_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_audit_events_action
+    ON audit_events(action, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_audit_events_created
+    ON audit_events(created_at, id);
+
+-- Down
+DROP INDEX IF EXISTS idx_audit_events_created;
+DROP INDEX IF EXISTS idx_audit_events_action;
+DROP INDEX IF EXISTS idx_audit_events_actor;
+DROP INDEX IF EXISTS idx_audit_events_target;
+ALTER TABLE audit_events DROP COLUMN ip_address;
+ALTER TABLE audit_events DROP COLUMN description;
+ALTER TABLE audit_events DROP COLUMN actor_name;
@@ -0,0 +1,46 @@
+-- Up
+-- Secondary indexes for the repo queries (R3, E5.2, E7.1)
+-- 001_initial.sql created the core tables with primary keys only, so the
+-- scheduler's due-job queries and every content listing scanned the table.
+-- tests/integration/test_query_plans.py asserts the repo queries use these.
+
+-- Due jobs: status IN ('queued', 'retry_wait') then publish_at_utc order.
+-- The status prefix also serves list_pending and claim_next_runnable.
+CREATE INDEX IF NOT EXISTS idx_publish_jobs_status_due
+    ON publish_jobs(status, publish_at_utc);
+-- Idempotency key lookup, per-content listing and delete
+CREATE INDEX IF NOT EXISTS idx_publish_jobs_content
+    ON publish_jobs(content_id, publish_at_utc);
+-- Calendar range queries
+CREATE INDEX IF NOT EXISTS idx_publish_jobs_publish_at
+    ON publish_jobs(publish_at_utc);
+
+-- Newest-first listings: unfiltered, by status, by type (+ status)
+CREATE INDEX IF NOT EXISTS idx_content_items_created
+    ON content_items(created_at);
+CREATE INDEX IF NOT EXISTS idx_content_items_status_created
+    ON content_items(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_content_items_type_status_created
+    ON content_items(type, status, created_at);
+-- Related posts: published items, most recently published first
+CREATE INDEX IF NOT EXISTS idx_content_items_status_published
+    ON content_items(status, published_at);
+
+-- Block hydration loads blocks for a batch of items in position order
+CREATE INDEX IF NOT EXISTS idx_content_blocks_item_position
+    ON content_blocks(content_item_id, position);
+
+-- Admin redirect list, newest first
+CREATE INDEX IF NOT EXISTS idx_redirects_created
+    ON redirects(created_at);
+
+-- Down
+DROP INDEX IF EXISTS idx_redirects_created;
+DROP INDEX IF EXISTS idx_content_blocks_item_position;
+DROP INDEX IF EXISTS idx_content_items_status_published;
+DROP INDEX IF EXISTS idx_content_items_type_status_created;
+DROP INDEX IF EXISTS idx_content_items_status_created;
+DROP INDEX IF EXISTS idx_content_items_created;
+DROP INDEX IF EXISTS idx_publish_jobs_publish_at;
+DROP INDEX IF EXISTS idx_publish_jobs_content;
+DROP INDEX IF EXISTS idx_publish_jobs_status_due;
@@ -0,0 +1,13 @@
+-- Up
+-- Newsletter export keyset pagination (E16.4, TA-0087)
+-- The streaming export pages through subscribers on (created_at, id),
+-- optionally within one status; each page seeks straight to its start.
+
+CREATE INDEX IF NOT EXISTS idx_newsletter_created
+    ON newsletter_subscribers(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_newsletter_status_created
+    ON newsletter_subscribers(status, created_at, id);
+
+-- Down
+DROP INDEX IF EXISTS idx_newsletter_status_created;
+DROP INDEX IF EXISTS idx_newsletter_created;
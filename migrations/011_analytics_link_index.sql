@@ -0,0 +1,14 @@
+-- Up
+-- Per-link outbound click queries (E6.2, E6.4)
+-- The admin link report filters on one link_id and event type over a
+-- bucket range; this index seeks straight to those rows and covers the
+-- counts, so the report never touches the table.
+
+CREATE INDEX IF NOT EXISTS idx_analytics_agg_link
+    ON analytics_aggregates(
+        link_id, bucket_type, event_type, bucket_start,
+        count_total, count_real, count_bot
+    );
+
+-- Down
+DROP INDEX IF EXISTS idx_analytics_agg_link;
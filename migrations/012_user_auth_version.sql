@@ -0,0 +1,11 @@
+-- Up
+-- Per-user principal version (E1)
+-- Every user save bumps auth_version. API workers cache resolved
+-- principals in process memory; a cache hit is only served while the
+-- row's auth_version still matches, so a status or role change made
+-- through one worker is seen by all of them.
+
+ALTER TABLE users ADD COLUMN auth_version INTEGER NOT NULL DEFAULT 0;
+
+-- Down
+ALTER TABLE users DROP COLUMN auth_version;
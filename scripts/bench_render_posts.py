@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Rich Text Render Microbenchmark (TA-0025).
+
+Renders a large generated document (default ~10k nodes) the way the admin
+preview does - HTML, plain text and headings - and compares the recursive
+node renderers against the single-pass RenderEngine, uncached and cached.
+
+Usage:
+    python scripts/bench_render_posts.py [--nodes N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.components.render_posts import (  # noqa: E402
+    RenderConfig,
+    RenderEngine,
+    render_document,
+    render_node,
+)
+
+_WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod".split()
+_MARKS: list[list[dict[str, Any]]] = [
+    [],
+    [],
+    [{"type": "bold"}],
+    [{"type": "italic"}],
+    [{"type": "link", "attrs": {"href": "https://example.com/a?b=1&c=2"}}],
+]
+
+
+def _count(node: dict[str, Any]) -> int:
+    return 1 + sum(_count(child) for child in node.get("content", []))
+
+
+def build_document(target_nodes: int, seed: int = 11) -> dict[str, Any]:
+    """Generate a post of roughly target_nodes nodes (sections of mixed blocks)."""
+    rng = random.Random(seed)
+
+    def text() -> dict[str, Any]:
+        node: dict[str, Any] = {"type": "text", "text": " ".join(rng.choices(_WORDS, k=6)) + " "}
+        marks = rng.choice(_MARKS)
+        if marks:
+            node["marks"] = marks
+        return node
+
+    def paragraph() -> dict[str, Any]:
+        return {"type": "paragraph", "content": [text() for _ in range(rng.randint(2, 6))]}
+
+    blocks: list[dict[str, Any]] = []
+    nodes = 1
+    while nodes < target_nodes:
+        section = [
+            {"type": "heading", "attrs": {"level": rng.randint(2, 3)}, "content": [text()]},
+            paragraph(),
+            {
+                "type": "bulletList",
+                "content": [
+                    {"type": "listItem", "content": [paragraph()]} for _ in range(rng.randint(2, 4))
+                ],
+            },
+            {"type": "blockquote", "content": [paragraph()]},
+            {"type": "codeBlock", "attrs": {"language": "python"}, "content": [text()]},
+            paragraph(),
+        ]
+        blocks.extend(section)
+        nodes += sum(_count(block) for block in section)
+    return {"type": "doc", "content": blocks}
+
+
+def _text(node: dict[str, Any]) -> str:
+    if node.get("type") == "text":
+        return str(node.get("text", ""))
+    return "".join(_text(child) for child in node.get("content", []))
+
+
+def _headings(node: dict[str, Any]) -> int:
+    own = 1 if node.get("type") == "heading" else 0
+    if own:
+        _text(node)  # the heading outline re-extracts each heading's text
+    return own + sum(_headings(child) for child in node.get("content", []))
+
+
+def _recursive_preview(doc: dict[str, Any], config: RenderConfig) -> tuple[str, str, int]:
+    """The previous preview path: render, then walk again for text and headings."""
+    html = render_node(doc, config)
+    if config.wrap_in_article:
+        html = f"<article>{html}</article>"
+    return html, _text(doc), _headings(doc)
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark rich text rendering")
+    parser.add_argument("--nodes", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    doc = build_document(args.nodes)
+    config = RenderConfig()
+    engine = RenderEngine()
+
+    expected_html, expected_text, expected_headings = _recursive_preview(doc, config)
+    rendered = render_document(doc, config)
+    parity = (
+        rendered.html == expected_html
+        and rendered.plain_text == expected_text
+        and len(rendered.headings) == expected_headings
+    )
+
+    engine.render(doc, config)  # warm the cache
+    results = {
+        "recursive (3 walks)": _time(lambda: _recursive_preview(doc, config), args.repeat),
+        "single pass": _time(lambda: render_document(doc, config), args.repeat),
+        "engine (cached)": _time(lambda: engine.render(doc, config), args.repeat),
+    }
+
+    baseline = results["recursive (3 walks)"]
+    print(f"{_count(doc):,} nodes, {len(expected_html) / 1024:,.0f} KiB of HTML\n")
+    for name, elapsed in results.items():
+        print(f"{name:<22} {elapsed * 1000:9.2f} ms/render  x{baseline / elapsed:6.1f}")
+
+    if not parity:
+        print("MISMATCH between recursive and single-pass output")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
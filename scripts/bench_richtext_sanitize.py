@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+HTML Sanitizer Microbenchmark (TA-0021).
+
+Sanitizes a large Word-style paste (styled spans, class-heavy paragraphs,
+conditional comments, tables) with the single-scan HTMLSanitizer and with
+the original per-tag regex callback, and reports time and warning volume.
+
+Usage:
+    python scripts/bench_richtext_sanitize.py [--kib N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import random
+import re
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Add project root to path for imports
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.components.richtext import (  # noqa: E402
+    RichTextConfig,
+    RichTextValidationError,
+    build_link_rel,
+    parse_attributes,
+    sanitize_html,
+    sanitize_url,
+)
+
+_WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod".split()
+_STYLES = (
+    "mso-bidi-font-family:Calibri;mso-ansi-language:EN-US",
+    "font-size:11.0pt;line-height:107%;font-family:&quot;Calibri&quot;,sans-serif",
+    "color:#1F3864;mso-themecolor:accent1;mso-themeshade:128",
+)
+
+_TAG_PATTERN = re.compile(r"<(/?)(\w+)([^>]*)>", re.IGNORECASE)
+
+
+def legacy_sanitize(
+    html_content: str, config: RichTextConfig
+) -> tuple[str, list[RichTextValidationError]]:
+    """The original regex callback sanitizer, kept for comparison."""
+    errors: list[RichTextValidationError] = []
+    link_count = 0
+
+    def warn(code: str, message: str) -> None:
+        errors.append(RichTextValidationError(code=code, message=message))
+
+    def process_tag(match: re.Match[str]) -> str:
+        nonlocal link_count
+        tag_name = match.group(2).lower()
+        if tag_name not in config.allow_tags:
+            warn("stripped_tag", f"Tag '{tag_name}' was stripped")
+            return ""
+        if match.group(1):
+            return f"</{tag_name}>"
+
+        allowed = config.allow_attrs.get(tag_name, frozenset())
+        attrs: dict[str, str] = {}
+        for name, value in parse_attributes(match.group(3)).items():
+            if name in allowed:
+                attrs[name] = value
+            else:
+                warn("stripped_attribute", f"Attribute '{name}' stripped from '{tag_name}'")
+
+        if tag_name == "a":
+            link_count += 1
+            href = sanitize_url(attrs.get("href", ""), config)
+            if link_count > config.max_links_per_doc or href is None:
+                warn("unsafe_url", "Unsafe link")
+                return ""
+            attrs["href"] = href
+            rel = build_link_rel(config)
+            if rel:
+                attrs["rel"] = rel
+        if tag_name == "img":
+            src = sanitize_url(attrs.get("src", ""), config)
+            if src is None:
+                warn("unsafe_url", "Unsafe image")
+                return ""
+            attrs["src"] = src
+
+        if attrs:
+            parts = [f'{name}="{html.escape(value)}"' for name, value in attrs.items()]
+            return f"<{tag_name} {' '.join(parts)}>"
+        return f"<{tag_name}>"
+
+    return _TAG_PATTERN.sub(process_tag, html_content), errors
+
+
+def build_paste(target_kib: int, seed: int = 7) -> str:
+    """Generate Word-style HTML of roughly target_kib KiB."""
+    rng = random.Random(seed)
+
+    def run() -> str:
+        words = " ".join(rng.choices(_WORDS, k=rng.randint(2, 8)))
+        style = rng.choice(_STYLES)
+        if rng.random() < 0.2:
+            return f'<b><span lang="EN-US" style="{style}">{words}</span></b> '
+        if rng.random() < 0.05:
+            return f'<a href="https://example.com/{rng.randint(1, 99)}?a=1&amp;b=2">{words}</a> '
+        return f'<span lang="EN-US" style="{style}">{words}</span> '
+
+    def paragraph() -> str:
+        runs = "".join(run() for _ in range(rng.randint(3, 10)))
+        return f'<p class="MsoNormal" style="margin-bottom:0cm">{runs}<o:p></o:p></p>\n'
+
+    parts = ['<html xmlns:o="urn:schemas-microsoft-com:office:office"><body lang="EN-US">\n']
+    size = 0
+    while size < target_kib * 1024:
+        block = paragraph()
+        roll = rng.random()
+        if roll < 0.1:
+            block = f"<!--[if !supportLists]--><span>·</span><!--[endif]-->{block}"
+        elif roll < 0.15:
+            cells = "".join(f'<td width="200" valign="top">{paragraph()}</td>' for _ in range(3))
+            block = f'<table class="MsoTableGrid" border="1"><tr>{cells}</tr></table>\n'
+        parts.append(block)
+        size += len(block)
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark HTML sanitization")
+    parser.add_argument("--kib", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    paste = build_paste(args.kib)
+    config = RichTextConfig()
+
+    _, legacy_errors = legacy_sanitize(paste, config)
+    sanitized, errors = sanitize_html(paste, config)
+
+    results = {
+        "regex callback": _time(lambda: legacy_sanitize(paste, config), args.repeat),
+        "single scan": _time(lambda: sanitize_html(paste, config), args.repeat),
+    }
+
+    baseline = results["regex callback"]
+    print(f"{len(paste) / 1024:,.0f} KiB in, {len(sanitized) / 1024:,.0f} KiB out\n")
+    for name, elapsed in results.items():
+        print(f"{name:<16} {elapsed * 1000:9.2f} ms/sanitize  x{baseline / elapsed:5.1f}")
+    print(
+        f"\nwarnings: {len(legacy_errors):,} error objects before, "
+        f"{len(errors)} distinct ({sum(e.count for e in errors):,} occurrences) now"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
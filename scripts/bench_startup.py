@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Cold-Start Import Benchmark.
+
+Imports each entry point in a fresh interpreter under `python -X importtime`
+and reports the total import time, the number of modules loaded and the
+slowest modules. Scale-to-zero deploys pay this cost on every cold start.
+
+The committed baseline (scripts/startup_baseline.json) is what
+tests/unit/test_startup_imports.py compares against when run with
+LAB_STARTUP_BENCH=1; refresh it with --update-baseline on the machine that
+runs that comparison after an intentional change.
+
+Usage:
+    python scripts/bench_startup.py [--runs N] [--top N] [--update-baseline]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+BASELINE_PATH = Path(__file__).parent / "startup_baseline.json"
+
+# Entry points: the FastAPI app and the Flet UI context
+ENTRY_POINTS = ("src.api.main", "src.ui.context")
+
+# Optional subsystems that must only be imported when first used
+DEFERRED_MODULES = ("matplotlib", "argon2", "jose", "passlib", "PIL")
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """One cold import of a module."""
+
+    module: str
+    total_us: int  # sum of per-module self times
+    module_count: int
+    modules: dict[str, int]  # top-level package -> cumulative self time (us)
+
+    def top(self, n: int) -> list[tuple[str, int]]:
+        return sorted(self.modules.items(), key=lambda kv: kv[1], reverse=True)[:n]
+
+
+def parse_importtime(stderr: str) -> tuple[int, int, dict[str, int]]:
+    """
+    Parse `-X importtime` output.
+
+    Returns:
+        (total self time in us, modules imported, self time per top-level package)
+    """
+    total = 0
+    count = 0
+    packages: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Header row
+        self_us = int(fields[0])
+        name = fields[2].strip()
+        total += self_us
+        count += 1
+        root = name.split(".")[0] if not name.startswith("src.") else ".".join(name.split(".")[:3])
+        packages[root] = packages.get(root, 0) + self_us
+    return total, count, packages
+
+
+def profile_import(module: str) -> ImportProfile:
+    """Import `module` in a fresh interpreter and profile it."""
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONPROFILEIMPORTTIME"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total, count, packages = parse_importtime(result.stderr)
+    return ImportProfile(module, total, count, packages)
+
+
+def loaded_modules(module: str) -> set[str]:
+    """Names in sys.modules after importing `module` in a fresh interpreter."""
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def median_profile(module: str, runs: int) -> ImportProfile:
+    """Profile with the median total time of `runs` imports (the first warms .pyc files)."""
+    profile_import(module)
+    profiles = sorted((profile_import(module) for _ in range(runs)), key=lambda p: p.total_us)
+    return profiles[len(profiles) // 2]
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, dict[str, int]]:
+    """Committed baseline: module -> {"total_us", "module_count"}."""
+    data: dict[str, dict[str, int]] = json.loads(path.read_text())["entry_points"]
+    return data
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark cold-start imports")
+    parser.add_argument("--runs", type=int, default=5, help="Imports per entry point")
+    parser.add_argument("--top", type=int, default=10, help="Slowest packages to list")
+    parser.add_argument(
+        "--update-baseline", action="store_true", help=f"Write {BASELINE_PATH.name}"
+    )
+    args = parser.parse_args()
+
+    baseline = load_baseline() if BASELINE_PATH.exists() else {}
+    results: dict[str, dict[str, int]] = {}
+
+    for module in ENTRY_POINTS:
+        profile = median_profile(module, args.runs)
+        results[module] = {"total_us": profile.total_us, "module_count": profile.module_count}
+
+        print(f"\n{module}")
+        print(f"  import time:  {profile.total_us / 1000:8.1f} ms (median of {args.runs})")
+        print(f"  modules:      {profile.module_count:8d}")
+        if module in baseline:
+            base = baseline[module]
+            print(
+                f"  vs baseline:  {profile.total_us / base['total_us']:8.2f}x time, "
+                f"{profile.module_count - base['module_count']:+d} modules"
+            )
+        deferred = sorted(m for m in DEFERRED_MODULES if m in loaded_modules(module))
+        print(f"  deferred imports loaded: {', '.join(deferred) or 'none'}")
+        print("  slowest packages:")
+        for name, self_us in profile.top(args.top):
+            print(f"    {self_us / 1000:8.1f} ms  {name}")
+
+    if args.update_baseline:
+        payload = {
+            "python": f"{sys.version_info.major}.{sys.version_info.minor}",
+            "entry_points": results,
+        }
+        BASELINE_PATH.write_text(json.dumps(payload, indent=2) + "\n")
+        print(f"\nWrote {BASELINE_PATH.relative_to(PROJECT_ROOT)}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
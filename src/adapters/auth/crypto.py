@@ -2,9 +2,6 @@ import hashlib
 from datetime import timedelta
 from typing import Any
 
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
-
 from src.api.auth_utils import (
     create_access_token,
     decode_access_token,
@@ -35,12 +32,17 @@ class JWTAuthAdapter:
 
 class Argon2AuthAdapter:
     def __init__(self) -> None:
+        # Imported here so startup does not pay for argon2 unless this adapter is used
+        from argon2 import PasswordHasher
+
         self.ph = PasswordHasher()
 
     def hash_password(self, password: str) -> str:
         return str(self.ph.hash(password))
 
     def verify_password(self, password: str, hash_str: str) -> bool:
+        from argon2.exceptions import VerifyMismatchError
+
         try:
             self.ph.verify(hash_str, password)
             return True
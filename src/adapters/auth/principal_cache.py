@@ -0,0 +1,233 @@
+"""
+Principal Cache - Short-TTL cache of authenticated principals.
+
+Every admin request resolves its bearer token to a User: JWT decode, a users
+row and a role_assignments query. Dashboards fire many calls in parallel
+with the same token, so the resolved (user, roles) is cached per token for a
+few seconds.
+
+Key behaviors:
+- Keyed by SHA-256 of the token; raw tokens are never held as keys
+- An entry lives for ttl_seconds, and never past the token's own exp
+- invalidate_principal(user_id) drops that user's entries from every live
+  cache in this process; user saves (status, roles, profile) and session
+  revocation call it
+- With a version_source (the users.auth_version column), a hit is only
+  served while the user's version is unchanged, so saves made by other
+  worker processes are seen too. That costs one primary-key read per hit
+  instead of the JWT decode, user row and role queries
+- A lookup that started before an invalidation cannot store its result
+  (generation check), so a save racing a cache miss is not lost
+- Bounded LRU (max_entries); stats() reports hit/miss counters
+- get() returns a copy, so callers cannot mutate the cached principal
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.entities import User
+from src.domain.stats import CacheCounters
+
+DEFAULT_TTL_SECONDS = 30.0
+DEFAULT_MAX_ENTRIES = 1024
+
+
+@dataclass(frozen=True)
+class PrincipalCacheStats(CacheCounters):
+    invalidations: int  # entries dropped by invalidate_user()
+    stale: int  # hits dropped because the user's version changed
+    evictions: int  # entries dropped by the LRU bound
+    size: int
+
+
+@dataclass(frozen=True)
+class _Entry:
+    user: User
+    expires_at: float
+    version: int | None
+
+
+class PrincipalCache:
+    """Token -> active User cache (thread-safe)."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+        version_source: Callable[[UUID], int | None] | None = None,
+    ) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: Lifetime of an entry (0 disables caching)
+            max_entries: LRU bound on cached tokens
+            clock: Wall-clock seconds, comparable with JWT exp
+            version_source: Current version of a user (None if missing),
+                checked on every hit
+        """
+        self._ttl = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._clock = clock
+        self._version_source = version_source
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._by_user: dict[UUID, set[str]] = {}
+        self._generation = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._stale = 0
+        self._evictions = 0
+
+        _live_caches.add(self)
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    @property
+    def generation(self) -> int:
+        """Snapshot before resolving a miss; pass it back to put()."""
+        return self._generation
+
+    def get(self, token: str) -> User | None:
+        """Cached principal for a token, or None on a miss, expiry or version change."""
+        key = _key(token)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= now:
+                if entry is not None:
+                    self._remove(key, entry)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+
+        if self.current_version(entry.user.id) != entry.version:
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    self._remove(key, entry)
+                self._stale += 1
+                self._misses += 1
+            return None
+
+        with self._lock:
+            self._hits += 1
+        return entry.user.model_copy(update={"roles": list(entry.user.roles)})
+
+    def current_version(self, user_id: UUID) -> int | None:
+        """
+        User's version from the version_source (None without one).
+
+        Read it before loading the user and pass it to put(), so a save
+        landing in between leaves the entry stale rather than current.
+        """
+        if self._version_source is None:
+            return None
+        return self._version_source(user_id)
+
+    def put(
+        self,
+        token: str,
+        user: User,
+        *,
+        generation: int,
+        version: int | None = None,
+        token_expires_at: float | None = None,
+    ) -> bool:
+        """
+        Cache a resolved principal.
+
+        Skipped (returns False) when caching is disabled or an invalidation
+        happened since `generation` was read.
+        """
+        if not self.enabled:
+            return False
+        expires_at = self._clock() + self._ttl
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+
+        key = _key(token)
+        cached = user.model_copy(update={"roles": list(user.roles)})
+        with self._lock:
+            if generation != self._generation:
+                return False
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._unlink(key, old)
+            self._entries[key] = _Entry(user=cached, expires_at=expires_at, version=version)
+            self._by_user.setdefault(user.id, set()).add(key)
+            while len(self._entries) > self._max_entries:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self._unlink(evicted_key, evicted)
+                self._evictions += 1
+        return True
+
+    def invalidate_user(self, user_id: UUID) -> int:
+        """Drop every cached token of a user; returns entries removed."""
+        user_id = UUID(str(user_id))  # callers pass UUIDs or their strings
+        with self._lock:
+            self._generation += 1
+            keys = self._by_user.pop(user_id, set())
+            for key in keys:
+                self._entries.pop(key, None)
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._by_user.clear()
+
+    def stats(self) -> PrincipalCacheStats:
+        """Snapshot of cache counters."""
+        with self._lock:
+            return PrincipalCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                stale=self._stale,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def _remove(self, key: str, entry: _Entry) -> None:
+        # Caller holds the lock
+        del self._entries[key]
+        self._unlink(key, entry)
+
+    def _unlink(self, key: str, entry: _Entry) -> None:
+        # Caller holds the lock
+        keys = self._by_user.get(entry.user.id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[entry.user.id]
+
+
+def _key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+# Every cache in the process, so writers can invalidate without holding one
+_live_caches: weakref.WeakSet[PrincipalCache] = weakref.WeakSet()
+
+
+def invalidate_principal(user_id: UUID) -> None:
+    """Drop a user's cached principals from every live cache."""
+    for cache in list(_live_caches):
+        cache.invalidate_user(user_id)
@@ -6,6 +6,7 @@ For production, consider SQLite or Redis backed implementations.
 
 from uuid import UUID
 
+from src.adapters.auth.principal_cache import invalidate_principal
 from src.domain.entities import Session
 
 
@@ -32,6 +33,8 @@ class InMemorySessionStore:
         tokens_to_remove = [k for k, v in self._sessions.items() if str(v.user_id) == str(user_id)]
         for token in tokens_to_remove:
             del self._sessions[token]
+        # Revocation also applies to principals cached for API tokens
+        invalidate_principal(user_id)
         return len(tokens_to_remove)
 
     def clear(self) -> None:
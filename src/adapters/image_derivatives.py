@@ -0,0 +1,436 @@
+"""
+Image Derivatives (E2.2) - Width-bucketed renditions of uploaded images.
+
+Uploaded images are otherwise only served at original size, so a phone
+downloads the same multi-megabyte original as a desktop. After an upload,
+ImageDerivativeWorker re-encodes the image at a few standard widths on a
+background thread pool, and rendered <img> tags list them in srcset.
+
+Key behaviors:
+- Widths in DERIVATIVE_WIDTHS narrower than the original are produced
+  (never upscaled), EXIF-rotated and re-encoded as WebP
+- Variants are stored content-addressed next to the original
+  (assets/{id}/v{n}/derived/{sha256}.webp); a manifest
+  (assets/{id}/v{n}/derivatives.json) records their widths and the
+  original's intrinsic size. The manifest is written last, so its presence
+  means the set is complete
+- Everything is immutable: a version's variants never change once written
+- DerivativeIndex resolves an /assets/... image src to a ResponsiveImage
+  for the renderer, loading manifests lazily and caching them
+- Decode/encode failures are logged and counted; the original still serves
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import posixpath
+import re
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any
+from uuid import UUID
+
+from src.components.render_posts import ImageVariant, ResponsiveImage
+from src.core.entities import AssetVersion
+from src.core.ports.storage import KeyExistsError, KeyNotFoundError, StoragePort
+from src.domain.stats import CounterSnapshot
+
+logger = logging.getLogger(__name__)
+
+# srcset width buckets (CSS pixels at 1x, and 2x for a 768px column)
+DERIVATIVE_WIDTHS = (320, 640, 960, 1280, 1920)
+
+# GIFs are left alone: re-encoding would drop animation
+DERIVATIVE_SOURCE_TYPES = frozenset({"image/jpeg", "image/png", "image/webp"})
+DERIVATIVE_MIME_TYPE = "image/webp"
+DERIVATIVE_QUALITY = 80
+
+MANIFEST_NAME = "derivatives.json"
+DEFAULT_MAX_WORKERS = 2
+
+# Unknown manifests are re-checked after this long (another process may write them)
+DEFAULT_NEGATIVE_TTL_SECONDS = 30.0
+
+_UUID = r"[0-9a-fA-F-]{36}"
+_ASSET_SRC = re.compile(
+    rf"^(?P<base>(?:https?://[^/?#]+)?(?:/[^?#]*)?/assets)/(?P<asset>{_UUID})/"
+    rf"(?:v/(?P<version>{_UUID})|latest)/?(?:[?#].*)?$"
+)
+
+
+# --- Manifest ---
+
+
+@dataclass(frozen=True)
+class Derivative:
+    """One stored rendition."""
+
+    width: int
+    height: int
+    storage_key: str
+    sha256: str
+    size_bytes: int
+    mime_type: str = DERIVATIVE_MIME_TYPE
+
+
+@dataclass(frozen=True)
+class DerivativeManifest:
+    """Intrinsic size of an original and its renditions (narrowest first)."""
+
+    source_key: str
+    width: int
+    height: int
+    derivatives: tuple[Derivative, ...] = ()
+
+    def get(self, width: int) -> Derivative | None:
+        """Rendition with exactly this width."""
+        for derivative in self.derivatives:
+            if derivative.width == width:
+                return derivative
+        return None
+
+    def to_json(self) -> bytes:
+        return json.dumps(asdict(self), separators=(",", ":")).encode("utf-8")
+
+    @classmethod
+    def from_json(cls, data: bytes) -> DerivativeManifest:
+        raw: dict[str, Any] = json.loads(data)
+        return cls(
+            source_key=raw["source_key"],
+            width=raw["width"],
+            height=raw["height"],
+            derivatives=tuple(Derivative(**d) for d in raw["derivatives"]),
+        )
+
+
+def manifest_key(source_key: str) -> str:
+    """Storage key of the manifest for an original."""
+    return f"{posixpath.dirname(source_key)}/{MANIFEST_NAME}"
+
+
+def derivative_key(source_key: str, sha256: str) -> str:
+    """Content-addressed storage key of a rendition, next to its original."""
+    return f"{posixpath.dirname(source_key)}/derived/{sha256}.webp"
+
+
+def load_manifest(storage: StoragePort, source_key: str) -> DerivativeManifest | None:
+    """Manifest for an original, or None if derivatives were not generated."""
+    try:
+        data, _ = storage.get(manifest_key(source_key))
+    except KeyNotFoundError:
+        return None
+    return DerivativeManifest.from_json(data)
+
+
+# --- Encoding ---
+
+
+def encode_derivatives(
+    data: bytes,
+    widths: tuple[int, ...] = DERIVATIVE_WIDTHS,
+    *,
+    quality: int = DERIVATIVE_QUALITY,
+) -> tuple[tuple[int, int], list[tuple[int, int, bytes]]]:
+    """
+    Decode an image and re-encode it at each width narrower than the original.
+
+    Returns:
+        ((width, height) of the upright original, [(width, height, webp bytes)])
+
+    Raises:
+        PIL.UnidentifiedImageError / OSError: If the bytes are not a readable image
+        PIL.Image.DecompressionBombError: If the image has too many pixels
+    """
+    from PIL import Image, ImageOps  # Deferred: only the worker thread needs Pillow
+
+    with Image.open(io.BytesIO(data)) as opened:
+        image = ImageOps.exif_transpose(opened)
+        image.load()
+
+    width, height = image.size
+    has_alpha = "A" in image.getbands() or "transparency" in image.info
+    mode = "RGBA" if has_alpha else "RGB"
+    if image.mode != mode:
+        image = image.convert(mode)
+
+    encoded = []
+    for target in sorted(set(widths)):
+        if target >= width:
+            break
+        size = (target, max(1, round(height * target / width)))
+        # reducing_gap pre-shrinks with a cheap box filter before LANCZOS
+        resized = image.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+        buffer = io.BytesIO()
+        resized.save(buffer, "WEBP", quality=quality, method=4)
+        encoded.append((size[0], size[1], buffer.getvalue()))
+    return (width, height), encoded
+
+
+def generate_derivatives(
+    storage: StoragePort,
+    source_key: str,
+    mime_type: str,
+    *,
+    widths: tuple[int, ...] = DERIVATIVE_WIDTHS,
+    quality: int = DERIVATIVE_QUALITY,
+) -> DerivativeManifest | None:
+    """
+    Generate and store renditions for an original (idempotent).
+
+    Returns the manifest, or None for types that get no derivatives.
+    """
+    if mime_type not in DERIVATIVE_SOURCE_TYPES:
+        return None
+    existing = load_manifest(storage, source_key)
+    if existing is not None:
+        return existing
+
+    data, _ = storage.get(source_key)
+    (width, height), encoded = encode_derivatives(data, widths, quality=quality)
+
+    derivatives = []
+    for variant_width, variant_height, blob in encoded:
+        sha256 = hashlib.sha256(blob).hexdigest()
+        key = derivative_key(source_key, sha256)
+        try:
+            storage.put(key, blob, DERIVATIVE_MIME_TYPE, expected_sha256=sha256)
+        except KeyExistsError:
+            pass  # Same key means same bytes
+        derivatives.append(
+            Derivative(
+                width=variant_width,
+                height=variant_height,
+                storage_key=key,
+                sha256=sha256,
+                size_bytes=len(blob),
+            )
+        )
+
+    manifest = DerivativeManifest(
+        source_key=source_key,
+        width=width,
+        height=height,
+        derivatives=tuple(derivatives),
+    )
+    try:
+        storage.put(manifest_key(source_key), manifest.to_json(), "application/json")
+    except KeyExistsError:
+        # A concurrent run finished first; its manifest is authoritative
+        return load_manifest(storage, source_key)
+    return manifest
+
+
+# --- Lookup for rendering ---
+
+
+class DerivativeIndex:
+    """
+    Resolves image srcs to ResponsiveImage (ResponsiveImagePort).
+
+    Understands the public asset routes, .../assets/{asset_id}/v/{version_id}
+    and .../assets/{asset_id}/latest; variant URLs always use the immutable
+    versioned form. Found manifests are cached for good (they never change);
+    misses are re-checked after negative_ttl_seconds.
+    """
+
+    def __init__(
+        self,
+        storage: StoragePort,
+        version_repo: Any,
+        *,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize index.
+
+        Args:
+            storage: Object storage holding originals and manifests
+            version_repo: Asset version repo (get_by_id, get_latest)
+            negative_ttl_seconds: How long a missing manifest is remembered
+            clock: Monotonic seconds
+        """
+        self._storage = storage
+        self._version_repo = version_repo
+        self._negative_ttl = negative_ttl_seconds
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._manifests: dict[UUID, DerivativeManifest] = {}
+        self._missing: dict[UUID, float] = {}  # version id -> re-check after
+        self._generation = 0
+
+        _live_indexes.add(self)
+
+    def __repr__(self) -> str:
+        # Part of the render cache key: changes whenever a manifest appears
+        return f"{type(self).__name__}(generation={self._generation})"
+
+    def publish(self, version_id: UUID, manifest: DerivativeManifest) -> None:
+        """Record a freshly generated manifest."""
+        with self._lock:
+            self._missing.pop(version_id, None)
+            if version_id not in self._manifests:
+                self._manifests[version_id] = manifest
+                self._generation += 1
+
+    def manifest(self, version: AssetVersion) -> DerivativeManifest | None:
+        """Manifest for an asset version (None until derivatives exist)."""
+        now = self._clock()
+        with self._lock:
+            cached = self._manifests.get(version.id)
+            if cached is not None:
+                return cached
+            if self._missing.get(version.id, 0.0) > now:
+                return None
+
+        manifest = load_manifest(self._storage, version.storage_key)
+        if manifest is None:
+            with self._lock:
+                self._missing[version.id] = now + self._negative_ttl
+            return None
+        self.publish(version.id, manifest)
+        return manifest
+
+    def responsive_image(self, src: str) -> ResponsiveImage | None:
+        """Intrinsic size and variants for an asset src (None if unknown)."""
+        match = _ASSET_SRC.match(src)
+        if match is None:
+            return None
+        asset_id = UUID(match["asset"])
+        if match["version"]:
+            version = self._version_repo.get_by_id(UUID(match["version"]))
+        else:
+            version = self._version_repo.get_latest(asset_id)
+        if version is None or version.asset_id != asset_id:
+            return None
+
+        manifest = self.manifest(version)
+        if manifest is None:
+            return None
+        base = f"{match['base']}/{asset_id}/v/{version.id}/w"
+        return ResponsiveImage(
+            width=manifest.width,
+            height=manifest.height,
+            variants=tuple(
+                ImageVariant(url=f"{base}/{d.width}", width=d.width) for d in manifest.derivatives
+            ),
+        )
+
+
+# Every index in the process, so the worker can publish without holding one
+_live_indexes: weakref.WeakSet[DerivativeIndex] = weakref.WeakSet()
+
+
+def publish_manifest(version_id: UUID, manifest: DerivativeManifest) -> None:
+    """Record a new manifest in every live index."""
+    for index in list(_live_indexes):
+        index.publish(version_id, manifest)
+
+
+# --- Background worker ---
+
+
+@dataclass(frozen=True)
+class DerivativeWorkerStats(CounterSnapshot):
+    generated: int  # versions whose derivatives are now stored
+    failed: int
+    pending: int
+
+
+class ImageDerivativeWorker:
+    """Generates derivatives for uploaded versions on a thread pool."""
+
+    def __init__(
+        self,
+        storage: StoragePort,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        widths: tuple[int, ...] = DERIVATIVE_WIDTHS,
+        quality: int = DERIVATIVE_QUALITY,
+    ) -> None:
+        """Initialize worker (call start() before submitting)."""
+        self._storage = storage
+        self._max_workers = max(1, max_workers)
+        self._widths = widths
+        self._quality = quality
+
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._generated = 0
+        self._failed = 0
+        self._pending = 0
+
+    def start(self) -> None:
+        """Start the thread pool (idempotent)."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="image-derivatives",
+                )
+
+    def stop(self, wait: bool = True) -> None:
+        """Stop accepting work; by default finish what was submitted."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    @property
+    def is_running(self) -> bool:
+        return self._executor is not None
+
+    def submit(self, version: AssetVersion) -> Future[DerivativeManifest | None] | None:
+        """
+        Queue derivative generation for a stored version.
+
+        Returns None (nothing queued) for types that get no derivatives or
+        when the worker is not running.
+        """
+        if version.mime_type not in DERIVATIVE_SOURCE_TYPES:
+            return None
+        with self._lock:
+            if self._executor is None:
+                return None
+            self._pending += 1
+            return self._executor.submit(self._generate, version)
+
+    def _generate(self, version: AssetVersion) -> DerivativeManifest | None:
+        try:
+            manifest = generate_derivatives(
+                self._storage,
+                version.storage_key,
+                version.mime_type,
+                widths=self._widths,
+                quality=self._quality,
+            )
+        except Exception:
+            logger.exception("Image derivatives failed for %s", version.storage_key)
+            with self._lock:
+                self._pending -= 1
+                self._failed += 1
+            return None
+
+        if manifest is not None:
+            publish_manifest(version.id, manifest)
+        with self._lock:
+            self._pending -= 1
+            self._generated += 1
+        return manifest
+
+    def stats(self) -> DerivativeWorkerStats:
+        """Snapshot of worker counters."""
+        with self._lock:
+            return DerivativeWorkerStats(
+                generated=self._generated,
+                failed=self._failed,
+                pending=self._pending,
+            )
@@ -0,0 +1,290 @@
+"""
+Storage Integrity Verification Cache and Scrubber (I3).
+
+LocalFileStorage enforces I3 (sha256 stored equals sha256 served) on every
+read. Hashing the whole object per request is wasted work once a file has
+been verified and has not changed, so verified files are remembered here.
+
+Spec refs: P2, E3, R2
+Invariants:
+- I3: AssetVersion bytes are immutable; sha256 stored equals sha256 served
+
+Key behaviors:
+- Cache entries are keyed on path and fingerprinted by (inode, size,
+  mtime_ns); any change to the file's stat forces a full re-hash
+- Optional reverify_after_seconds bounds how long a verification is trusted
+- Bounded LRU; counters report cached vs full verifications
+- IntegrityScrubber walks the store a batch at a time (on demand or on a
+  background schedule), re-hashing every object to catch silent corruption
+  that leaves the stat unchanged, and reports corrupt keys
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from src.core.ports.storage import IntegrityError, KeyNotFoundError
+from src.domain.stats import CounterSnapshot, ratio
+
+if TYPE_CHECKING:
+    from src.adapters.local_storage import LocalFileStorage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+# (inode, size, mtime_ns)
+Fingerprint = tuple[int, int, int]
+
+
+def fingerprint(st: os.stat_result) -> Fingerprint:
+    """Stat fields that change whenever file contents are rewritten."""
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+# --- Verification cache ---
+
+
+@dataclass(frozen=True)
+class IntegrityCacheStats(CounterSnapshot):
+    entries: int
+    max_entries: int
+    cached_verifications: int  # reads that skipped hashing
+    full_verifications: int  # reads (or scrubs) that hashed the whole file
+    failures: int  # full verifications that found a hash mismatch
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.cached_verifications + self.full_verifications
+        return ratio(self.cached_verifications, total)
+
+
+class VerifiedHashCache:
+    """
+    Remembers files whose bytes already matched their recorded SHA-256.
+
+    Thread-safe. A hit requires the same path, the same expected hash and an
+    unchanged (inode, size, mtime_ns) fingerprint.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        *,
+        reverify_after_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Verified files remembered before LRU eviction
+            reverify_after_seconds: Re-hash files verified longer ago than this
+                (None trusts a verification until the file's stat changes)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self._max_entries = max_entries
+        self._reverify_after = reverify_after_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # path -> (fingerprint, sha256, verified_at)
+        self._entries: OrderedDict[str, tuple[Fingerprint, str, float]] = OrderedDict()
+
+        self._hits = 0
+        self._full = 0
+        self._failures = 0
+
+    def check(self, path: str, st: os.stat_result, sha256: str) -> bool:
+        """Return True (and count a cached verification) if path is still verified."""
+        fp = fingerprint(st)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != fp or entry[1] != sha256:
+                return False
+            if self._reverify_after is not None:
+                if self._clock() - entry[2] >= self._reverify_after:
+                    return False
+            self._entries.move_to_end(path)
+            self._hits += 1
+            return True
+
+    def record(self, path: str, st: os.stat_result, sha256: str, actual_sha256: str) -> bool:
+        """
+        Record the outcome of a full verification.
+
+        Returns True if the hashes matched. Mismatches drop any cached entry.
+        """
+        ok = actual_sha256 == sha256
+        with self._lock:
+            self._full += 1
+            if not ok:
+                self._failures += 1
+                self._entries.pop(path, None)
+                return False
+            self._entries[path] = (fingerprint(st), sha256, self._clock())
+            self._entries.move_to_end(path)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def prime(self, path: str, st: os.stat_result, sha256: str) -> None:
+        """Mark a file verified without counting a verification (hashed on write)."""
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[path] = (fingerprint(st), sha256, self._clock())
+            self._entries.move_to_end(path)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, path: str) -> None:
+        """Forget a path (deleted or known corrupt)."""
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def clear(self) -> None:
+        """Forget every verification (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> IntegrityCacheStats:
+        """Snapshot of cache counters."""
+        with self._lock:
+            return IntegrityCacheStats(
+                entries=len(self._entries),
+                max_entries=self._max_entries,
+                cached_verifications=self._hits,
+                full_verifications=self._full,
+                failures=self._failures,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# --- Scrubber ---
+
+
+@dataclass
+class ScrubReport:
+    """Result of one scrub batch."""
+
+    checked: int = 0
+    corrupt: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    completed_pass: bool = False  # True when this batch reached the end of the store
+
+
+class IntegrityScrubber:
+    """
+    Incrementally re-hashes every object in a LocalFileStorage.
+
+    Each run_once() verifies the next batch_size keys in sorted order and
+    resumes where the previous batch stopped, wrapping to the start after
+    a full pass. Corrupt keys are logged and kept in corrupt_keys until a
+    later scrub finds them intact again.
+    """
+
+    def __init__(self, storage: LocalFileStorage, *, batch_size: int = 100) -> None:
+        """Initialize scrubber for a storage instance."""
+        self._storage = storage
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending: list[str] = []
+        self._corrupt: set[str] = set()
+        self._passes = 0
+
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def corrupt_keys(self) -> frozenset[str]:
+        """Keys that failed their most recent scrub."""
+        with self._lock:
+            return frozenset(self._corrupt)
+
+    @property
+    def passes_completed(self) -> int:
+        return self._passes
+
+    def run_once(self) -> ScrubReport:
+        """Verify the next batch of keys."""
+        report = ScrubReport()
+        with self._lock:
+            if not self._pending:
+                # Newest listing each pass; reversed so pop() yields sorted order
+                self._pending = sorted(self._storage.iter_keys(), reverse=True)
+            batch = [self._pending.pop() for _ in range(min(self._batch_size, len(self._pending)))]
+            report.completed_pass = not self._pending
+
+        for key in batch:
+            report.checked += 1
+            try:
+                self._storage.verify(key, force=True)
+            except KeyNotFoundError:
+                report.missing.append(key)
+                continue
+            except IntegrityError as e:
+                logger.error("Integrity scrub: %s is corrupt (%s)", key, e)
+                report.corrupt.append(key)
+                with self._lock:
+                    self._corrupt.add(key)
+                continue
+            with self._lock:
+                self._corrupt.discard(key)
+
+        if report.completed_pass:
+            self._passes += 1
+        return report
+
+    def run_pass(self) -> ScrubReport:
+        """Verify every key once, starting from the current position."""
+        total = ScrubReport()
+        while True:
+            report = self.run_once()
+            total.checked += report.checked
+            total.corrupt.extend(report.corrupt)
+            total.missing.extend(report.missing)
+            if report.completed_pass:
+                total.completed_pass = True
+                return total
+
+    # --- Background schedule ---
+
+    def start(self, interval_seconds: float) -> None:
+        """Scrub one batch every interval_seconds on a daemon thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(interval_seconds,),
+            name="storage-integrity-scrub",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background thread."""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self, interval_seconds: float) -> None:
+        while not self._stopping.wait(interval_seconds):
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Integrity scrub batch failed")
@@ -10,24 +10,66 @@ Test assertions: TA-0104 (immutable key)
 Invariants:
 - I3: AssetVersion bytes are immutable; sha256 stored equals sha256 served
 - Keys once written cannot be overwritten
+
+Writes are streamed: bytes are spooled to a temp file in fixed chunks while
+SHA-256 is computed, then renamed into a content-addressed blob store
+({base_path}/_sha256/ab/abcd...) and hard-linked to the key path. Content
+already stored under the same hash is linked, not written again.
+
+Reads verify I3 through a VerifiedHashCache: a file is hashed in full the
+first time it is read (or when its stat changes) and trusted afterwards;
+IntegrityScrubber re-hashes the store in the background.
 """
 
 from __future__ import annotations
 
 import hashlib
+import io
 import json
 import os
+import shutil
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO
 
+from src.adapters.integrity import IntegrityCacheStats, VerifiedHashCache
 from src.core.ports.storage import (
     IntegrityError,
     KeyExistsError,
     KeyNotFoundError,
+    ObjectTooLargeError,
+    StagedObject,
     StorageError,
     StoredObject,
 )
 
+# Read size when spooling uploads
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Layout directories (outside the key namespace used by assets/...)
+BLOB_DIR = "_sha256"
+STAGING_DIR = "_staging"
+
+
+def _write_json_atomic(path: Path, data: dict[str, Any]) -> None:
+    """
+    Write JSON so readers see either the old file or the complete new one.
+
+    The temp file lives in the target directory so os.replace stays a
+    same-filesystem rename.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".part")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
 
 class LocalFileStorage:
     """
@@ -45,6 +87,7 @@ class LocalFileStorage:
         *,
         create_dirs: bool = True,
         allow_delete: bool = False,
+        verify_cache: VerifiedHashCache | None = None,
     ) -> None:
         """
         Initialize local file storage.
@@ -53,9 +96,11 @@ class LocalFileStorage:
             base_path: Root directory for storage
             create_dirs: Whether to create directories if they don't exist
             allow_delete: Whether to allow deletion (disabled for production immutability)
+            verify_cache: Integrity verification cache (a private one by default)
         """
         self.base_path = Path(base_path)
         self.allow_delete = allow_delete
+        self.verify_cache = verify_cache if verify_cache is not None else VerifiedHashCache()
 
         if create_dirs:
             self.base_path.mkdir(parents=True, exist_ok=True)
@@ -68,24 +113,9 @@ class LocalFileStorage:
         meta_path = self.base_path / f"{safe_key}.meta.json"
         return data_path, meta_path
 
-    def _compute_sha256(self, data: bytes | BinaryIO) -> tuple[bytes, str]:
-        """Compute SHA-256 hash of data, returning (bytes, hex_hash)."""
-        hasher = hashlib.sha256()
-
-        if isinstance(data, bytes):
-            hasher.update(data)
-            return data, hasher.hexdigest()
-
-        # Stream from file-like object
-        chunks = []
-        while True:
-            chunk = data.read(8192)
-            if not chunk:
-                break
-            chunks.append(chunk)
-            hasher.update(chunk)
-
-        return b"".join(chunks), hasher.hexdigest()
+    def _blob_path(self, sha256_hex: str) -> Path:
+        """Content-addressed location for bytes with the given hash."""
+        return self.base_path / BLOB_DIR / sha256_hex[:2] / sha256_hex
 
     def _compute_etag(self, sha256_hex: str) -> str:
         """Compute ETag from sha256 hash."""
@@ -104,48 +134,116 @@ class LocalFileStorage:
 
         Enforces immutability: raises KeyExistsError if key already exists.
         """
-        data_path, meta_path = self._key_to_paths(key)
+        data_path, _ = self._key_to_paths(key)
 
         # Immutability check: key must not exist
         if data_path.exists():
             raise KeyExistsError(key)
 
-        # Compute hash and verify integrity
-        data_bytes, sha256_hex = self._compute_sha256(data)
+        source = io.BytesIO(data) if isinstance(data, bytes) else data
+        staged = self.stage(source, expected_sha256=expected_sha256)
+        return self.commit_staged(staged, key, content_type)
 
-        if expected_sha256 and sha256_hex != expected_sha256:
-            raise IntegrityError(expected_sha256, sha256_hex)
+    def stage(
+        self,
+        source: BinaryIO,
+        *,
+        max_bytes: int | None = None,
+        expected_sha256: str | None = None,
+    ) -> StagedObject:
+        """
+        Spool a stream to a temp file, hashing it chunk by chunk.
 
-        # Create parent directories
-        data_path.parent.mkdir(parents=True, exist_ok=True)
+        Raises:
+            ObjectTooLargeError: As soon as more than max_bytes have been read
+            IntegrityError: If expected_sha256 doesn't match the streamed bytes
+        """
+        staging_dir = self.base_path / STAGING_DIR
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=staging_dir, suffix=".part")
+        tmp_path = Path(tmp_name)
 
-        # Write data file
-        with open(data_path, "wb") as f:
-            f.write(data_bytes)
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while chunk := source.read(UPLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if max_bytes is not None and size > max_bytes:
+                        raise ObjectTooLargeError(max_bytes)
+                    hasher.update(chunk)
+                    out.write(chunk)
+                out.flush()
+                os.fsync(out.fileno())
+
+            sha256_hex = hasher.hexdigest()
+            if expected_sha256 and sha256_hex != expected_sha256:
+                raise IntegrityError(expected_sha256, sha256_hex)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        return StagedObject(path=tmp_path, size_bytes=size, sha256=sha256_hex)
+
+    def commit_staged(self, staged: StagedObject, key: str, content_type: str) -> StoredObject:
+        """
+        Bind staged bytes to a key.
+
+        The staged file is atomically renamed into the blob store, or
+        discarded if a blob with the same hash already exists.
+        """
+        data_path, meta_path = self._key_to_paths(key)
+        if data_path.exists():
+            self.discard_staged(staged)
+            raise KeyExistsError(key)
+
+        blob_path = self._blob_path(staged.sha256)
+        if blob_path.exists():
+            # Deduplicated: identical bytes are already stored
+            self.discard_staged(staged)
+        else:
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(staged.path, blob_path)
+
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(blob_path, data_path)
+        except FileExistsError:
+            raise KeyExistsError(key) from None
+        except OSError:
+            # Filesystem without hard links: fall back to a private copy
+            tmp_copy = data_path.with_suffix(".part")
+            shutil.copyfile(blob_path, tmp_copy)
+            os.replace(tmp_copy, data_path)
+
+        # Bytes were hashed while staging; no need to hash them again on first read
+        self.verify_cache.prime(str(data_path), data_path.stat(), staged.sha256)
 
-        # Write metadata
         metadata = StoredObject(
             key=key,
-            size_bytes=len(data_bytes),
+            size_bytes=staged.size_bytes,
             content_type=content_type,
-            sha256=sha256_hex,
-            etag=self._compute_etag(sha256_hex),
+            sha256=staged.sha256,
+            etag=self._compute_etag(staged.sha256),
         )
 
-        with open(meta_path, "w") as f:
-            json.dump(
-                {
-                    "key": metadata.key,
-                    "size_bytes": metadata.size_bytes,
-                    "content_type": metadata.content_type,
-                    "sha256": metadata.sha256,
-                    "etag": metadata.etag,
-                },
-                f,
-            )
+        _write_json_atomic(
+            meta_path,
+            {
+                "key": metadata.key,
+                "size_bytes": metadata.size_bytes,
+                "content_type": metadata.content_type,
+                "sha256": metadata.sha256,
+                "etag": metadata.etag,
+            },
+        )
 
         return metadata
 
+    def discard_staged(self, staged: StagedObject) -> None:
+        """Remove staged bytes that will not be committed."""
+        staged.path.unlink(missing_ok=True)
+
     def get(self, key: str) -> tuple[bytes, StoredObject]:
         """Retrieve object bytes by key."""
         data_path, meta_path = self._key_to_paths(key)
@@ -154,14 +252,16 @@ class LocalFileStorage:
             raise KeyNotFoundError(key)
 
         with open(data_path, "rb") as f:
+            st = os.fstat(f.fileno())
             data = f.read()
 
         metadata = self._load_metadata(meta_path, key)
 
-        # Verify integrity on read (I3)
-        actual_sha256 = hashlib.sha256(data).hexdigest()
-        if actual_sha256 != metadata.sha256:
-            raise IntegrityError(metadata.sha256, actual_sha256)
+        # Verify integrity on read (I3); unchanged, verified files skip the hash
+        if not self.verify_cache.check(str(data_path), st, metadata.sha256):
+            actual_sha256 = hashlib.sha256(data).hexdigest()
+            if not self.verify_cache.record(str(data_path), st, metadata.sha256, actual_sha256):
+                raise IntegrityError(metadata.sha256, actual_sha256)
 
         return data, metadata
 
@@ -175,7 +275,62 @@ class LocalFileStorage:
         metadata = self._load_metadata(meta_path, key)
 
         # Return file handle (caller responsible for closing)
-        return open(data_path, "rb"), metadata
+        handle = open(data_path, "rb")
+        try:
+            self._verify_handle(data_path, handle, metadata.sha256)
+        except BaseException:
+            handle.close()
+            raise
+        return handle, metadata
+
+    def verify(self, key: str, *, force: bool = False) -> StoredObject:
+        """
+        Check a stored object's bytes against its recorded sha256 (I3).
+
+        Uses the verification cache unless force=True (scrubbing).
+
+        Raises:
+            KeyNotFoundError: If the key does not exist
+            IntegrityError: If the bytes no longer match
+        """
+        data_path, meta_path = self._key_to_paths(key)
+        if not data_path.exists():
+            raise KeyNotFoundError(key)
+
+        metadata = self._load_metadata(meta_path, key)
+        with open(data_path, "rb") as f:
+            self._verify_handle(data_path, f, metadata.sha256, force=force)
+        return metadata
+
+    def iter_keys(self) -> Iterator[str]:
+        """Yield every stored key (unordered)."""
+        for data_path in self.base_path.rglob("*.bin"):
+            yield data_path.relative_to(self.base_path).as_posix().removesuffix(".bin")
+
+    def integrity_stats(self) -> IntegrityCacheStats:
+        """Cached vs full verification counters."""
+        return self.verify_cache.stats()
+
+    def _verify_handle(
+        self,
+        data_path: Path,
+        handle: BinaryIO,
+        expected_sha256: str,
+        *,
+        force: bool = False,
+    ) -> None:
+        """Verify an open file, hashing it only on a cache miss; rewinds the handle."""
+        st = os.fstat(handle.fileno())
+        if not force and self.verify_cache.check(str(data_path), st, expected_sha256):
+            return
+
+        hasher = hashlib.sha256()
+        while chunk := handle.read(UPLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
+        actual_sha256 = hasher.hexdigest()
+        handle.seek(0)
+        if not self.verify_cache.record(str(data_path), st, expected_sha256, actual_sha256):
+            raise IntegrityError(expected_sha256, actual_sha256)
 
     def exists(self, key: str) -> bool:
         """Check if key exists in storage."""
@@ -197,10 +352,17 @@ class LocalFileStorage:
         if not data_path.exists():
             return False
 
+        sha256_hex = self._load_metadata(meta_path, key).sha256
+        self.verify_cache.discard(str(data_path))
         data_path.unlink()
         if meta_path.exists():
             meta_path.unlink()
 
+        # Drop the blob once no key links to it any more
+        blob_path = self._blob_path(sha256_hex)
+        if blob_path.exists() and blob_path.stat().st_nlink == 1:
+            blob_path.unlink()
+
         return True
 
     def get_metadata(self, key: str) -> StoredObject | None:
@@ -0,0 +1,270 @@
+"""
+Publish Worker (E5.2) - Event-driven scheduled publishing.
+
+Long-running worker that publishes scheduled content on time. Instead of
+polling the job table on a fixed interval, it keeps an in-memory min-heap
+of upcoming due times and sleeps until the earliest one. SchedulerService
+calls notify() whenever a job is scheduled, rescheduled, cancelled or put
+into retry, so changes take effect immediately.
+
+Spec refs: E5.2, TA-0029, R3
+
+Key behaviors:
+- Sleeps until the next due job (or resync_seconds, whichever is sooner);
+  notify() wakes it early
+- The heap is only a hint: jobs are claimed from the repo in batches
+  (SchedulerService.claim_due), so R3 and double-execution guarantees
+  stay with the database
+- Periodic resync picks up jobs changed by other processes
+- Claimed jobs are published on a thread pool of max_concurrency workers
+- stats() reports publish lag (actual publish time - scheduled time)
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+from src.components.scheduler._impl import (
+    ExecutionResult,
+    PublishJob,
+    SchedulerService,
+    job_due_at,
+)
+from src.domain.stats import CounterSnapshot, ratio
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_RESYNC_SECONDS = 300.0
+_RESYNC_LIMIT = 1000
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+@dataclass(frozen=True)
+class PublishWorkerStats(CounterSnapshot):
+    published: int
+    failed: int
+    batches: int  # claim batches that returned at least one job
+    wakeups: int
+    pending: int  # due times currently tracked in the heap
+    lag_total_seconds: float
+    lag_max_seconds: float
+
+    @property
+    def mean_lag_seconds(self) -> float:
+        return ratio(self.lag_total_seconds, self.published)
+
+
+class PublishWorker:
+    """
+    Publishes due jobs as soon as they are due.
+
+    Thread-safe. run_due() may also be called directly (e.g. from tests or
+    an admin trigger); the background thread is optional.
+    """
+
+    def __init__(
+        self,
+        service: SchedulerService,
+        *,
+        worker_id: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        resync_seconds: float = DEFAULT_RESYNC_SECONDS,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        """
+        Initialize worker.
+
+        Args:
+            service: Scheduler service whose repo holds the jobs
+            worker_id: Claim owner recorded on jobs (defaults to a random id)
+            max_concurrency: Publishes executed in parallel
+            batch_size: Jobs claimed per repo round trip
+            resync_seconds: Interval for reloading due times from the repo
+            clock: UTC time source (injectable for tests)
+        """
+        self._service = service
+        self._worker_id = worker_id or f"publish-{uuid4().hex[:8]}"
+        self._max_concurrency = max(1, max_concurrency)
+        self._batch_size = max(1, batch_size)
+        self._resync_seconds = resync_seconds
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._heap: list[tuple[datetime, UUID]] = []
+        self._due: dict[UUID, datetime] = {}  # current due time per job (heap entries may be stale)
+
+        self._published = 0
+        self._failed = 0
+        self._batches = 0
+        self._wakeups = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pool: ThreadPoolExecutor | None = None
+
+    # --- Queue changes ---
+
+    def notify(self, job_id: UUID, due_at: datetime | None) -> None:
+        """Record a job's new due time (None removes it) and wake the worker."""
+        with self._lock:
+            if due_at is None:
+                self._due.pop(job_id, None)
+            else:
+                self._due[job_id] = due_at
+                heapq.heappush(self._heap, (due_at, job_id))
+        self._wake.set()
+
+    def resync(self) -> int:
+        """Reload pending due times from the repo; returns jobs tracked."""
+        jobs = self._service.get_pending_jobs(limit=_RESYNC_LIMIT)
+        due = {job.id: at for job in jobs if (at := job_due_at(job)) is not None}
+        with self._lock:
+            self._due = due
+            self._heap = [(at, job_id) for job_id, at in due.items()]
+            heapq.heapify(self._heap)
+            return len(self._due)
+
+    def next_due_at(self) -> datetime | None:
+        """Earliest tracked due time (None when nothing is scheduled)."""
+        with self._lock:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def _drop_stale(self) -> None:
+        # Caller holds the lock. Entries superseded by a later notify() or
+        # removed from _due are discarded lazily.
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    # --- Execution ---
+
+    def run_due(self) -> list[ExecutionResult]:
+        """Claim and publish every job that is due now."""
+        now = self._clock()
+        with self._lock:
+            self._drop_stale()
+            while self._heap and self._heap[0][0] <= now:
+                _, job_id = heapq.heappop(self._heap)
+                del self._due[job_id]
+                self._drop_stale()
+
+        results: list[ExecutionResult] = []
+        while True:
+            jobs = self._service.claim_due(self._worker_id, self._batch_size)
+            if not jobs:
+                return results
+            with self._lock:
+                self._batches += 1
+            results.extend(self._execute(jobs))
+            if len(jobs) < self._batch_size:
+                return results
+
+    def _execute(self, jobs: list[PublishJob]) -> list[ExecutionResult]:
+        if self._pool is None or len(jobs) == 1:
+            return [self._execute_one(job) for job in jobs]
+        return list(self._pool.map(self._execute_one, jobs))
+
+    def _execute_one(self, job: PublishJob) -> ExecutionResult:
+        scheduled_at = job.publish_at_utc
+        try:
+            result = self._service.execute_job(job)
+        except Exception as e:
+            logger.exception("Publish of job %s raised", job.id)
+            result = ExecutionResult(success=False, job_id=job.id, message=str(e))
+
+        with self._lock:
+            if result.success:
+                self._published += 1
+                published_at = result.actual_publish_at or self._clock()
+                lag = max(0.0, (published_at - scheduled_at).total_seconds())
+                self._lag_total += lag
+                self._lag_max = max(self._lag_max, lag)
+            else:
+                self._failed += 1
+        return result
+
+    # --- Background thread ---
+
+    def start(self) -> None:
+        """Start the worker thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._max_concurrency,
+            thread_name_prefix="publish-job",
+        )
+        self._thread = threading.Thread(target=self._run, name="publish-worker", daemon=True)
+        self._thread.start()
+        logger.info("Publish worker %s started", self._worker_id)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the worker thread and wait for in-flight publishes."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        resync_interval = timedelta(seconds=self._resync_seconds)
+        next_resync: datetime | None = None
+        while not self._stopping.is_set():
+            try:
+                now = self._clock()
+                # Also resync if the clock stepped back past the interval
+                if next_resync is None or not now < next_resync <= now + resync_interval:
+                    next_resync = now + resync_interval
+                    self.resync()
+                self.run_due()
+            except Exception:
+                logger.exception("Publish worker iteration failed")
+
+            # Measured after the batch, so time spent publishing counts
+            # toward the resync interval
+            now = self._clock()
+            delay = (next_resync - now).total_seconds() if next_resync else 0.0
+            due_at = self.next_due_at()
+            if due_at is not None:
+                delay = min(delay, (due_at - now).total_seconds())
+
+            self._wake.wait(max(0.0, delay))
+            self._wake.clear()
+            with self._lock:
+                self._wakeups += 1
+
+    def stats(self) -> PublishWorkerStats:
+        """Snapshot of worker counters."""
+        with self._lock:
+            return PublishWorkerStats(
+                published=self._published,
+                failed=self._failed,
+                batches=self._batches,
+                wakeups=self._wakeups,
+                pending=len(self._due),
+                lag_total_seconds=self._lag_total,
+                lag_max_seconds=self._lag_max,
+            )
@@ -0,0 +1,262 @@
+"""
+Sliding-Window Rate Limiter.
+
+Single rate-limiting engine shared by analytics ingestion, login, upload and
+newsletter limits.
+
+Each key holds two counters (previous and current fixed window) instead of
+a list of timestamps, so a check is O(1) and memory per key is constant.
+Counters are kept per (key, window size): the same key checked against a
+different window gets its own counters rather than resetting the other's.
+The request count over the trailing window is estimated Cloudflare-style:
+
+    estimate = previous * (1 - elapsed_in_current / window) + current
+
+Key behaviors:
+- Monotonic clock: wall-clock jumps never reset or extend a window
+- hit() checks and records atomically; peek()/record() split the two for
+  callers whose port separates them
+- One process-wide lock guards the key table; each operation holds it for
+  O(1) work
+- Keys idle for two full windows are swept periodically, and the key table
+  is capped so IP churn cannot grow memory without bound
+- stats() exposes allowed/denied decisions made by hit() and swept/evicted
+  counters for monitoring; peek() and record() leave the decision counters
+  alone
+- get_shared_rate_limiter() is the process-wide instance; callers namespace
+  their keys ("login:", "analytics:", ...)
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+from src.domain.stats import CounterSnapshot
+
+# Idle-key sweep cadence (seconds of monotonic time)
+DEFAULT_SWEEP_INTERVAL = 60.0
+
+# Hard cap on tracked keys; past it the oldest key is dropped (fails open)
+DEFAULT_MAX_KEYS = 100_000
+
+
+@dataclass(frozen=True)
+class RateLimiterStats(CounterSnapshot):
+    keys: int
+    allowed: int
+    denied: int
+    sweeps: int
+    swept_keys: int
+    evicted_keys: int
+
+
+class RateLimitEngine(Protocol):
+    """
+    Rate-limiting engine interface.
+
+    Implemented by SlidingWindowRateLimiter (per process) and
+    SQLiteRateLimitStore (shared across worker processes).
+    """
+
+    def hit(self, key: str, limit: int, window_seconds: float) -> bool: ...
+
+    def peek(self, key: str, limit: int, window_seconds: float) -> tuple[bool, int]: ...
+
+    def record(self, key: str, window_seconds: float) -> None: ...
+
+    def reset(self, key: str | None = None) -> None: ...
+
+
+class WindowCounter:
+    """Counters for one key: the current fixed window and the one before it."""
+
+    __slots__ = ("window", "start", "previous", "current")
+
+    def __init__(self, window: float, start: float) -> None:
+        self.window = window
+        self.start = start
+        self.previous = 0
+        self.current = 0
+
+    def advance(self, now: float) -> None:
+        """Roll the fixed windows forward to the one containing now."""
+        elapsed = int((now - self.start) // self.window)
+        if elapsed <= 0:
+            return
+        self.previous = self.current if elapsed == 1 else 0
+        self.current = 0
+        self.start += elapsed * self.window
+
+    def estimate(self, now: float) -> float:
+        """Approximate requests in the trailing window ending at now."""
+        weight = 1.0 - (now - self.start) / self.window
+        return self.previous * weight + self.current
+
+    def idle(self, now: float) -> bool:
+        """True once both windows have expired (equivalent to a fresh key)."""
+        return now - self.start >= 2 * self.window
+
+
+class SlidingWindowRateLimiter:
+    """
+    Fixed-memory sliding-window-counter rate limiter.
+
+    Thread-safe through a single lock; every operation holds it for O(1)
+    work apart from the periodic sweep.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        sweep_interval: float = DEFAULT_SWEEP_INTERVAL,
+        max_keys: int = DEFAULT_MAX_KEYS,
+    ) -> None:
+        """Initialize limiter."""
+        self._clock = clock
+        self._sweep_interval = sweep_interval
+        self._max_keys = max_keys
+        self._windows: dict[tuple[str, float], WindowCounter] = {}
+        self._lock = threading.Lock()
+        self._next_sweep = clock() + sweep_interval
+
+        self._allowed = 0
+        self._denied = 0
+        self._sweeps = 0
+        self._swept = 0
+        self._evicted = 0
+
+    # --- Public API ---
+
+    def hit(self, key: str, limit: int, window_seconds: float) -> bool:
+        """Record a request for key if it is under limit; return whether it was."""
+        if limit <= 0:
+            with self._lock:
+                self._denied += 1
+            return False
+
+        with self._lock:
+            now = self._clock()
+            state = self._window(key, window_seconds, now)
+            if state.estimate(now) >= limit:
+                self._denied += 1
+                return False
+            state.current += 1
+            self._allowed += 1
+            return True
+
+    def peek(self, key: str, limit: int, window_seconds: float) -> tuple[bool, int]:
+        """Check key against limit without recording; returns (allowed, remaining)."""
+        with self._lock:
+            now = self._clock()
+            self._maybe_sweep(now)
+            state = self._windows.get((key, float(window_seconds)))
+            if state is None:
+                used = 0.0
+            else:
+                state.advance(now)
+                used = state.estimate(now)
+            return used < limit, max(0, limit - math.ceil(used))
+
+    def record(self, key: str, window_seconds: float) -> None:
+        """Count one request against key."""
+        with self._lock:
+            now = self._clock()
+            self._window(key, window_seconds, now).current += 1
+
+    def reset(self, key: str | None = None) -> None:
+        """Forget one key (under every window size), or every key."""
+        with self._lock:
+            if key is None:
+                self._windows.clear()
+            else:
+                for entry in [entry for entry in self._windows if entry[0] == key]:
+                    del self._windows[entry]
+
+    def sweep(self) -> int:
+        """Drop idle keys now; returns how many were removed."""
+        with self._lock:
+            return self._sweep_locked(self._clock())
+
+    def stats(self) -> RateLimiterStats:
+        """Snapshot of limiter counters."""
+        with self._lock:
+            return RateLimiterStats(
+                keys=len(self._windows),
+                allowed=self._allowed,
+                denied=self._denied,
+                sweeps=self._sweeps,
+                swept_keys=self._swept,
+                evicted_keys=self._evicted,
+            )
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    # --- Internals (lock held) ---
+
+    def _window(self, key: str, window_seconds: float, now: float) -> WindowCounter:
+        self._maybe_sweep(now)
+        entry = (key, float(window_seconds))
+        state = self._windows.get(entry)
+        if state is None:
+            if len(self._windows) >= self._max_keys:
+                self._make_room(now)
+            state = self._windows[entry] = WindowCounter(entry[1], now)
+        else:
+            state.advance(now)
+        return state
+
+    def _maybe_sweep(self, now: float) -> None:
+        if now >= self._next_sweep:
+            self._sweep_locked(now)
+
+    def _sweep_locked(self, now: float) -> int:
+        idle = [entry for entry, state in self._windows.items() if state.idle(now)]
+        for entry in idle:
+            del self._windows[entry]
+        self._sweeps += 1
+        self._swept += len(idle)
+        self._next_sweep = now + self._sweep_interval
+        return len(idle)
+
+    def _make_room(self, now: float) -> None:
+        if self._sweep_locked(now):
+            return
+        # Everything is active: drop the oldest-inserted key
+        del self._windows[next(iter(self._windows))]
+        self._evicted += 1
+
+
+# -----------------------------------------------------------------------------
+# Process-wide instance
+# -----------------------------------------------------------------------------
+
+_shared: RateLimitEngine | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_rate_limiter() -> RateLimitEngine:
+    """Process-wide limiter used by every rate-limited entry point."""
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = SlidingWindowRateLimiter()
+    return _shared
+
+
+def configure_shared_rate_limiter(engine: RateLimitEngine | None) -> None:
+    """
+    Replace the process-wide limiter (e.g. with a cross-process store).
+
+    Must run before the first rate-limited request; None restores the
+    in-memory default on next use.
+    """
+    global _shared
+    with _shared_lock:
+        _shared = engine
@@ -0,0 +1,374 @@
+"""
+Chart Render Service - Off-thread chart rendering with a bounded cache.
+
+Matplotlib holds the GIL for hundreds of milliseconds per chart, so rendering
+on the calling thread stalls everything else in the process. This service
+renders in a pool of worker processes that import matplotlib once at start,
+and caches the result in two tiers.
+
+Key behaviors:
+- Implements RendererPort (render_chart); fmt="svg" gives SVG output, which
+  is smaller for simple charts and scales without blurring
+- Concurrent requests for the same spec hash share one render (single-flight)
+- Hot tier: in-memory LRU bounded by memory_max_bytes
+- Disk tier: {cache_dir}/{md5}.{png|svg}, an LRU bounded by disk_max_bytes;
+  recency survives restarts through file mtimes
+- max_workers=0 renders on the calling thread (no child processes)
+- stats() reports hits per tier, renders, coalesced waits and evictions
+- get_shared_chart_service() is the process-wide instance per cache
+  directory; shutdown_shared_chart_services() stops their workers on exit
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.adapters.render.mpl_renderer import ChartFormat, chart_cache_name, render_chart_image
+from src.domain.stats import CounterSnapshot, ratio
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_DISK_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MEMORY_MAX_BYTES = 8 * 1024 * 1024
+
+CHART_MEDIA_TYPES: dict[str, str] = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+}
+
+
+@dataclass(frozen=True)
+class ChartCacheStats(CounterSnapshot):
+    memory_hits: int
+    disk_hits: int
+    renders: int  # charts actually rendered (cache misses)
+    coalesced: int  # requests that waited on another request's render
+    failures: int
+    memory_evictions: int
+    disk_evictions: int
+    memory_bytes: int
+    disk_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.renders
+        return ratio(hits, lookups)
+
+
+def _warm_worker() -> None:
+    """Pool initializer: import matplotlib and load the font cache once per process."""
+    render_chart_image({"type": "line", "data": {"x": [0, 1], "y": [0, 1]}}, 64, 64, 32)
+
+
+class ChartDiskCache:
+    """
+    Size-bounded LRU of chart files in one directory (thread-safe).
+
+    Existing files are adopted on start in mtime order; reads touch the
+    file so the order carries across restarts.
+    """
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int = DEFAULT_DISK_MAX_BYTES) -> None:
+        """Initialize cache, adopting files already in cache_dir."""
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()  # name -> size
+        self._bytes = 0
+        self.evictions = 0
+
+        found = []
+        for path in self.cache_dir.iterdir():
+            if path.is_file() and path.suffix[1:] in CHART_MEDIA_TYPES:
+                st = path.stat()
+                found.append((st.st_mtime, path.name, st.st_size))
+        for _, name, size in sorted(found):
+            self._entries[name] = size
+            self._bytes += size
+        with self._lock:
+            self._evict()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, name: str) -> bytes | None:
+        """Cached bytes, or None."""
+        path = self.cache_dir / name
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                size = self._entries.pop(name, None)
+                if size is not None:
+                    self._bytes -= size
+            return None
+        with self._lock:
+            if name in self._entries:
+                self._entries.move_to_end(name)
+            else:  # Written by another process
+                self._entries[name] = len(data)
+                self._bytes += len(data)
+                self._evict()
+        return data
+
+    def put(self, name: str, data: bytes) -> None:
+        """Store bytes (atomic rename) and evict least recently used files."""
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self.cache_dir / name)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            old = self._entries.pop(name, None)
+            if old is not None:
+                self._bytes -= old
+            self._entries[name] = len(data)
+            self._bytes += len(data)
+            self._evict()
+
+    def _evict(self) -> None:
+        # Caller holds the lock; the newest entry is kept even if oversized
+        while self._bytes > self._max_bytes and len(self._entries) > 1:
+            name, size = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+            (self.cache_dir / name).unlink(missing_ok=True)
+
+
+class ChartRenderService:
+    """Renders chart specs in worker processes behind memory and disk caches."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        disk_max_bytes: int = DEFAULT_DISK_MAX_BYTES,
+        memory_max_bytes: int = DEFAULT_MEMORY_MAX_BYTES,
+    ) -> None:
+        """
+        Initialize service (the process pool starts on first use or start()).
+
+        Args:
+            cache_dir: Directory for the disk tier
+            max_workers: Render processes (0 renders on the calling thread)
+            disk_max_bytes: Disk tier bound
+            memory_max_bytes: Hot tier bound
+        """
+        self._disk = ChartDiskCache(cache_dir, disk_max_bytes)
+        self._max_workers = max_workers
+        self._memory_max_bytes = memory_max_bytes
+
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._inflight: dict[str, Future[bytes]] = {}
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._renders = 0
+        self._coalesced = 0
+        self._failures = 0
+        self._memory_evictions = 0
+
+    # --- Pool lifecycle ---
+
+    def start(self) -> None:
+        """
+        Start the worker processes now so the first chart does not pay for imports.
+
+        No-op while the pool is already running.
+        """
+        if self._max_workers > 0:
+            with self._lock:
+                if self._pool is not None:
+                    return
+                pool = self._get_pool()
+            # Any task spawns a worker; the initializer does the warm-up
+            for _ in range(self._max_workers):
+                pool.submit(os.getpid)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes (restarted on next use)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        # Caller holds the lock. Spawned, not forked: the parent has threads
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+            )
+        return self._pool
+
+    # --- Rendering ---
+
+    def render_chart(
+        self,
+        spec: dict[str, Any],
+        width: int = 800,
+        height: int = 600,
+        dpi: int = 100,
+        fmt: ChartFormat = "png",
+    ) -> bytes:
+        """Render a chart (see render_chart_image for the spec schema); blocks until done."""
+        return self.submit(spec, width, height, dpi, fmt).result()
+
+    def submit(
+        self,
+        spec: dict[str, Any],
+        width: int = 800,
+        height: int = 600,
+        dpi: int = 100,
+        fmt: ChartFormat = "png",
+    ) -> Future[bytes]:
+        """Future for a chart; cached charts resolve immediately."""
+        name = chart_cache_name(spec, width, height, dpi, fmt)
+        with self._lock:
+            data = self._memory.get(name)
+            if data is not None:
+                self._memory.move_to_end(name)
+                self._memory_hits += 1
+                return _resolved(data)
+            flight = self._inflight.get(name)
+            if flight is not None:
+                self._coalesced += 1
+                return flight
+            flight = self._inflight[name] = Future()
+
+        # This request leads the flight: disk, then render
+        try:
+            data = self._disk.get(name)
+            if data is not None:
+                with self._lock:
+                    self._disk_hits += 1
+                self._complete(name, flight, data, store=False)
+                return flight
+
+            with self._lock:
+                self._renders += 1
+                pool = self._get_pool() if self._max_workers > 0 else None
+            if pool is None:
+                self._complete(name, flight, render_chart_image(spec, width, height, dpi, fmt))
+            else:
+                job = pool.submit(render_chart_image, spec, width, height, dpi, fmt)
+                job.add_done_callback(lambda done: self._on_rendered(name, flight, done))
+        except Exception as e:
+            self._fail(name, flight, e)
+        return flight
+
+    def _on_rendered(self, name: str, flight: Future[bytes], job: Future[bytes]) -> None:
+        try:
+            data = job.result()
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                # A worker died; the next render starts a fresh pool
+                with self._lock:
+                    self._pool = None
+            self._fail(name, flight, e)
+            return
+        self._complete(name, flight, data)
+
+    def _complete(self, name: str, flight: Future[bytes], data: bytes, store: bool = True) -> None:
+        if store:
+            try:
+                self._disk.put(name, data)
+            except OSError as e:
+                # Still serve the chart; it is rendered again next time
+                logger.warning("Chart cache write failed for %s: %s", name, e)
+        with self._lock:
+            self._remember(name, data)
+            self._inflight.pop(name, None)
+        flight.set_result(data)
+
+    def _fail(self, name: str, flight: Future[bytes], error: Exception) -> None:
+        logger.warning("Chart render failed for %s: %s", name, error)
+        with self._lock:
+            self._failures += 1
+            self._inflight.pop(name, None)
+        if not flight.done():
+            flight.set_exception(error)
+
+    def _remember(self, name: str, data: bytes) -> None:
+        # Caller holds the lock
+        if len(data) > self._memory_max_bytes:
+            return
+        old = self._memory.pop(name, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        self._memory[name] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self._memory_max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._memory_evictions += 1
+
+    def stats(self) -> ChartCacheStats:
+        """Snapshot of service counters."""
+        with self._lock:
+            return ChartCacheStats(
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                renders=self._renders,
+                coalesced=self._coalesced,
+                failures=self._failures,
+                memory_evictions=self._memory_evictions,
+                disk_evictions=self._disk.evictions,
+                memory_bytes=self._memory_bytes,
+                disk_bytes=self._disk.size_bytes,
+            )
+
+
+def _resolved(data: bytes) -> Future[bytes]:
+    future: Future[bytes] = Future()
+    future.set_result(data)
+    return future
+
+
+# --- Shared instances ---
+# One service (and worker pool) per cache directory for the whole process,
+# so per-session callers (e.g. each Flet page) do not spawn their own workers.
+_shared: dict[Path, ChartRenderService] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_chart_service(cache_dir: str | Path) -> ChartRenderService:
+    """Process-wide service for a cache directory (workers start on first use)."""
+    key = Path(cache_dir).resolve()
+    with _shared_lock:
+        service = _shared.get(key)
+        if service is None:
+            service = _shared[key] = ChartRenderService(key)
+    return service
+
+
+def shutdown_shared_chart_services() -> None:
+    """Stop every shared service's worker processes (shutdown hook)."""
+    with _shared_lock:
+        services = list(_shared.values())
+        _shared.clear()
+    for service in services:
+        service.shutdown()
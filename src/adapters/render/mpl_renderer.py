@@ -1,15 +1,94 @@
 import hashlib
 import json
 from io import BytesIO
-from typing import Any
-
-import matplotlib.figure
-from matplotlib.backends.backend_agg import FigureCanvasAgg
+from typing import Any, Literal
 
 from src.ports.filestore import FileStorePort
 
+ChartFormat = Literal["png", "svg"]
+
+
+def chart_cache_name(
+    spec: dict[str, Any], width: int, height: int, dpi: int, fmt: ChartFormat = "png"
+) -> str:
+    """File name for a rendered chart: md5 of the canonical spec and size, plus extension."""
+    # Canonical JSON repr
+    spec_str = json.dumps(spec, sort_keys=True)
+    # Include dim in hash (PNG names predate the format option, so it is only added for SVG)
+    hash_input = f"{spec_str}|{width}|{height}|{dpi}"
+    if fmt != "png":
+        hash_input += f"|{fmt}"
+    digest = hashlib.md5(hash_input.encode("utf-8")).hexdigest()
+    return f"{digest}.{fmt}"
+
+
+def render_chart_image(
+    spec: dict[str, Any],
+    width: int = 800,
+    height: int = 600,
+    dpi: int = 100,
+    fmt: ChartFormat = "png",
+) -> bytes:
+    """
+    Render a chart spec to PNG or SVG bytes (no caching).
+
+    Module-level so it can run in a worker process. Matplotlib is imported
+    here rather than at module import, so loading this module stays cheap.
+    Spec Schema:
+    {
+        "type": "bar" | "line" | "scatter",
+        "title": str,
+        "data": {
+            "x": list[int|float|str],
+            "y": list[int|float]
+        },
+        "xlabel": str,
+        "ylabel": str
+    }
+    """
+    import matplotlib.figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = matplotlib.figure.Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    FigureCanvasAgg(fig)  # Attach canvas backend
+    ax = fig.add_subplot(111)
+
+    c_type = spec.get("type", "line")
+    data = spec.get("data", {})
+    x = data.get("x", [])
+    y = data.get("y", [])
+
+    if c_type == "bar":
+        ax.bar(x, y)
+    elif c_type == "scatter":
+        ax.scatter(x, y)
+    else:  # line
+        ax.plot(x, y)
+
+    if title := spec.get("title"):
+        ax.set_title(title)
+    if xlabel := spec.get("xlabel"):
+        ax.set_xlabel(xlabel)
+    if ylabel := spec.get("ylabel"):
+        ax.set_ylabel(ylabel)
+
+    fig.tight_layout()
+
+    buf = BytesIO()
+    fig.savefig(buf, format=fmt)
+    image_data = buf.getvalue()
+    buf.close()
+    return image_data
+
 
 class MatplotlibRenderer:
+    """
+    Renders charts on the calling thread, cached in a FileStorePort.
+
+    See ChartRenderService (chart_service.py) for off-thread rendering with a
+    bounded cache.
+    """
+
     def __init__(self, cache_store: FileStorePort):
         self.cache_store = cache_store
 
@@ -17,26 +96,10 @@ class MatplotlibRenderer:
         self, spec: dict[str, Any], width: int = 800, height: int = 600, dpi: int = 100
     ) -> bytes:
         """
-        Renders a chart based on the spec.
-        Spec Schema:
-        {
-            "type": "bar" | "line" | "scatter",
-            "title": str,
-            "data": {
-                "x": list[int|float|str],
-                "y": list[int|float]
-            },
-            "xlabel": str,
-            "ylabel": str
-        }
+        Renders a chart based on the spec (see render_chart_image for the schema).
         """
         # 1. Compute Hash for Cache
-        # Canonical JSON repr
-        spec_str = json.dumps(spec, sort_keys=True)
-        # Include dim in hash
-        hash_input = f"{spec_str}|{width}|{height}|{dpi}"
-        digest = hashlib.md5(hash_input.encode("utf-8")).hexdigest()
-        cache_key = f"charts/{digest}.png"
+        cache_key = f"charts/{chart_cache_name(spec, width, height, dpi)}"
 
         # 2. Check Cache
         try:
@@ -45,38 +108,9 @@ class MatplotlibRenderer:
             pass
 
         # 3. Render
-        fig = matplotlib.figure.Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
-        FigureCanvasAgg(fig)  # Attach canvas backend
-        ax = fig.add_subplot(111)
-
-        c_type = spec.get("type", "line")
-        data = spec.get("data", {})
-        x = data.get("x", [])
-        y = data.get("y", [])
-
-        if c_type == "bar":
-            ax.bar(x, y)
-        elif c_type == "scatter":
-            ax.scatter(x, y)
-        else:  # line
-            ax.plot(x, y)
-
-        if title := spec.get("title"):
-            ax.set_title(title)
-        if xlabel := spec.get("xlabel"):
-            ax.set_xlabel(xlabel)
-        if ylabel := spec.get("ylabel"):
-            ax.set_ylabel(ylabel)
-
-        fig.tight_layout()
-
-        # 4. Save to Bytes
-        buf = BytesIO()
-        fig.savefig(buf, format="png")
-        png_data = buf.getvalue()
-        buf.close()
-
-        # 5. Write to Cache
+        png_data = render_chart_image(spec, width, height, dpi)
+
+        # 4. Write to Cache
         self.cache_store.save(cache_key, png_data)
 
         return png_data
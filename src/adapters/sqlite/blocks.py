@@ -0,0 +1,52 @@
+"""
+SQLite Content Block Loading.
+
+Batch loader shared by the content repositories in repos.py and
+sqlite_db.py. They map content_items rows to different entity types but
+load blocks the same way: one IN (...) query per chunk of item ids,
+grouped in memory, instead of one query per item.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Sequence
+
+from src.domain.entities import ContentBlock
+
+# Item ids bound per IN (...) query. SQLite allows 32766 host parameters
+# since 3.32 (999 before), so this stays under the limit on any build.
+IN_CHUNK = 500
+
+
+def load_blocks_by_item(
+    conn: sqlite3.Connection, item_ids: Sequence[str]
+) -> dict[str, list[ContentBlock]]:
+    """
+    Load the blocks of many content items, keyed by item id.
+
+    conn must use a dict row factory. Blocks are in position order; items
+    without blocks are absent from the result.
+    """
+    blocks_by_item: dict[str, list[ContentBlock]] = {}
+    for i in range(0, len(item_ids), IN_CHUNK):
+        chunk = list(item_ids[i : i + IN_CHUNK])
+        placeholders = ", ".join("?" for _ in chunk)
+        rows = conn.execute(
+            f"""
+            SELECT * FROM content_blocks
+            WHERE content_item_id IN ({placeholders})
+            ORDER BY content_item_id, position ASC
+            """,
+            chunk,
+        ).fetchall()
+        for row in rows:
+            blocks_by_item.setdefault(row["content_item_id"], []).append(
+                ContentBlock(
+                    id=str(row["id"]),
+                    block_type=row["block_type"],
+                    data_json=json.loads(row["data_json"]),
+                )
+            )
+    return blocks_by_item
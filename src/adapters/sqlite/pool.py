@@ -0,0 +1,421 @@
+"""
+SQLite Connection Pool.
+
+Shared, thread-affine connection manager used by every SQLite repository.
+
+Opening a connection, switching journal mode and enabling foreign keys on
+every repo call is a large share of request latency. The pool keeps one
+long-lived connection per thread (FastAPI threadpool workers, the event loop
+thread, background jobs) and applies the tuned PRAGMAs once, when the
+connection is opened.
+
+Key behaviors:
+- acquire() returns the calling thread's connection; close() hands it back
+- Re-entrant: nested acquire/close pairs on one thread share the connection,
+  and with it the transaction: an inner commit() or rollback() also covers
+  the outer caller's pending writes (use acquire_dedicated() to isolate)
+- Uncommitted work is rolled back on final release (same as a real close)
+- acquire_dedicated() hands out an exclusive connection for SQLiteUnitOfWork
+- Connections are reopened if the database file is replaced or removed
+- stats() exposes opened/reused/stale counters for monitoring
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from src.domain.stats import CounterSnapshot, ratio
+
+logger = logging.getLogger(__name__)
+
+RowFactory = Callable[[sqlite3.Cursor, Any], Any]
+
+
+def dict_factory(cursor: sqlite3.Cursor, row: tuple[Any, ...]) -> dict[str, Any]:
+    """Convert SQLite row to dictionary."""
+    return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+
+
+# -----------------------------------------------------------------------------
+# Configuration and statistics
+# -----------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """PRAGMA tuning and sizing for a connection pool."""
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 64 * 1024 * 1024  # 64 MiB
+    cache_size_kib: int = 16 * 1024  # 16 MiB page cache per connection
+    busy_timeout_ms: int = 5000
+    foreign_keys: bool = True
+    max_idle_dedicated: int = 4
+
+
+@dataclass(frozen=True)
+class PoolStats(CounterSnapshot):
+    db_path: str
+    connections_opened: int
+    connections_closed: int
+    acquires: int
+    reuses: int
+    stale_reopens: int
+    thread_connections: int
+    dedicated_in_use: int
+    dedicated_idle: int
+
+    @property
+    def reuse_rate(self) -> float:
+        """Fraction of acquires served by an already-open connection."""
+        return ratio(self.reuses, self.acquires)
+
+
+# -----------------------------------------------------------------------------
+# Pooled connection
+# -----------------------------------------------------------------------------
+
+
+class PooledConnection(sqlite3.Connection):
+    """
+    sqlite3.Connection whose close() returns it to the owning pool.
+
+    Repositories keep their existing try/finally conn.close() pattern;
+    only the pool ever closes the underlying handle.
+    """
+
+    _pool: SQLiteConnectionPool | None
+    _depth: int
+    _dedicated: bool
+    _file_id: tuple[int, int] | None
+    _factories: list[RowFactory | None]
+
+    def close(self) -> None:
+        pool = getattr(self, "_pool", None)
+        if pool is None:
+            super().close()
+            return
+        pool._release(self)
+
+    def _close_physical(self) -> None:
+        self._pool = None
+        super().close()
+
+
+# -----------------------------------------------------------------------------
+# Pool
+# -----------------------------------------------------------------------------
+
+
+class SQLiteConnectionPool:
+    """
+    Per-database connection pool.
+
+    Thread-affine connections serve ordinary repository calls; dedicated
+    connections give SQLiteUnitOfWork a transaction that is not shared
+    with unrelated repo calls on the same thread.
+    """
+
+    def __init__(self, db_path: str, config: PoolConfig | None = None) -> None:
+        self.db_path = db_path
+        self.config = config or PoolConfig()
+        self._lock = threading.Lock()
+        self._thread_conns: dict[int, PooledConnection] = {}
+        self._idle: list[PooledConnection] = []
+        self._dedicated_in_use = 0
+        self._closed = False
+        self._track_file = db_path != ":memory:" and not db_path.startswith("file:")
+
+        self._opened = 0
+        self._closed_count = 0
+        self._acquires = 0
+        self._reuses = 0
+        self._stale_reopens = 0
+
+    # --- Public API ---
+
+    def acquire(self, row_factory: RowFactory | None = dict_factory) -> sqlite3.Connection:
+        """
+        Get the calling thread's connection.
+
+        Must be paired with conn.close(), which releases rather than closes.
+        A nested acquire on the same thread returns the same connection, so
+        it joins any transaction the outer caller has open; code that must
+        commit or roll back on its own uses acquire_dedicated().
+        """
+        ident = threading.get_ident()
+        conn = self._thread_conns.get(ident)
+
+        if conn is not None and conn._depth == 0 and self._is_stale(conn):
+            with self._lock:
+                self._thread_conns.pop(ident, None)
+                self._stale_reopens += 1
+            self._discard(conn)
+            conn = None
+
+        if conn is None:
+            conn = self._open(dedicated=False)
+            with self._lock:
+                self._reap_dead_threads()
+                self._thread_conns[ident] = conn
+                self._acquires += 1
+        else:
+            with self._lock:
+                self._acquires += 1
+                self._reuses += 1
+
+        conn._factories.append(conn.row_factory)
+        conn.row_factory = row_factory
+        conn._depth += 1
+        return conn
+
+    @contextmanager
+    def connection(
+        self, row_factory: RowFactory | None = dict_factory
+    ) -> Iterator[sqlite3.Connection]:
+        """Context-managed acquire()/close() pair."""
+        conn = self.acquire(row_factory)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def acquire_dedicated(
+        self, row_factory: RowFactory | None = dict_factory
+    ) -> sqlite3.Connection:
+        """
+        Check out an exclusive connection (used by SQLiteUnitOfWork).
+
+        The connection is not shared with other callers until close().
+        """
+        conn: PooledConnection | None = None
+        with self._lock:
+            self._acquires += 1
+            while self._idle:
+                candidate = self._idle.pop()
+                if self._is_stale(candidate):
+                    self._stale_reopens += 1
+                    self._discard_locked(candidate)
+                    continue
+                conn = candidate
+                self._reuses += 1
+                break
+            self._dedicated_in_use += 1
+
+        if conn is None:
+            try:
+                conn = self._open(dedicated=True)
+            except Exception:
+                with self._lock:
+                    self._dedicated_in_use -= 1
+                raise
+
+        conn.row_factory = row_factory
+        conn._depth = 1
+        return conn
+
+    def stats(self) -> PoolStats:
+        """Snapshot of pool counters."""
+        with self._lock:
+            return PoolStats(
+                db_path=self.db_path,
+                connections_opened=self._opened,
+                connections_closed=self._closed_count,
+                acquires=self._acquires,
+                reuses=self._reuses,
+                stale_reopens=self._stale_reopens,
+                thread_connections=len(self._thread_conns),
+                dedicated_in_use=self._dedicated_in_use,
+                dedicated_idle=len(self._idle),
+            )
+
+    def close_all(self) -> None:
+        """
+        Close every idle connection and retire the pool.
+
+        Connections currently in use are closed when they are released.
+        """
+        with self._lock:
+            self._closed = True
+            conns = [
+                self._thread_conns.pop(ident)
+                for ident, conn in list(self._thread_conns.items())
+                if conn._depth == 0
+            ]
+            conns.extend(self._idle)
+            self._idle = []
+        for conn in conns:
+            self._discard(conn)
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed
+
+    # --- Internals ---
+
+    def _open(self, *, dedicated: bool) -> PooledConnection:
+        cfg = self.config
+        conn = sqlite3.connect(
+            self.db_path,
+            factory=PooledConnection,
+            check_same_thread=False,
+            timeout=cfg.busy_timeout_ms / 1000,
+        )
+        assert isinstance(conn, PooledConnection)
+        conn._pool = None
+        try:
+            conn.execute(f"PRAGMA busy_timeout = {int(cfg.busy_timeout_ms)};")
+            if self._track_file:
+                conn.execute(f"PRAGMA journal_mode = {cfg.journal_mode};")
+                conn.execute(f"PRAGMA mmap_size = {int(cfg.mmap_size)};")
+            conn.execute(f"PRAGMA synchronous = {cfg.synchronous};")
+            conn.execute(f"PRAGMA cache_size = -{int(cfg.cache_size_kib)};")
+            if cfg.foreign_keys:
+                conn.execute("PRAGMA foreign_keys = ON;")
+        except Exception:
+            conn.close()
+            raise
+
+        conn._pool = self
+        conn._depth = 0
+        conn._dedicated = dedicated
+        conn._factories = []
+        conn._file_id = self._file_id()
+        with self._lock:
+            self._opened += 1
+        return conn
+
+    def _release(self, conn: PooledConnection) -> None:
+        if conn._depth <= 0:
+            return
+        conn._depth -= 1
+
+        if not conn._dedicated:
+            conn.row_factory = conn._factories.pop() if conn._factories else None
+            if conn._depth > 0:
+                return
+            self._reset(conn)
+            if self._closed:
+                with self._lock:
+                    for ident, owned in list(self._thread_conns.items()):
+                        if owned is conn:
+                            del self._thread_conns[ident]
+                self._discard(conn)
+            return
+
+        self._reset(conn)
+        with self._lock:
+            self._dedicated_in_use -= 1
+            if not self._closed and len(self._idle) < self.config.max_idle_dedicated:
+                self._idle.append(conn)
+                return
+        self._discard(conn)
+
+    def _reset(self, conn: PooledConnection) -> None:
+        """Discard uncommitted work, matching the semantics of a real close()."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            logger.exception("Rollback on release failed for %s", self.db_path)
+
+    def _discard(self, conn: PooledConnection) -> None:
+        with self._lock:
+            self._discard_locked(conn)
+
+    def _discard_locked(self, conn: PooledConnection) -> None:
+        try:
+            conn._close_physical()
+        except sqlite3.Error:
+            pass
+        self._closed_count += 1
+
+    def _file_id(self) -> tuple[int, int] | None:
+        if not self._track_file:
+            return None
+        try:
+            st = os.stat(self.db_path)
+        except OSError:
+            return None
+        return (st.st_dev, st.st_ino)
+
+    def _is_stale(self, conn: PooledConnection) -> bool:
+        """True if the database file was removed or replaced since open."""
+        if not self._track_file:
+            return False
+        return self._file_id() != conn._file_id
+
+    def _reap_dead_threads(self) -> None:
+        """Close idle connections owned by threads that have exited (lock held)."""
+        alive = {t.ident for t in threading.enumerate()}
+        dead = [
+            ident
+            for ident, conn in self._thread_conns.items()
+            if ident not in alive and conn._depth == 0
+        ]
+        for ident in dead:
+            self._discard_locked(self._thread_conns.pop(ident))
+
+
+# -----------------------------------------------------------------------------
+# Registry
+# -----------------------------------------------------------------------------
+
+# Pools are keyed by database path. Production has a single database; the
+# bound only matters for test suites that create many temporary databases.
+MAX_POOLS = 32
+
+_pools: dict[str, SQLiteConnectionPool] = {}
+_pools_lock = threading.Lock()
+_default_config: PoolConfig | None = None
+
+
+def get_pool(db_path: str) -> SQLiteConnectionPool:
+    """Get (or create) the shared pool for a database path."""
+    pool = _pools.get(db_path)
+    if pool is not None and not pool.is_closed:
+        return pool
+
+    evicted: list[SQLiteConnectionPool] = []
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None or pool.is_closed:
+            pool = SQLiteConnectionPool(db_path, _default_config)
+            _pools[db_path] = pool
+            while len(_pools) > MAX_POOLS:
+                oldest = next(iter(_pools))
+                evicted.append(_pools.pop(oldest))
+
+    for old in evicted:
+        old.close_all()
+    return pool
+
+
+def configure_pools(config: PoolConfig) -> None:
+    """Set the PoolConfig used for pools created from now on."""
+    global _default_config
+    _default_config = config
+
+
+def get_pool_stats() -> list[PoolStats]:
+    """Stats for every live pool."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [p.stats() for p in pools]
+
+
+def close_all_pools() -> None:
+    """Close every pool (shutdown hook and test teardown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close_all()
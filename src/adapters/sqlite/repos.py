@@ -5,6 +5,9 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
+from src.adapters.auth.principal_cache import invalidate_principal
+from src.adapters.sqlite.blocks import load_blocks_by_item
+from src.adapters.sqlite.pool import get_pool
 from src.domain.entities import (
     Asset,
     CollaborationGrant,
@@ -30,10 +33,7 @@ class SQLiteContentRepo:
         self.db_path = db_path
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = dict_factory
-        conn.execute("PRAGMA foreign_keys = ON;")
-        return conn
+        return get_pool(self.db_path).acquire(dict_factory)
 
     def save(self, item: ContentItem) -> ContentItem:
         conn = self._get_conn()
@@ -104,41 +104,7 @@ class SQLiteContentRepo:
             ).fetchone()
             if not row:
                 return None
-
-            # Fetch blocks
-            block_rows = conn.execute(
-                "SELECT * FROM content_blocks WHERE content_item_id = ? ORDER BY position ASC",
-                (str(item_id),),
-            ).fetchall()
-
-            blocks = []
-            for b_row in block_rows:
-                blocks.append(
-                    ContentBlock(
-                        id=str(b_row["id"]),
-                        block_type=b_row["block_type"],
-                        data_json=json.loads(b_row["data_json"]),
-                    )
-                )
-
-            def parse_dt(s: str | None) -> datetime | None:
-                return datetime.fromisoformat(s) if s else None
-
-            return ContentItem(
-                id=UUID(row["id"]),
-                type=row["type"],
-                slug=row["slug"],
-                title=row["title"],
-                summary=row["summary"],
-                status=row["status"],
-                publish_at=parse_dt(row["publish_at"]),
-                published_at=parse_dt(row["published_at"]),
-                owner_user_id=UUID(row["owner_user_id"]),
-                visibility=row["visibility"],
-                created_at=parse_dt(row["created_at"]) or datetime.min,  # should not be None
-                updated_at=parse_dt(row["updated_at"]) or datetime.min,
-                blocks=blocks,
-            )
+            return self._hydrate(conn, [row])[0]
         finally:
             conn.close()
 
@@ -146,11 +112,11 @@ class SQLiteContentRepo:
         conn = self._get_conn()
         try:
             row = conn.execute(
-                "SELECT id FROM content_items WHERE slug = ? AND type = ?", (slug, item_type)
+                "SELECT * FROM content_items WHERE slug = ? AND type = ?", (slug, item_type)
             ).fetchone()
             if not row:
                 return None
-            return self.get_by_id(UUID(row["id"]))
+            return self._hydrate(conn, [row])[0]
         finally:
             conn.close()
 
@@ -180,98 +146,161 @@ class SQLiteContentRepo:
         status: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        include_blocks: bool = True,
     ) -> tuple[list[ContentItem], int]:
-        filters = {}
-        if content_type:
-            filters["type"] = content_type
-        if status:
-            filters["status"] = status
-
-        # Reuse internal list logic or call list_items
-        # But list_items takes filters dict and returns list
-        # I need to implement pagination and total count here or update list_items logic.
-        # Since I'm editing the repos file, I can just implement it.
+        """
+        List content with pagination. Returns (items, total_count).
 
+        include_blocks=False is a projection for listing callers (home page,
+        sitemap, admin tables) that only need item fields: blocks are not
+        loaded and every item has blocks=[].
+        """
         conn = self._get_conn()
         try:
-            # Base query
-            query = "SELECT id FROM content_items WHERE 1=1"
+            where = " WHERE 1=1"
             params: list[str | int] = []
 
             if content_type:
-                query += " AND type = ?"
+                where += " AND type = ?"
                 params.append(content_type)
             if status:
-                query += " AND status = ?"
+                where += " AND status = ?"
                 params.append(status)
 
-            # Get Total
-            count_query = f"SELECT COUNT(*) as cnt FROM ({query})"
-            row = conn.execute(count_query, params).fetchone()
+            row = conn.execute(
+                f"SELECT COUNT(*) as cnt FROM content_items{where}", params
+            ).fetchone()
             total = row["cnt"] if row else 0
 
-            # Pagination
-            query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-            params.append(limit)
-            params.append(offset)
-
-            rows = conn.execute(query, params).fetchall()
-            items = []
-            for row in rows:
-                item = self.get_by_id(UUID(row["id"]))
-                if item:
-                    items.append(item)
-
-            return items, total
+            rows = conn.execute(
+                f"SELECT * FROM content_items{where} ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                [*params, limit, offset],
+            ).fetchall()
+            return self._hydrate(conn, rows, include_blocks=include_blocks), total
         finally:
             conn.close()
 
-    def list_items(self, filters: dict[str, Any]) -> builtins.list[ContentItem]:
-        # Legacy support using new logic if possible, or just wrap
+    def list_items(
+        self, filters: dict[str, Any], include_blocks: bool = True
+    ) -> builtins.list[ContentItem]:
         ct = filters.get("type")
         st = filters.get("status")
-        # Legacy didn't paginate explicitly always? Or defaults?
-        # Just use list() with defaults
-        items, _ = self.list(content_type=ct, status=st, limit=100)
+        items, _ = self.list(content_type=ct, status=st, limit=100, include_blocks=include_blocks)
         return items
 
+    def version(self) -> tuple[int, str | None]:
+        """Cheap change marker for the sitemap store: (rows, latest update)."""
+        conn = self._get_conn()
+        try:
+            row = conn.execute(
+                "SELECT COUNT(*) AS n, MAX(updated_at) AS latest FROM content_items"
+            ).fetchone()
+            return row["n"], row["latest"]
+        finally:
+            conn.close()
+
+    def list_published_refs(
+        self,
+    ) -> builtins.list[tuple[UUID, str, str, datetime | None, datetime | None]]:
+        """
+        (id, slug, type, published_at, updated_at) for every published item.
+
+        Column projection with no limit, for the sitemap store.
+        """
+        conn = self._get_conn()
+        try:
+            rows = conn.execute(
+                """
+                SELECT id, slug, type, published_at, updated_at FROM content_items
+                WHERE status = 'published'
+                """
+            ).fetchall()
+        finally:
+            conn.close()
+
+        def parse_dt(s: str | None) -> datetime | None:
+            return datetime.fromisoformat(s) if s else None
+
+        return [
+            (
+                UUID(row["id"]),
+                row["slug"],
+                row["type"],
+                parse_dt(row["published_at"]),
+                parse_dt(row["updated_at"]),
+            )
+            for row in rows
+        ]
+
     def get_related_published(
         self,
         *,
         exclude_id: UUID,
         limit: int = 3,
+        include_blocks: bool = True,
     ) -> builtins.list[ContentItem]:
         """Get related published content, excluding the given ID."""
         conn = self._get_conn()
         try:
             rows = conn.execute(
                 """
-                SELECT id FROM content_items
+                SELECT * FROM content_items
                 WHERE status = 'published' AND id != ?
                 ORDER BY published_at DESC
                 LIMIT ?
                 """,
                 (str(exclude_id), limit),
             ).fetchall()
-            items = []
-            for row in rows:
-                item = self.get_by_id(UUID(row["id"]))
-                if item:
-                    items.append(item)
-            return items
+            return self._hydrate(conn, rows, include_blocks=include_blocks)
         finally:
             conn.close()
 
+    def _hydrate(
+        self,
+        conn: sqlite3.Connection,
+        rows: builtins.list[dict[str, Any]],
+        include_blocks: bool = True,
+    ) -> builtins.list[ContentItem]:
+        """
+        Build ContentItems for a batch of content_items rows.
+
+        Blocks for the whole batch come from load_blocks_by_item() rather
+        than one query per item.
+        """
+        blocks_by_item = (
+            load_blocks_by_item(conn, [r["id"] for r in rows]) if include_blocks else {}
+        )
+        return [self._map_row(r, blocks_by_item.get(r["id"], [])) for r in rows]
+
+    def _map_row(
+        self, row: dict[str, Any], blocks: builtins.list[ContentBlock]
+    ) -> ContentItem:
+        def parse_dt(s: str | None) -> datetime | None:
+            return datetime.fromisoformat(s) if s else None
+
+        return ContentItem(
+            id=UUID(row["id"]),
+            type=row["type"],
+            slug=row["slug"],
+            title=row["title"],
+            summary=row["summary"],
+            status=row["status"],
+            publish_at=parse_dt(row["publish_at"]),
+            published_at=parse_dt(row["published_at"]),
+            owner_user_id=UUID(row["owner_user_id"]),
+            visibility=row["visibility"],
+            created_at=parse_dt(row["created_at"]) or datetime.min,  # should not be None
+            updated_at=parse_dt(row["updated_at"]) or datetime.min,
+            blocks=blocks,
+        )
+
 
 class SQLiteAssetRepo:
     def __init__(self, db_path: str):
         self.db_path = db_path
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
-        return conn
+        return get_pool(self.db_path).acquire(sqlite3.Row)
 
     def save(self, asset: Asset) -> Asset:
         conn = self._get_conn()
@@ -409,10 +438,7 @@ class SQLiteLinkRepo:
         self.db_path = db_path
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = dict_factory
-        conn.execute("PRAGMA foreign_keys = ON;")
-        return conn
+        return get_pool(self.db_path).acquire(dict_factory)
 
     def save(self, link: LinkItem) -> LinkItem:
         conn = self._get_conn()
@@ -486,10 +512,7 @@ class SQLiteUserRepo:
         self.db_path = db_path
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = dict_factory
-        conn.execute("PRAGMA foreign_keys = ON;")
-        return conn
+        return get_pool(self.db_path).acquire(dict_factory)
 
     def save(self, user: User) -> None:
         conn = self._get_conn()
@@ -504,7 +527,8 @@ class SQLiteUserRepo:
                     display_name=excluded.display_name,
                     password_hash=excluded.password_hash,
                     status=excluded.status,
-                    updated_at=excluded.updated_at
+                    updated_at=excluded.updated_at,
+                    auth_version=users.auth_version + 1
             """,
                 (
                     str(user.id),
@@ -533,6 +557,8 @@ class SQLiteUserRepo:
             conn.commit()
         finally:
             conn.close()
+        # Status and role changes must not be served from cached principals
+        invalidate_principal(user.id)
 
     def get_by_email(self, email: str) -> User | None:
         conn = self._get_conn()
@@ -562,6 +588,17 @@ class SQLiteUserRepo:
         finally:
             conn.close()
 
+    def auth_version(self, user_id: UUID) -> int | None:
+        """Counter bumped by every save (None if the user does not exist)."""
+        conn = self._get_conn()
+        try:
+            row = conn.execute(
+                "SELECT auth_version FROM users WHERE id = ?", (str(user_id),)
+            ).fetchone()
+            return row["auth_version"] if row else None
+        finally:
+            conn.close()
+
     def _map_row_to_user(self, conn: sqlite3.Connection, row: dict[str, Any]) -> User:
         # Fetch roles
         role_rows = conn.execute(
@@ -586,10 +623,7 @@ class SQLiteInviteRepo:
         self.db_path = db_path
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = dict_factory
-        conn.execute("PRAGMA foreign_keys = ON;")
-        return conn
+        return get_pool(self.db_path).acquire(dict_factory)
 
     def save(self, invite: Invite) -> None:
         conn = self._get_conn()
@@ -669,10 +703,7 @@ class SQLiteCollabRepo:
         self.db_path = db_path
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = dict_factory
-        conn.execute("PRAGMA foreign_keys = ON;")
-        return conn
+        return get_pool(self.db_path).acquire(dict_factory)
 
     def save(self, grant: CollaborationGrant) -> None:
         conn = self._get_conn()
@@ -745,10 +776,7 @@ class SQLiteSiteSettingsRepo:
         self.db_path = db_path
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = dict_factory
-        conn.execute("PRAGMA foreign_keys = ON;")
-        return conn
+        return get_pool(self.db_path).acquire(dict_factory)
 
     def get(self) -> SiteSettings | None:
         conn = self._get_conn()
@@ -807,10 +835,7 @@ class SQLitePublishJobRepo:
         self.db_path = db_path
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = dict_factory
-        conn.execute("PRAGMA foreign_keys = ON;")
-        return conn
+        return get_pool(self.db_path).acquire(dict_factory)
 
     def _map_row(self, row: dict[str, Any]) -> Any:
         # Import here to avoid circular dependency if models imports repo (unlikely but safe)
@@ -966,6 +991,35 @@ class SQLitePublishJobRepo:
         finally:
             conn.close()
 
+    def claim_due_jobs(self, worker_id: str, now_utc: datetime, limit: int = 10) -> list[Any]:
+        """Claim up to limit due jobs in one atomic UPDATE ... RETURNING."""
+        conn = self._get_conn()
+        try:
+            now_iso = now_utc.isoformat()
+            rows = conn.execute(
+                """
+                UPDATE publish_jobs
+                SET status = 'running', claimed_by = ?, updated_at = ?
+                WHERE id IN (
+                    SELECT id FROM publish_jobs
+                    WHERE (status = 'queued' OR status = 'retry_wait')
+                    AND (next_retry_at IS NULL OR next_retry_at <= ?)
+                    AND publish_at_utc <= ?
+                    ORDER BY publish_at_utc ASC
+                    LIMIT ?
+                )
+                RETURNING *
+            """,
+                (worker_id, now_iso, now_iso, now_iso, limit),
+            ).fetchall()
+            conn.commit()
+
+            jobs = [self._map_row(r) for r in rows]
+            jobs.sort(key=lambda job: job.publish_at_utc)  # RETURNING order is unspecified
+            return jobs
+        finally:
+            conn.close()
+
     def list_in_range(
         self,
         start_utc: datetime,
@@ -1005,10 +1059,7 @@ class SQLiteRedirectRepo:
         self.db_path = db_path
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = dict_factory
-        conn.execute("PRAGMA foreign_keys = ON;")
-        return conn
+        return get_pool(self.db_path).acquire(dict_factory)
 
     def save(self, redirect: Any) -> Any:
         conn = self._get_conn()
@@ -1048,10 +1099,7 @@ class SQLiteRedirectRepo:
         return self._get_one("SELECT * FROM redirects WHERE id = ?", (str(redirect_id),))
 
     def get_by_source(self, source_path: str) -> Any | None:
-        print(f"DEBUG REPO: get_by_source path={source_path}")
-        res = self._get_one("SELECT * FROM redirects WHERE source_path = ?", (source_path,))
-        print(f"DEBUG REPO: result={res}")
-        return res
+        return self._get_one("SELECT * FROM redirects WHERE source_path = ?", (source_path,))
 
     def delete(self, redirect_id: UUID) -> None:
         conn = self._get_conn()
@@ -1069,6 +1117,17 @@ class SQLiteRedirectRepo:
         finally:
             conn.close()
 
+    def version(self) -> tuple[int, str | None]:
+        """Cheap change marker for the compiled redirect index: (rows, latest update)."""
+        conn = self._get_conn()
+        try:
+            row = conn.execute(
+                "SELECT COUNT(*) AS n, MAX(updated_at) AS latest FROM redirects"
+            ).fetchone()
+            return row["n"], row["latest"]
+        finally:
+            conn.close()
+
     def _get_one(self, query: str, params: tuple[Any, ...]) -> Any | None:
         conn = self._get_conn()
         try:
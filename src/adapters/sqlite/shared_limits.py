@@ -0,0 +1,531 @@
+"""
+SQLite Shared Limits Store.
+
+Cross-process rate-limit counters and analytics dedupe keys for multi-worker
+deployments (uvicorn --workers N). Every worker opens the same small SQLite
+file, so limits are no longer multiplied by the worker count and a duplicate
+seen by one worker is rejected by the others.
+
+The state is ephemeral, so it lives in its own database file (not the
+migrated application schema) and the tables are created on first use.
+
+Key behaviors:
+- WAL journal via the shared connection pool; concurrent workers never
+  block readers
+- Rate limits use the same sliding-window counters as the in-process engine;
+  each worker batches its hits locally and syncs a key when the batch fills
+  or its cached view is older than sync_interval, so the hot path rarely
+  touches disk (overshoot is bounded by workers x batch size)
+- New keys on batched limits start counting locally; their first sync
+  reads the shared counters together with the first batch
+- Small limits (batch of one) check and count each hit inside one
+  BEGIN IMMEDIATE transaction, so they hold exactly across workers
+- Per-key state sits behind striped locks; no process-wide lock is held
+  during SQLite I/O, so a sync for one key does not stall the others
+- Dedupe keys are claimed with a single conditional upsert (insert, or take
+  over an expired row); keys known to be live are answered from a local cache
+- Expired rows are deleted in bounded batches on a periodic sweep
+- Wall-clock time, since monotonic clocks are not comparable across restarts
+"""
+
+from __future__ import annotations
+
+import math
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from contextlib import ExitStack
+from dataclasses import dataclass
+
+from src.adapters.rate_limiter import WindowCounter
+from src.adapters.sqlite.pool import get_pool
+from src.domain.stats import CounterSnapshot
+
+# Rows deleted per cleanup statement (keeps write locks short)
+CLEANUP_BATCH = 500
+
+# Maximum local hits buffered per key before syncing to the database
+DEFAULT_MAX_BATCH = 10
+
+# Locks guarding per-key state; keys hash onto one of them
+LOCK_STRIPES = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limit_windows (
+    key TEXT PRIMARY KEY,
+    window_seconds REAL NOT NULL,
+    window_start REAL NOT NULL,
+    previous INTEGER NOT NULL,
+    current INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dedupe_keys (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_dedupe_keys_expires ON dedupe_keys(expires_at);
+"""
+
+
+def ensure_schema(db_path: str) -> None:
+    """Create the shared-limits tables if they do not exist."""
+    with get_pool(db_path).connection(None) as conn:
+        conn.executescript(_SCHEMA)
+
+
+@dataclass(frozen=True)
+class SharedLimitStats(CounterSnapshot):
+    local_keys: int
+    allowed: int
+    denied: int
+    syncs: int
+    flushed_hits: int
+    purged_rows: int
+
+
+# -----------------------------------------------------------------------------
+# Rate limits
+# -----------------------------------------------------------------------------
+
+
+class _LocalWindow:
+    """A worker's cached view of one key plus its unsynced hits."""
+
+    __slots__ = ("counter", "pending", "batch", "synced_at")
+
+    def __init__(self, counter: WindowCounter, synced_at: float) -> None:
+        self.counter = counter
+        self.pending = 0
+        self.batch = 1
+        self.synced_at = synced_at
+
+
+class SQLiteRateLimitStore:
+    """
+    Sliding-window rate limiter whose counters are shared through SQLite.
+
+    Drop-in RateLimitEngine: install it with configure_shared_rate_limiter()
+    and every limiter adapter in the process uses it.
+
+    Each key's cached state is guarded by one of LOCK_STRIPES locks, held
+    across that key's database I/O so its pending hits are flushed exactly
+    once. The store-wide lock only covers the key table and counters and
+    is never held while SQLite is busy, so a slow sync delays only hits on
+    keys sharing its stripe.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        clock: Callable[[], float] = time.time,
+        sync_interval: float = 0.5,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        sweep_interval: float = 60.0,
+    ) -> None:
+        """Initialize store (creates tables if needed)."""
+        self.db_path = db_path
+        self._clock = clock
+        self._sync_interval = sync_interval
+        self._max_batch = max(1, max_batch)
+        self._sweep_interval = sweep_interval
+        self._local: dict[str, _LocalWindow] = {}
+        self._stripes = tuple(threading.Lock() for _ in range(LOCK_STRIPES))
+        self._lock = threading.Lock()
+        self._next_sweep = clock() + sweep_interval
+
+        self._allowed = 0
+        self._denied = 0
+        self._syncs = 0
+        self._flushed = 0
+        self._purged = 0
+
+        ensure_schema(db_path)
+
+    # --- RateLimitEngine ---
+
+    def hit(self, key: str, limit: int, window_seconds: float) -> bool:
+        """Record a request for key if it is under limit; return whether it was."""
+        if limit <= 0:
+            self._decided(False)
+            return False
+
+        now = self._clock()
+        self._maybe_sweep(now)
+        batch = self._batch_for(limit)
+        with self._stripe(key):
+            if batch == 1:
+                allowed = self._claim(key, limit, window_seconds, now)
+            else:
+                state = self._state(key, window_seconds, now, batch)
+                state.batch = batch
+                allowed = state.counter.estimate(now) + state.pending < limit
+                if allowed:
+                    state.pending += 1
+                    if state.pending >= state.batch:
+                        self._sync(key, state, window_seconds, now)
+
+        self._decided(allowed)
+        return allowed
+
+    def peek(self, key: str, limit: int, window_seconds: float) -> tuple[bool, int]:
+        """Check key against limit without recording; returns (allowed, remaining)."""
+        now = self._clock()
+        self._maybe_sweep(now)
+        batch = self._batch_for(limit)
+        with self._stripe(key):
+            state = self._state(key, window_seconds, now, batch)
+            state.batch = batch
+            used = state.counter.estimate(now) + state.pending
+        return used < limit, max(0, limit - math.ceil(used))
+
+    def record(self, key: str, window_seconds: float) -> None:
+        """Count one request against key."""
+        now = self._clock()
+        self._maybe_sweep(now)
+        with self._stripe(key):
+            known = self._local.get(key)
+            state = self._state(key, window_seconds, now, known.batch if known else 1)
+            state.pending += 1
+            if state.pending >= state.batch:
+                self._sync(key, state, window_seconds, now)
+
+    def reset(self, key: str | None = None) -> None:
+        """Forget one key, or every key, in this worker and the database."""
+        if key is not None:
+            with self._stripe(key), get_pool(self.db_path).connection(None) as conn:
+                with self._lock:
+                    self._local.pop(key, None)
+                conn.execute("DELETE FROM rate_limit_windows WHERE key = ?", (key,))
+                conn.commit()
+            return
+
+        with ExitStack() as stack:
+            for stripe in self._stripes:
+                stack.enter_context(stripe)
+            with self._lock:
+                self._local.clear()
+            with get_pool(self.db_path).connection(None) as conn:
+                conn.execute("DELETE FROM rate_limit_windows")
+                conn.commit()
+
+    # --- Maintenance ---
+
+    def flush(self) -> None:
+        """Push every buffered hit to the database (shutdown hook)."""
+        now = self._clock()
+        for key in list(self._local):
+            with self._stripe(key):
+                state = self._local.get(key)
+                if state is not None and state.pending:
+                    self._sync(key, state, state.counter.window, now)
+
+    def sweep(self) -> int:
+        """Drop idle local keys and expired rows now; returns rows purged."""
+        now = self._clock()
+        with self._lock:
+            self._next_sweep = now + self._sweep_interval
+        return self._sweep(now)
+
+    def stats(self) -> SharedLimitStats:
+        """Snapshot of store counters."""
+        with self._lock:
+            return SharedLimitStats(
+                local_keys=len(self._local),
+                allowed=self._allowed,
+                denied=self._denied,
+                syncs=self._syncs,
+                flushed_hits=self._flushed,
+                purged_rows=self._purged,
+            )
+
+    # --- Internals ---
+
+    def _stripe(self, key: str) -> threading.Lock:
+        return self._stripes[hash(key) % LOCK_STRIPES]
+
+    def _batch_for(self, limit: int) -> int:
+        """Hits buffered before a sync; small limits sync on every hit."""
+        return max(1, min(self._max_batch, limit // 10))
+
+    def _decided(self, allowed: bool) -> None:
+        with self._lock:
+            if allowed:
+                self._allowed += 1
+            else:
+                self._denied += 1
+
+    def _state(self, key: str, window_seconds: float, now: float, batch: int) -> _LocalWindow:
+        """Cached view of key, synced if missing or stale (stripe lock held)."""
+        state = self._local.get(key)
+        if state is None and batch > 1:
+            # New key on a batched limit: count locally and read the shared
+            # counters with the first batch (same bound as any batch)
+            state = _LocalWindow(WindowCounter(float(window_seconds), now), now)
+            with self._lock:
+                self._local[key] = state
+            return state
+
+        if (
+            state is None
+            or state.counter.window != window_seconds
+            or now - state.synced_at >= self._sync_interval
+        ):
+            return self._sync(key, state, window_seconds, now)
+
+        state.counter.advance(now)
+        return state
+
+    def _sync(
+        self,
+        key: str,
+        state: _LocalWindow | None,
+        window_seconds: float,
+        now: float,
+    ) -> _LocalWindow:
+        """Flush pending hits for key and refresh the cached counters (stripe lock held)."""
+        pending = state.pending if state is not None else 0
+        window = float(window_seconds)
+
+        with get_pool(self.db_path).connection(None) as conn:
+            if pending:
+                # Serialize writers so concurrent workers never lose increments
+                conn.execute("BEGIN IMMEDIATE")
+            counter = self._load_counter(conn, key, window, now)
+            if pending:
+                counter.current += pending
+                self._store_counter(conn, key, counter)
+                conn.commit()
+
+        return self._cache(key, state, counter, pending, now)
+
+    def _claim(self, key: str, limit: int, window_seconds: float, now: float) -> bool:
+        """
+        Check and count one hit in a single write transaction (stripe lock held).
+
+        Used for small limits, where a check against a cached count followed
+        by a separate increment would let concurrent workers both take the
+        last slot.
+        """
+        state = self._local.get(key)
+        pending = state.pending if state is not None else 0
+        window = float(window_seconds)
+
+        with get_pool(self.db_path).connection(None) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            counter = self._load_counter(conn, key, window, now)
+            counter.current += pending
+            allowed = counter.estimate(now) < limit
+            if allowed:
+                counter.current += 1
+            if allowed or pending:
+                self._store_counter(conn, key, counter)
+            conn.commit()
+
+        fresh = self._cache(key, state, counter, pending + int(allowed), now)
+        fresh.batch = 1
+        return allowed
+
+    def _load_counter(
+        self, conn: sqlite3.Connection, key: str, window: float, now: float
+    ) -> WindowCounter:
+        row = conn.execute(
+            "SELECT window_seconds, window_start, previous, current "
+            "FROM rate_limit_windows WHERE key = ?",
+            (key,),
+        ).fetchone()
+
+        if row is None or row[0] != window:
+            return WindowCounter(window, now)
+        counter = WindowCounter(window, row[1])
+        counter.previous, counter.current = row[2], row[3]
+        counter.advance(now)
+        return counter
+
+    def _store_counter(self, conn: sqlite3.Connection, key: str, counter: WindowCounter) -> None:
+        conn.execute(
+            """
+            INSERT INTO rate_limit_windows
+                (key, window_seconds, window_start, previous, current)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                window_seconds = excluded.window_seconds,
+                window_start = excluded.window_start,
+                previous = excluded.previous,
+                current = excluded.current
+            """,
+            (key, counter.window, counter.start, counter.previous, counter.current),
+        )
+
+    def _cache(
+        self,
+        key: str,
+        state: _LocalWindow | None,
+        counter: WindowCounter,
+        flushed: int,
+        now: float,
+    ) -> _LocalWindow:
+        """Replace the worker's cached view of key after a sync."""
+        fresh = _LocalWindow(counter, now)
+        if state is not None:
+            fresh.batch = state.batch
+        with self._lock:
+            self._local[key] = fresh
+            self._syncs += 1
+            self._flushed += flushed
+        return fresh
+
+    def _maybe_sweep(self, now: float) -> None:
+        """Sweep if due; called before taking any stripe lock."""
+        with self._lock:
+            if now < self._next_sweep:
+                return
+            self._next_sweep = now + self._sweep_interval
+        self._sweep(now)
+
+    def _sweep(self, now: float) -> int:
+        for key, state in list(self._local.items()):
+            if state.counter.idle(now):
+                with self._stripe(key), self._lock:
+                    if self._local.get(key) is state:
+                        del self._local[key]
+
+        purged = _delete_in_batches(
+            self.db_path,
+            "DELETE FROM rate_limit_windows WHERE rowid IN ("
+            "SELECT rowid FROM rate_limit_windows "
+            "WHERE window_start + 2 * window_seconds <= ? LIMIT ?)",
+            now,
+        )
+        with self._lock:
+            self._purged += purged
+        return purged
+
+
+# -----------------------------------------------------------------------------
+# Dedupe
+# -----------------------------------------------------------------------------
+
+
+class SQLiteDedupeStore:
+    """
+    DedupeStorePort shared across worker processes.
+
+    Positive answers are cached locally until the key expires; negative
+    answers always consult the database, since another worker may have
+    claimed the key since.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        clock: Callable[[], float] = time.time,
+        cleanup_interval: float = 60.0,
+        max_local_keys: int = 10_000,
+    ) -> None:
+        """Initialize store (creates tables if needed)."""
+        self.db_path = db_path
+        self._clock = clock
+        self._cleanup_interval = cleanup_interval
+        self._max_local_keys = max_local_keys
+        self._known: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._next_cleanup = clock() + cleanup_interval
+
+        ensure_schema(db_path)
+
+    def exists(self, key: str) -> bool:
+        """Check if key exists (not expired)."""
+        now = self._clock()
+        if self._known_live(key, now):
+            return True
+
+        with get_pool(self.db_path).connection(None) as conn:
+            row = conn.execute(
+                "SELECT expires_at FROM dedupe_keys WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+        if row is None:
+            return False
+        self._remember(key, row[0])
+        return True
+
+    def add(self, key: str, ttl_seconds: int) -> bool:
+        """Add key with TTL. Returns True if added (new), False if exists."""
+        now = self._clock()
+        if self._known_live(key, now):
+            return False
+        if now >= self._next_cleanup:
+            self.cleanup_expired()
+
+        expires_at = now + ttl_seconds
+        with get_pool(self.db_path).connection(None) as conn:
+            # Insert, or take over a row whose TTL has lapsed; otherwise ignore
+            cur = conn.execute(
+                """
+                INSERT INTO dedupe_keys (key, expires_at) VALUES (?, ?)
+                ON CONFLICT(key) DO UPDATE SET expires_at = excluded.expires_at
+                WHERE dedupe_keys.expires_at <= ?
+                """,
+                (key, expires_at, now),
+            )
+            conn.commit()
+            added = cur.rowcount == 1
+            if not added:
+                row = conn.execute(
+                    "SELECT expires_at FROM dedupe_keys WHERE key = ?", (key,)
+                ).fetchone()
+                expires_at = row[0] if row is not None else now
+
+        self._remember(key, expires_at)
+        return added
+
+    def cleanup_expired(self) -> int:
+        """Remove expired entries. Returns count removed."""
+        now = self._clock()
+        with self._lock:
+            self._next_cleanup = now + self._cleanup_interval
+            self._known = {k: exp for k, exp in self._known.items() if exp > now}
+        return _delete_in_batches(
+            self.db_path,
+            "DELETE FROM dedupe_keys WHERE rowid IN ("
+            "SELECT rowid FROM dedupe_keys WHERE expires_at <= ? LIMIT ?)",
+            now,
+        )
+
+    def clear(self) -> None:
+        """Clear all entries (for testing)."""
+        with self._lock:
+            self._known.clear()
+        with get_pool(self.db_path).connection(None) as conn:
+            conn.execute("DELETE FROM dedupe_keys")
+            conn.commit()
+
+    # --- Local cache ---
+
+    def _known_live(self, key: str, now: float) -> bool:
+        with self._lock:
+            expires_at = self._known.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= now:
+                del self._known[key]
+                return False
+            return True
+
+    def _remember(self, key: str, expires_at: float) -> None:
+        with self._lock:
+            if key not in self._known and len(self._known) >= self._max_local_keys:
+                del self._known[next(iter(self._known))]
+            self._known[key] = expires_at
+
+
+def _delete_in_batches(db_path: str, sql: str, now: float) -> int:
+    """Run a `... <= ? LIMIT ?` delete until no rows remain; returns rows removed."""
+    removed = 0
+    with get_pool(db_path).connection(None) as conn:
+        while True:
+            cur = conn.execute(sql, (now, CLEANUP_BATCH))
+            conn.commit()
+            removed += cur.rowcount
+            if cur.rowcount < CLEANUP_BATCH:
+                return removed
@@ -12,10 +12,16 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from src.adapters.auth.principal_cache import invalidate_principal
+from src.adapters.sqlite.blocks import load_blocks_by_item
+from src.adapters.sqlite.pool import get_pool
+from src.components.analytics._aggregate import AggregateIncrement, DashboardSummary
+from src.components.audit._impl import AuditAction, AuditEntry, AuditQuery, EntityType
 from src.components.newsletter.models import NewsletterSubscriber, SubscriberStatus
 from src.core.entities import (
     AnalyticsEventAggregate,
@@ -34,7 +40,6 @@ from src.domain.entities import ContentBlock
 # Helper functions
 # -----------------------------------------------------------------------------
 
-
 def dict_factory(cursor: sqlite3.Cursor, row: tuple[Any, ...]) -> dict[str, Any]:
     """Convert SQLite row to dictionary."""
     return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
@@ -63,17 +68,14 @@ class SQLiteRepoBase:
         self._external_conn = connection
 
     def _get_conn(self) -> sqlite3.Connection:
-        """Get database connection (uses external if provided)."""
+        """Get database connection (uses external if provided, else the shared pool)."""
         if self._external_conn is not None:
             return self._external_conn
 
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = dict_factory
-        conn.execute("PRAGMA foreign_keys = ON;")
-        return conn
+        return get_pool(self.db_path).acquire(dict_factory)
 
     def _should_close(self) -> bool:
-        """Whether to close connection after use."""
+        """Whether to release the connection after use (pooled close is a release)."""
         return self._external_conn is None
 
 
@@ -412,6 +414,32 @@ class SQLitePublishJobRepo(SQLiteRepoBase):
 class SQLiteAnalyticsAggregateRepo(SQLiteRepoBase):
     """SQLite implementation of AnalyticsAggregateRepoPort."""
 
+    # Columns that identify a bucket beyond (bucket_type, bucket_start, event_type)
+    _DIMENSION_COLUMNS = (
+        "content_id",
+        "asset_id",
+        "link_id",
+        "utm_source",
+        "utm_medium",
+        "utm_campaign",
+        "referrer_domain",
+        "ua_class",
+    )
+
+    _UPSERT_SQL = """
+        INSERT INTO analytics_aggregates (
+            id, bucket_type, bucket_start, event_type,
+            content_id, asset_id, link_id,
+            utm_source, utm_medium, utm_campaign, referrer_domain, ua_class,
+            dims_key, count_total, count_real, count_bot, created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(bucket_type, bucket_start, event_type, dims_key) DO UPDATE SET
+            count_total = count_total + excluded.count_total,
+            count_real = count_real + excluded.count_real,
+            count_bot = count_bot + excluded.count_bot,
+            updated_at = excluded.updated_at
+    """
+
     def get_or_create_bucket(
         self,
         bucket_type: str,
@@ -421,94 +449,126 @@ class SQLiteAnalyticsAggregateRepo(SQLiteRepoBase):
     ) -> AnalyticsEventAggregate:
         conn = self._get_conn()
         try:
-            # Try to find existing
+            dims_key = self._build_dims_key(dimensions)
             row = conn.execute(
                 """
                 SELECT * FROM analytics_aggregates
                 WHERE bucket_type = ? AND bucket_start = ? AND event_type = ?
-                  AND content_id IS ? AND utm_source IS ? AND utm_medium IS ?
-                  AND utm_campaign IS ? AND referrer_domain IS ? AND ua_class = ?
+                  AND dims_key = ?
                 """,
-                (
-                    bucket_type,
-                    bucket_start.isoformat(),
-                    event_type,
-                    str(dimensions.get("content_id")) if dimensions.get("content_id") else None,
-                    dimensions.get("utm_source"),
-                    dimensions.get("utm_medium"),
-                    dimensions.get("utm_campaign"),
-                    dimensions.get("referrer_domain"),
-                    dimensions.get("ua_class", "unknown"),
-                ),
+                (bucket_type, self._iso_utc(bucket_start), event_type, dims_key),
             ).fetchone()
 
             if row:
                 return self._map_row(row)
 
-            # Create new bucket
-            from uuid import uuid4
-
             now = datetime.now(UTC)
-            bucket = AnalyticsEventAggregate(
-                id=uuid4(),
-                bucket_type=bucket_type,  # type: ignore[arg-type]
-                bucket_start=bucket_start,
-                event_type=event_type,  # type: ignore[arg-type]
-                content_id=dimensions.get("content_id"),
-                asset_id=dimensions.get("asset_id"),
-                link_id=dimensions.get("link_id"),
-                utm_source=dimensions.get("utm_source"),
-                utm_medium=dimensions.get("utm_medium"),
-                utm_campaign=dimensions.get("utm_campaign"),
-                referrer_domain=dimensions.get("referrer_domain"),
-                ua_class=dimensions.get("ua_class", "unknown"),
-                count_total=0,
-                count_real=0,
-                count_bot=0,
-                created_at=now,
-                updated_at=now,
-            )
-
             conn.execute(
+                self._UPSERT_SQL,
+                self._upsert_params(
+                    bucket_type, bucket_start, event_type, dimensions, (0, 0, 0), now
+                ),
+            )
+            row = conn.execute(
                 """
-                INSERT INTO analytics_aggregates (
-                    id, bucket_type, bucket_start, event_type,
-                    content_id, asset_id, link_id,
-                    utm_source, utm_medium, utm_campaign, referrer_domain, ua_class,
-                    count_total, count_real, count_bot, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                SELECT * FROM analytics_aggregates
+                WHERE bucket_type = ? AND bucket_start = ? AND event_type = ?
+                  AND dims_key = ?
                 """,
-                (
-                    str(bucket.id),
-                    bucket.bucket_type,
-                    bucket.bucket_start.isoformat(),
-                    bucket.event_type,
-                    str(bucket.content_id) if bucket.content_id else None,
-                    str(bucket.asset_id) if bucket.asset_id else None,
-                    str(bucket.link_id) if bucket.link_id else None,
-                    bucket.utm_source,
-                    bucket.utm_medium,
-                    bucket.utm_campaign,
-                    bucket.referrer_domain,
-                    bucket.ua_class,
-                    bucket.count_total,
-                    bucket.count_real,
-                    bucket.count_bot,
-                    bucket.created_at.isoformat(),
-                    bucket.updated_at.isoformat(),
-                ),
+                (bucket_type, self._iso_utc(bucket_start), event_type, dims_key),
+            ).fetchone()
+
+            if self._should_close():
+                conn.commit()
+            return self._map_row(row)
+        finally:
+            if self._should_close():
+                conn.close()
+
+    def upsert_increments(self, increments: Sequence[AggregateIncrement]) -> None:
+        """
+        Apply a batch of count increments in a single transaction.
+
+        Each increment is an INSERT ... ON CONFLICT DO UPDATE against the
+        (bucket_type, bucket_start, event_type, dims_key) unique key, so
+        no read-modify-write round trips are needed.
+        """
+        if not increments:
+            return
+        now = datetime.now(UTC)
+        params = [
+            self._upsert_params(
+                inc.bucket_type,
+                inc.bucket_start,
+                inc.event_type,
+                inc.dimensions,
+                (inc.count_total, inc.count_real, inc.count_bot),
+                now,
             )
+            for inc in increments
+        ]
+        conn = self._get_conn()
+        try:
+            conn.executemany(self._UPSERT_SQL, params)
+            if self._should_close():
+                conn.commit()
+        finally:
+            if self._should_close():
+                conn.close()
 
+    def delete_before(self, bucket_type: str, before: datetime) -> int:
+        """Delete buckets of a type starting before a time (retention sweep)."""
+        conn = self._get_conn()
+        try:
+            cursor = conn.execute(
+                "DELETE FROM analytics_aggregates WHERE bucket_type = ? AND bucket_start < ?",
+                (bucket_type, self._iso_utc(before)),
+            )
             if self._should_close():
                 conn.commit()
-            return bucket
+            return cursor.rowcount
         finally:
             if self._should_close():
                 conn.close()
 
     def _build_dims_key(self, dimensions: dict[str, Any]) -> str:
-        """Build a key from dimensions for comparison."""
-        return json.dumps(dimensions, sort_keys=True)
+        """Canonical, order-independent key for a bucket's dimension values."""
+        values = [
+            dimensions.get(col, "unknown" if col == "ua_class" else None)
+            for col in self._DIMENSION_COLUMNS
+        ]
+        return json.dumps([str(v) if v is not None else None for v in values])
+
+    def _upsert_params(
+        self,
+        bucket_type: str,
+        bucket_start: datetime,
+        event_type: str,
+        dimensions: dict[str, Any],
+        counts: tuple[int, int, int],
+        now: datetime,
+    ) -> tuple[Any, ...]:
+        def text(value: Any) -> str | None:
+            return str(value) if value is not None else None
+
+        return (
+            str(uuid4()),
+            bucket_type,
+            self._iso_utc(bucket_start),
+            event_type,
+            text(dimensions.get("content_id")),
+            text(dimensions.get("asset_id")),
+            text(dimensions.get("link_id")),
+            dimensions.get("utm_source"),
+            dimensions.get("utm_medium"),
+            dimensions.get("utm_campaign"),
+            dimensions.get("referrer_domain"),
+            dimensions.get("ua_class", "unknown"),
+            self._build_dims_key(dimensions),
+            *counts,
+            now.isoformat(),
+            now.isoformat(),
+        )
 
     def increment(
         self,
@@ -548,28 +608,250 @@ class SQLiteAnalyticsAggregateRepo(SQLiteRepoBase):
     ) -> list[AnalyticsEventAggregate]:
         conn = self._get_conn()
         try:
-            query = """
-                SELECT * FROM analytics_aggregates
-                WHERE bucket_type = ? AND bucket_start >= ? AND bucket_start < ?
-            """
-            params: list[Any] = [bucket_type, start.isoformat(), end.isoformat()]
+            where, params = self._range_filter(bucket_type, start, end, event_type, content_id)
+            rows = conn.execute(
+                f"SELECT * FROM analytics_aggregates WHERE {where} ORDER BY bucket_start ASC",
+                params,
+            ).fetchall()
+            return [self._map_row(r) for r in rows]
+        finally:
+            if self._should_close():
+                conn.close()
 
-            if event_type:
-                query += " AND event_type = ?"
-                params.append(event_type)
+    # --- Pushed-down dashboard queries (AggregateQueryPort) ---
 
-            if content_id:
-                query += " AND content_id = ?"
-                params.append(str(content_id))
+    def sum_counts(
+        self,
+        bucket_type: str,
+        start: datetime,
+        end: datetime,
+        event_type: str | None = None,
+        content_id: UUID | None = None,
+        link_id: UUID | None = None,
+    ) -> dict[str, int]:
+        conn = self._get_conn()
+        try:
+            where, params = self._range_filter(
+                bucket_type, start, end, event_type, content_id, link_id
+            )
+            row = conn.execute(
+                f"""
+                SELECT COALESCE(SUM(count_total), 0) AS total,
+                       COALESCE(SUM(count_real), 0) AS real,
+                       COALESCE(SUM(count_bot), 0) AS bot
+                FROM analytics_aggregates WHERE {where}
+                """,
+                params,
+            ).fetchone()
+            return {"total": row["total"], "real": row["real"], "bot": row["bot"]}
+        finally:
+            if self._should_close():
+                conn.close()
+
+    def count_series(
+        self,
+        bucket_type: str,
+        start: datetime,
+        end: datetime,
+        event_type: str | None = None,
+        content_id: UUID | None = None,
+        exclude_bots: bool = True,
+        link_id: UUID | None = None,
+    ) -> list[dict[str, Any]]:
+        count_col = self._count_column(exclude_bots)
+        conn = self._get_conn()
+        try:
+            where, params = self._range_filter(
+                bucket_type, start, end, event_type, content_id, link_id
+            )
+            rows = conn.execute(
+                f"""
+                SELECT bucket_start, SUM({count_col}) AS count
+                FROM analytics_aggregates WHERE {where}
+                GROUP BY bucket_start ORDER BY bucket_start ASC
+                """,
+                params,
+            ).fetchall()
+            return [
+                {"timestamp": datetime.fromisoformat(r["bucket_start"]), "count": r["count"]}
+                for r in rows
+            ]
+        finally:
+            if self._should_close():
+                conn.close()
 
-            query += " ORDER BY bucket_start ASC"
+    def top_values(
+        self,
+        dimensions: tuple[str, ...],
+        bucket_type: str,
+        start: datetime,
+        end: datetime,
+        event_type: str,
+        limit: int = 10,
+        exclude_bots: bool = True,
+        skip_null: bool = True,
+    ) -> list[tuple[tuple[Any, ...], int]]:
+        for dim in dimensions:
+            if dim not in self._DIMENSION_COLUMNS:
+                raise ValueError(f"Unknown aggregate dimension: {dim}")
+        count_col = self._count_column(exclude_bots)
+        cols = ", ".join(dimensions)
 
-            rows = conn.execute(query, params).fetchall()
-            return [self._map_row(r) for r in rows]
+        conn = self._get_conn()
+        try:
+            where, params = self._range_filter(bucket_type, start, end, event_type)
+            if skip_null:
+                where += " AND NOT (" + " AND ".join(f"{d} IS NULL" for d in dimensions) + ")"
+            rows = conn.execute(
+                f"""
+                SELECT {cols}, SUM({count_col}) AS count
+                FROM analytics_aggregates WHERE {where}
+                GROUP BY {cols} ORDER BY count DESC LIMIT ?
+                """,
+                [*params, limit],
+            ).fetchall()
+            return [
+                (tuple(self._dimension_value(d, r[d]) for d in dimensions), r["count"])
+                for r in rows
+            ]
+        finally:
+            if self._should_close():
+                conn.close()
+
+    def dashboard(
+        self,
+        bucket_type: str,
+        start: datetime,
+        end: datetime,
+        limit: int = 5,
+        exclude_bots: bool = True,
+    ) -> DashboardSummary:
+        """
+        Every dashboard section from one range scan.
+
+        The range is materialized once and each section is a GROUP BY over
+        it, combined with UNION ALL into a single statement.
+        """
+        c = self._count_column(exclude_bots)
+        sums = "SUM(count_total) AS total, SUM(count_real) AS real, SUM(count_bot) AS bot"
+        page_views = "event_type = 'page_view'"
+        sql = f"""
+            WITH r AS MATERIALIZED (
+                SELECT bucket_start, event_type, content_id, utm_source, utm_medium,
+                       referrer_domain, count_total, count_real, count_bot
+                FROM analytics_aggregates
+                WHERE bucket_type = ? AND bucket_start >= ? AND bucket_start < ?
+            )
+            SELECT 'totals' AS kind, NULL AS k1, NULL AS k2, {sums} FROM r
+            UNION ALL
+            SELECT 'series', bucket_start, NULL, {sums} FROM r GROUP BY bucket_start
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'content', content_id, NULL, {sums} FROM r
+                WHERE {page_views} AND content_id IS NOT NULL
+                GROUP BY content_id ORDER BY SUM({c}) DESC LIMIT ?
+            )
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'source', utm_source, utm_medium, {sums} FROM r
+                WHERE {page_views}
+                GROUP BY utm_source, utm_medium ORDER BY SUM({c}) DESC LIMIT ?
+            )
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'referrer', referrer_domain, NULL, {sums} FROM r
+                WHERE {page_views} AND referrer_domain IS NOT NULL
+                GROUP BY referrer_domain ORDER BY SUM({c}) DESC LIMIT ?
+            )
+        """
+        params = [bucket_type, self._iso_utc(start), self._iso_utc(end), limit, limit, limit]
+
+        conn = self._get_conn()
+        try:
+            rows = conn.execute(sql, params).fetchall()
         finally:
             if self._should_close():
                 conn.close()
 
+        totals = {"total": 0, "real": 0, "bot": 0}
+        sections: dict[str, list[tuple[Any, Any, int]]] = {
+            "series": [],
+            "content": [],
+            "source": [],
+            "referrer": [],
+        }
+        for r in rows:
+            if r["kind"] == "totals":
+                totals = {k: r[k] or 0 for k in ("total", "real", "bot")}
+            else:
+                count = r["real"] if exclude_bots else r["total"]
+                # Ranked sections arrive in their subquery's ORDER BY order
+                sections[r["kind"]].append((r["k1"], r["k2"], count))
+
+        return DashboardSummary(
+            totals={
+                "total": totals["real"] if exclude_bots else totals["total"],
+                "total_with_bots": totals["total"],
+                "real": totals["real"],
+                "bot": totals["bot"],
+            },
+            time_series=[
+                {"timestamp": datetime.fromisoformat(ts), "count": n}
+                for ts, _, n in sorted(sections["series"])
+            ],
+            top_content=[
+                {"content_id": UUID(cid), "count": n} for cid, _, n in sections["content"]
+            ],
+            top_sources=[
+                {"source": src, "medium": med, "count": n}
+                for src, med, n in sections["source"]
+            ],
+            top_referrers=[{"domain": d, "count": n} for d, _, n in sections["referrer"]],
+        )
+
+    def _range_filter(
+        self,
+        bucket_type: str,
+        start: datetime,
+        end: datetime,
+        event_type: str | None = None,
+        content_id: UUID | None = None,
+        link_id: UUID | None = None,
+    ) -> tuple[str, list[Any]]:
+        where = "bucket_type = ? AND bucket_start >= ? AND bucket_start < ?"
+        params: list[Any] = [bucket_type, self._iso_utc(start), self._iso_utc(end)]
+
+        if event_type:
+            where += " AND event_type = ?"
+            params.append(event_type)
+
+        if content_id:
+            where += " AND content_id = ?"
+            params.append(str(content_id))
+
+        if link_id:
+            where += " AND link_id = ?"
+            params.append(str(link_id))
+
+        return where, params
+
+    @staticmethod
+    def _iso_utc(dt: datetime) -> str:
+        """bucket_start is stored as UTC ISO text, so bounds must be too."""
+        if dt.tzinfo is None:
+            return dt.replace(tzinfo=UTC).isoformat()
+        return dt.astimezone(UTC).isoformat()
+
+    @staticmethod
+    def _count_column(exclude_bots: bool) -> str:
+        return "count_real" if exclude_bots else "count_total"
+
+    @staticmethod
+    def _dimension_value(dimension: str, value: Any) -> Any:
+        if value is not None and dimension in ("content_id", "asset_id", "link_id"):
+            return UUID(value)
+        return value
+
     def _map_row(self, row: dict[str, Any]) -> AnalyticsEventAggregate:
         return AnalyticsEventAggregate(
             id=UUID(row["id"]),
@@ -796,6 +1078,155 @@ class SQLiteAuditLogRepo(SQLiteRepoBase):
         )
 
 
+# -----------------------------------------------------------------------------
+# E8.1: Audit Log Repository (admin audit API)
+# -----------------------------------------------------------------------------
+
+
+def _audit_ts(dt: datetime) -> str:
+    """Fixed-width UTC ISO string so created_at sorts and compares as text."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.astimezone(UTC).isoformat(timespec="microseconds")
+
+
+class SQLiteAuditRepo(SQLiteRepoBase):
+    """
+    SQLite implementation of the audit component's AuditRepoPort.
+
+    Filters map onto the composite audit_events indexes (migration 008);
+    results are newest first by (created_at, id), which also drives keyset
+    pagination via AuditQuery.before.
+    """
+
+    # Transient errors (locked or busy database) the write-behind queue retries
+    retriable_errors = (sqlite3.OperationalError,)
+
+    _INSERT = """
+        INSERT INTO audit_events (
+            id, actor_user_id, actor_name, action, target_type, target_id,
+            description, meta_json, ip_address, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def save(self, entry: AuditEntry) -> AuditEntry:
+        self.save_many([entry])
+        return entry
+
+    def save_many(self, entries: Sequence[AuditEntry]) -> None:
+        """Insert entries in one transaction (write-behind flush path)."""
+        if not entries:
+            return
+        conn = self._get_conn()
+        try:
+            conn.executemany(self._INSERT, [self._to_row(e) for e in entries])
+            if self._should_close():
+                conn.commit()
+        finally:
+            if self._should_close():
+                conn.close()
+
+    def get_by_id(self, entry_id: UUID) -> AuditEntry | None:
+        conn = self._get_conn()
+        try:
+            row = conn.execute(
+                "SELECT * FROM audit_events WHERE id = ?", (str(entry_id),)
+            ).fetchone()
+            return self._map_row(row) if row else None
+        finally:
+            if self._should_close():
+                conn.close()
+
+    def query(self, query: AuditQuery) -> list[AuditEntry]:
+        where, params = self._where(query)
+        if query.before:
+            ts, entry_id = query.before
+            where.append("(created_at, id) < (?, ?)")
+            params.extend([_audit_ts(ts), str(entry_id)])
+            page_sql, page_params = "LIMIT ?", [query.limit]
+        else:
+            page_sql, page_params = "LIMIT ? OFFSET ?", [query.limit, query.offset]
+
+        sql = "SELECT * FROM audit_events"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY created_at DESC, id DESC {page_sql}"
+
+        conn = self._get_conn()
+        try:
+            rows = conn.execute(sql, [*params, *page_params]).fetchall()
+            return [self._map_row(r) for r in rows]
+        finally:
+            if self._should_close():
+                conn.close()
+
+    def count(self, query: AuditQuery) -> int:
+        where, params = self._where(query)
+        sql = "SELECT COUNT(*) AS n FROM audit_events"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+
+        conn = self._get_conn()
+        try:
+            return int(conn.execute(sql, params).fetchone()["n"])
+        finally:
+            if self._should_close():
+                conn.close()
+
+    @staticmethod
+    def _where(query: AuditQuery) -> tuple[list[str], list[Any]]:
+        where: list[str] = []
+        params: list[Any] = []
+        if query.entity_type:
+            where.append("target_type = ?")
+            params.append(query.entity_type.value)
+        if query.entity_id:
+            where.append("target_id = ?")
+            params.append(query.entity_id)
+        if query.actor_id:
+            where.append("actor_user_id = ?")
+            params.append(str(query.actor_id))
+        if query.action:
+            where.append("action = ?")
+            params.append(query.action.value)
+        if query.start_time:
+            where.append("created_at >= ?")
+            params.append(_audit_ts(query.start_time))
+        if query.end_time:
+            where.append("created_at <= ?")
+            params.append(_audit_ts(query.end_time))
+        return where, params
+
+    @staticmethod
+    def _to_row(entry: AuditEntry) -> tuple[Any, ...]:
+        return (
+            str(entry.id),
+            str(entry.actor_id) if entry.actor_id else None,
+            entry.actor_name,
+            entry.action.value,
+            entry.entity_type.value,
+            entry.entity_id or "",  # target_id is NOT NULL
+            entry.description,
+            json.dumps(entry.metadata, default=str),
+            entry.ip_address,
+            _audit_ts(entry.timestamp),
+        )
+
+    def _map_row(self, row: dict[str, Any]) -> AuditEntry:
+        return AuditEntry(
+            id=UUID(row["id"]),
+            timestamp=datetime.fromisoformat(row["created_at"]),
+            action=AuditAction(row["action"]),
+            entity_type=EntityType(row["target_type"]),
+            entity_id=row["target_id"] or None,
+            actor_id=parse_uuid(row["actor_user_id"]),
+            actor_name=row["actor_name"],
+            description=row["description"],
+            metadata=json.loads(row["meta_json"]),
+            ip_address=row["ip_address"],
+        )
+
+
 # -----------------------------------------------------------------------------
 # Unit of Work
 # -----------------------------------------------------------------------------
@@ -825,9 +1256,9 @@ class SQLiteUnitOfWork:
         self._users: SQLiteUserRepoAdapter | None = None
 
     def __enter__(self) -> SQLiteUnitOfWork:
-        self._conn = sqlite3.connect(self.db_path)
-        self._conn.row_factory = dict_factory
-        self._conn.execute("PRAGMA foreign_keys = ON;")
+        # Dedicated pooled connection: the transaction is not shared with
+        # plain repo calls made on the same thread.
+        self._conn = get_pool(self.db_path).acquire_dedicated(dict_factory)
         return self
 
     def __exit__(
@@ -839,6 +1270,7 @@ class SQLiteUnitOfWork:
         if exc_type is not None:
             self.rollback()
         if self._conn:
+            # Returns the connection to the pool; uncommitted work is rolled back.
             self._conn.close()
             self._conn = None
 
@@ -976,7 +1408,7 @@ class SQLiteContentRepoAdapter(SQLiteRepoBase):
             ).fetchone()
             if not row:
                 return None
-            return self._map_row_with_blocks(conn, row)
+            return self._hydrate(conn, [row])[0]
         finally:
             if self._should_close():
                 conn.close()
@@ -990,7 +1422,7 @@ class SQLiteContentRepoAdapter(SQLiteRepoBase):
             ).fetchone()
             if not row:
                 return None
-            return self._map_row_with_blocks(conn, row)
+            return self._hydrate(conn, [row])[0]
         finally:
             if self._should_close():
                 conn.close()
@@ -1073,7 +1505,9 @@ class SQLiteContentRepoAdapter(SQLiteRepoBase):
             if self._should_close():
                 conn.close()
 
-    def list_items(self, filters: dict[str, Any]) -> list[ContentItem]:
+    def list_items(
+        self, filters: dict[str, Any], include_blocks: bool = True
+    ) -> list[ContentItem]:
         conn = self._get_conn()
         try:
             query = "SELECT * FROM content_items"
@@ -1084,7 +1518,7 @@ class SQLiteContentRepoAdapter(SQLiteRepoBase):
                 query += " WHERE " + " AND ".join(conditions)
 
             rows = conn.execute(query, params).fetchall()
-            return [self._map_row_with_blocks(conn, r) for r in rows]
+            return self._hydrate(conn, rows, include_blocks=include_blocks)
         finally:
             if self._should_close():
                 conn.close()
@@ -1110,7 +1544,7 @@ class SQLiteContentRepoAdapter(SQLiteRepoBase):
                 """,
                 (str(exclude_id), limit),
             ).fetchall()
-            return [self._map_row_with_blocks(conn, r) for r in rows]
+            return self._hydrate(conn, rows)
         finally:
             if self._should_close():
                 conn.close()
@@ -1122,26 +1556,24 @@ class SQLiteContentRepoAdapter(SQLiteRepoBase):
                 "SELECT * FROM content_items WHERE status = 'scheduled' AND publish_at <= ?",
                 (before_utc.isoformat(),),
             ).fetchall()
-            return [self._map_row_with_blocks(conn, r) for r in rows]
+            return self._hydrate(conn, rows)
         finally:
             if self._should_close():
                 conn.close()
 
-    def _map_row_with_blocks(self, conn: sqlite3.Connection, row: dict[str, Any]) -> ContentItem:
-        block_rows = conn.execute(
-            "SELECT * FROM content_blocks WHERE content_item_id = ? ORDER BY position ASC",
-            (row["id"],),
-        ).fetchall()
-
-        blocks = [
-            ContentBlock(
-                id=str(b["id"]),
-                block_type=b["block_type"],
-                data_json=json.loads(b["data_json"]),
-            )
-            for b in block_rows
-        ]
+    def _hydrate(
+        self,
+        conn: sqlite3.Connection,
+        rows: list[dict[str, Any]],
+        include_blocks: bool = True,
+    ) -> list[ContentItem]:
+        """Build ContentItems for a batch of rows with one blocks query per chunk."""
+        blocks_by_item = (
+            load_blocks_by_item(conn, [r["id"] for r in rows]) if include_blocks else {}
+        )
+        return [self._map_row(r, blocks_by_item.get(r["id"], [])) for r in rows]
 
+    def _map_row(self, row: dict[str, Any], blocks: list[ContentBlock]) -> ContentItem:
         return ContentItem(
             id=UUID(row["id"]),
             type=row["type"],
@@ -1283,7 +1715,8 @@ class SQLiteUserRepoAdapter(SQLiteRepoBase):
                     display_name=excluded.display_name,
                     password_hash=excluded.password_hash,
                     status=excluded.status,
-                    updated_at=excluded.updated_at
+                    updated_at=excluded.updated_at,
+                    auth_version=users.auth_version + 1
                 """,
                 (
                     str(user.id),
@@ -1312,6 +1745,7 @@ class SQLiteUserRepoAdapter(SQLiteRepoBase):
         finally:
             if self._should_close():
                 conn.close()
+        invalidate_principal(user.id)
 
     def list_all(self) -> list[User]:
         conn = self._get_conn()
@@ -1692,6 +2126,49 @@ class SQLiteNewsletterSubscriberRepo(SQLiteRepoBase):
             if self._should_close():
                 conn.close()
 
+    def iter_all(
+        self,
+        status: SubscriberStatus | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[NewsletterSubscriber]:
+        """
+        Yield every subscriber (optionally one status), oldest first.
+
+        Keyset pagination on (created_at, id): each batch is one indexed
+        query that resumes after the last row seen, so cost does not grow
+        with depth and rows inserted mid-export are not skipped or repeated.
+        The connection is released between batches, so a StreamingResponse
+        may resume the generator on a different thread.
+        """
+        where = "WHERE (created_at, id) > (?, ?)"
+        params: list[Any] = []
+        if status is not None:
+            where += " AND status = ?"
+            params.append(status.value)
+
+        last: tuple[str, str] = ("", "")
+        while True:
+            conn = self._get_conn()
+            try:
+                rows = conn.execute(
+                    f"""
+                    SELECT * FROM newsletter_subscribers
+                    {where}
+                    ORDER BY created_at, id
+                    LIMIT ?
+                    """,
+                    (*last, *params, batch_size),
+                ).fetchall()
+            finally:
+                if self._should_close():
+                    conn.close()
+
+            for row in rows:
+                yield self._map_row(row)
+            if len(rows) < batch_size:
+                return
+            last = (rows[-1]["created_at"], rows[-1]["id"])
+
     def count_all(self) -> int:
         """Count all subscribers."""
         conn = self._get_conn()
@@ -0,0 +1,251 @@
+"""
+Asset Delivery (E2.2) - Streaming, range-capable responses for stored objects.
+
+Builds responses from StoragePort.get_stream() handles so asset bytes are
+never buffered whole in worker memory.
+
+Spec refs: E2.2, TA-0009, R2
+
+Key behaviors:
+- Full bodies of local files go out through FileResponse, which uses the
+  server's zero-copy pathsend extension when available
+- Single ranges answer 206 with Content-Range; multiple ranges answer 206
+  with a multipart/byteranges body
+- Unsatisfiable ranges answer 416 with Content-Range: bytes */size
+- Malformed or excessive Range headers, and If-Range with a stale
+  validator, fall back to the full 200 body
+- Accept-Ranges and Content-Length are always sent
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from collections.abc import Iterator
+from typing import BinaryIO
+from uuid import uuid4
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+# Read size for streamed (non-zero-copy) bodies
+CHUNK_SIZE = 64 * 1024
+
+# More ranges than this are served as a full body (RFC 9110 allows ignoring)
+MAX_RANGES = 16
+
+
+class RangeNotSatisfiableError(ValueError):
+    """No requested range overlaps the representation."""
+
+
+# --- Range Parsing ---
+
+
+def parse_range_header(header: str | None, size: int) -> list[tuple[int, int]] | None:
+    """
+    Parse a bytes Range header into inclusive (start, end) pairs.
+
+    Overlapping and adjacent ranges are coalesced.
+
+    Returns:
+        Ranges to serve, or None when the full body should be sent.
+
+    Raises:
+        RangeNotSatisfiableError: Valid header but no range overlaps the body.
+    """
+    if not header:
+        return None
+
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec.strip():
+        return None
+
+    parts = [p.strip() for p in spec.split(",") if p.strip()]
+    if len(parts) > MAX_RANGES:
+        return None
+
+    ranges: list[tuple[int, int]] = []
+    for part in parts:
+        first, sep, last = part.partition("-")
+        if not sep:
+            return None
+
+        if not first:
+            # Suffix range: the final N bytes
+            if not last.isdigit():
+                return None
+            length = int(last)
+            if length == 0 or size == 0:
+                continue
+            ranges.append((max(size - length, 0), size - 1))
+            continue
+
+        if not first.isdigit() or (last and not last.isdigit()):
+            return None
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        if start >= size:
+            continue
+        end = min(int(last), size - 1) if last else size - 1
+        ranges.append((start, end))
+
+    if not ranges:
+        raise RangeNotSatisfiableError(header)
+
+    ranges.sort()
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        last_start, last_end = merged[-1]
+        if start <= last_end + 1:
+            merged[-1] = (last_start, max(last_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _if_range_matches(request: Request, etag: str | None) -> bool:
+    """If-Range only honours a strong ETag match; dates are not tracked."""
+    if_range = request.headers.get("if-range")
+    if if_range is None:
+        return True
+    return etag is not None and if_range.strip() == etag
+
+
+# --- Body Iterators ---
+
+
+def _read_range(stream: BinaryIO, start: int, end: int) -> Iterator[bytes]:
+    """Yield bytes start..end (inclusive) in CHUNK_SIZE reads."""
+    stream.seek(start)
+    remaining = end - start + 1
+    while remaining > 0:
+        chunk = stream.read(min(CHUNK_SIZE, remaining))
+        if not chunk:
+            break
+        remaining -= len(chunk)
+        yield chunk
+
+
+def _iter_ranges(stream: BinaryIO, ranges: list[tuple[int, int]]) -> Iterator[bytes]:
+    try:
+        for start, end in ranges:
+            yield from _read_range(stream, start, end)
+    finally:
+        stream.close()
+
+
+def _iter_multipart(
+    stream: BinaryIO,
+    ranges: list[tuple[int, int]],
+    part_headers: list[bytes],
+    closing: bytes,
+) -> Iterator[bytes]:
+    try:
+        for (start, end), head in zip(ranges, part_headers, strict=True):
+            yield head
+            yield from _read_range(stream, start, end)
+            yield b"\r\n"
+        yield closing
+    finally:
+        stream.close()
+
+
+def _local_file(stream: BinaryIO) -> os.stat_result | None:
+    """stat() of the file behind a stream, if it is a regular local file."""
+    if not isinstance(stream, io.BufferedReader) or not isinstance(stream.name, str):
+        return None
+    try:
+        return os.fstat(stream.fileno())
+    except OSError:
+        return None
+
+
+# --- Responses ---
+
+
+def stream_stored_object(
+    request: Request,
+    stream: BinaryIO,
+    *,
+    size: int,
+    media_type: str,
+    headers: dict[str, str],
+    etag: str | None = None,
+) -> Response:
+    """
+    Serve a storage stream, honouring Range / If-Range.
+
+    Takes ownership of the stream: it is closed once the body is sent
+    (or immediately when no body is streamed from it).
+    """
+    base_headers = {**headers, "Accept-Ranges": "bytes"}
+    if etag is not None:
+        base_headers["ETag"] = etag
+
+    ranges: list[tuple[int, int]] | None = None
+    if _if_range_matches(request, etag):
+        try:
+            ranges = parse_range_header(request.headers.get("range"), size)
+        except RangeNotSatisfiableError:
+            stream.close()
+            return Response(
+                status_code=416,
+                headers={**base_headers, "Content-Range": f"bytes */{size}"},
+            )
+
+    # Full body
+    if ranges is None:
+        base_headers["Content-Length"] = str(size)
+        stat_result = _local_file(stream)
+        if stat_result is not None:
+            path = stream.name
+            stream.close()
+            return FileResponse(
+                path,
+                media_type=media_type,
+                headers=base_headers,
+                stat_result=stat_result,
+            )
+        return StreamingResponse(
+            _iter_ranges(stream, [(0, size - 1)] if size else []),
+            media_type=media_type,
+            headers=base_headers,
+        )
+
+    # Single range
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        base_headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        base_headers["Content-Length"] = str(end - start + 1)
+        return StreamingResponse(
+            _iter_ranges(stream, ranges),
+            status_code=206,
+            media_type=media_type,
+            headers=base_headers,
+        )
+
+    # Multiple ranges: multipart/byteranges with an exact Content-Length
+    boundary = uuid4().hex
+    part_headers = [
+        (
+            f"--{boundary}\r\n"
+            f"Content-Type: {media_type}\r\n"
+            f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+        ).encode("latin-1")
+        for start, end in ranges
+    ]
+    closing = f"--{boundary}--\r\n".encode("latin-1")
+    length = (
+        sum(len(h) for h in part_headers)
+        + sum(end - start + 1 + 2 for start, end in ranges)
+        + len(closing)
+    )
+    base_headers["Content-Length"] = str(length)
+    return StreamingResponse(
+        _iter_multipart(stream, ranges, part_headers, closing),
+        status_code=206,
+        media_type=f"multipart/byteranges; boundary={boundary}",
+        headers=base_headers,
+    )
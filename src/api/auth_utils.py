@@ -1,24 +1,35 @@
+from __future__ import annotations
+
 import os
 from datetime import UTC, datetime, timedelta
-from typing import Any, cast
+from functools import cache
+from typing import TYPE_CHECKING, Any, cast
 
-from jose import jwt
-from passlib.context import CryptContext
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
 
 SECRET_KEY = os.environ.get("LAB_SECRET_KEY", "dev-secret-unsafe")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+
+# jose, passlib and argon2 are imported on first use, not at startup
+
+
+@cache
+def _pwd_context() -> CryptContext:
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["argon2"], deprecated="auto")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    result: bool = pwd_context.verify(plain_password, hashed_password)
+    result: bool = _pwd_context().verify(plain_password, hashed_password)
     return result
 
 
 def get_password_hash(password: str) -> str:
-    result: str = pwd_context.hash(password)
+    result: str = _pwd_context().hash(password)
     return result
 
 
@@ -35,6 +46,8 @@ def create_access_token(
         expires_delta: Optional custom expiration delta
         now_utc: Current UTC time (for testing/determinism). Defaults to datetime.now(UTC).
     """
+    from jose import jwt
+
     to_encode = data.copy()
     current_time = now_utc if now_utc is not None else datetime.now(UTC)
 
@@ -49,6 +62,8 @@ def create_access_token(
 
 
 def decode_access_token(token: str) -> dict[str, Any] | None:
+    from jose import jwt
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         return cast(dict[str, Any], payload)
@@ -0,0 +1,59 @@
+"""
+Client Address - The address rate limits and dedupe are keyed by.
+
+X-Forwarded-For is set by whoever sends the request, so it is only
+believed when the connection comes from a configured reverse proxy
+(LAB_TRUSTED_PROXIES). Otherwise every client could pick a fresh key per
+request and never hit a limit.
+
+Key behaviors:
+- Without trusted proxies, the socket peer address is the client
+- From a trusted proxy, X-Forwarded-For is read right to left and the
+  first hop that is not itself a trusted proxy is the client; entries to
+  its left were supplied by the client and are ignored
+- Proxies are given as addresses or CIDR networks, comma-separated
+"""
+
+from __future__ import annotations
+
+import ipaddress
+from collections.abc import Iterable
+
+from fastapi import Request
+
+ProxyNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+def parse_trusted_proxies(value: str) -> tuple[ProxyNetwork, ...]:
+    """Parse a comma-separated list of proxy addresses or networks."""
+    return tuple(
+        ipaddress.ip_network(item.strip(), strict=False)
+        for item in value.split(",")
+        if item.strip()
+    )
+
+
+def is_trusted_proxy(address: str, trusted: Iterable[ProxyNetwork]) -> bool:
+    """Check if an address belongs to one of the trusted proxy networks."""
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in trusted)
+
+
+def client_address(request: Request, trusted: tuple[ProxyNetwork, ...] = ()) -> str:
+    """Address of the client that sent the request ("unknown" without a peer)."""
+    peer = request.client.host if request.client else None
+    if peer is None:
+        return "unknown"
+    if not trusted or not is_trusted_proxy(peer, trusted):
+        return peer
+
+    forwarded = request.headers.get("x-forwarded-for", "")
+    hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not is_trusted_proxy(hop, trusted):
+            return hop
+    # Only proxies in the chain: the leftmost one is as close as we get
+    return hops[0] if hops else peer
@@ -1,7 +1,10 @@
 import os
+import threading
+import weakref
+from collections.abc import Callable
 from functools import lru_cache
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, cast
 from typing import Any as AnyType
 from uuid import UUID
 
@@ -9,25 +12,56 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 
 from src.adapters.auth.crypto import JWTAuthAdapter
+from src.adapters.auth.principal_cache import PrincipalCache
 from src.adapters.auth.session_store import InMemorySessionStore
 from src.adapters.clock import SystemClock
 from src.adapters.dev_email import DevEmailAdapter
 from src.adapters.fs.filestore import FileSystemStore
+from src.adapters.image_derivatives import DerivativeIndex, ImageDerivativeWorker
+from src.adapters.integrity import IntegrityScrubber
+from src.adapters.local_storage import LocalFileStorage
+from src.adapters.rate_limiter import (
+    RateLimitEngine,
+    SlidingWindowRateLimiter,
+    configure_shared_rate_limiter,
+    get_shared_rate_limiter,
+)
 from src.adapters.sqlite.repos import (
     SQLiteAssetRepo,
     SQLiteCollabRepo,
     SQLiteContentRepo,
     SQLiteLinkRepo,
+    SQLitePublishJobRepo,
     SQLiteRedirectRepo,
     SQLiteSiteSettingsRepo,
     SQLiteUserRepo,
 )
-from src.adapters.sqlite_db import SQLiteNewsletterSubscriberRepo
+from src.adapters.sqlite.shared_limits import SQLiteDedupeStore, SQLiteRateLimitStore
+from src.adapters.sqlite_db import (
+    SQLiteAnalyticsAggregateRepo,
+    SQLiteAuditRepo,
+    SQLiteNewsletterSubscriberRepo,
+)
 from src.api.auth_utils import decode_access_token
+from src.api.client_address import parse_trusted_proxies
 
 # Atomic components are stateless, so we import them here for dependency injection.
 # Dependencies are injected as ports/repos/adapters.
-from src.components.links import LinkService
+from src.components.analytics import (
+    AggregatePipeline,
+    AnalyticsIngestionService,
+    DedupeService,
+    DedupeStorePort,
+    IngestionConfig,
+    IngestQueue,
+    InMemoryDedupeStore,
+    PipelineEventStore,
+)
+from src.components.analytics import InMemoryRateLimiter as AnalyticsRateLimiter
+from src.components.audit import AuditWriteBehind
+from src.components.C2_PublicTemplates import InProcessPageCache, SitemapStore
+from src.components.links import LinkService, PublicLinkIndex
+from src.components.redirects import CompiledRedirectIndex
 from src.components.settings import SettingsService
 from src.domain.blocks import BlockValidator
 from src.domain.entities import User
@@ -43,6 +77,18 @@ class Settings:
         self.db_path = f"{os.environ.get('LAB_DATA_DIR', './data')}/lrl.db"
         self.assets_dir = Path(f"{os.environ.get('LAB_DATA_DIR', './data')}/assets")
         self.rules_path = self.base_dir / "rules.yaml"
+        # Set when running several workers so rate limits and dedupe are shared
+        self.shared_limits_db = os.environ.get("LAB_SHARED_LIMITS_DB") or None
+        # Seconds between background integrity scrub batches (0 disables)
+        self.storage_scrub_seconds = float(os.environ.get("LAB_STORAGE_SCRUB_SECONDS", "0"))
+        # Parallel publishes for the scheduled-publish worker (0 disables it)
+        self.publish_worker_concurrency = int(os.environ.get("LAB_PUBLISH_WORKER_CONCURRENCY", "0"))
+        # Seconds an authenticated principal is cached per token (0 disables)
+        self.auth_cache_seconds = float(os.environ.get("LAB_AUTH_CACHE_SECONDS", "30"))
+        # Threads generating responsive image variants after upload (0 disables)
+        self.image_derivative_workers = int(os.environ.get("LAB_IMAGE_DERIVATIVE_WORKERS", "2"))
+        # Reverse proxies whose X-Forwarded-For is believed (addresses or CIDRs)
+        self.trusted_proxies = parse_trusted_proxies(os.environ.get("LAB_TRUSTED_PROXIES", ""))
 
 
 @lru_cache
@@ -57,32 +103,85 @@ def get_rules(settings: Settings = Depends(get_settings)) -> Rules:
 
 
 # --- Repos ---
+# Repos are stateless wrappers around the shared connection pool
+# (src/adapters/sqlite/pool.py), so one instance per database is reused
+# across requests instead of being rebuilt on every call.
+_repo_instances: dict[tuple[Callable[[str], AnyType], str], AnyType] = {}
+
+
+def _shared_repo[RepoT](repo_cls: Callable[[str], RepoT], db_path: str) -> RepoT:
+    """Get the repo singleton for a database path."""
+    key = (repo_cls, db_path)
+    repo = _repo_instances.get(key)
+    if repo is None:
+        repo = _repo_instances[key] = repo_cls(db_path)
+    return cast(RepoT, repo)
+
+
 def get_content_repo(settings: Settings = Depends(get_settings)) -> SQLiteContentRepo:
-    return SQLiteContentRepo(settings.db_path)
+    return _shared_repo(SQLiteContentRepo, settings.db_path)
 
 
 def get_asset_repo(settings: Settings = Depends(get_settings)) -> SQLiteAssetRepo:
-    return SQLiteAssetRepo(settings.db_path)
+    return _shared_repo(SQLiteAssetRepo, settings.db_path)
 
 
 def get_collab_repo(settings: Settings = Depends(get_settings)) -> SQLiteCollabRepo:
-    return SQLiteCollabRepo(settings.db_path)
+    return _shared_repo(SQLiteCollabRepo, settings.db_path)
 
 
 def get_site_settings_repo(settings: Settings = Depends(get_settings)) -> SQLiteSiteSettingsRepo:
-    return SQLiteSiteSettingsRepo(settings.db_path)
+    return _shared_repo(SQLiteSiteSettingsRepo, settings.db_path)
 
 
 def get_link_repo(settings: Settings = Depends(get_settings)) -> SQLiteLinkRepo:
-    return SQLiteLinkRepo(settings.db_path)
+    return _shared_repo(SQLiteLinkRepo, settings.db_path)
 
 
 def get_user_repo(settings: Settings = Depends(get_settings)) -> SQLiteUserRepo:
-    return SQLiteUserRepo(settings.db_path)
+    return _shared_repo(SQLiteUserRepo, settings.db_path)
 
 
 def get_redirect_repo(settings: Settings = Depends(get_settings)) -> SQLiteRedirectRepo:
-    return SQLiteRedirectRepo(settings.db_path)
+    return _shared_repo(SQLiteRedirectRepo, settings.db_path)
+
+
+def get_publish_job_repo(settings: Settings = Depends(get_settings)) -> SQLitePublishJobRepo:
+    return _shared_repo(SQLitePublishJobRepo, settings.db_path)
+
+
+# --- Redirect Index (E7.2) ---
+# One compiled redirect table per repo instance. The public resolver reads it
+# without touching the database; admin writes rebuild it via RedirectService,
+# and a background thread picks up writes made by other workers.
+_redirect_indexes: weakref.WeakKeyDictionary[AnyType, CompiledRedirectIndex] = (
+    weakref.WeakKeyDictionary()
+)
+_redirect_indexes_lock = threading.Lock()
+
+
+def get_redirect_index(repo: AnyType = Depends(get_redirect_repo)) -> CompiledRedirectIndex:
+    """Get the compiled redirect index for a repo (compiled on first lookup)."""
+    index = _redirect_indexes.get(repo)
+    if index is None:
+        with _redirect_indexes_lock:
+            index = _redirect_indexes.get(repo)
+            if index is None:
+                index = _redirect_indexes[repo] = CompiledRedirectIndex(repo)
+    return index
+
+
+def init_redirect_index(settings: Settings) -> None:
+    """Load the redirect table and start its refresher (startup hook)."""
+    index = get_redirect_index(get_redirect_repo(settings))
+    if not index.is_running:
+        index.start()
+
+
+def shutdown_redirect_indexes() -> None:
+    """Stop every redirect index refresher (shutdown hook)."""
+    for index in list(_redirect_indexes.values()):
+        index.stop()
 
 
 # --- Component Services ---
@@ -93,11 +192,29 @@ def get_settings_service(
     return SettingsService(repo=repo)
 
 
+# One public link index per repo instance; link writes through LinkService
+# invalidate it, and it reloads after a few seconds for other workers' writes.
+_link_indexes: weakref.WeakKeyDictionary[AnyType, PublicLinkIndex] = weakref.WeakKeyDictionary()
+_link_indexes_lock = threading.Lock()
+
+
+def get_public_link_index(repo: AnyType = Depends(get_link_repo)) -> PublicLinkIndex:
+    """Get the public link index for a repo (loaded on first lookup)."""
+    index = _link_indexes.get(repo)
+    if index is None:
+        with _link_indexes_lock:
+            index = _link_indexes.get(repo)
+            if index is None:
+                index = _link_indexes[repo] = PublicLinkIndex(repo)
+    return index
+
+
 def get_link_service(
     repo: SQLiteLinkRepo = Depends(get_link_repo),
+    index: PublicLinkIndex = Depends(get_public_link_index),
 ) -> LinkService:
     """Get link component service."""
-    return LinkService(repo=repo)
+    return LinkService(repo=repo, index=index)
 
 
 # --- Services ---
@@ -112,11 +229,35 @@ def get_block_validator(rules: Rules = Depends(get_rules)) -> BlockValidator:
 # --- Auth ---
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
 
+# One principal cache per user repo instance, so a test or tool that swaps
+# the repo never sees principals resolved against another database.
+_principal_caches: weakref.WeakKeyDictionary[AnyType, PrincipalCache] = weakref.WeakKeyDictionary()
+_principal_caches_lock = threading.Lock()
+
+
+def get_principal_cache(
+    user_repo: AnyType = Depends(get_user_repo),
+    settings: Settings = Depends(get_settings),
+) -> PrincipalCache:
+    """Get the authenticated-principal cache for a user repo."""
+    cache = _principal_caches.get(user_repo)
+    if cache is None:
+        with _principal_caches_lock:
+            cache = _principal_caches.get(user_repo)
+            if cache is None:
+                cache = _principal_caches[user_repo] = PrincipalCache(
+                    ttl_seconds=settings.auth_cache_seconds,
+                    # Saves from other workers invalidate through this column
+                    version_source=getattr(user_repo, "auth_version", None),
+                )
+    return cache
+
 
 async def get_current_user(
     request: Request,
     token: Annotated[str | None, Depends(oauth2_scheme)],
     user_repo: SQLiteUserRepo = Depends(get_user_repo),
+    principals: PrincipalCache = Depends(get_principal_cache),
 ) -> User:
     # 1. Try Cookie first (HttpOnly)
     cookie_token = request.cookies.get("access_token")
@@ -134,7 +275,13 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # 3. Decode
+    # 3. Recently resolved token (user saves and revocations invalidate it)
+    cached = principals.get(token)
+    if cached is not None:
+        return cached
+    generation = principals.generation
+
+    # 4. Decode
     payload = decode_access_token(token)
     if not payload:
         raise HTTPException(
@@ -150,7 +297,8 @@ async def get_current_user(
             detail="Invalid token payload",
         )
 
-    # 4. Fetch User
+    # 5. Fetch User (version first, so a concurrent save leaves the entry stale)
+    version = principals.current_version(UUID(user_id))
     user = user_repo.get_by_id(UUID(user_id))
     if not user:
         raise HTTPException(
@@ -164,6 +312,14 @@ async def get_current_user(
             detail="Inactive user",
         )
 
+    exp = payload.get("exp")
+    principals.put(
+        token,
+        user,
+        generation=generation,
+        version=version,
+        token_expires_at=float(exp) if isinstance(exp, int | float) else None,
+    )
     return user
 
 
@@ -171,6 +327,57 @@ def get_file_store(settings: Settings = Depends(get_settings)) -> FileSystemStor
     return FileSystemStore(base_path=str(settings.assets_dir))
 
 
+@lru_cache
+def _object_storage(base_path: str) -> LocalFileStorage:
+    return LocalFileStorage(base_path)
+
+
+def get_object_storage(settings: Settings = Depends(get_settings)) -> LocalFileStorage:
+    """Immutable asset object storage (StoragePort) under the assets dir."""
+    return _object_storage(str(settings.assets_dir))
+
+
+# Background integrity scrub of the object store (I3). Reads only re-hash
+# files whose stat changed; the scrubber catches corruption that did not.
+_storage_scrubber: IntegrityScrubber | None = None
+
+
+def init_storage_scrubber(settings: Settings) -> None:
+    """Start the object-store scrubber if configured (startup hook)."""
+    global _storage_scrubber
+    if settings.storage_scrub_seconds > 0 and _storage_scrubber is None:
+        _storage_scrubber = IntegrityScrubber(_object_storage(str(settings.assets_dir)))
+        _storage_scrubber.start(settings.storage_scrub_seconds)
+
+
+def shutdown_storage_scrubber() -> None:
+    """Stop the object-store scrubber (shutdown hook)."""
+    global _storage_scrubber
+    scrubber, _storage_scrubber = _storage_scrubber, None
+    if scrubber is not None:
+        scrubber.stop()
+
+
+@lru_cache
+def _page_cache(db_path: str) -> AnyType:
+    return InProcessPageCache()
+
+
+def get_page_cache(settings: Settings = Depends(get_settings)) -> AnyType:
+    """Rendered SSR page cache (InProcessPageCache), one per database."""
+    return _page_cache(settings.db_path)
+
+
+@lru_cache
+def _sitemap_store(db_path: str) -> AnyType:
+    return SitemapStore(_shared_repo(SQLiteContentRepo, db_path))
+
+
+def get_sitemap_store(settings: Settings = Depends(get_settings)) -> AnyType:
+    """Materialized sitemap (SitemapStore), one per database."""
+    return _sitemap_store(settings.db_path)
+
+
 # Adapters needed for component injection
 def get_auth_adapter() -> JWTAuthAdapter:
     return JWTAuthAdapter()
@@ -273,6 +480,54 @@ def get_version_repo() -> InMemoryVersionRepo:
     return _version_repo_instance
 
 
+# Responsive image variants (srcset) are generated off the request path
+_derivative_worker: ImageDerivativeWorker | None = None
+
+
+def init_image_derivatives(settings: Settings) -> None:
+    """Start the image derivative worker if configured (startup hook)."""
+    global _derivative_worker
+    if settings.image_derivative_workers > 0 and _derivative_worker is None:
+        _derivative_worker = ImageDerivativeWorker(
+            _object_storage(str(settings.assets_dir)),
+            max_workers=settings.image_derivative_workers,
+        )
+        _derivative_worker.start()
+
+
+def shutdown_image_derivatives() -> None:
+    """Stop the image derivative worker (shutdown hook)."""
+    global _derivative_worker
+    worker, _derivative_worker = _derivative_worker, None
+    if worker is not None:
+        worker.stop()
+
+
+def get_image_derivative_worker() -> ImageDerivativeWorker | None:
+    """Running derivative worker, or None when disabled."""
+    return _derivative_worker
+
+
+_derivative_indexes: weakref.WeakKeyDictionary[AnyType, DerivativeIndex] = (
+    weakref.WeakKeyDictionary()
+)
+_derivative_indexes_lock = threading.Lock()
+
+
+def get_derivative_index(
+    version_repo: AnyType = Depends(get_version_repo),
+    storage: LocalFileStorage = Depends(get_object_storage),
+) -> DerivativeIndex:
+    """Get the responsive image lookup for a version repo."""
+    index = _derivative_indexes.get(version_repo)
+    if index is None:
+        with _derivative_indexes_lock:
+            index = _derivative_indexes.get(version_repo)
+            if index is None:
+                index = _derivative_indexes[version_repo] = DerivativeIndex(storage, version_repo)
+    return index
+
+
 # --- Resource PDF Repository (E3.1) ---
 
 
@@ -363,7 +618,7 @@ def get_newsletter_repo(
     settings: Settings = Depends(get_settings),
 ) -> SQLiteNewsletterSubscriberRepo:
     """Get newsletter subscriber repository."""
-    return SQLiteNewsletterSubscriberRepo(settings.db_path)
+    return _shared_repo(SQLiteNewsletterSubscriberRepo, settings.db_path)
 
 
 class NewsletterEmailSender:
@@ -467,13 +722,22 @@ def get_newsletter_email_sender(
 
 class InMemoryRateLimiter:
     """
-    Simple in-memory rate limiter.
+    In-process rate limiter for newsletter signups.
 
-    For production, use Redis or similar distributed cache.
+    Thin adapter over the sliding-window engine: fixed memory per key,
+    idle keys swept. The dependency shares the process-wide engine with
+    the other rate-limited entry points.
     """
 
-    def __init__(self) -> None:
-        self._attempts: dict[str, list[float]] = {}
+    def __init__(
+        self,
+        engine: RateLimitEngine | None = None,
+        window_seconds: int = 3600,
+        namespace: str = "newsletter",
+    ) -> None:
+        self._engine = engine if engine is not None else SlidingWindowRateLimiter()
+        self._window_seconds = window_seconds
+        self._prefix = f"{namespace}:"
 
     def check_rate_limit(
         self,
@@ -482,29 +746,48 @@ class InMemoryRateLimiter:
         window_seconds: int,
     ) -> tuple[bool, int]:
         """Check if rate limit is exceeded."""
-        import time
+        return self._engine.peek(self._prefix + key, limit, window_seconds)
 
-        now = time.time()
-        window_start = now - window_seconds
+    def record_attempt(self, key: str) -> None:
+        """Record an attempt against the configured (hourly) window."""
+        self._engine.record(self._prefix + key, self._window_seconds)
 
-        # Clean old attempts
-        if key in self._attempts:
-            self._attempts[key] = [t for t in self._attempts[key] if t > window_start]
-        else:
-            self._attempts[key] = []
 
-        current_count = len(self._attempts[key])
-        remaining = max(0, limit - current_count)
+# --- Shared limits (multi-worker) ---
+# With LAB_SHARED_LIMITS_DB set, rate limits and analytics dedupe keys live in
+# a small SQLite file every worker process opens; otherwise they are in-process.
+_shared_limit_store: SQLiteRateLimitStore | None = None
+_dedupe_store: DedupeStorePort | None = None
 
-        return current_count < limit, remaining
 
-    def record_attempt(self, key: str) -> None:
-        """Record an attempt."""
-        import time
+def init_shared_limits(settings: Settings) -> None:
+    """Install the cross-process limit store if configured (startup hook)."""
+    global _shared_limit_store
+    if settings.shared_limits_db and _shared_limit_store is None:
+        _shared_limit_store = SQLiteRateLimitStore(settings.shared_limits_db)
+        configure_shared_rate_limiter(_shared_limit_store)
 
-        if key not in self._attempts:
-            self._attempts[key] = []
-        self._attempts[key].append(time.time())
+
+def shutdown_shared_limits() -> None:
+    """Flush buffered rate-limit hits (shutdown hook)."""
+    if _shared_limit_store is not None:
+        _shared_limit_store.flush()
+
+
+def get_dedupe_store(settings: Settings = Depends(get_settings)) -> DedupeStorePort:
+    """Get analytics dedupe store singleton."""
+    global _dedupe_store
+    if _dedupe_store is None:
+        if settings.shared_limits_db:
+            _dedupe_store = SQLiteDedupeStore(settings.shared_limits_db)
+        else:
+            _dedupe_store = InMemoryDedupeStore()
+    return _dedupe_store
+
+
+def get_dedupe_service(store: DedupeStorePort = Depends(get_dedupe_store)) -> DedupeService:
+    """Get dedupe service (UA classifier is compiled and cached once per config)."""
+    return DedupeService(store=store)
 
 
 # Rate limiter singleton
@@ -515,5 +798,104 @@ def get_rate_limiter() -> InMemoryRateLimiter:
     """Get rate limiter singleton."""
     global _rate_limiter_instance
     if _rate_limiter_instance is None:
-        _rate_limiter_instance = InMemoryRateLimiter()
+        _rate_limiter_instance = InMemoryRateLimiter(engine=get_shared_rate_limiter())
     return _rate_limiter_instance
+
+
+# --- Analytics Aggregate Pipeline (E6.4) ---
+# One write-batched pipeline per database: /a/event buffers into it and the
+# background thread flushes coalesced counts to analytics_aggregates.
+_analytics_pipelines: dict[str, AggregatePipeline] = {}
+_analytics_pipeline_lock = threading.Lock()
+
+
+def get_analytics_aggregate_repo(
+    settings: Settings = Depends(get_settings),
+) -> SQLiteAnalyticsAggregateRepo:
+    return _shared_repo(SQLiteAnalyticsAggregateRepo, settings.db_path)
+
+
+def get_analytics_pipeline(db_path: str) -> AggregatePipeline:
+    """Get the aggregate pipeline for a database (started on first use)."""
+    pipeline = _analytics_pipelines.get(db_path)
+    if pipeline is None:
+        with _analytics_pipeline_lock:
+            pipeline = _analytics_pipelines.get(db_path)
+            if pipeline is None:
+                pipeline = AggregatePipeline(
+                    sink=_shared_repo(SQLiteAnalyticsAggregateRepo, db_path)
+                )
+                pipeline.start()
+                _analytics_pipelines[db_path] = pipeline
+    return pipeline
+
+
+def shutdown_analytics_pipeline() -> None:
+    """Stop the pipelines and flush buffered counts (shutdown hook)."""
+    with _analytics_pipeline_lock:
+        pipelines = list(_analytics_pipelines.values())
+        _analytics_pipelines.clear()
+    for pipeline in pipelines:
+        pipeline.stop()
+
+
+# Non-blocking ingestion front: handlers that must not wait (outbound click
+# redirects) queue raw payloads, and a background thread runs them through
+# the same validation and rate limits as /a/event into the pipeline above.
+_ingest_queues: dict[str, IngestQueue] = {}
+_ingest_queue_lock = threading.Lock()
+
+
+def get_ingest_queue(db_path: str) -> IngestQueue:
+    """Get the analytics ingest queue for a database (started on first use)."""
+    queue = _ingest_queues.get(db_path)
+    if queue is None:
+        with _ingest_queue_lock:
+            queue = _ingest_queues.get(db_path)
+            if queue is None:
+                service = AnalyticsIngestionService(
+                    event_store=PipelineEventStore(get_analytics_pipeline(db_path)),
+                    config=IngestionConfig(),
+                    rate_limiter=AnalyticsRateLimiter(engine=get_shared_rate_limiter()),
+                )
+                queue = IngestQueue(service)
+                queue.start()
+                _ingest_queues[db_path] = queue
+    return queue
+
+
+def shutdown_ingest_queue() -> None:
+    """Stop the ingest queues and ingest what is still queued (shutdown hook)."""
+    with _ingest_queue_lock:
+        queues = list(_ingest_queues.values())
+        _ingest_queues.clear()
+    for queue in queues:
+        queue.stop()
+
+
+# Audit write-behind, one per database: admin mutations enqueue audit entries
+# and a background thread inserts them into audit_events in batches.
+_audit_writers: dict[str, AuditWriteBehind] = {}
+_audit_writer_lock = threading.Lock()
+
+
+def get_audit_writer(db_path: str) -> AuditWriteBehind:
+    """Get the audit write-behind repo for a database (started on first use)."""
+    writer = _audit_writers.get(db_path)
+    if writer is None:
+        with _audit_writer_lock:
+            writer = _audit_writers.get(db_path)
+            if writer is None:
+                writer = AuditWriteBehind(SQLiteAuditRepo(db_path))
+                writer.start()
+                _audit_writers[db_path] = writer
+    return writer
+
+
+def shutdown_audit_writer() -> None:
+    """Stop the writers and flush queued audit entries (shutdown hook)."""
+    with _audit_writer_lock:
+        writers = list(_audit_writers.values())
+        _audit_writers.clear()
+    for writer in writers:
+        writer.stop()
@@ -6,8 +6,25 @@ from typing import Any
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.api.deps import get_settings
+from src.adapters.sqlite.pool import close_all_pools
+from src.api.deps import (
+    get_redirect_index,
+    get_redirect_repo,
+    get_settings,
+    init_image_derivatives,
+    init_redirect_index,
+    init_shared_limits,
+    init_storage_scrubber,
+    shutdown_analytics_pipeline,
+    shutdown_audit_writer,
+    shutdown_image_derivatives,
+    shutdown_ingest_queue,
+    shutdown_redirect_indexes,
+    shutdown_shared_limits,
+    shutdown_storage_scrubber,
+)
 from src.app_shell.config import validate_ops_rules
+from src.components.redirects import CompiledRedirectIndex
 from src.rules.loader import load_rules
 
 
@@ -25,8 +42,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         print(f"CRITICAL: Rules load failed: {e}", file=sys.stderr)
         sys.exit(1)
 
+    init_shared_limits(settings)
+    init_storage_scrubber(settings)
+    init_image_derivatives(settings)
+    admin_schedule.init_publish_worker(settings)
+    init_redirect_index(settings)
+
     yield
-    # Shutdown cleanup if needed
+
+    # Shutdown: flush buffered analytics and audit entries, then release
+    # pooled SQLite connections
+    shutdown_redirect_indexes()
+    admin_schedule.shutdown_publish_worker()
+    shutdown_image_derivatives()
+    shutdown_storage_scrubber()
+    shutdown_ingest_queue()
+    shutdown_analytics_pipeline()
+    shutdown_audit_writer()
+    shutdown_shared_limits()
+    close_all_pools()
 
 
 app = FastAPI(
@@ -51,6 +85,7 @@ from src.api.routes import (  # noqa: E402
     assets,
     auth,
     content,
+    outbound,
     public,
     public_assets,
     public_newsletter,
@@ -86,6 +121,15 @@ app.include_router(
 app.include_router(public_ssr.router, prefix="", tags=["SSR"])
 app.include_router(public_assets.router, prefix="/assets", tags=["Assets Public"])
 app.include_router(analytics_ingest.router, prefix="/a", tags=["Analytics Ingest"])
+app.include_router(outbound.router, prefix="/out", tags=["Outbound Clicks"])
+
+
+# Redirects (E7.2): applied to public GETs before routing
+def _redirect_index() -> CompiledRedirectIndex:
+    return get_redirect_index(get_redirect_repo(get_settings()))
+
+
+app.add_middleware(public_redirects.RedirectMiddleware, index_provider=_redirect_index)
 
 
 # CORS (Allow Frontend)
@@ -10,18 +10,17 @@ Test assertions:
 - E14: Engagement data queries
 """
 
-import os
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
-from src.adapters.sqlite_db import SQLiteEngagementRepo
+from src.adapters.sqlite_db import SQLiteAnalyticsAggregateRepo, SQLiteEngagementRepo
+from src.api.deps import Settings, get_analytics_aggregate_repo, get_settings
 from src.components.analytics._aggregate import (
     AggregateService,
     BucketType,
-    InMemoryAggregateRepo,
 )
 from src.components.engagement import EngagementRepoPort
 
@@ -96,6 +95,28 @@ class TopReferrersResponse(BaseModel):
     items: list[TopReferrerItem]
 
 
+class TopLinkItem(BaseModel):
+    """Top outbound link item."""
+
+    link_id: str
+    count: int
+
+
+class TopLinksResponse(BaseModel):
+    """Top outbound links response model."""
+
+    items: list[TopLinkItem]
+
+
+class LinkClicksResponse(BaseModel):
+    """Outbound clicks on one link per time bucket."""
+
+    link_id: str
+    bucket_type: str
+    total: int
+    points: list[TimeSeriesPoint]
+
+
 class EngagementTotalsResponse(BaseModel):
     """Engagement totals response model."""
 
@@ -147,30 +168,21 @@ class DashboardResponse(BaseModel):
 # --- Dependencies ---
 
 
-_aggregate_repo = InMemoryAggregateRepo()
-_aggregate_service = AggregateService(repo=_aggregate_repo)
-
-# Database path for engagement repo
-_db_path = os.environ.get("DATABASE_URL", "lrl.db")
-if _db_path.startswith("sqlite:///"):
-    _db_path = _db_path.replace("sqlite:///", "")
-
+def get_aggregate_service(
+    repo: SQLiteAnalyticsAggregateRepo = Depends(get_analytics_aggregate_repo),
+) -> AggregateService:
+    """
+    Get aggregate service dependency.
 
-def get_aggregate_service() -> AggregateService:
-    """Get aggregate service dependency."""
-    return _aggregate_service
+    Reads analytics_aggregates directly. Events buffered by the ingestion
+    pipeline show up after its next background flush (about a second).
+    """
+    return AggregateService(repo=repo)
 
 
-def get_engagement_repo() -> EngagementRepoPort:
+def get_engagement_repo(settings: Settings = Depends(get_settings)) -> EngagementRepoPort:
     """Get engagement repo dependency."""
-    return SQLiteEngagementRepo(_db_path)
-
-
-def reset_aggregate_service() -> None:
-    """Reset aggregate service (for testing)."""
-    global _aggregate_repo, _aggregate_service
-    _aggregate_repo = InMemoryAggregateRepo()
-    _aggregate_service = AggregateService(repo=_aggregate_repo)
+    return SQLiteEngagementRepo(settings.db_path)
 
 
 # --- Helper Functions ---
@@ -211,6 +223,17 @@ def parse_bucket_type(bucket_type: str) -> BucketType:
         ) from None
 
 
+def parse_link_id(link_id: str) -> UUID:
+    """Parse a link ID (aggregates key outbound links by UUID)."""
+    try:
+        return UUID(link_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid link ID: {link_id}. Clicks are aggregated per link UUID",
+        ) from None
+
+
 # --- Routes ---
 
 
@@ -430,18 +453,19 @@ def get_top_referrers(
     )
 
 
-@router.get("/dashboard", response_model=DashboardResponse)
-def get_dashboard(
+@router.get("/links", response_model=TopLinksResponse)
+def get_top_links(
     start: str | None = Query(None, description="Start datetime (ISO format)"),
     end: str | None = Query(None, description="End datetime (ISO format)"),
-    bucket_type: str = Query("day", description="Bucket type for time series"),
+    bucket_type: str = Query("day", description="Bucket type: minute, hour, day"),
+    limit: int = Query(10, ge=1, le=100, description="Number of results"),
+    exclude_bots: bool = Query(True, description="Exclude bot traffic"),
     service: AggregateService = Depends(get_aggregate_service),
-    engagement_repo: EngagementRepoPort = Depends(get_engagement_repo),
-) -> DashboardResponse:
+) -> TopLinksResponse:
     """
-    Get complete dashboard data (TA-0041, TA-0042, E14).
+    Get top outbound links by clicks (TA-0038, TA-0042).
 
-    Returns totals, time series, top content, sources, referrers, and engagement.
+    Returns link IDs sorted by click count.
     """
     if start and end:
         start_dt = parse_datetime(start)
@@ -451,39 +475,99 @@ def get_dashboard(
 
     bt = parse_bucket_type(bucket_type)
 
-    # Get all dashboard data
-    totals = service.get_totals(
+    top = service.get_top_links(
         bucket_type=bt,
         start=start_dt,
         end=end_dt,
+        limit=limit,
+        exclude_bots=exclude_bots,
     )
 
-    series = service.get_time_series(
-        bucket_type=bt,
-        start=start_dt,
-        end=end_dt,
+    return TopLinksResponse(
+        items=[
+            TopLinkItem(
+                link_id=str(item["link_id"]),
+                count=item["count"],
+            )
+            for item in top
+        ],
     )
 
-    top_content = service.get_top_content(
+
+@router.get("/links/{link_id}", response_model=LinkClicksResponse)
+def get_link_clicks(
+    link_id: str,
+    start: str | None = Query(None, description="Start datetime (ISO format)"),
+    end: str | None = Query(None, description="End datetime (ISO format)"),
+    bucket_type: str = Query("day", description="Bucket type: minute, hour, day"),
+    exclude_bots: bool = Query(True, description="Exclude bot traffic"),
+    service: AggregateService = Depends(get_aggregate_service),
+) -> LinkClicksResponse:
+    """
+    Get outbound clicks on one link per time bucket (TA-0038, TA-0042).
+
+    Counts come from /out/go and /out/click/{link_id} redirects.
+    """
+    if start and end:
+        start_dt = parse_datetime(start)
+        end_dt = parse_datetime(end)
+    else:
+        start_dt, end_dt = get_default_time_range()
+
+    bt = parse_bucket_type(bucket_type)
+    link_uuid = parse_link_id(link_id)
+
+    series = service.get_link_clicks(
+        link_id=link_uuid,
         bucket_type=bt,
         start=start_dt,
         end=end_dt,
-        limit=5,
+        exclude_bots=exclude_bots,
     )
 
-    top_sources = service.get_top_sources(
-        bucket_type=bt,
-        start=start_dt,
-        end=end_dt,
-        limit=5,
+    return LinkClicksResponse(
+        link_id=str(link_uuid),
+        bucket_type=bt.value,
+        total=sum(point["count"] for point in series),
+        points=[
+            TimeSeriesPoint(
+                timestamp=point["timestamp"].isoformat(),
+                count=point["count"],
+            )
+            for point in series
+        ],
     )
 
-    top_referrers = service.get_top_referrers(
+
+@router.get("/dashboard", response_model=DashboardResponse)
+def get_dashboard(
+    start: str | None = Query(None, description="Start datetime (ISO format)"),
+    end: str | None = Query(None, description="End datetime (ISO format)"),
+    bucket_type: str = Query("day", description="Bucket type for time series"),
+    service: AggregateService = Depends(get_aggregate_service),
+    engagement_repo: EngagementRepoPort = Depends(get_engagement_repo),
+) -> DashboardResponse:
+    """
+    Get complete dashboard data (TA-0041, TA-0042, E14).
+
+    Returns totals, time series, top content, sources, referrers, and engagement.
+    """
+    if start and end:
+        start_dt = parse_datetime(start)
+        end_dt = parse_datetime(end)
+    else:
+        start_dt, end_dt = get_default_time_range()
+
+    bt = parse_bucket_type(bucket_type)
+
+    # All sections from a single scan of the range
+    summary = service.get_dashboard(
         bucket_type=bt,
         start=start_dt,
         end=end_dt,
         limit=5,
     )
+    totals = summary.totals
 
     # Get engagement data (E14)
     engagement_data = None
@@ -522,7 +606,7 @@ def get_dashboard(
                     timestamp=point["timestamp"].isoformat(),
                     count=point["count"],
                 )
-                for point in series
+                for point in summary.time_series
             ],
         ),
         top_content=TopContentResponse(
@@ -531,7 +615,7 @@ def get_dashboard(
                     content_id=str(item["content_id"]),
                     count=item["count"],
                 )
-                for item in top_content
+                for item in summary.top_content
             ],
         ),
         top_sources=TopSourcesResponse(
@@ -541,7 +625,7 @@ def get_dashboard(
                     medium=item["medium"],
                     count=item["count"],
                 )
-                for item in top_sources
+                for item in summary.top_sources
             ],
         ),
         top_referrers=TopReferrersResponse(
@@ -550,7 +634,7 @@ def get_dashboard(
                     domain=item["domain"],
                     count=item["count"],
                 )
-                for item in top_referrers
+                for item in summary.top_referrers
             ],
         ),
         engagement=engagement_data,
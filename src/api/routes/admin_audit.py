@@ -15,12 +15,15 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
+from src.api.deps import Settings, get_audit_writer, get_settings
 from src.components.audit import (
     AuditAction,
     AuditEntry,
     AuditService,
     EntityType,
     InMemoryAuditRepo,
+    decode_cursor,
+    encode_cursor,
 )
 
 router = APIRouter()
@@ -51,6 +54,7 @@ class AuditQueryResponse(BaseModel):
     total: int
     offset: int
     limit: int
+    next_cursor: str | None = None
 
 
 class EntityHistoryResponse(BaseModel):
@@ -64,20 +68,26 @@ class EntityHistoryResponse(BaseModel):
 # --- Dependencies ---
 
 
-_audit_repo = InMemoryAuditRepo()
-_audit_service = AuditService(repo=_audit_repo)
+# Set by reset_audit_service() to pin an in-memory repo (for testing)
+_audit_service: AuditService | None = None
 
 
-def get_audit_service() -> AuditService:
-    """Get audit service dependency."""
-    return _audit_service
+def get_audit_service(settings: Settings = Depends(get_settings)) -> AuditService:
+    """
+    Get audit service dependency.
+
+    Entries persist to the configured database's audit_events through its
+    shared write-behind queue.
+    """
+    if _audit_service is not None:
+        return _audit_service
+    return AuditService(repo=get_audit_writer(settings.db_path))
 
 
 def reset_audit_service() -> None:
-    """Reset audit service (for testing)."""
-    global _audit_repo, _audit_service
-    _audit_repo = InMemoryAuditRepo()
-    _audit_service = AuditService(repo=_audit_repo)
+    """Reset audit service to an in-memory repo (for testing)."""
+    global _audit_service
+    _audit_service = AuditService(repo=InMemoryAuditRepo())
 
 
 # --- Helper Functions ---
@@ -151,6 +161,17 @@ def parse_uuid(uuid_str: str, param_name: str) -> UUID:
         ) from None
 
 
+def parse_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Parse a keyset pagination cursor."""
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid cursor: {cursor}",
+        ) from None
+
+
 # --- Routes ---
 
 
@@ -164,12 +185,14 @@ def query_audit_logs(
     end: str | None = Query(None, description="End datetime (ISO format)"),
     limit: int = Query(50, ge=1, le=500, description="Number of results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: str | None = Query(None, description="next_cursor from a previous page"),
     service: AuditService = Depends(get_audit_service),
 ) -> AuditQueryResponse:
     """
     Query audit logs with filters (TA-0049).
 
-    Returns paginated list of audit entries.
+    Returns paginated list of audit entries, newest first. Pass the returned
+    next_cursor to fetch the following page without an OFFSET scan.
     """
     # Parse filters
     entity_type_enum = parse_entity_type(entity_type) if entity_type else None
@@ -177,6 +200,7 @@ def query_audit_logs(
     actor_uuid = parse_uuid(actor_id, "actor_id") if actor_id else None
     start_dt = parse_datetime(start) if start else None
     end_dt = parse_datetime(end) if end else None
+    before = parse_cursor(cursor) if cursor else None
 
     # Query
     results = service.query(
@@ -188,6 +212,7 @@ def query_audit_logs(
         end_time=end_dt,
         limit=limit,
         offset=offset,
+        before=before,
     )
 
     # Count total
@@ -203,8 +228,9 @@ def query_audit_logs(
     return AuditQueryResponse(
         items=[entry_to_response(e) for e in results],
         total=total,
-        offset=offset,
+        offset=0 if before else offset,
         limit=limit,
+        next_cursor=encode_cursor(results[-1]) if len(results) == limit else None,
     )
 
 
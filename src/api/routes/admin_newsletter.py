@@ -7,13 +7,12 @@ Test assertions: TA-0084, TA-0085, TA-0086, TA-0087
 Endpoints:
 - GET /api/admin/newsletter/subscribers - List subscribers
 - DELETE /api/admin/newsletter/subscribers/{id} - Delete subscriber (GDPR)
-- GET /api/admin/newsletter/subscribers/export - Export CSV
+- GET /api/admin/newsletter/subscribers/export/csv - Export CSV (?gzip=true)
+- GET /api/admin/newsletter/subscribers/export/jsonl - Export JSON Lines (?gzip=true)
 """
 
 from __future__ import annotations
 
-import csv
-import io
 from typing import Literal
 from uuid import UUID
 
@@ -23,6 +22,11 @@ from pydantic import BaseModel, Field
 
 from src.adapters.sqlite_db import SQLiteNewsletterSubscriberRepo
 from src.api.deps import get_current_user, get_newsletter_repo
+from src.components.newsletter.export import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    stream_export,
+)
 from src.components.newsletter.models import NewsletterSubscriber, SubscriberStatus
 from src.domain.entities import User
 
@@ -85,6 +89,27 @@ def _subscriber_to_response(subscriber: NewsletterSubscriber) -> SubscriberRespo
     )
 
 
+def _export_response(
+    fmt: ExportFormat,
+    status: str | None,
+    compress: bool,
+    repo: SQLiteNewsletterSubscriberRepo,
+) -> StreamingResponse:
+    """Stream every matching subscriber, paged from the repo as it is sent."""
+    status_enum = SubscriberStatus(status) if status else None
+    filename = f"newsletter_subscribers.{fmt}"
+    media_type = EXPORT_MEDIA_TYPES[fmt]
+    if compress:
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        stream_export(repo.iter_all(status_enum), fmt, compress=compress),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
 # --- Endpoints ---
 
 
@@ -204,6 +229,7 @@ def export_subscribers_csv(
     status: Literal["pending", "confirmed", "unsubscribed"] | None = Query(
         None, description="Filter by status"
     ),
+    gzip: bool = Query(False, description="Gzip the file"),
     user: User = Depends(get_current_user),
     repo: SQLiteNewsletterSubscriberRepo = Depends(get_newsletter_repo),
 ) -> StreamingResponse:
@@ -212,38 +238,27 @@ def export_subscribers_csv(
 
     Returns CSV file with email, status, and timestamps.
     No tokens are included in export (security).
+    Rows are streamed in chunks; there is no size cap.
     """
-    # Get all matching subscribers (no pagination for export)
-    if status:
-        status_enum = SubscriberStatus(status)
-        subscribers = repo.list_by_status(status_enum, limit=10000, offset=0)
-    else:
-        subscribers = repo.list_all(limit=10000, offset=0)
-
-    # Generate CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header row
-    writer.writerow(["email", "status", "created_at", "confirmed_at", "unsubscribed_at"])
-
-    # Data rows
-    for subscriber in subscribers:
-        writer.writerow([
-            subscriber.email,
-            subscriber.status.value,
-            subscriber.created_at.isoformat(),
-            subscriber.confirmed_at.isoformat() if subscriber.confirmed_at else "",
-            subscriber.unsubscribed_at.isoformat() if subscriber.unsubscribed_at else "",
-        ])
-
-    # Create streaming response
-    output.seek(0)
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=newsletter_subscribers.csv"},
-    )
+    return _export_response("csv", status, gzip, repo)
+
+
+@router.get(
+    "/subscribers/export/jsonl",
+    responses={401: {"model": ErrorResponse}},
+    summary="Export subscribers to JSON Lines",
+    description="Export all subscribers as one JSON object per line.",
+)
+def export_subscribers_jsonl(
+    status: Literal["pending", "confirmed", "unsubscribed"] | None = Query(
+        None, description="Filter by status"
+    ),
+    gzip: bool = Query(False, description="Gzip the file"),
+    user: User = Depends(get_current_user),
+    repo: SQLiteNewsletterSubscriberRepo = Depends(get_newsletter_repo),
+) -> StreamingResponse:
+    """Export subscribers to JSON Lines (same fields as the CSV export)."""
+    return _export_response("jsonl", status, gzip, repo)
 
 
 @router.get(
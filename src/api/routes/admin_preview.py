@@ -6,6 +6,9 @@ Provides preview endpoints for content before publishing.
 Spec refs: E4.4, TA-0025
 Test assertions:
 - TA-0025: Preview renders same as public (content parity)
+
+HTML, plain text and headings come from one cached render pass, so
+re-previewing an unchanged draft does not walk the document again.
 """
 
 from __future__ import annotations
@@ -16,10 +19,12 @@ from uuid import UUID
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
 
+from src.adapters.image_derivatives import DerivativeIndex
+from src.api.deps import get_derivative_index
 from src.components.render_posts import (
     PostRenderer,
     RenderConfig,
-    render_rich_text,
+    get_render_engine,
 )
 from src.components.richtext import RichTextConfig
 
@@ -68,12 +73,15 @@ class ContentPreviewResponse(BaseModel):
 # --- Dependencies ---
 
 
-def get_post_renderer() -> PostRenderer:
+def get_post_renderer(
+    images: DerivativeIndex = Depends(get_derivative_index),
+) -> PostRenderer:
     """Get post renderer dependency."""
     config = RenderConfig(
         rich_text_config=RichTextConfig(),
         wrap_in_article=True,
         add_heading_ids=True,
+        image_sources=images,
     )
     return PostRenderer(config=config)
 
@@ -111,6 +119,7 @@ def count_links(doc: dict[str, Any]) -> int:
 def preview_rich_text(
     request: PreviewRequest,
     renderer: PostRenderer = Depends(get_post_renderer),
+    images: DerivativeIndex = Depends(get_derivative_index),
 ) -> PreviewResponse:
     """
     Preview rich text content (TA-0025).
@@ -122,21 +131,19 @@ def preview_rich_text(
         rich_text_config=RichTextConfig(),
         wrap_in_article=request.wrap_in_article,
         add_heading_ids=request.add_heading_ids,
+        image_sources=images,
     )
 
-    # Render HTML
-    html = render_rich_text(request.rich_text_json, config)
-
-    # Extract metadata
-    plain_text = renderer.extract_text(request.rich_text_json)
-    headings = renderer.extract_headings(request.rich_text_json)
+    # Render HTML, plain text and headings in one pass
+    rendered = get_render_engine().render(request.rich_text_json, config)
+    plain_text = rendered.plain_text
     word_count = count_words(plain_text)
     link_count = count_links(request.rich_text_json)
 
     return PreviewResponse(
-        html=html,
+        html=rendered.html,
         plain_text=plain_text,
-        headings=headings,
+        headings=rendered.heading_list(),
         word_count=word_count,
         link_count=link_count,
     )
@@ -166,29 +173,28 @@ def validate_rich_text(
 def sanitize_rich_text(
     request: PreviewRequest,
     renderer: PostRenderer = Depends(get_post_renderer),
+    images: DerivativeIndex = Depends(get_derivative_index),
 ) -> dict[str, Any]:
     """
     Sanitize rich text and return cleaned version.
 
     Strips disallowed content and returns the sanitized document.
     """
-    from src.components.richtext import RichTextService
-
-    service = RichTextService()
-    sanitized, errors = service.sanitize(request.rich_text_json)
-
-    # Render sanitized version
     config = RenderConfig(
         rich_text_config=RichTextConfig(),
         wrap_in_article=request.wrap_in_article,
         add_heading_ids=request.add_heading_ids,
+        image_sources=images,
     )
-    html = render_rich_text(sanitized, config)
+    # Sanitize and render the sanitized version (cached together)
+    rendered = get_render_engine().render(request.rich_text_json, config, sanitize=True)
 
     return {
-        "sanitized": sanitized,
-        "html": html,
-        "changes": [{"code": e.code, "message": e.message, "path": e.path} for e in errors],
+        "sanitized": rendered.sanitized,
+        "html": rendered.html,
+        "changes": [
+            {"code": e.code, "message": e.message, "path": e.path} for e in rendered.changes
+        ],
     }
 
 
@@ -200,8 +206,7 @@ def extract_headings(
     """
     Extract headings for table of contents.
     """
-    headings = renderer.extract_headings(request.rich_text_json)
-    return {"headings": headings}
+    return {"headings": renderer.render_all(request.rich_text_json).heading_list()}
 
 
 @router.post("/preview/stats")
@@ -212,11 +217,12 @@ def get_content_stats(
     """
     Get content statistics.
     """
-    plain_text = renderer.extract_text(request.rich_text_json)
+    rendered = renderer.render_all(request.rich_text_json)
+    plain_text = rendered.plain_text
     word_count = count_words(plain_text)
     char_count = len(plain_text)
     link_count = count_links(request.rich_text_json)
-    headings = renderer.extract_headings(request.rich_text_json)
+    headings = rendered.headings
 
     return {
         "word_count": word_count,
@@ -12,14 +12,16 @@ Test assertions:
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
-from src.api.deps import get_redirect_repo
+from src.api.deps import get_redirect_index, get_redirect_repo
 from src.components.redirects import (
+    CompiledRedirectIndex,
     Redirect,
     RedirectConfig,
     RedirectService,
@@ -119,11 +121,13 @@ def _serialize_errors(
 
 def get_redirect_service(
     repo: Any = Depends(get_redirect_repo),
+    index: CompiledRedirectIndex = Depends(get_redirect_index),
 ) -> RedirectService:
-    """Get redirect service dependency."""
+    """Get redirect service dependency (writes rebuild the shared index)."""
     return RedirectService(
         repo=repo,
         config=RedirectConfig(),
+        index=index,
     )
 
 
@@ -176,6 +180,14 @@ def list_redirects(
     )
 
 
+@router.get("/redirects/stats")
+def redirect_stats(
+    index: CompiledRedirectIndex = Depends(get_redirect_index),
+) -> dict[str, int]:
+    """Compiled redirect table size and lookup hit/miss counters."""
+    return asdict(index.stats())
+
+
 @router.get(
     "/redirects/{redirect_id}",
     response_model=RedirectResponse,
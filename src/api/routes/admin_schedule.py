@@ -14,15 +14,24 @@ from __future__ import annotations
 
 from dataclasses import replace
 from datetime import UTC, datetime
-from typing import Any, cast
+from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
 from src.adapters.clock import SystemClock
+from src.adapters.publish_worker import PublishWorker
 from src.adapters.sqlite.repos import SQLiteContentRepo
-from src.api.deps import get_clock, get_content_repo
+from src.api.deps import (
+    Settings,
+    get_clock,
+    get_content_repo,
+    get_page_cache,
+    get_publish_job_repo,
+    get_sitemap_store,
+)
+from src.components.C2_PublicTemplates import generate_cache_tag
 from src.components.scheduler import (
     PublishJob,
     SchedulerConfig,
@@ -152,11 +161,11 @@ def _serialize_errors(errors: list[SchedulerError]) -> list[dict[str, Any]]:
     ]
 
 
-# --- Mock Dependencies (to be replaced with real DI) ---
+# --- Test Doubles ---
 
 
 class MockPublishJobRepo:
-    """In-memory repository for testing."""
+    """In-memory publish job repository for testing."""
 
     def __init__(self) -> None:
         self.jobs: dict[UUID, PublishJob] = {}
@@ -229,6 +238,22 @@ class MockPublishJobRepo:
             return updated_job
         return None
 
+    def claim_due_jobs(
+        self,
+        worker_id: str,
+        now_utc: datetime,
+        limit: int = 10,
+    ) -> list[PublishJob]:
+        due = sorted(
+            self.list_due_jobs(now_utc, limit=len(self.jobs)), key=lambda j: j.publish_at_utc
+        )
+        claimed = []
+        for job in due[:limit]:
+            updated = self.claim_job(job.id, worker_id, now_utc)
+            if updated is not None:
+                claimed.append(updated)
+        return claimed
+
 
 class MockPublisher:
     """Mock publisher for testing - always succeeds."""
@@ -240,9 +265,17 @@ class MockPublisher:
 class ContentPublisher:
     """Real publisher that updates content status in the database."""
 
-    def __init__(self, content_repo: SQLiteContentRepo, clock: SystemClock) -> None:
+    def __init__(
+        self,
+        content_repo: SQLiteContentRepo,
+        clock: SystemClock,
+        page_cache: Any | None = None,
+        sitemap: Any | None = None,
+    ) -> None:
         self._content_repo = content_repo
         self._clock = clock
+        self._page_cache = page_cache
+        self._sitemap = sitemap
 
     def publish(self, content_id: UUID) -> tuple[bool, str | None]:
         """Publish content by updating its status to 'published'."""
@@ -257,6 +290,14 @@ class ContentPublisher:
             updated_item = transition(item, "published", now)
             self._content_repo.save(updated_item)
 
+            # Drop rendered pages for this item (e.g. a cached archived view)
+            if self._page_cache is not None:
+                self._page_cache.revalidate_tag(
+                    generate_cache_tag(updated_item.type, str(updated_item.id))
+                )
+            if self._sitemap is not None:
+                self._sitemap.apply(updated_item)
+
             return True, None
         except ValueError as e:
             return False, str(e)
@@ -265,20 +306,64 @@ class ContentPublisher:
 
 
 # Singleton instances
-_repo = MockPublishJobRepo()
+_worker: PublishWorker | None = None
+
+
+def _notify_worker(job_id: UUID, due_at: datetime | None) -> None:
+    """Forward schedule changes to the publish worker, if running."""
+    worker = _worker
+    if worker is not None:
+        worker.notify(job_id, due_at)
 
 
 def get_scheduler_service(
+    repo: Any = Depends(get_publish_job_repo),
     content_repo: SQLiteContentRepo = Depends(get_content_repo),
     clock: SystemClock = Depends(get_clock),
+    page_cache: Any = Depends(get_page_cache),
+    sitemap: Any = Depends(get_sitemap_store),
 ) -> SchedulerService:
     """Get scheduler service dependency with real publisher."""
-    publisher = ContentPublisher(content_repo, clock)
+    publisher = ContentPublisher(content_repo, clock, page_cache, sitemap)
     return SchedulerService(
-        repo=cast(Any, _repo),
+        repo=repo,
         publisher=publisher,
         config=SchedulerConfig(),
+        on_change=_notify_worker,
+    )
+
+
+def init_publish_worker(settings: Settings) -> None:
+    """Start the scheduled-publish worker if configured (startup hook)."""
+    global _worker
+    if settings.publish_worker_concurrency <= 0 or _worker is not None:
+        return
+    service = get_scheduler_service(
+        get_publish_job_repo(settings),
+        get_content_repo(settings),
+        get_clock(),
+        get_page_cache(settings),
+        get_sitemap_store(settings),
+    )
+    _worker = PublishWorker(
+        service,
+        worker_id="api-publish-worker",
+        max_concurrency=settings.publish_worker_concurrency,
     )
+    _worker.start()
+
+
+def shutdown_publish_worker() -> None:
+    """Stop the scheduled-publish worker (shutdown hook)."""
+    global _worker
+    worker, _worker = _worker, None
+    if worker is not None:
+        worker.stop()
+
+
+def get_publish_worker() -> PublishWorker | None:
+    """The running publish worker (None when disabled)."""
+    return _worker
 
 
 # --- Routes ---
@@ -402,10 +487,11 @@ def publish_now(
     """
     now = datetime.now(UTC)
 
-    # Schedule for now
+    # Schedule for now (executed below, so the publish worker is not woken)
     job, errors = service.schedule(
         content_id=request.content_id,
         publish_at_utc=now,
+        notify=False,
     )
 
     if errors:
@@ -14,9 +14,8 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 
-from src.api.deps import get_current_user, get_site_settings_repo
+from src.api.deps import get_current_user, get_page_cache, get_site_settings_repo
 from src.components.settings import (
-    NoOpCacheInvalidator,
     SettingsService,
     ValidationError,
 )
@@ -96,11 +95,12 @@ def validation_errors_to_response(errors: list[ValidationError]) -> list[Validat
 
 def get_settings_service(
     repo: Any = Depends(get_site_settings_repo),
+    page_cache: Any = Depends(get_page_cache),
 ) -> SettingsService:
-    """Create SettingsService with dependencies."""
+    """Create SettingsService with dependencies (saves purge rendered SSR pages)."""
     return SettingsService(
         repo=repo,
-        cache_invalidator=NoOpCacheInvalidator(),
+        cache_invalidator=page_cache,
     )
 
 
@@ -11,18 +11,22 @@ Test assertions:
 
 from __future__ import annotations
 
-import os
 from typing import Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, ConfigDict, Field
 
+from src.adapters.rate_limiter import get_shared_rate_limiter
 from src.adapters.sqlite_db import SQLiteEngagementRepo
+from src.api.client_address import client_address
+from src.api.deps import Settings, get_analytics_pipeline, get_dedupe_service, get_settings
 from src.components.analytics import (
     AnalyticsIngestionService,
+    DedupeService,
     IngestionConfig,
-    InMemoryEventStore,
+    InMemoryRateLimiter,
+    PipelineEventStore,
 )
 from src.components.engagement import (
     CalculateEngagementInput,
@@ -33,11 +37,6 @@ from src.components.engagement import (
 
 router = APIRouter()
 
-# Database path for engagement repo
-_db_path = os.environ.get("DATABASE_URL", "lrl.db")
-if _db_path.startswith("sqlite:///"):
-    _db_path = _db_path.replace("sqlite:///", "")
-
 
 # --- Request/Response Models ---
 
@@ -82,25 +81,36 @@ class ErrorResponse(BaseModel):
 # --- Dependencies ---
 
 
-# Shared event store (in production, use a proper store)
-_event_store = InMemoryEventStore()
-
+def get_ingestion_service(
+    settings: Settings = Depends(get_settings),
+) -> AnalyticsIngestionService:
+    """
+    Get analytics ingestion service dependency.
 
-def get_ingestion_service() -> AnalyticsIngestionService:
-    """Get analytics ingestion service dependency."""
+    Accepted events are buffered in the shared aggregate pipeline and
+    flushed to analytics_aggregates in batches. Rate limits are counted
+    in the process-wide limiter, so they hold across requests.
+    """
     return AnalyticsIngestionService(
-        event_store=_event_store,
+        event_store=PipelineEventStore(get_analytics_pipeline(settings.db_path)),
         config=IngestionConfig(),
+        rate_limiter=InMemoryRateLimiter(engine=get_shared_rate_limiter()),
     )
 
 
 def get_client_key(request: Request) -> str:
     """Extract client key from request for rate limiting."""
-    # Use X-Forwarded-For if behind proxy, otherwise client host
-    forwarded = request.headers.get("x-forwarded-for")
-    if forwarded:
-        return forwarded.split(",")[0].strip()
-    return request.client.host if request.client else "unknown"
+    # X-Forwarded-For only counts when it comes from a trusted proxy
+    return client_address(request, get_settings().trusted_proxies)
+
+
+def get_request_ua_class(request: Request, dedupe: DedupeService) -> str:
+    """
+    Classify the request's User-Agent header (TA-0040).
+
+    Only the class is kept; the raw UA string never reaches the event (TA-0035).
+    """
+    return dedupe.classify(request.headers.get("user-agent")).value
 
 
 # --- Routes ---
@@ -118,6 +128,8 @@ def ingest_event(
     request: Request,
     body: EventRequest,
     service: AnalyticsIngestionService = Depends(get_ingestion_service),
+    dedupe: DedupeService = Depends(get_dedupe_service),
+    settings: Settings = Depends(get_settings),
 ) -> EventResponse | ErrorResponse:
     """
     Ingest an analytics event.
@@ -134,6 +146,7 @@ def ingest_event(
 
     # Remove None values but keep explicit ones for validation
     data = {k: v for k, v in data.items() if v is not None}
+    data.setdefault("ua_class", get_request_ua_class(request, dedupe))
 
     event, errors = service.ingest(data, client_key=client_key)
 
@@ -164,7 +177,7 @@ def ingest_event(
     # Process engagement data if present (E14)
     if body.time_on_page is not None and body.scroll_depth is not None and body.content_id:
         try:
-            engagement_repo = SQLiteEngagementRepo(_db_path)
+            engagement_repo = SQLiteEngagementRepo(settings.db_path)
             engagement_input = CalculateEngagementInput(
                 content_id=UUID(body.content_id),
                 time_on_page_seconds=float(body.time_on_page),
@@ -183,6 +196,7 @@ def ingest_batch(
     request: Request,
     events: list[dict[str, Any]],
     service: AnalyticsIngestionService = Depends(get_ingestion_service),
+    dedupe: DedupeService = Depends(get_dedupe_service),
 ) -> dict[str, Any]:
     """
     Ingest multiple analytics events.
@@ -191,8 +205,11 @@ def ingest_batch(
     """
     client_key = get_client_key(request)
 
+    ua_class = get_request_ua_class(request, dedupe)
+
     results = []
     for i, event_data in enumerate(events):
+        event_data = {"ua_class": ua_class, **event_data}
         event, errors = service.ingest(event_data, client_key=client_key)
         if errors:
             results.append(
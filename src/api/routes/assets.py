@@ -7,15 +7,19 @@ Provides endpoints for asset upload, listing, and content retrieval.
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
 from fastapi.responses import Response
 from pydantic import BaseModel
 
+from src.adapters.image_derivatives import ImageDerivativeWorker
+from src.adapters.local_storage import LocalFileStorage
+from src.api.asset_delivery import stream_stored_object
 from src.api.deps import (
     get_asset_repo,
     get_asset_rules,
     get_current_user,
-    get_file_store,
+    get_image_derivative_worker,
+    get_object_storage,
     get_version_repo,
 )
 from src.api.schemas import AssetResponse
@@ -26,6 +30,7 @@ from src.components.assets.models import (
     SetLatestVersionInput,
     UploadAssetInput,
 )
+from src.core.ports.storage import IntegrityError, KeyNotFoundError
 from src.domain.entities import User
 
 router = APIRouter()
@@ -37,15 +42,15 @@ def upload_asset(
     current_user: User = Depends(get_current_user),
     asset_repo: Any = Depends(get_asset_repo),
     version_repo: Any = Depends(get_version_repo),
-    storage: Any = Depends(get_file_store),
+    storage: Any = Depends(get_object_storage),
     rules: Any = Depends(get_asset_rules),
+    derivatives: ImageDerivativeWorker | None = Depends(get_image_derivative_worker),
 ) -> AssetResponse:
-    """Upload a new asset."""
-    content = file.file.read()
+    """Upload a new asset (image srcset variants are generated in the background)."""
     mime_type = file.content_type or "application/octet-stream"
 
     inp = UploadAssetInput(
-        data=content,
+        data=file.file,  # Streamed to storage, never read whole
         filename=file.filename or "unnamed",
         content_type=mime_type,
         user_id=current_user.id,
@@ -64,6 +69,9 @@ def upload_asset(
         status_code = 403 if "not allowed" in err.message else 400
         raise HTTPException(status_code=status_code, detail=err.message)
 
+    if derivatives is not None and result.version is not None:
+        derivatives.submit(result.version)
+
     return result.asset  # type: ignore
 
 
@@ -84,12 +92,13 @@ def list_assets(
 
 @router.get("/{asset_id}/content")
 def get_asset_content(
+    request: Request,
     asset_id: UUID,
     current_user: User = Depends(get_current_user),
     asset_repo: Any = Depends(get_asset_repo),
-    storage: Any = Depends(get_file_store),
+    storage: LocalFileStorage = Depends(get_object_storage),
 ) -> Response:
-    """Get asset file content."""
+    """Stream asset file content (supports Range requests)."""
     inp = GetAssetInput(asset_id=asset_id)
 
     # Get asset metadata
@@ -100,15 +109,27 @@ def get_asset_content(
 
     asset = result.asset
 
-    # Retrieve content from storage
+    # Open a streaming handle; bytes are never buffered whole
     try:
-        data = storage.get(asset.storage_path)
-        if data is None:
-            raise HTTPException(status_code=404, detail="Asset content not found")
+        stream, stored = storage.get_stream(asset.storage_path)
+    except KeyNotFoundError:
+        raise HTTPException(status_code=404, detail="Asset content not found") from None
+    except IntegrityError:
+        # I3: never serve bytes that no longer match the recorded hash
+        raise HTTPException(
+            status_code=500, detail="Asset content failed integrity check"
+        ) from None
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving asset: {e}") from e
 
-    return Response(content=data, media_type=asset.mime_type)
+    return stream_stored_object(
+        request,
+        stream,
+        size=stored.size_bytes,
+        media_type=asset.mime_type,
+        headers={},
+        etag=stored.etag,
+    )
 
 
 class SetLatestRequest(BaseModel):
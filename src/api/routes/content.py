@@ -4,7 +4,13 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
 
 from src.adapters.clock import SystemClock
-from src.api.deps import get_content_repo, get_current_user, get_policy
+from src.api.deps import (
+    get_content_repo,
+    get_current_user,
+    get_page_cache,
+    get_policy,
+    get_sitemap_store,
+)
 from src.api.schemas import (
     ContentBlockModel,
     ContentCreateRequest,
@@ -12,6 +18,7 @@ from src.api.schemas import (
     ContentTransitionRequest,
     ContentUpdateRequest,
 )
+from src.components.C2_PublicTemplates import generate_cache_tag
 from src.components.content.component import (
     run_create,
     run_delete,
@@ -43,6 +50,11 @@ def get_time_port() -> Any:
 router = APIRouter()
 
 
+def _revalidate_pages(page_cache: Any, item: Any) -> None:
+    """Purge rendered SSR pages for a content item (by ID tag, so old slugs go too)."""
+    page_cache.revalidate_tag(generate_cache_tag(item.type, str(item.id)))
+
+
 @router.get("", response_model=list[ContentItemResponse])
 def list_content(
     status: str | None = None,
@@ -138,6 +150,8 @@ def update_content(
     repo: Any = Depends(get_content_repo),
     policy: Any = Depends(get_policy),
     time: Any = Depends(get_time_port),
+    page_cache: Any = Depends(get_page_cache),
+    sitemap: Any = Depends(get_sitemap_store),
 ) -> ContentItemResponse:
     """Update an existing content item."""
     # Need to fetch first to check permission on resource
@@ -178,6 +192,9 @@ def update_content(
     if not result.success:
         raise HTTPException(status_code=400, detail=result.errors[0].message)
 
+    _revalidate_pages(page_cache, existing)
+    sitemap.apply(result.content)
+
     return result.content  # type: ignore[return-value]
 
 
@@ -189,6 +206,8 @@ def transition_content(
     repo: Any = Depends(get_content_repo),
     policy: Any = Depends(get_policy),
     time: Any = Depends(get_time_port),
+    page_cache: Any = Depends(get_page_cache),
+    sitemap: Any = Depends(get_sitemap_store),
 ) -> ContentItemResponse:
     """Transition content status."""
     # Get content for permission check
@@ -213,6 +232,9 @@ def transition_content(
     if not result.success:
         raise HTTPException(status_code=400, detail=result.errors[0].message)
 
+    _revalidate_pages(page_cache, get_res.content)
+    sitemap.apply(result.content)
+
     return result.content  # type: ignore
 
 
@@ -222,6 +244,8 @@ def delete_content(
     current_user: User = Depends(get_current_user),
     repo: Any = Depends(get_content_repo),
     policy: Any = Depends(get_policy),
+    page_cache: Any = Depends(get_page_cache),
+    sitemap: Any = Depends(get_sitemap_store),
 ) -> None:
     """Delete a content item."""
     # Get first for permission
@@ -240,3 +264,6 @@ def delete_content(
 
     if not result.success:
         raise HTTPException(status_code=400, detail=result.errors[0].message)
+
+    _revalidate_pages(page_cache, get_res.content)
+    sitemap.remove(item_id)
@@ -8,21 +8,33 @@ Test assertions:
 - TA-0038: Outbound clicks are tracked and UTM params preserved
 
 Key behaviors:
-- Track outbound clicks for analytics
+- Track outbound clicks for analytics: each click is queued as an
+  outbound_click event and aggregated like /a/event (E6.1, E6.4)
+- The redirect never waits on ingestion; a full queue drops the click
 - Preserve UTM params in redirect
-- Validate target URLs (no open redirects)
+- No open redirects: /click/{link_id} redirects to the stored link URL,
+  and /go only to hosts that one of the site's public links points to
+- Links are looked up in PublicLinkIndex (in memory), not scanned per click
+- The rate-limit client key honors X-Forwarded-For only from trusted proxies
 - Support optional link IDs for attribution
 """
 
 from __future__ import annotations
 
+from collections import deque
 from datetime import UTC, datetime
 from typing import Any
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
-from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from fastapi.responses import RedirectResponse
 
+from src.api.client_address import client_address
+from src.api.deps import get_dedupe_service, get_ingest_queue, get_public_link_index, get_settings
+from src.components.analytics import DedupeService, IngestQueue
+from src.components.links import PublicLinkIndex
+from src.domain.entities import LinkItem
+
 router = APIRouter()
 
 
@@ -73,6 +85,23 @@ def is_safe_url(url: str) -> bool:
     return True
 
 
+def get_public_link(links: PublicLinkIndex, key: str) -> LinkItem | None:
+    """Find an active public link by slug or ID."""
+    return links.get(key)
+
+
+def is_allowed_target(url: str, links: PublicLinkIndex) -> bool:
+    """
+    Check if URL may be used as a free-form redirect target.
+
+    Beyond is_safe_url, the host must be one that an active public link
+    points to, so /go cannot be used to bounce visitors to arbitrary sites.
+    """
+    if not is_safe_url(url):
+        return False
+    return links.allows_host(urlparse(url).hostname)
+
+
 def preserve_utm_params(
     target_url: str,
     utm_params: dict[str, str],
@@ -129,14 +158,29 @@ def extract_utm_from_request(request: Request) -> dict[str, str]:
     return utm_params
 
 
-# --- Event Recording (stub for now) ---
+# --- Event Recording ---
+
+
+# Recent clicks kept in memory for inspection; the counts live in the aggregates
+RECENT_EVENTS_LIMIT = 100
 
 
 class OutboundEventRecorder:
-    """Records outbound click events for analytics."""
+    """
+    Records outbound click events for analytics.
 
-    def __init__(self) -> None:
-        self._events: list[dict[str, Any]] = []
+    Each click is queued as an outbound_click event on the shared ingest
+    queue, which validates, rate limits and aggregates it like /a/event
+    without holding up the redirect. The target URL is not ingested.
+    """
+
+    def __init__(
+        self,
+        queue: IngestQueue | None = None,
+        recent_limit: int = RECENT_EVENTS_LIMIT,
+    ) -> None:
+        self._queue = queue
+        self._events: deque[dict[str, Any]] = deque(maxlen=recent_limit)
 
     def record(
         self,
@@ -145,8 +189,14 @@ class OutboundEventRecorder:
         referrer: str | None,
         timestamp: datetime,
         utm_params: dict[str, str],
-    ) -> None:
-        """Record an outbound click event."""
+        ua_class: str | None = None,
+        client_key: str | None = None,
+    ) -> bool:
+        """
+        Record an outbound click event.
+
+        Returns False if the ingest queue was full and the click was not counted.
+        """
         self._events.append(
             {
                 "event_type": "outbound_click",
@@ -158,9 +208,27 @@ class OutboundEventRecorder:
             }
         )
 
+        payload: dict[str, Any] = {
+            "event_type": "outbound_click",
+            "ts": timestamp,
+            "link_id": link_id,
+            "referrer": referrer,
+            "ua_class": ua_class,
+            **utm_params,
+        }
+        return self._get_queue().submit(
+            {k: v for k, v in payload.items() if v is not None},
+            client_key=client_key,
+        )
+
+    def _get_queue(self) -> IngestQueue:
+        if self._queue is None:
+            self._queue = get_ingest_queue(get_settings().db_path)
+        return self._queue
+
     def get_events(self) -> list[dict[str, Any]]:
-        """Get all recorded events (for testing)."""
-        return self._events.copy()
+        """Get recently recorded events (oldest first)."""
+        return list(self._events)
 
     def clear(self) -> None:
         """Clear recorded events (for testing)."""
@@ -176,10 +244,36 @@ def get_event_recorder() -> OutboundEventRecorder:
     return _event_recorder
 
 
-def reset_event_recorder() -> None:
+def reset_event_recorder(queue: IngestQueue | None = None) -> None:
     """Reset event recorder (for testing)."""
     global _event_recorder
-    _event_recorder = OutboundEventRecorder()
+    _event_recorder = OutboundEventRecorder(queue)
+
+
+def get_client_key(request: Request) -> str:
+    """Extract client key from request for rate limiting."""
+    # X-Forwarded-For only counts when it comes from a trusted proxy
+    return client_address(request, get_settings().trusted_proxies)
+
+
+def record_click(
+    request: Request,
+    dedupe: DedupeService,
+    target_url: str,
+    link_id: str | None,
+    utm_params: dict[str, str],
+) -> None:
+    """Queue a click for analytics; never delays or fails the redirect."""
+    _event_recorder.record(
+        target_url=target_url,
+        link_id=link_id,
+        referrer=request.headers.get("referer"),  # Note: HTTP header is "referer"
+        timestamp=datetime.now(UTC),
+        utm_params=utm_params,
+        # Only the UA class is kept, never the raw header (TA-0035)
+        ua_class=dedupe.classify(request.headers.get("user-agent")).value,
+        client_key=get_client_key(request),
+    )
 
 
 # --- Routes ---
@@ -190,14 +284,17 @@ def track_outbound_click(
     request: Request,
     url: str = Query(..., description="Target URL to redirect to"),
     link_id: str | None = Query(None, description="Optional link ID for attribution"),
+    dedupe: DedupeService = Depends(get_dedupe_service),
+    links: PublicLinkIndex = Depends(get_public_link_index),
 ) -> RedirectResponse:
     """
     Track outbound click and redirect (TA-0038).
 
     Records the click event and redirects to target URL with UTM params preserved.
+    Only hosts of the site's public links are accepted as targets.
     """
     # Validate URL
-    if not is_safe_url(url):
+    if not is_allowed_target(url, links):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid or unsafe URL",
@@ -206,15 +303,8 @@ def track_outbound_click(
     # Extract UTM params from request
     utm_params = extract_utm_from_request(request)
 
-    # Record the click event
-    referrer = request.headers.get("referer")  # Note: HTTP header is "referer"
-    _event_recorder.record(
-        target_url=url,
-        link_id=link_id,
-        referrer=referrer,
-        timestamp=datetime.now(UTC),
-        utm_params=utm_params,
-    )
+    # Record the click event (queued; the redirect does not wait for ingestion)
+    record_click(request, dedupe, url, link_id, utm_params)
 
     # Preserve UTM params in target URL
     final_url = preserve_utm_params(url, utm_params)
@@ -230,35 +320,30 @@ def track_outbound_click(
 def track_named_link(
     request: Request,
     link_id: str,
-    url: str = Query(..., description="Target URL to redirect to"),
+    dedupe: DedupeService = Depends(get_dedupe_service),
+    links: PublicLinkIndex = Depends(get_public_link_index),
 ) -> RedirectResponse:
     """
     Track click on a named link (TA-0038).
 
-    Simplified route for named links with pre-registered IDs.
+    The link is looked up by slug or ID and the redirect goes to its stored
+    URL; any target passed by the caller is ignored.
     """
-    # Validate URL
-    if not is_safe_url(url):
+    link = get_public_link(links, link_id)
+    if link is None:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid or unsafe URL",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Link not found",
         )
 
     # Extract UTM params from request
     utm_params = extract_utm_from_request(request)
 
-    # Record the click event
-    referrer = request.headers.get("referer")
-    _event_recorder.record(
-        target_url=url,
-        link_id=link_id,
-        referrer=referrer,
-        timestamp=datetime.now(UTC),
-        utm_params=utm_params,
-    )
+    # Record under the link's ID so per-link aggregates can find it
+    record_click(request, dedupe, link.url, str(link.id), utm_params)
 
     # Preserve UTM params in target URL
-    final_url = preserve_utm_params(url, utm_params)
+    final_url = preserve_utm_params(link.url, utm_params)
 
     # Redirect to target
     return RedirectResponse(
@@ -23,7 +23,8 @@ def get_public_home(
     # We should assume default sorting (likely by created_at desc) in repo?
     # SQLiteContentRepo uses `ORDER BY created_at DESC` usually.
 
-    inp = ListContentInput(status="published", limit=10)
+    # Home cards only show title/summary/date, so skip loading blocks.
+    inp = ListContentInput(status="published", limit=10, include_blocks=False)
     res = run_list(inp, repo=content_repo)
     posts = res.items if res.success else []
 
@@ -14,6 +14,11 @@ Headers:
 - Cache-Control: Immutable, long max-age for versioned routes
 - Content-Disposition: inline (default) or attachment (?download=1)
 - X-Content-SHA256: SHA256 hash for integrity verification
+- Accept-Ranges / Content-Range: bodies are streamed from object storage
+  and Range requests answer 206 (see src/api/asset_delivery.py)
+
+Image versions also have width variants (/{asset_id}/v/{version_id}/w/{width},
+see src/adapters/image_derivatives.py), immutable like the version itself.
 """
 
 from typing import Any
@@ -22,6 +27,12 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import Response
 
+from src.adapters.image_derivatives import DerivativeIndex
+from src.adapters.local_storage import LocalFileStorage
+from src.api.asset_delivery import stream_stored_object
+from src.api.deps import get_derivative_index, get_object_storage, get_version_repo
+from src.core.ports.storage import IntegrityError, KeyNotFoundError
+
 router = APIRouter()
 
 
@@ -35,59 +46,6 @@ CACHE_CONTROL_IMMUTABLE = f"public, max-age={CACHE_MAX_AGE}, immutable"
 CACHE_CONTROL_LATEST = "public, max-age=60, must-revalidate"
 
 
-# --- Mock Storage (to be replaced with real implementation) ---
-
-
-class MockStorage:
-    """Mock storage for testing."""
-
-    def __init__(self) -> None:
-        self._data: dict[str, tuple[bytes, str]] = {}  # key -> (data, mime_type)
-
-    def get(self, key: str) -> tuple[bytes, str] | None:
-        """Get data and mime type by key."""
-        return self._data.get(key)
-
-    def put(self, key: str, data: bytes, mime_type: str) -> None:
-        """Store data."""
-        self._data[key] = (data, mime_type)
-
-
-class MockVersionRepo:
-    """Mock version repository."""
-
-    def __init__(self) -> None:
-        self._versions: dict[UUID, Any] = {}
-        self._latest: dict[UUID, UUID] = {}
-
-    def get_by_id(self, version_id: UUID) -> Any:
-        return self._versions.get(version_id)
-
-    def get_latest(self, asset_id: UUID) -> Any:
-        if asset_id in self._latest:
-            return self._versions.get(self._latest[asset_id])
-        return None
-
-    def add(self, version: Any) -> None:
-        self._versions[version.id] = version
-
-    def set_latest(self, asset_id: UUID, version_id: UUID) -> None:
-        self._latest[asset_id] = version_id
-
-
-# Singleton mocks
-_mock_storage = MockStorage()
-_mock_version_repo = MockVersionRepo()
-
-
-def get_storage() -> MockStorage:
-    return _mock_storage
-
-
-def get_version_repo() -> MockVersionRepo:
-    return _mock_version_repo
-
-
 # --- Helper Functions ---
 
 
@@ -133,6 +91,71 @@ def check_if_none_match(request: Request, etag: str) -> bool:
     return False
 
 
+def _serve_version(
+    request: Request,
+    version: Any,
+    storage: LocalFileStorage,
+    cache_control: str,
+    download: bool,
+) -> Response:
+    """Stream a version's bytes from storage (full body or requested ranges)."""
+    return _serve_object(
+        request,
+        storage,
+        storage_key=version.storage_key,
+        sha256=version.sha256,
+        media_type=version.mime_type,
+        filename=version.filename_original,
+        cache_control=cache_control,
+        download=download,
+    )
+
+
+def _serve_object(
+    request: Request,
+    storage: LocalFileStorage,
+    *,
+    storage_key: str,
+    sha256: str,
+    media_type: str,
+    filename: str,
+    cache_control: str,
+    download: bool,
+) -> Response:
+    """Stream stored bytes with the asset headers (full body or requested ranges)."""
+    try:
+        stream, stored = storage.get_stream(storage_key)
+    except KeyNotFoundError:
+        raise HTTPException(status_code=404, detail="Asset content not found") from None
+    except IntegrityError:
+        # I3: never serve bytes that no longer match the recorded hash
+        raise HTTPException(
+            status_code=500, detail="Asset content failed integrity check"
+        ) from None
+
+    # Build headers (TA-0009)
+    headers = {
+        "Cache-Control": cache_control,
+        "Content-Disposition": build_content_disposition(filename, download=download),
+        "X-Content-SHA256": sha256,
+    }
+
+    return stream_stored_object(
+        request,
+        stream,
+        size=stored.size_bytes,
+        media_type=media_type,
+        headers=headers,
+        etag=build_etag(sha256),
+    )
+
+
+def derivative_filename(filename: str, width: int) -> str:
+    """Download name for a width variant: photo.jpg -> photo-640w.webp."""
+    stem = filename.rsplit(".", 1)[0] if "." in filename else filename
+    return f"{stem}-{width}w.webp"
+
+
 # --- Endpoints ---
 
 
@@ -148,10 +171,13 @@ def check_if_none_match(request: Request, etag: str) -> bool:
                 "Cache-Control": {"description": "Immutable cache directive"},
                 "Content-Disposition": {"description": "Inline or attachment"},
                 "X-Content-SHA256": {"description": "Full SHA256 hash"},
+                "Accept-Ranges": {"description": "Byte ranges supported"},
             },
         },
+        206: {"description": "Requested byte range(s)"},
         304: {"description": "Not modified (client has cached version)"},
         404: {"description": "Version not found"},
+        416: {"description": "Range not satisfiable"},
     },
 )
 def get_versioned_asset(
@@ -159,8 +185,8 @@ def get_versioned_asset(
     asset_id: UUID,
     version_id: UUID,
     download: bool = Query(False, description="Trigger download (TA-0011)"),
-    storage: MockStorage = Depends(get_storage),
-    version_repo: MockVersionRepo = Depends(get_version_repo),
+    storage: LocalFileStorage = Depends(get_object_storage),
+    version_repo: Any = Depends(get_version_repo),
 ) -> Response:
     """
     Serve asset version with proper headers.
@@ -193,28 +219,64 @@ def get_versioned_asset(
             },
         )
 
-    # Get content from storage
-    stored = storage.get(version.storage_key)
-    if not stored:
-        raise HTTPException(status_code=404, detail="Asset content not found")
+    return _serve_version(request, version, storage, CACHE_CONTROL_IMMUTABLE, download)
 
-    data, _ = stored
 
-    # Build headers (TA-0009)
-    headers = {
-        "ETag": etag,
-        "Cache-Control": CACHE_CONTROL_IMMUTABLE,
-        "Content-Disposition": build_content_disposition(
-            version.filename_original, download=download
-        ),
-        "X-Content-SHA256": version.sha256,
-        "Content-Length": str(len(data)),
-    }
+@router.get(
+    "/{asset_id}/v/{version_id}/w/{width}",
+    summary="Get image variant",
+    description="Serve a downscaled WebP rendition of an image version (srcset candidate).",
+    responses={
+        200: {"description": "Variant content with immutable cache headers"},
+        206: {"description": "Requested byte range(s)"},
+        304: {"description": "Not modified (client has cached version)"},
+        404: {"description": "Version or variant not found"},
+        416: {"description": "Range not satisfiable"},
+    },
+)
+def get_asset_variant(
+    request: Request,
+    asset_id: UUID,
+    version_id: UUID,
+    width: int,
+    storage: LocalFileStorage = Depends(get_object_storage),
+    version_repo: Any = Depends(get_version_repo),
+    derivatives: DerivativeIndex = Depends(get_derivative_index),
+) -> Response:
+    """
+    Serve a width variant of an image version.
 
-    return Response(
-        content=data,
-        media_type=version.mime_type,
-        headers=headers,
+    Variants are derived from an immutable version and stored by content
+    hash, so they get the same immutable caching as the version itself.
+    """
+    version = version_repo.get_by_id(version_id)
+    if not version or version.asset_id != asset_id:
+        raise HTTPException(status_code=404, detail="Version not found")
+
+    manifest = derivatives.manifest(version)
+    derivative = manifest.get(width) if manifest is not None else None
+    if derivative is None:
+        raise HTTPException(status_code=404, detail="Variant not found")
+
+    etag = build_etag(derivative.sha256)
+    if check_if_none_match(request, etag):
+        return Response(
+            status_code=304,
+            headers={
+                "ETag": etag,
+                "Cache-Control": CACHE_CONTROL_IMMUTABLE,
+            },
+        )
+
+    return _serve_object(
+        request,
+        storage,
+        storage_key=derivative.storage_key,
+        sha256=derivative.sha256,
+        media_type=derivative.mime_type,
+        filename=derivative_filename(version.filename_original, width),
+        cache_control=CACHE_CONTROL_IMMUTABLE,
+        download=False,
     )
 
 
@@ -224,16 +286,18 @@ def get_versioned_asset(
     description="Serve latest version of asset (shorter cache).",
     responses={
         200: {"description": "Asset content"},
+        206: {"description": "Requested byte range(s)"},
         304: {"description": "Not modified"},
         404: {"description": "Asset or version not found"},
+        416: {"description": "Range not satisfiable"},
     },
 )
 def get_latest_asset(
     request: Request,
     asset_id: UUID,
     download: bool = Query(False, description="Trigger download"),
-    storage: MockStorage = Depends(get_storage),
-    version_repo: MockVersionRepo = Depends(get_version_repo),
+    storage: LocalFileStorage = Depends(get_object_storage),
+    version_repo: Any = Depends(get_version_repo),
 ) -> Response:
     """
     Serve latest version of asset.
@@ -258,29 +322,8 @@ def get_latest_asset(
             },
         )
 
-    # Get content from storage
-    stored = storage.get(version.storage_key)
-    if not stored:
-        raise HTTPException(status_code=404, detail="Asset content not found")
-
-    data, _ = stored
-
-    # Headers for /latest (shorter cache)
-    headers = {
-        "ETag": etag,
-        "Cache-Control": CACHE_CONTROL_LATEST,
-        "Content-Disposition": build_content_disposition(
-            version.filename_original, download=download
-        ),
-        "X-Content-SHA256": version.sha256,
-        "Content-Length": str(len(data)),
-    }
-
-    return Response(
-        content=data,
-        media_type=version.mime_type,
-        headers=headers,
-    )
+    # /latest uses a shorter cache since the pointer can change
+    return _serve_version(request, version, storage, CACHE_CONTROL_LATEST, download)
 
 
 # --- Utility Functions for Testing ---
@@ -8,7 +8,10 @@ Test assertions:
 - TA-0046: Redirects are applied in the routing path
 
 Key behaviors:
-- Middleware-style redirect resolution
+- RedirectMiddleware applies redirects to public GET/HEAD requests before
+  routing, from the in-process compiled redirect table; any lookup that
+  could still query the database runs in the threadpool, never on the
+  event loop
 - Preserves query parameters (especially UTM)
 - Returns appropriate status codes (301/302)
 - Handles disabled redirects gracefully
@@ -16,17 +19,25 @@ Key behaviors:
 
 from __future__ import annotations
 
+import logging
+from collections.abc import Callable
 from typing import Any
 from urllib.parse import parse_qs, urlencode, urlparse
 
 from fastapi import APIRouter, Depends, Request
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import RedirectResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from src.api.deps import get_redirect_repo
+from src.api.deps import get_redirect_index, get_redirect_repo
 from src.components.redirects import (
+    CompiledRedirectIndex,
     RedirectConfig,
     RedirectService,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -35,11 +46,13 @@ router = APIRouter()
 
 def get_redirect_service(
     repo: Any = Depends(get_redirect_repo),
+    index: CompiledRedirectIndex = Depends(get_redirect_index),
 ) -> RedirectService:
-    """Get redirect service."""
+    """Get redirect service (resolves from the compiled index, no DB hit)."""
     return RedirectService(
         repo=repo,
         config=RedirectConfig(preserve_utm_params=True),
+        index=index,
     )
 
 
@@ -106,22 +119,13 @@ def resolve_redirect(
     Returns (target_url, status_code) or None if no redirect.
     """
     if service is None:
-        # Without service injection, we can't resolve.
-        # Ideally, middleware should handle DI or database access correctly.
-        # But for now, if called from route, service is provided.
-        # If called from middleware check, we need a way to get repo.
-        return None  # Middleware support needs deeper DI integration or On-demand repo.
-
-    svc = service
+        # Request-path resolution goes through RedirectMiddleware instead
+        return None
 
     # Preserve UTM params
     original_url = f"{path}?{query_string}" if query_string else path
-    
-    svc = service
-    print(f"DEBUG: resolving redirect for path={path}")
-    result = svc.resolve(path)
-    print(f"DEBUG: resolve result={result}")
-    
+
+    result = service.resolve(path)
     if result is None:
         return None
 
@@ -163,16 +167,79 @@ async def resolve_redirect_endpoint(
     }
 
 
-# --- Middleware-style checker for use in app ---
+# --- Middleware ---
 
+# Never redirected: API, analytics beacon, asset and docs paths
+DEFAULT_SKIP_PREFIXES = (
+    "/api/",
+    "/a/",
+    "/assets/",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/health",
+)
 
-async def redirect_middleware_check(
-    path: str,
-    query_string: str = "",
-) -> tuple[str, int] | None:
-    """
-    Check for redirect (for use in ASGI middleware).
 
-    Returns (target_url, status_code) or None.
+class RedirectMiddleware:
     """
-    return resolve_redirect(path, query_string)
+    ASGI middleware applying redirects before routing (TA-0046).
+
+    Only GET/HEAD requests outside skip_prefixes are checked. Lookups go
+    to the compiled redirect index (dict lookup, negative-cached misses).
+    Once the index is loaded and refreshed by its background thread, they
+    run inline; until then (first load, or no refresher started) they run
+    in the threadpool so blocking SQLite I/O stays off the event loop.
+    Failures to load the index are logged once and the request passes
+    through; the index itself waits a few seconds before querying the
+    database again.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        index_provider: Callable[[], CompiledRedirectIndex],
+        skip_prefixes: tuple[str, ...] = DEFAULT_SKIP_PREFIXES,
+    ) -> None:
+        self.app = app
+        self._index_provider = index_provider
+        self._skip_prefixes = skip_prefixes
+        self._failing = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        path: str = scope["path"]
+        if path.startswith(self._skip_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            index = self._index_provider()
+            if index.resolves_from_memory:
+                result = index.resolve(path)
+            else:
+                result = await run_in_threadpool(index.resolve, path)
+        except Exception:
+            # Log the first failure of a streak; keep serving the request
+            if not self._failing:
+                logger.exception("Redirect lookup failed; serving %s without redirects", path)
+            self._failing = True
+            result = None
+        else:
+            self._failing = False
+
+        if result is None:
+            await self.app(scope, receive, send)
+            return
+
+        target_path, status_code = result
+        query_string = scope.get("query_string", b"").decode("latin-1")
+        original_url = f"{path}?{query_string}" if query_string else path
+        response = RedirectResponse(
+            preserve_query_params(original_url, target_path),
+            status_code=status_code,
+        )
+        await response(scope, receive, send)
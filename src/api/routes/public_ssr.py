@@ -8,24 +8,38 @@ Spec refs: E1.2, TA-0003, TA-0004
 Test assertions:
 - TA-0003: Public SSR reflects settings
 - TA-0004: SSR meta snapshot (title, description, canonical, OG, Twitter)
+
+Rendered HTML is kept in an in-process page cache keyed on route, slug and
+base URL. Entries carry generate_cache_tags() tags and are purged when
+settings change or content is saved, transitioned or published. Only
+content that determine_cache_policy() marks cacheable is stored (R2).
 """
 
+from collections.abc import Hashable, Iterator
+from datetime import UTC
+from email.utils import format_datetime, parsedate_to_datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import HTMLResponse, Response
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 
 from src.api.deps import (
     get_content_repo,
+    get_page_cache,
     get_site_settings_repo,
+    get_sitemap_store,
     get_version_repo,
     require_published,
 )
 from src.components.C2_PublicTemplates import (
     SitemapEntry,
-    filter_sitemap_entries,
+    SitemapSnapshot,
+    determine_cache_policy,
     format_file_size,
     format_page_count,
+    generate_cache_tags,
+    render_sitemap_index,
+    render_sitemap_urlset,
     supports_pdf_embed,
 )
 from src.components.render import PageMetadata, RenderService, create_render_service
@@ -105,11 +119,10 @@ def render_ssr_page(metadata: PageMetadata, body_content: str = "") -> str:
 
 def get_settings_service(
     repo: Any = Depends(get_site_settings_repo),
+    page_cache: Any = Depends(get_page_cache),
 ) -> SettingsService:
     """Create SettingsService with dependencies."""
-    from src.components.settings import NoOpCacheInvalidator
-
-    return SettingsService(repo=repo, cache_invalidator=NoOpCacheInvalidator())
+    return SettingsService(repo=repo, cache_invalidator=page_cache)
 
 
 def get_render_service(request: Request) -> RenderService:
@@ -122,6 +135,27 @@ def get_render_service(request: Request) -> RenderService:
     )
 
 
+# --- Page Cache ---
+
+
+def _page_key(route: str, slug: str, request: Request) -> Hashable:
+    return (route, slug, str(request.base_url).rstrip("/"))
+
+
+def _is_cacheable(content: Any) -> bool:
+    """R2: only content determine_cache_policy allows publicly may be cached."""
+    published_at = getattr(content, "published_at", None)
+    if published_at is not None and published_at.tzinfo is None:
+        published_at = published_at.replace(tzinfo=UTC)
+    return determine_cache_policy(content.status, published_at).can_be_cached
+
+
+def _cache_content_page(page_cache: Any, key: Hashable, html: str, content: Any, path: str) -> None:
+    if _is_cacheable(content):
+        tags = generate_cache_tags(content.type, str(content.id), content.slug)
+        page_cache.put(key, html, path=path, tags=tags)
+
+
 # --- SSR Endpoints ---
 
 
@@ -132,14 +166,21 @@ def get_render_service(request: Request) -> RenderService:
     description="Server-side rendered homepage with meta tags (TA-0003, TA-0004).",
 )
 def ssr_homepage(
+    request: Request,
     settings_service: SettingsService = Depends(get_settings_service),
     render_service: RenderService = Depends(get_render_service),
+    page_cache: Any = Depends(get_page_cache),
 ) -> HTMLResponse:
     """
     Serve SSR homepage.
 
     Returns HTML with proper meta tags derived from settings.
     """
+    key = _page_key("home", "", request)
+    cached = page_cache.get(key)
+    if cached is not None:
+        return HTMLResponse(content=cached, status_code=200)
+
     settings = settings_service.get()
     metadata = render_service.build_homepage_metadata(settings)
 
@@ -155,6 +196,7 @@ def ssr_homepage(
     """
 
     html = render_ssr_page(metadata, body)
+    page_cache.put(key, html, path="/")
     return HTMLResponse(content=html, status_code=200)
 
 
@@ -166,15 +208,22 @@ def ssr_homepage(
 )
 def ssr_post(
     slug: str,
+    request: Request,
     settings_service: SettingsService = Depends(get_settings_service),
     render_service: RenderService = Depends(get_render_service),
     content_repo: Any = Depends(get_content_repo),
+    page_cache: Any = Depends(get_page_cache),
 ) -> HTMLResponse:
     """
     Serve SSR post page.
 
     Returns HTML with meta tags for the specific post.
     """
+    key = _page_key("post", slug, request)
+    cached = page_cache.get(key)
+    if cached is not None:
+        return HTMLResponse(content=cached, status_code=200)
+
     settings = settings_service.get()
 
     # Get content by slug and enforce published-only (R2, T-0046)
@@ -194,6 +243,7 @@ def ssr_post(
     """
 
     html = render_ssr_page(metadata, body)
+    _cache_content_page(page_cache, key, html, content, f"/p/{slug}")
     return HTMLResponse(content=html, status_code=200)
 
 
@@ -205,15 +255,22 @@ def ssr_post(
 )
 def ssr_page(
     slug: str,
+    request: Request,
     settings_service: SettingsService = Depends(get_settings_service),
     render_service: RenderService = Depends(get_render_service),
     content_repo: Any = Depends(get_content_repo),
+    page_cache: Any = Depends(get_page_cache),
 ) -> HTMLResponse:
     """
     Serve SSR static page (about, contact, etc.).
 
     Returns HTML with meta tags for the specific page.
     """
+    key = _page_key("page", slug, request)
+    cached = page_cache.get(key)
+    if cached is not None:
+        return HTMLResponse(content=cached, status_code=200)
+
     settings = settings_service.get()
 
     # Get content by slug and enforce published-only (R2, T-0046)
@@ -233,6 +290,7 @@ def ssr_page(
     """
 
     html = render_ssr_page(metadata, body)
+    _cache_content_page(page_cache, key, html, content, f"/page/{slug}")
     return HTMLResponse(content=html, status_code=200)
 
 
@@ -409,6 +467,7 @@ def ssr_resource_pdf(
     render_service: RenderService = Depends(get_render_service),
     content_repo: Any = Depends(get_content_repo),
     version_repo: Any = Depends(get_version_repo),
+    page_cache: Any = Depends(get_page_cache),
 ) -> HTMLResponse:
     """
     Serve SSR Resource(PDF) page.
@@ -426,6 +485,14 @@ def ssr_resource_pdf(
     - Fallback links for non-supporting browsers
     - Download link
     """
+    # Get user-agent for browser detection (TA-E2.2-01); the embed markup
+    # varies with it, so the detection result is part of the cache key
+    user_agent = request.headers.get("user-agent")
+    key = (_page_key("resource_pdf", slug, request), supports_pdf_embed(user_agent))
+    cached = page_cache.get(key)
+    if cached is not None:
+        return HTMLResponse(content=cached, status_code=200)
+
     settings = settings_service.get()
 
     # Get resource by slug and enforce published-only (R2, T-0046)
@@ -471,9 +538,6 @@ def ssr_resource_pdf(
     if not filename:
         filename = f"{slug}.pdf"
 
-    # Get user-agent for browser detection (TA-E2.2-01)
-    user_agent = request.headers.get("user-agent")
-
     # Build body content
     body_parts = [
         "<article class='resource-pdf'>",
@@ -510,6 +574,7 @@ def ssr_resource_pdf(
     body = "\n".join(body_parts)
 
     html = render_ssr_page(metadata, body)
+    _cache_content_page(page_cache, key, html, content, f"/r/{slug}")
     return HTMLResponse(content=html, status_code=200)
 
 
@@ -526,24 +591,38 @@ def _render_sitemap_xml(entries: list[SitemapEntry]) -> str:
     Returns:
         Valid sitemap.xml content
     """
-    xml_parts = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
-    ]
+    return "".join(render_sitemap_urlset(entries))
+
+
+def _sitemap_response(
+    request: Request,
+    snapshot: SitemapSnapshot,
+    variant: str,
+    body: Iterator[str],
+) -> Response:
+    """Stream a sitemap document, answering 304 when the crawler's copy is current."""
+    etag = snapshot.etag(variant)
+    headers = {
+        "Cache-Control": "public, max-age=3600",  # 1 hour cache
+        "ETag": etag,
+        "Last-Modified": format_datetime(snapshot.last_modified, usegmt=True),
+    }
 
-    for entry in entries:
-        xml_parts.append("  <url>")
-        xml_parts.append(f"    <loc>{_escape_html(entry.loc)}</loc>")
-        if entry.lastmod:
-            xml_parts.append(f"    <lastmod>{entry.lastmod}</lastmod>")
-        if entry.changefreq:
-            xml_parts.append(f"    <changefreq>{entry.changefreq}</changefreq>")
-        if entry.priority is not None:
-            xml_parts.append(f"    <priority>{entry.priority}</priority>")
-        xml_parts.append("  </url>")
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                since = None
+            if since is not None and snapshot.last_modified.replace(microsecond=0) <= since:
+                return Response(status_code=304, headers=headers)
 
-    xml_parts.append("</urlset>")
-    return "\n".join(xml_parts)
+    return StreamingResponse(body, media_type="application/xml", headers=headers)
 
 
 @router.get(
@@ -554,10 +633,10 @@ def _render_sitemap_xml(entries: list[SitemapEntry]) -> str:
 )
 def sitemap_xml(
     request: Request,
-    content_repo: Any = Depends(get_content_repo),
+    sitemap: Any = Depends(get_sitemap_store),
 ) -> Response:
     """
-    Generate sitemap.xml with published content only (R2, T-0046).
+    Serve sitemap.xml with published content only (R2, T-0046).
 
     Implements invariant R2: Draft and future scheduled content
     must never be publicly served or cached, including in sitemap.
@@ -567,48 +646,45 @@ def sitemap_xml(
     - Published resources at /r/{slug}
     - Published pages at /{slug}
 
+    Past SITEMAP_MAX_URLS URLs this is a sitemap index pointing at
+    /sitemap-{n}.xml children.
+
     Excludes:
     - Draft content
     - Scheduled content (future publish dates)
     - Archived content
     """
     base_url = str(request.base_url).rstrip("/")
+    snapshot = sitemap.snapshot()
+    pages = snapshot.page_count()
+
+    if pages > 1:
+        lastmod = snapshot.last_modified.strftime("%Y-%m-%d")
+        children = ((f"{base_url}/sitemap-{n}.xml", lastmod) for n in range(1, pages + 1))
+        return _sitemap_response(
+            request, snapshot, f"{base_url}:index", render_sitemap_index(children)
+        )
 
-    # Get all content items with status and timestamps
-    all_items = content_repo.list_items({})
-
-    # Build entry tuples: (slug, content_type, published_at, updated_at)
-    entry_tuples: list[tuple[str, str, Any, Any]] = []
-    for item in all_items:
-        # Only include items that are published (filter_sitemap_entries will
-        # also verify, but pre-filter to avoid processing unnecessary items)
-        if item.status == "published":
-            entry_tuples.append((
-                item.slug,
-                item.type,
-                getattr(item, "published_at", None),
-                getattr(item, "updated_at", None),
-            ))
-
-    # Filter entries using the R2-compliant filter function
-    sitemap_entries = filter_sitemap_entries(entry_tuples, base_url)
-
-    # Add homepage
-    sitemap_entries.insert(
-        0,
-        SitemapEntry(
-            loc=f"{base_url}/",
-            changefreq="daily",
-            priority=1.0,
-        ),
-    )
+    body = render_sitemap_urlset(snapshot.iter_entries(base_url))
+    return _sitemap_response(request, snapshot, f"{base_url}:1", body)
 
-    xml_content = _render_sitemap_xml(sitemap_entries)
 
-    return Response(
-        content=xml_content,
-        media_type="application/xml",
-        headers={
-            "Cache-Control": "public, max-age=3600",  # 1 hour cache
-        },
-    )
+@router.get(
+    "/sitemap-{page:int}.xml",
+    response_class=Response,
+    summary="XML Sitemap (child)",
+    description="One child sitemap of a sitemap index (R2, T-0046).",
+)
+def sitemap_child_xml(
+    page: int,
+    request: Request,
+    sitemap: Any = Depends(get_sitemap_store),
+) -> Response:
+    """Serve one child sitemap when the site exceeds SITEMAP_MAX_URLS."""
+    base_url = str(request.base_url).rstrip("/")
+    snapshot = sitemap.snapshot()
+    if not 1 <= page <= snapshot.page_count():
+        raise HTTPException(status_code=404, detail="Sitemap not found")
+
+    body = render_sitemap_urlset(snapshot.iter_entries(base_url, page))
+    return _sitemap_response(request, snapshot, f"{base_url}:{page}", body)
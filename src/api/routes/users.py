@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -7,6 +8,7 @@ from src.api.deps import (
     get_clock,
     get_current_user,
     get_policy,
+    get_principal_cache,
     get_session_store,
     get_user_repo,
 )
@@ -67,6 +69,19 @@ def create_user(
     return result.user  # type: ignore
 
 
+@router.get("/principal-cache/stats")
+def principal_cache_stats(
+    current_user: User = Depends(get_current_user),
+    policy: Any = Depends(get_policy),
+    principals: Any = Depends(get_principal_cache),
+) -> dict[str, float]:
+    """Authenticated-principal cache size and hit/miss counters (admin only)."""
+    if not policy.can_manage_users(current_user):
+        raise HTTPException(status_code=403, detail="Access denied")
+    stats = principals.stats()
+    return {**asdict(stats), "hit_rate": stats.hit_rate}
+
+
 @router.put("/{user_id}", response_model=UserResponse)
 def update_user(
     user_id: str,
@@ -13,7 +13,7 @@ logger = logging.getLogger(__name__)
 
 def ContentListContent(page: ft.Page, ctx: ServiceContext, state: AppState) -> ft.Control:
     # Fetch all items
-    items = ctx.content_service.repo.list_items(filters={})
+    items = ctx.content_service.repo.list_items(filters={}, include_blocks=False)
     items.sort(key=lambda x: x.updated_at, reverse=True)
 
     def edit_item(e: ft.ControlEvent) -> None:
@@ -14,7 +14,7 @@ def AdminDashboardContent(page: ft.Page, ctx: ServiceContext, state: AppState) -
     health_status = "Unknown"
     health_color = "grey"
     try:
-        ctx.content_service.repo.list_items(filters={"status": "published"})
+        ctx.content_service.repo.list_items(filters={"status": "published"}, include_blocks=False)
         health_status = "Operational"
         health_color = "green"
     except Exception as e:
@@ -22,7 +22,7 @@ def AdminDashboardContent(page: ft.Page, ctx: ServiceContext, state: AppState) -
         health_color = "error"
 
     # 2. Stats
-    items = ctx.content_service.repo.list_items(filters={})
+    items = ctx.content_service.repo.list_items(filters={}, include_blocks=False)
     stats = {"draft": 0, "published": 0, "scheduled": 0, "archived": 0}
     for i in items:
         if i.status in stats:
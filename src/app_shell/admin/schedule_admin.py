@@ -12,7 +12,7 @@ logger = logging.getLogger(__name__)
 def ScheduleView(page: ft.Page, ctx: ServiceContext, state: AppState) -> ft.View:
     def fetch_items() -> list[ContentItem]:
         # Ideally the repo supports filtering, but for now we filter in-memory if repo doesn't
-        all_items = ctx.content_service.repo.list_items(filters={})
+        all_items = ctx.content_service.repo.list_items(filters={}, include_blocks=False)
         return [i for i in all_items if i.status == "scheduled"]
 
     def refresh_data() -> None:
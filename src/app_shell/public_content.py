@@ -230,7 +230,9 @@ def TagFilterContent(
 
     # For now, filter by searching title/summary for tag
     # Future: implement proper tagging system with ContentItem.tags field
-    all_items = ctx.content_service.repo.list_items(filters={"status": "published"})
+    all_items = ctx.content_service.repo.list_items(
+        filters={"status": "published"}, include_blocks=False
+    )
 
     # Simple tag matching in title or summary
     tag_lower = tag.lower()
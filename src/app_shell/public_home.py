@@ -9,7 +9,7 @@ from src.ui.state import AppState
 
 def PublicHomeContent(page: ft.Page, ctx: ServiceContext, state: AppState) -> ft.Control:
     # 1. Fetch Data
-    all_items = ctx.content_service.repo.list_items(filters={})
+    all_items = ctx.content_service.repo.list_items(filters={}, include_blocks=False)
     now = datetime.now(UTC)
     published_items = [
         item
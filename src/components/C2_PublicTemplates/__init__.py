@@ -46,6 +46,8 @@ from src.components.C2_PublicTemplates.fc import (
     group_link_hub_items,
     is_external_link,
     prepare_link_hub_item,
+    render_sitemap_index,
+    render_sitemap_urlset,
     sanitize_external_links,
     should_include_in_sitemap,
     supports_pdf_embed,
@@ -58,10 +60,14 @@ from src.components.C2_PublicTemplates.fc import (
 
 # Import IS module (named 'is' which is a Python keyword, so use importlib)
 _is_module = importlib.import_module("src.components.C2_PublicTemplates.is")
+InProcessPageCache = _is_module.InProcessPageCache
 RevalidationAdapter = _is_module.RevalidationAdapter
 RevalidationPort = _is_module.RevalidationPort
 RevalidationResult = _is_module.RevalidationResult
 StubRevalidationAdapter = _is_module.StubRevalidationAdapter
+SITEMAP_MAX_URLS = _is_module.SITEMAP_MAX_URLS
+SitemapSnapshot = _is_module.SitemapSnapshot
+SitemapStore = _is_module.SitemapStore
 
 __all__ = [
     # Data classes
@@ -113,12 +119,19 @@ __all__ = [
     "generate_asset_cache_headers",
     "should_include_in_sitemap",
     "filter_sitemap_entries",
+    "render_sitemap_urlset",
+    "render_sitemap_index",
     "generate_cache_tag",
     "generate_cache_tags",
     "validate_cache_policy_r2",
     # Revalidation adapter (P3)
+    "InProcessPageCache",
     "RevalidationAdapter",
     "RevalidationPort",
     "RevalidationResult",
     "StubRevalidationAdapter",
+    # Materialized sitemap (E2.3)
+    "SITEMAP_MAX_URLS",
+    "SitemapSnapshot",
+    "SitemapStore",
 ]
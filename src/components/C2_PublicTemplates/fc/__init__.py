@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import html
 import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -1478,6 +1479,62 @@ def filter_sitemap_entries(
     return result
 
 
+SITEMAP_XMLNS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+def render_sitemap_urlset(entries: Iterable[SitemapEntry]) -> Iterator[str]:
+    """
+    Render a <urlset> sitemap document incrementally.
+
+    Yields newline-terminated lines (the closing tag has no trailing
+    newline), so large sitemaps can be streamed without building one string.
+
+    Args:
+        entries: SitemapEntry objects to include
+
+    Yields:
+        XML text chunks
+    """
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield f'<urlset xmlns="{SITEMAP_XMLNS}">\n'
+
+    for entry in entries:
+        parts = ["  <url>\n", f"    <loc>{html.escape(entry.loc)}</loc>\n"]
+        if entry.lastmod:
+            parts.append(f"    <lastmod>{entry.lastmod}</lastmod>\n")
+        if entry.changefreq:
+            parts.append(f"    <changefreq>{entry.changefreq}</changefreq>\n")
+        if entry.priority is not None:
+            parts.append(f"    <priority>{entry.priority}</priority>\n")
+        parts.append("  </url>\n")
+        yield "".join(parts)
+
+    yield "</urlset>"
+
+
+def render_sitemap_index(sitemaps: Iterable[tuple[str, str | None]]) -> Iterator[str]:
+    """
+    Render a <sitemapindex> document incrementally.
+
+    Args:
+        sitemaps: (loc, lastmod) pairs for each child sitemap
+
+    Yields:
+        XML text chunks
+    """
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield f'<sitemapindex xmlns="{SITEMAP_XMLNS}">\n'
+
+    for loc, lastmod in sitemaps:
+        yield "  <sitemap>\n"
+        yield f"    <loc>{html.escape(loc)}</loc>\n"
+        if lastmod:
+            yield f"    <lastmod>{lastmod}</lastmod>\n"
+        yield "  </sitemap>\n"
+
+    yield "</sitemapindex>"
+
+
 def generate_cache_tag(
     content_type: str,
     content_id: str,
@@ -5,17 +5,24 @@ Handles HTTP response generation, cache header management, and
 integration with Next.js App Router handlers.
 
 This module defines the P3 RevalidationAdapter port and provides
-implementations for cache invalidation.
+implementations for cache invalidation, including the in-process
+rendered-page cache used by the SSR routes.
 
 Spec refs: E2.1, E2.3, TA-E2.3-01
 """
 
 from __future__ import annotations
 
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
 from dataclasses import dataclass, field
 from typing import Protocol
 
+from .sitemap import SITEMAP_MAX_URLS, SitemapSnapshot, SitemapSourcePort, SitemapStore
+
 # ═══════════════════════════════════════════════════════════════════════════
 # P3 REVALIDATION ADAPTER (Port)
 # Abstract interface for cache revalidation
@@ -168,11 +175,125 @@ class StubRevalidationAdapter(RevalidationAdapter):
         self.revalidated_paths = []
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# IN-PROCESS PAGE CACHE
+# Rendered SSR HTML, evicted by LRU + TTL and purged by cache tag
+# ═══════════════════════════════════════════════════════════════════════════
+
+DEFAULT_PAGE_CACHE_MAX_ENTRIES = 512
+DEFAULT_PAGE_CACHE_TTL_SECONDS = 300.0
+
+
+@dataclass(frozen=True)
+class _PageEntry:
+    html: str
+    expires_at: float
+    tags: frozenset[str]
+
+
+class InProcessPageCache(RevalidationAdapter):
+    """
+    Rendered-HTML cache for SSR routes.
+
+    Entries are tagged with generate_cache_tags() output (plus a path tag)
+    so content writes purge exactly the pages that render that content.
+    Also acts as the settings CacheInvalidator: settings feed every page's
+    head, so a settings change drops everything.
+
+    Callers decide cacheability (determine_cache_policy); this class only
+    stores what it is given.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_PAGE_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_PAGE_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _PageEntry] = OrderedDict()
+        self._by_tag: dict[str, set[Hashable]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def path_tag(path: str) -> str:
+        """Tag under which every entry for a URL path is registered."""
+        return f"path:{path}"
+
+    def get(self, key: Hashable) -> str | None:
+        """Return cached HTML for key, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= self._clock():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.html
+
+    def put(self, key: Hashable, html: str, *, path: str, tags: Iterable[str] = ()) -> None:
+        """Store HTML for key, tagged for later revalidation."""
+        entry = _PageEntry(
+            html=html,
+            expires_at=self._clock() + self._ttl_seconds,
+            tags=frozenset((*tags, self.path_tag(path))),
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            for tag in entry.tags:
+                self._by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        for tag in entry.tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+
+    def revalidate_tag(self, tag: str) -> bool:
+        """Drop every entry registered under tag."""
+        with self._lock:
+            for key in list(self._by_tag.get(tag, ())):
+                self._remove(key)
+        return True
+
+    def revalidate_path(self, path: str) -> bool:
+        """Drop every entry rendered for path."""
+        return self.revalidate_tag(self.path_tag(path))
+
+    def invalidate_settings(self) -> None:
+        """Settings change: every rendered page is stale."""
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._by_tag.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # EXPORTS
 # ═══════════════════════════════════════════════════════════════════════════
 
 __all__ = [
+    "InProcessPageCache",
+    "SITEMAP_MAX_URLS",
+    "SitemapSnapshot",
+    "SitemapSourcePort",
+    "SitemapStore",
     "RevalidationPort",
     "RevalidationAdapter",
     "RevalidationResult",
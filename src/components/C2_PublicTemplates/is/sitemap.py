@@ -0,0 +1,268 @@
+"""
+C2-PublicTemplates Imperative Shell: Materialized sitemap.
+
+Keeps the published-content list for sitemap.xml in memory, loaded once
+from the content repository and updated on publish/unpublish events,
+instead of re-listing content on every crawler hit.
+
+Spec refs: E2.3, TA-E2.3-03, R2, T-0046
+
+Key behaviors:
+- No item cap: every published item is listed
+- Future-dated items stay out until their publish time passes; the
+  snapshot rebuilds itself when that moment arrives (R2)
+- Past SITEMAP_MAX_URLS the site is split into child sitemaps behind a
+  sitemap index
+- Each snapshot carries a content digest and Last-Modified for
+  conditional (304) responses
+- Sources that provide version() are checked every few seconds and the
+  list is reloaded when it changes, so content written by another worker
+  process appears without a restart
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, Protocol
+from uuid import UUID
+
+from src.components.C2_PublicTemplates.fc import SitemapEntry, filter_sitemap_entries
+
+logger = logging.getLogger(__name__)
+
+# Sitemap protocol limit on URLs per file
+SITEMAP_MAX_URLS = 50_000
+
+# Entries formatted per filter_sitemap_entries() call while streaming
+_RENDER_BATCH = 1_000
+
+# Seconds between source version() checks for writes made by other processes
+STALENESS_CHECK_SECONDS = 10.0
+
+# (slug, content_type, published_at, updated_at), as filter_sitemap_entries takes
+SitemapRow = tuple[str, str, datetime | None, datetime | None]
+
+
+class SitemapSourcePort(Protocol):
+    """Content repository view used to (re)load the sitemap."""
+
+    def list_published_refs(
+        self,
+    ) -> list[tuple[UUID, str, str, datetime | None, datetime | None]]:
+        """(id, slug, type, published_at, updated_at) for every published item."""
+        ...
+
+
+def _utc(value: datetime | None) -> datetime | None:
+    """Treat naive timestamps from storage as UTC."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+@dataclass(frozen=True)
+class SitemapSnapshot:
+    """Immutable, live view of the sitemap at build time."""
+
+    rows: tuple[SitemapRow, ...]
+    digest: str
+    last_modified: datetime
+    refresh_at: datetime | None  # Earliest future publish time, if any
+    max_urls: int = SITEMAP_MAX_URLS  # URLs per child sitemap
+
+    @property
+    def url_count(self) -> int:
+        """URLs including the homepage."""
+        return len(self.rows) + 1
+
+    def page_count(self) -> int:
+        """Child sitemaps needed; 1 means a single urlset."""
+        return -(-self.url_count // self.max_urls)
+
+    def etag(self, variant: str) -> str:
+        """Strong ETag for one rendering (base URL, page) of this snapshot."""
+        raw = hashlib.sha256(f"{self.digest}:{variant}".encode()).hexdigest()
+        return f'"{raw[:32]}"'
+
+    def iter_entries(
+        self,
+        base_url: str,
+        page: int = 1,
+        now: datetime | None = None,
+    ) -> Iterator[SitemapEntry]:
+        """Yield the entries of one child sitemap (page 1 leads with the homepage)."""
+        # URL index 0 is the homepage, content rows follow
+        first = (page - 1) * self.max_urls
+        last = first + self.max_urls
+        if first == 0:
+            yield SitemapEntry(loc=f"{base_url}/", changefreq="daily", priority=1.0)
+            first = 1
+
+        rows = self.rows[first - 1 : last - 1]
+        for start in range(0, len(rows), _RENDER_BATCH):
+            yield from filter_sitemap_entries(
+                list(rows[start : start + _RENDER_BATCH]), base_url, now or _utc_now()
+            )
+
+
+class SitemapStore:
+    """
+    Materialized published-content list for sitemap generation.
+
+    Loaded lazily from the repository; apply()/remove() keep it current
+    as content is published, unpublished, edited or deleted in this
+    process. When the source provides version() (a cheap change marker),
+    it is polled every check_interval_seconds and the list is reloaded
+    when it moved, which covers writes made by other workers.
+    """
+
+    def __init__(
+        self,
+        source: SitemapSourcePort,
+        clock: Callable[[], datetime] = _utc_now,
+        max_urls_per_sitemap: int = SITEMAP_MAX_URLS,
+        check_interval_seconds: float = STALENESS_CHECK_SECONDS,
+    ) -> None:
+        """Initialize store."""
+        self._source = source
+        self._clock = clock
+        self._max_urls = max_urls_per_sitemap
+        self._check_interval = timedelta(seconds=check_interval_seconds)
+        self._version: Callable[[], Any] | None = getattr(source, "version", None)
+        self._rows: dict[UUID, SitemapRow] | None = None
+        self._loaded_version: Any = None
+        self._checked_at: datetime | None = None
+        self._snapshot: SitemapSnapshot | None = None
+        self._changed_at: datetime | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[UUID, SitemapRow]:
+        if self._rows is None:
+            # Read the marker first: a write racing the load forces another reload
+            if self._version is not None:
+                self._loaded_version = self._version()
+                self._checked_at = self._clock()
+            self._rows = {
+                content_id: (slug, content_type, _utc(published_at), _utc(updated_at))
+                for content_id, slug, content_type, published_at, updated_at in (
+                    self._source.list_published_refs()
+                )
+            }
+        return self._rows
+
+    def _build(self, now: datetime) -> SitemapSnapshot:
+        live: list[SitemapRow] = []
+        refresh_at: datetime | None = None
+        for row in self._load().values():
+            published_at = row[2]
+            if published_at is not None and published_at > now:
+                if refresh_at is None or published_at < refresh_at:
+                    refresh_at = published_at
+                continue
+            live.append(row)
+
+        # Stable order: newest first, slug as tie-breaker
+        live.sort(key=lambda r: (r[2] or datetime.min.replace(tzinfo=UTC), r[0]), reverse=True)
+
+        hasher = hashlib.sha256()
+        last_modified = self._changed_at
+        for slug, content_type, published_at, updated_at in live:
+            stamp = updated_at or published_at
+            hasher.update(f"{content_type}/{slug}@{stamp}\n".encode())
+            if stamp is not None and (last_modified is None or stamp > last_modified):
+                last_modified = stamp
+
+        return SitemapSnapshot(
+            rows=tuple(live),
+            digest=hasher.hexdigest(),
+            last_modified=last_modified or now,
+            refresh_at=refresh_at,
+            max_urls=self._max_urls,
+        )
+
+    def _check_due(self, now: datetime) -> bool:
+        return (
+            self._version is not None
+            and self._checked_at is not None
+            and now - self._checked_at >= self._check_interval
+        )
+
+    def _resync(self, now: datetime) -> None:
+        """Reload the rows if the source changed (caller holds the lock)."""
+        assert self._version is not None
+        self._checked_at = now
+        previous = self._rows
+        try:
+            if self._version() == self._loaded_version:
+                return
+            self._rows = None
+            rows = self._load()
+        except Exception:
+            # Keep serving the current list; the next check retries
+            logger.exception("Sitemap resync failed; serving the current list")
+            self._rows = previous
+            return
+        # Edits to unpublished content move the marker but not the sitemap
+        if rows != previous:
+            self._changed()
+
+    def snapshot(self) -> SitemapSnapshot:
+        """Current snapshot, rebuilt after changes or once a scheduled item goes live."""
+        now = self._clock()
+        snapshot = self._snapshot
+        if (
+            snapshot is None
+            or (snapshot.refresh_at is not None and snapshot.refresh_at <= now)
+            or self._check_due(now)
+        ):
+            with self._lock:
+                if self._check_due(now):
+                    self._resync(now)
+                snapshot = self._snapshot
+                if snapshot is None or (
+                    snapshot.refresh_at is not None and snapshot.refresh_at <= now
+                ):
+                    snapshot = self._snapshot = self._build(now)
+        return snapshot
+
+    def apply(self, item: Any) -> None:
+        """Record a content write: published items are listed, others dropped."""
+        if getattr(item, "status", None) != "published":
+            self.remove(item.id)
+            return
+
+        with self._lock:
+            if self._rows is None:
+                return  # Not loaded yet; the first load will read the new state
+            self._rows[item.id] = (
+                item.slug,
+                item.type,
+                _utc(getattr(item, "published_at", None)),
+                _utc(getattr(item, "updated_at", None)),
+            )
+            self._changed()
+
+    def remove(self, content_id: UUID) -> None:
+        """Drop an item (unpublished, archived or deleted)."""
+        with self._lock:
+            if self._rows is not None and self._rows.pop(content_id, None) is not None:
+                self._changed()
+
+    def reload(self) -> None:
+        """Discard materialized state; the next snapshot reloads from the repository."""
+        with self._lock:
+            self._rows = None
+            self._changed()
+
+    def _changed(self) -> None:
+        self._changed_at = self._clock()
+        self._snapshot = None
@@ -4,19 +4,6 @@ Analytics component - Event ingestion and aggregation.
 Spec refs: E6.1
 """
 
-# Re-exports from _impl for backwards compatibility
-# Aggregate (E6.4, TA-0041)
-from src.core.services.analytics_aggregate import (
-    AggregateConfig,
-    AggregateInput,
-    AggregateService,
-    BucketType,
-    InMemoryAggregateRepo,
-    calculate_bucket_end,
-    calculate_bucket_start,
-    create_aggregate_service,
-)
-
 # Re-exports from legacy services (pending full migration)
 # Attribution (E6.2, TA-0036, TA-0037)
 from src.core.services.analytics_attrib import (
@@ -40,16 +27,35 @@ from src.core.services.analytics_dedupe import (
     DedupeConfig,
     DedupeResult,
     DedupeService,
+    DedupeStorePort,
     InMemoryDedupeStore,
     UAClass,
+    UAClassifier,
+    UAClassifierStats,
     classify_user_agent,
     create_dedupe_service,
     generate_dedupe_key,
     get_timestamp_bucket,
+    get_ua_classifier,
     is_bot,
     should_count,
 )
 
+# Aggregate (E6.4, TA-0041)
+from ._aggregate import (
+    AggregateConfig,
+    AggregateInput,
+    AggregateQueryPort,
+    AggregateRetentionPort,
+    AggregateService,
+    BucketType,
+    DashboardSummary,
+    InMemoryAggregateRepo,
+    calculate_bucket_end,
+    calculate_bucket_start,
+    create_aggregate_service,
+    summarize_buckets,
+)
 from ._impl import (
     AnalyticsIngestionService,
     DefaultTimePort,
@@ -66,6 +72,17 @@ from ._impl import (
     validate_timestamp,
     validate_ua_class,
 )
+from ._ingest_queue import (
+    IngestQueue,
+    IngestQueueConfig,
+    IngestQueueStats,
+)
+from ._pipeline import (
+    AggregatePipeline,
+    PipelineConfig,
+    PipelineEventStore,
+    PipelineStats,
+)
 
 # Note: Ingest functions now re-exported from _impl (above) for consistency
 from .component import (
@@ -147,24 +164,41 @@ __all__ = [
     "parse_domain",
     "parse_referrer",
     "parse_utm_params",
-    # Legacy aggregate re-exports
+    # Aggregate
     "AggregateConfig",
     "AggregateInput",
+    "AggregateQueryPort",
+    "AggregateRetentionPort",
     "AggregateService",
     "BucketType",
+    "DashboardSummary",
     "InMemoryAggregateRepo",
     "calculate_bucket_end",
     "calculate_bucket_start",
     "create_aggregate_service",
+    "summarize_buckets",
+    # Write-batched aggregate pipeline
+    "AggregatePipeline",
+    "PipelineConfig",
+    "PipelineEventStore",
+    "PipelineStats",
+    # Non-blocking ingestion queue
+    "IngestQueue",
+    "IngestQueueConfig",
+    "IngestQueueStats",
     # Legacy dedupe re-exports
     "DedupeConfig",
     "DedupeResult",
     "DedupeService",
+    "DedupeStorePort",
     "InMemoryDedupeStore",
+    "UAClassifier",
+    "UAClassifierStats",
     "classify_user_agent",
     "create_dedupe_service",
     "generate_dedupe_key",
     "get_timestamp_bucket",
+    "get_ua_classifier",
     "is_bot",
     "should_count",
     # Ingest re-exports (from _impl)
@@ -16,10 +16,11 @@ Key behaviors:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import Enum
-from typing import Any, Protocol
+from typing import Any, Protocol, runtime_checkable
 from uuid import UUID, uuid4
 
 from src.core.entities import AnalyticsEventAggregate
@@ -114,6 +115,88 @@ class AggregateRepoPort(Protocol):
         ...
 
 
+class AggregateSinkPort(Protocol):
+    """Write side of the aggregate store used by the batched pipeline."""
+
+    def upsert_increments(self, increments: Sequence[AggregateIncrement]) -> None:
+        """Apply a batch of count increments, creating buckets as needed."""
+        ...
+
+
+@runtime_checkable
+class AggregateQueryPort(Protocol):
+    """
+    Dashboard queries pushed down to the store (GROUP BY / ORDER BY / LIMIT).
+
+    Optional: AggregateService uses it when the repo implements it and
+    otherwise groups query() results in Python.
+    """
+
+    def sum_counts(
+        self,
+        bucket_type: str,
+        start: datetime,
+        end: datetime,
+        event_type: str | None = None,
+        content_id: UUID | None = None,
+        link_id: UUID | None = None,
+    ) -> dict[str, int]:
+        """Sum counts over a range. Returns dict with total, real, bot."""
+        ...
+
+    def count_series(
+        self,
+        bucket_type: str,
+        start: datetime,
+        end: datetime,
+        event_type: str | None = None,
+        content_id: UUID | None = None,
+        exclude_bots: bool = True,
+        link_id: UUID | None = None,
+    ) -> list[dict[str, Any]]:
+        """Counts per bucket start. Returns list of {timestamp, count} dicts."""
+        ...
+
+    def top_values(
+        self,
+        dimensions: tuple[str, ...],
+        bucket_type: str,
+        start: datetime,
+        end: datetime,
+        event_type: str,
+        limit: int = 10,
+        exclude_bots: bool = True,
+        skip_null: bool = True,
+    ) -> list[tuple[tuple[Any, ...], int]]:
+        """Top dimension value tuples by count, descending."""
+        ...
+
+    def dashboard(
+        self,
+        bucket_type: str,
+        start: datetime,
+        end: datetime,
+        limit: int = 5,
+        exclude_bots: bool = True,
+    ) -> DashboardSummary:
+        """Compute every dashboard section from a single scan of the range."""
+        ...
+
+
+@runtime_checkable
+class AggregateRetentionPort(Protocol):
+    """
+    Deletion of expired buckets.
+
+    Optional: AggregatePipeline.sweep() prunes minute buckets when its sink
+    implements it.
+    """
+
+    def delete_before(self, bucket_type: str, before: datetime) -> int:
+        """Delete buckets of a type starting before a time. Returns rows deleted."""
+        ...
+
+
 # --- Time Port Protocol ---
 
 
@@ -144,6 +227,30 @@ class AggregateInput:
     ua_class: UAClass = UAClass.UNKNOWN
 
 
+@dataclass(frozen=True)
+class AggregateIncrement:
+    """Count delta for one bucket (coalesced from one or more events)."""
+
+    bucket_type: str
+    bucket_start: datetime
+    event_type: str
+    dimensions: dict[str, Any]
+    count_total: int = 0
+    count_real: int = 0
+    count_bot: int = 0
+
+
+@dataclass
+class DashboardSummary:
+    """All dashboard sections for one range (shapes match the service getters)."""
+
+    totals: dict[str, int]
+    time_series: list[dict[str, Any]]
+    top_content: list[dict[str, Any]]
+    top_sources: list[dict[str, Any]]
+    top_referrers: list[dict[str, Any]]
+
+
 # --- Bucket Calculation ---
 
 
@@ -332,6 +439,35 @@ class InMemoryAggregateRepo:
         # Sort by bucket_start
         return sorted(results, key=lambda b: b.bucket_start)
 
+    def upsert_increments(self, increments: Sequence[AggregateIncrement]) -> None:
+        """Apply a batch of count increments."""
+        for inc in increments:
+            bucket = self.get_or_create_bucket(
+                bucket_type=inc.bucket_type,
+                bucket_start=inc.bucket_start,
+                event_type=inc.event_type,
+                dimensions=inc.dimensions,
+            )
+            self.increment(
+                bucket_id=bucket.id,
+                count_total=inc.count_total,
+                count_real=inc.count_real,
+                count_bot=inc.count_bot,
+            )
+
+    def delete_before(self, bucket_type: str, before: datetime) -> int:
+        """Delete buckets of a type starting before a time."""
+        expired = {
+            key: bucket_id
+            for key, bucket_id in self._index.items()
+            if self._buckets[bucket_id].bucket_type == bucket_type
+            and self._buckets[bucket_id].bucket_start < before
+        }
+        for key, bucket_id in expired.items():
+            del self._index[key]
+            del self._buckets[bucket_id]
+        return len(expired)
+
     def clear(self) -> None:
         """Clear all buckets."""
         self._buckets.clear()
@@ -368,22 +504,62 @@ class AggregateService:
 
         return LondonTimeAdapter().now_utc()
 
+    def retention_cutoff(self, bucket_type: BucketType) -> datetime:
+        """Oldest bucket start kept for a bucket type (AggregateConfig retention)."""
+        retention = {
+            BucketType.MINUTE: timedelta(minutes=self._config.retention_minutes),
+            BucketType.HOUR: timedelta(hours=self._config.retention_hours),
+            BucketType.DAY: timedelta(days=self._config.retention_days),
+        }[bucket_type]
+        return calculate_bucket_start(self._now() - retention, bucket_type)
+
     def record(self, event: AggregateInput) -> list[AnalyticsEventAggregate]:
         """
         Record an event to all configured bucket types (TA-0041).
 
         Returns the updated/created buckets.
         """
+        buckets = []
+
+        for inc in self.build_increments(event):
+            bucket = self._repo.get_or_create_bucket(
+                bucket_type=inc.bucket_type,
+                bucket_start=inc.bucket_start,
+                event_type=inc.event_type,
+                dimensions=inc.dimensions,
+            )
+
+            self._repo.increment(
+                bucket_id=bucket.id,
+                count_total=inc.count_total,
+                count_real=inc.count_real,
+                count_bot=inc.count_bot,
+            )
+
+            # Re-fetch to get updated counts
+            updated = self._repo.get_or_create_bucket(
+                bucket_type=inc.bucket_type,
+                bucket_start=inc.bucket_start,
+                event_type=inc.event_type,
+                dimensions=inc.dimensions,
+            )
+            buckets.append(updated)
+
+        return buckets
+
+    def build_increments(self, event: AggregateInput) -> list[AggregateIncrement]:
+        """
+        Compute the per-bucket count deltas for an event without writing them.
+
+        Used by record() and by the write-batched AggregatePipeline.
+        """
         if not self._config.enabled:
             return []
 
-        buckets = []
-
         # Build base dimensions
         dimensions = self._build_dimensions(event)
 
         # Determine count increments based on ua_class
-        count_total = 1
         count_real = 0
         count_bot = 0
 
@@ -396,34 +572,18 @@ class AggregateService:
                 count_real = 1
             # else: neither real nor bot
 
-        # Record to each bucket type
-        for bucket_type in self._config.bucket_types:
-            bucket_start = calculate_bucket_start(event.timestamp, bucket_type)
-
-            bucket = self._repo.get_or_create_bucket(
+        return [
+            AggregateIncrement(
                 bucket_type=bucket_type.value,
-                bucket_start=bucket_start,
+                bucket_start=calculate_bucket_start(event.timestamp, bucket_type),
                 event_type=event.event_type,
                 dimensions=dimensions,
-            )
-
-            self._repo.increment(
-                bucket_id=bucket.id,
-                count_total=count_total,
+                count_total=1,
                 count_real=count_real,
                 count_bot=count_bot,
             )
-
-            # Re-fetch to get updated counts
-            updated = self._repo.get_or_create_bucket(
-                bucket_type=bucket_type.value,
-                bucket_start=bucket_start,
-                event_type=event.event_type,
-                dimensions=dimensions,
-            )
-            buckets.append(updated)
-
-        return buckets
+            for bucket_type in self._config.bucket_types
+        ]
 
     def _build_dimensions(self, event: AggregateInput) -> dict[str, Any]:
         """Build dimension dict from event."""
@@ -467,6 +627,10 @@ class AggregateService:
             dimensions=dimension_filters if dimension_filters else None,
         )
 
+    def _query_port(self) -> AggregateQueryPort | None:
+        """The repo's pushed-down query engine, if it has one."""
+        return self._repo if isinstance(self._repo, AggregateQueryPort) else None
+
     def get_totals(
         self,
         bucket_type: BucketType,
@@ -475,30 +639,34 @@ class AggregateService:
         event_type: str | None = None,
         content_id: UUID | None = None,
         exclude_bots: bool = True,
+        link_id: UUID | None = None,
     ) -> dict[str, int]:
         """
         Get aggregated totals for a time range.
 
         Returns dict with total, real, and bot counts.
         """
+        engine = self._query_port()
+        if engine is not None:
+            sums = engine.sum_counts(
+                bucket_type.value, start, end, event_type, content_id, link_id=link_id
+            )
+            return _shape_totals(sums["total"], sums["real"], sums["bot"], exclude_bots)
+
         buckets = self.query_buckets(
             bucket_type=bucket_type,
             start=start,
             end=end,
             event_type=event_type,
             content_id=content_id,
+            link_id=link_id,
         )
 
         total = sum(b.count_total for b in buckets)
         real = sum(b.count_real for b in buckets)
         bot = sum(b.count_bot for b in buckets)
 
-        return {
-            "total": real if exclude_bots else total,
-            "total_with_bots": total,
-            "real": real,
-            "bot": bot,
-        }
+        return _shape_totals(total, real, bot, exclude_bots)
 
     def get_time_series(
         self,
@@ -508,28 +676,39 @@ class AggregateService:
         event_type: str | None = None,
         content_id: UUID | None = None,
         exclude_bots: bool = True,
+        link_id: UUID | None = None,
     ) -> list[dict[str, Any]]:
         """
         Get time series data for charting.
 
         Returns list of {timestamp, count} dicts.
         """
+        engine = self._query_port()
+        if engine is not None:
+            return engine.count_series(
+                bucket_type.value,
+                start,
+                end,
+                event_type,
+                content_id,
+                exclude_bots,
+                link_id=link_id,
+            )
+
         buckets = self.query_buckets(
             bucket_type=bucket_type,
             start=start,
             end=end,
             event_type=event_type,
             content_id=content_id,
+            link_id=link_id,
         )
 
         # Group by timestamp (in case multiple dimension combos)
         by_time: dict[datetime, int] = {}
         for bucket in buckets:
             count = bucket.count_real if exclude_bots else bucket.count_total
-            if bucket.bucket_start in by_time:
-                by_time[bucket.bucket_start] += count
-            else:
-                by_time[bucket.bucket_start] = count
+            by_time[bucket.bucket_start] = by_time.get(bucket.bucket_start, 0) + count
 
         return [{"timestamp": ts, "count": count} for ts, count in sorted(by_time.items())]
 
@@ -547,28 +726,12 @@ class AggregateService:
 
         Returns list of {content_id, count} dicts.
         """
-        buckets = self.query_buckets(
-            bucket_type=bucket_type,
-            start=start,
-            end=end,
-            event_type=event_type,
-        )
-
-        # Group by content_id
-        by_content: dict[UUID | None, int] = {}
-        for bucket in buckets:
-            if bucket.content_id is None:
-                continue
-            count = bucket.count_real if exclude_bots else bucket.count_total
-            if bucket.content_id in by_content:
-                by_content[bucket.content_id] += count
-            else:
-                by_content[bucket.content_id] = count
-
-        # Sort by count desc and limit
-        sorted_content = sorted(by_content.items(), key=lambda x: x[1], reverse=True)
-
-        return [{"content_id": cid, "count": count} for cid, count in sorted_content[:limit]]
+        return [
+            {"content_id": content_id, "count": count}
+            for (content_id,), count in self._top(
+                ("content_id",), bucket_type, start, end, event_type, limit, exclude_bots
+            )
+        ]
 
     def get_top_sources(
         self,
@@ -583,29 +746,18 @@ class AggregateService:
 
         Returns list of {source, medium, count} dicts.
         """
-        buckets = self.query_buckets(
-            bucket_type=bucket_type,
-            start=start,
-            end=end,
-            event_type="page_view",
-        )
-
-        # Group by source/medium
-        by_source: dict[tuple[str | None, str | None], int] = {}
-        for bucket in buckets:
-            key = (bucket.utm_source, bucket.utm_medium)
-            count = bucket.count_real if exclude_bots else bucket.count_total
-            if key in by_source:
-                by_source[key] += count
-            else:
-                by_source[key] = count
-
-        # Sort by count desc and limit
-        sorted_sources = sorted(by_source.items(), key=lambda x: x[1], reverse=True)
-
         return [
             {"source": src, "medium": med, "count": count}
-            for (src, med), count in sorted_sources[:limit]
+            for (src, med), count in self._top(
+                ("utm_source", "utm_medium"),
+                bucket_type,
+                start,
+                end,
+                "page_view",
+                limit,
+                exclude_bots,
+                skip_null=False,
+            )
         ]
 
     def get_top_referrers(
@@ -621,29 +773,172 @@ class AggregateService:
 
         Returns list of {domain, count} dicts.
         """
+        return [
+            {"domain": domain, "count": count}
+            for (domain,), count in self._top(
+                ("referrer_domain",), bucket_type, start, end, "page_view", limit, exclude_bots
+            )
+        ]
+
+    def get_top_links(
+        self,
+        bucket_type: BucketType,
+        start: datetime,
+        end: datetime,
+        limit: int = 10,
+        exclude_bots: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        Get top outbound links by clicks.
+
+        Returns list of {link_id, count} dicts.
+        """
+        return [
+            {"link_id": link_id, "count": count}
+            for (link_id,), count in self._top(
+                ("link_id",), bucket_type, start, end, "outbound_click", limit, exclude_bots
+            )
+        ]
+
+    def get_link_clicks(
+        self,
+        link_id: UUID,
+        bucket_type: BucketType,
+        start: datetime,
+        end: datetime,
+        exclude_bots: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        Get outbound clicks on one link per time bucket.
+
+        Returns list of {timestamp, count} dicts.
+        """
+        return self.get_time_series(
+            bucket_type=bucket_type,
+            start=start,
+            end=end,
+            event_type="outbound_click",
+            exclude_bots=exclude_bots,
+            link_id=link_id,
+        )
+
+    def get_dashboard(
+        self,
+        bucket_type: BucketType,
+        start: datetime,
+        end: datetime,
+        limit: int = 5,
+        exclude_bots: bool = True,
+    ) -> DashboardSummary:
+        """
+        Get every dashboard section from a single scan of the range.
+
+        Totals and time series cover all event types; top lists cover
+        page views, matching the individual getters.
+        """
+        engine = self._query_port()
+        if engine is not None:
+            return engine.dashboard(bucket_type.value, start, end, limit, exclude_bots)
+
+        buckets = self.query_buckets(bucket_type=bucket_type, start=start, end=end)
+        return summarize_buckets(buckets, limit=limit, exclude_bots=exclude_bots)
+
+    def _top(
+        self,
+        dimensions: tuple[str, ...],
+        bucket_type: BucketType,
+        start: datetime,
+        end: datetime,
+        event_type: str,
+        limit: int,
+        exclude_bots: bool,
+        skip_null: bool = True,
+    ) -> list[tuple[tuple[Any, ...], int]]:
+        """Top dimension value tuples by count (SQL when available)."""
+        engine = self._query_port()
+        if engine is not None:
+            return engine.top_values(
+                dimensions,
+                bucket_type.value,
+                start,
+                end,
+                event_type,
+                limit,
+                exclude_bots,
+                skip_null,
+            )
+
         buckets = self.query_buckets(
             bucket_type=bucket_type,
             start=start,
             end=end,
-            event_type="page_view",
+            event_type=event_type,
         )
 
-        # Group by referrer_domain
-        by_domain: dict[str | None, int] = {}
+        grouped: dict[tuple[Any, ...], int] = {}
         for bucket in buckets:
-            domain = bucket.referrer_domain
-            if domain is None:
+            key = tuple(getattr(bucket, dim) for dim in dimensions)
+            if skip_null and all(v is None for v in key):
                 continue
             count = bucket.count_real if exclude_bots else bucket.count_total
-            if domain in by_domain:
-                by_domain[domain] += count
-            else:
-                by_domain[domain] = count
+            grouped[key] = grouped.get(key, 0) + count
 
         # Sort by count desc and limit
-        sorted_domains = sorted(by_domain.items(), key=lambda x: x[1], reverse=True)
-
-        return [{"domain": domain, "count": count} for domain, count in sorted_domains[:limit]]
+        return sorted(grouped.items(), key=lambda x: x[1], reverse=True)[:limit]
+
+
+# --- Summaries ---
+
+
+def _shape_totals(total: int, real: int, bot: int, exclude_bots: bool) -> dict[str, int]:
+    return {
+        "total": real if exclude_bots else total,
+        "total_with_bots": total,
+        "real": real,
+        "bot": bot,
+    }
+
+
+def summarize_buckets(
+    buckets: Sequence[AnalyticsEventAggregate],
+    limit: int = 5,
+    exclude_bots: bool = True,
+) -> DashboardSummary:
+    """Build every dashboard section in one pass over the buckets."""
+    total = real = bot = 0
+    by_time: dict[datetime, int] = {}
+    by_content: dict[UUID, int] = {}
+    by_source: dict[tuple[str | None, str | None], int] = {}
+    by_domain: dict[str, int] = {}
+
+    for b in buckets:
+        count = b.count_real if exclude_bots else b.count_total
+        total += b.count_total
+        real += b.count_real
+        bot += b.count_bot
+        by_time[b.bucket_start] = by_time.get(b.bucket_start, 0) + count
+
+        if b.event_type != "page_view":
+            continue
+        if b.content_id is not None:
+            by_content[b.content_id] = by_content.get(b.content_id, 0) + count
+        source = (b.utm_source, b.utm_medium)
+        by_source[source] = by_source.get(source, 0) + count
+        if b.referrer_domain is not None:
+            by_domain[b.referrer_domain] = by_domain.get(b.referrer_domain, 0) + count
+
+    def top[K](grouped: dict[K, int]) -> list[tuple[K, int]]:
+        return sorted(grouped.items(), key=lambda x: x[1], reverse=True)[:limit]
+
+    return DashboardSummary(
+        totals=_shape_totals(total, real, bot, exclude_bots),
+        time_series=[{"timestamp": ts, "count": c} for ts, c in sorted(by_time.items())],
+        top_content=[{"content_id": cid, "count": c} for cid, c in top(by_content)],
+        top_sources=[
+            {"source": src, "medium": med, "count": c} for (src, med), c in top(by_source)
+        ],
+        top_referrers=[{"domain": d, "count": c} for d, c in top(by_domain)],
+    )
 
 
 # --- Factory ---
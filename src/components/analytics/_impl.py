@@ -19,11 +19,14 @@ Key behaviors:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from enum import Enum
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 from uuid import UUID
 
+if TYPE_CHECKING:
+    from src.adapters.rate_limiter import RateLimitEngine
+
 # --- Enums ---
 
 
@@ -192,20 +195,24 @@ class TimePort(Protocol):
 
 
 class InMemoryRateLimiter:
-    """In-memory rate limiter for testing/dev."""
+    """
+    In-process rate limiter backed by the sliding-window engine.
 
-    def __init__(self, time_port: TimePort | None = None) -> None:
-        self._requests: dict[str, list[datetime]] = {}
-        self._time_port = time_port
+    Fixed memory per client key; pass the shared engine so every
+    ingestion request counts against the same windows.
+    """
 
-    def _now(self) -> datetime:
-        """Get current time via injected port (deterministic core)."""
-        if self._time_port:
-            return self._time_port.now_utc()
-        # Fallback for backward compatibility - should inject TimePort in production
-        from src.adapters.time_london import LondonTimeAdapter
+    def __init__(
+        self,
+        engine: RateLimitEngine | None = None,
+        namespace: str = "analytics",
+    ) -> None:
+        if engine is None:
+            from src.adapters.rate_limiter import SlidingWindowRateLimiter
 
-        return LondonTimeAdapter().now_utc()
+            engine = SlidingWindowRateLimiter()
+        self._engine = engine
+        self._prefix = f"{namespace}:"
 
     def check_rate_limit(
         self,
@@ -214,24 +221,12 @@ class InMemoryRateLimiter:
         window_seconds: int,
     ) -> bool:
         """Check if rate limit allows request."""
-        now = self._now()
-        cutoff = now - timedelta(seconds=window_seconds)
-
-        if key not in self._requests:
-            return True
-
-        # Clean old entries and count recent
-        recent = [t for t in self._requests[key] if t > cutoff]
-        self._requests[key] = recent
-
-        return len(recent) < max_requests
+        allowed, _ = self._engine.peek(self._prefix + key, max_requests, window_seconds)
+        return allowed
 
     def record_request(self, key: str, window_seconds: int) -> None:
         """Record a request."""
-        now = self._now()
-        if key not in self._requests:
-            self._requests[key] = []
-        self._requests[key].append(now)
+        self._engine.record(self._prefix + key, window_seconds)
 
 
 class InMemoryEventStore:
@@ -0,0 +1,194 @@
+"""
+IngestQueue (E6.1) - Non-blocking front for analytics ingestion.
+
+Request handlers that must not wait on ingestion (the outbound click
+redirects) submit raw event payloads here; a background thread runs them
+through AnalyticsIngestionService, so they get the same validation, rate
+limiting and aggregation as /a/event.
+
+Spec refs: E6.1, E6.2, TA-0038
+
+Key behaviors:
+- submit() only appends to an in-memory deque and returns
+- The queue is bounded; when it is full the event is dropped and counted
+  (clicks are analytics, not records - the redirect never waits)
+- Each payload keeps its own "ts", so queueing delay does not move it
+  into a later bucket
+- Without a running thread (tests, scripts) submit() ingests inline
+- stop() drains the queue (shutdown hook); stats() reports depth and outcomes
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from src.domain.stats import CounterSnapshot, ratio
+
+from ._impl import AnalyticsIngestionService
+
+logger = logging.getLogger(__name__)
+
+
+# --- Configuration ---
+
+
+@dataclass(frozen=True)
+class IngestQueueConfig:
+    """Ingest queue configuration."""
+
+    # Longest the worker sleeps when nothing wakes it
+    drain_interval_seconds: float = 0.5
+
+    # Payloads held in memory before submit() starts dropping
+    max_queue: int = 10_000
+
+
+DEFAULT_INGEST_QUEUE_CONFIG = IngestQueueConfig()
+
+
+@dataclass(frozen=True)
+class IngestQueueStats(CounterSnapshot):
+    queue_depth: int
+    submitted: int
+    dropped: int  # Rejected by submit() because the queue was full
+    ingested: int
+    rejected: int  # Failed validation or rate limiting
+    errors: int  # Raised while ingesting
+
+    @property
+    def drop_rate(self) -> float:
+        return ratio(self.dropped, self.submitted + self.dropped)
+
+
+# --- Queue ---
+
+
+class IngestQueue:
+    """Bounded queue that feeds an AnalyticsIngestionService from a background thread."""
+
+    def __init__(
+        self,
+        service: AnalyticsIngestionService,
+        config: IngestQueueConfig | None = None,
+    ) -> None:
+        """Initialize queue."""
+        self._service = service
+        self._config = config or DEFAULT_INGEST_QUEUE_CONFIG
+
+        self._lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+        self._queue: deque[tuple[dict[str, Any], str | None]] = deque()
+
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._submitted = 0
+        self._dropped = 0
+        self._ingested = 0
+        self._rejected = 0
+        self._errors = 0
+
+    # --- Submitting ---
+
+    def submit(self, data: dict[str, Any], client_key: str | None = None) -> bool:
+        """
+        Queue an event payload for ingestion.
+
+        Returns False if the payload was dropped because the queue is full.
+        """
+        with self._lock:
+            if len(self._queue) >= self._config.max_queue:
+                self._dropped += 1
+                return False
+            self._queue.append((data, client_key))
+            self._submitted += 1
+
+        if self.is_running:
+            self._wake.set()
+        else:
+            # No worker thread (tests, scripts): behave as write-through
+            self.drain()
+        return True
+
+    # --- Draining ---
+
+    def drain(self) -> int:
+        """
+        Ingest every queued payload on the calling thread.
+
+        Returns the number of payloads accepted by the service.
+        """
+        accepted = 0
+        with self._drain_lock:
+            while True:
+                with self._lock:
+                    if not self._queue:
+                        return accepted
+                    data, client_key = self._queue.popleft()
+                try:
+                    _, errors = self._service.ingest(data, client_key=client_key)
+                except Exception:
+                    logger.exception("Queued analytics ingest failed (%s)", data.get("event_type"))
+                    with self._lock:
+                        self._errors += 1
+                    continue
+                with self._lock:
+                    if errors:
+                        self._rejected += 1
+                    else:
+                        self._ingested += 1
+                        accepted += 1
+
+    # --- Background worker ---
+
+    def start(self) -> None:
+        """Start the background ingest thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="analytics-ingest-queue",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background thread and ingest whatever is still queued."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.drain()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self._config.drain_interval_seconds)
+            self._wake.clear()
+            if self._stopping.is_set():
+                break
+            self.drain()
+
+    # --- Monitoring ---
+
+    def stats(self) -> IngestQueueStats:
+        """Snapshot of queue counters."""
+        with self._lock:
+            return IngestQueueStats(
+                queue_depth=len(self._queue),
+                submitted=self._submitted,
+                dropped=self._dropped,
+                ingested=self._ingested,
+                rejected=self._rejected,
+                errors=self._errors,
+            )
@@ -0,0 +1,374 @@
+"""
+AggregatePipeline (E6.4) - Write-batched aggregate ingestion.
+
+Buffers accepted analytics events in memory, coalesces them per bucket and
+flushes them periodically as a single batched upsert.
+
+Spec refs: E6.1, E6.4, TA-0041
+
+Key behaviors:
+- Events are coalesced by (bucket_type, bucket_start, event_type, dimensions)
+- A background thread flushes every flush_interval_seconds, or early when
+  the buffer reaches flush_high_water pending rows
+- Each flush is one sink call (one transaction for the SQLite sink)
+- Backlog is bounded: events that would add rows beyond max_pending_rows
+  are dropped and counted rather than growing memory without limit
+- Failed flushes are merged back into the buffer and retried next cycle
+- The flush thread also prunes minute buckets older than the aggregate
+  retention (AggregateConfig.retention_minutes, the default dashboard
+  window) once per retention_sweep_interval_seconds; hour and day
+  buckets are kept
+- stats() reports queue depth, drops and flush latency
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from urllib.parse import urlparse
+from uuid import UUID
+
+from src.domain.stats import CounterSnapshot
+
+from ._aggregate import (
+    AggregateIncrement,
+    AggregateInput,
+    AggregateRetentionPort,
+    AggregateService,
+    AggregateSinkPort,
+    BucketType,
+    UAClass,
+)
+from ._impl import AnalyticsEvent
+
+logger = logging.getLogger(__name__)
+
+_BucketKey = tuple[str, datetime, str, tuple[tuple[str, Any], ...]]
+
+
+# --- Configuration ---
+
+
+@dataclass(frozen=True)
+class PipelineConfig:
+    """Aggregate pipeline configuration."""
+
+    flush_interval_seconds: float = 1.0
+
+    # Wake the flusher early once this many coalesced rows are pending
+    flush_high_water: int = 2_000
+
+    # Hard bound on coalesced rows held in memory (including failed retries)
+    max_pending_rows: int = 20_000
+
+    # How often the flush thread deletes expired minute buckets
+    retention_sweep_interval_seconds: float = 3600.0
+
+
+DEFAULT_PIPELINE_CONFIG = PipelineConfig()
+
+
+@dataclass(frozen=True)
+class PipelineStats(CounterSnapshot):
+    queue_depth: int  # Coalesced rows waiting for the next flush
+    events_accepted: int
+    events_dropped: int
+    rows_dropped: int  # Coalesced rows discarded after failed flushes overflowed
+    flushes: int
+    flush_errors: int
+    rows_flushed: int
+    last_flush_ms: float
+    max_flush_ms: float
+    last_flush_rows: int
+
+
+# --- Pipeline ---
+
+
+class AggregatePipeline:
+    """
+    Write-batched aggregate recorder.
+
+    record() only touches the in-memory buffer; the database sees one
+    batched upsert per flush instead of several round trips per event.
+    """
+
+    def __init__(
+        self,
+        sink: AggregateSinkPort,
+        service: AggregateService | None = None,
+        config: PipelineConfig | None = None,
+    ) -> None:
+        """Initialize pipeline."""
+        self._sink = sink
+        self._service = service or AggregateService()
+        self._config = config or DEFAULT_PIPELINE_CONFIG
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: dict[_BucketKey, list[int]] = {}
+
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._accepted = 0
+        self._dropped = 0
+        self._rows_dropped = 0
+        self._flushes = 0
+        self._flush_errors = 0
+        self._rows_flushed = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+        self._last_flush_rows = 0
+        self._failure_streak = 0
+        self._last_sweep: float | None = None
+
+    # --- Recording ---
+
+    def record(self, event: AggregateInput) -> bool:
+        """
+        Buffer an event for aggregation.
+
+        Returns False if the event was dropped because the backlog is full.
+        """
+        increments = self._service.build_increments(event)
+        if not increments:
+            return True
+
+        keys = [
+            (
+                inc.bucket_type,
+                inc.bucket_start,
+                inc.event_type,
+                tuple(sorted(inc.dimensions.items())),
+            )
+            for inc in increments
+        ]
+
+        with self._lock:
+            new_rows = sum(1 for key in keys if key not in self._pending)
+            if len(self._pending) + new_rows > self._config.max_pending_rows:
+                self._dropped += 1
+                return False
+
+            for key, inc in zip(keys, increments, strict=True):
+                counts = self._pending.get(key)
+                if counts is None:
+                    self._pending[key] = [inc.count_total, inc.count_real, inc.count_bot]
+                else:
+                    counts[0] += inc.count_total
+                    counts[1] += inc.count_real
+                    counts[2] += inc.count_bot
+            self._accepted += 1
+            depth = len(self._pending)
+
+        if depth >= self._config.flush_high_water:
+            self._wake.set()
+        return True
+
+    # --- Flushing ---
+
+    def flush(self) -> int:
+        """
+        Write all pending rows to the sink in one batch.
+
+        Returns the number of rows written. On failure the batch is merged
+        back into the buffer for the next attempt.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+
+            if not batch:
+                return 0
+
+            increments = [
+                AggregateIncrement(
+                    bucket_type=bucket_type,
+                    bucket_start=bucket_start,
+                    event_type=event_type,
+                    dimensions=dict(dims),
+                    count_total=counts[0],
+                    count_real=counts[1],
+                    count_bot=counts[2],
+                )
+                for (bucket_type, bucket_start, event_type, dims), counts in batch.items()
+            ]
+
+            started = time.perf_counter()
+            try:
+                self._sink.upsert_increments(increments)
+            except Exception:
+                # Log the first failure of a streak in full; retries stay quiet
+                if self._failure_streak == 0:
+                    logger.exception("Analytics aggregate flush failed (%d rows)", len(batch))
+                self._failure_streak += 1
+                with self._lock:
+                    self._flush_errors += 1
+                    self._merge_back(batch)
+                return 0
+            self._failure_streak = 0
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                self._flushes += 1
+                self._rows_flushed += len(increments)
+                self._last_flush_ms = elapsed_ms
+                self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+                self._last_flush_rows = len(increments)
+            return len(increments)
+
+    def _merge_back(self, batch: dict[_BucketKey, list[int]]) -> None:
+        """Return a failed batch to the buffer (lock held), oldest rows first."""
+        merged = batch
+        for key, counts in self._pending.items():
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = counts
+            else:
+                for i in range(3):
+                    existing[i] += counts[i]
+
+        overflow = len(merged) - self._config.max_pending_rows
+        if overflow > 0:
+            for key in list(merged)[-overflow:]:
+                del merged[key]
+            self._rows_dropped += overflow
+        self._pending = merged
+
+    # --- Retention ---
+
+    def sweep(self) -> int:
+        """
+        Delete minute buckets that have aged out of the retention window.
+
+        Returns the number of rows deleted (0 if the sink cannot delete).
+        """
+        if not isinstance(self._sink, AggregateRetentionPort):
+            return 0
+        cutoff = self._service.retention_cutoff(BucketType.MINUTE)
+        deleted = self._sink.delete_before(BucketType.MINUTE.value, cutoff)
+        if deleted:
+            logger.info("Pruned %d minute aggregate rows before %s", deleted, cutoff)
+        return deleted
+
+    def _sweep_if_due(self) -> None:
+        now = time.monotonic()
+        interval = self._config.retention_sweep_interval_seconds
+        if self._last_sweep is not None and now - self._last_sweep < interval:
+            return
+        self._last_sweep = now
+        try:
+            self.sweep()
+        except Exception:
+            logger.exception("Analytics aggregate retention sweep failed")
+
+    # --- Background worker ---
+
+    def start(self) -> None:
+        """Start the background flush thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="analytics-aggregate-flush",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background thread and flush whatever is still buffered."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self._config.flush_interval_seconds)
+            self._wake.clear()
+            if self._stopping.is_set():
+                break
+            self.flush()
+            self._sweep_if_due()
+
+    # --- Monitoring ---
+
+    def stats(self) -> PipelineStats:
+        """Snapshot of pipeline counters."""
+        with self._lock:
+            return PipelineStats(
+                queue_depth=len(self._pending),
+                events_accepted=self._accepted,
+                events_dropped=self._dropped,
+                rows_dropped=self._rows_dropped,
+                flushes=self._flushes,
+                flush_errors=self._flush_errors,
+                rows_flushed=self._rows_flushed,
+                last_flush_ms=self._last_flush_ms,
+                max_flush_ms=self._max_flush_ms,
+                last_flush_rows=self._last_flush_rows,
+            )
+
+
+# --- Event Store Adapter ---
+
+
+def _referrer_domain(referrer: str | None) -> str | None:
+    """Reduce a referrer URL to its host (no path or query - privacy)."""
+    if not referrer:
+        return None
+    host = urlparse(referrer).hostname
+    if not host:
+        return None
+    return host.removeprefix("www.")
+
+
+def _link_uuid(link_id: str | None) -> str | None:
+    """Aggregates key outbound links by UUID; free-form ids are not bucketed."""
+    if not link_id:
+        return None
+    try:
+        return str(UUID(link_id))
+    except ValueError:
+        return None
+
+
+class PipelineEventStore:
+    """
+    EventStorePort that feeds validated events into an AggregatePipeline.
+
+    Raw events are not retained; only bucketed counts are persisted.
+    """
+
+    def __init__(self, pipeline: AggregatePipeline) -> None:
+        self._pipeline = pipeline
+
+    def store(self, event: AnalyticsEvent) -> None:
+        """Convert a validated event to an aggregate input and buffer it."""
+        self._pipeline.record(
+            AggregateInput(
+                event_type=event.event_type.value,
+                timestamp=event.timestamp,
+                content_id=event.content_id,
+                asset_id=event.asset_id,
+                link_id=_link_uuid(event.link_id),
+                utm_source=event.utm_source,
+                utm_medium=event.utm_medium,
+                utm_campaign=event.utm_campaign,
+                referrer_domain=_referrer_domain(event.referrer),
+                ua_class=UAClass(event.ua_class.value),
+            )
+        )
@@ -42,6 +42,7 @@ from .models import (
 from .ports import (
     AssetRepoPort,
     RulesPort,
+    StagingStoragePort,
     StoragePort,
     VersionRepoPort,
 )
@@ -87,6 +88,7 @@ __all__ = [
     # Ports
     "AssetRepoPort",
     "RulesPort",
+    "StagingStoragePort",
     "StoragePort",
     "VersionRepoPort",
 ]
@@ -17,11 +17,14 @@ Invariants:
 from __future__ import annotations
 
 import hashlib
+import io
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any, BinaryIO
 from uuid import UUID, uuid4
 
 from src.core.entities import Asset, AssetVersion
+from src.core.ports.storage import IntegrityError, ObjectTooLargeError
 
 from .models import (
     AssetKindConfig,
@@ -39,7 +42,14 @@ from .models import (
     VersionListOutput,
     VersionOutput,
 )
-from .ports import AssetRepoPort, RulesPort, StoragePort, TimePort, VersionRepoPort
+from .ports import (
+    AssetRepoPort,
+    RulesPort,
+    StagingStoragePort,
+    StoragePort,
+    TimePort,
+    VersionRepoPort,
+)
 
 
 def _get_now(time_port: TimePort | None = None) -> datetime:
@@ -372,6 +382,16 @@ def run_upload(
     """
     kinds = _get_kinds_config(rules)
 
+    if isinstance(storage, StagingStoragePort):
+        return _run_streaming_upload(
+            inp,
+            kinds,
+            asset_repo=asset_repo,
+            version_repo=version_repo,
+            storage=storage,
+            time_port=time_port,
+        )
+
     # Read data and compute hash
     data_bytes, sha256 = compute_sha256(inp.data)
     size = len(data_bytes)
@@ -390,6 +410,98 @@ def run_upload(
     if errors:
         return UploadOutput(errors=errors, success=False)
 
+    # Store in object storage (TA-0008: integrity verified during storage)
+    def store(storage_key: str) -> None:
+        storage.put(
+            storage_key,
+            data_bytes,
+            inp.content_type,
+            expected_sha256=sha256,
+        )
+
+    return _record_upload(
+        inp,
+        sha256=sha256,
+        size=size,
+        store=store,
+        asset_repo=asset_repo,
+        version_repo=version_repo,
+        time_port=time_port,
+    )
+
+
+def _run_streaming_upload(
+    inp: UploadAssetInput,
+    kinds: dict[str, AssetKindConfig],
+    *,
+    asset_repo: AssetRepoPort,
+    version_repo: VersionRepoPort,
+    storage: StagingStoragePort,
+    time_port: TimePort | None,
+) -> UploadOutput:
+    """
+    Upload path for storage that can stage streams.
+
+    The body is spooled in chunks with the hash computed on the fly, and
+    spooling stops as soon as the kind's size limit is exceeded.
+    """
+    # Validate MIME type (TA-0006) before reading any bytes
+    errors = validate_mime_type(inp.content_type, kinds)
+    if errors:
+        return UploadOutput(errors=errors, success=False)
+
+    kind_name = get_asset_kind(inp.content_type, kinds)
+    max_bytes = kinds[kind_name].max_upload_bytes if kind_name in kinds else None
+    source = io.BytesIO(inp.data) if isinstance(inp.data, bytes) else inp.data
+
+    try:
+        staged = storage.stage(
+            source,
+            max_bytes=max_bytes,
+            expected_sha256=inp.expected_sha256,
+        )
+    except ObjectTooLargeError as e:
+        # Validate size (TA-0007)
+        return UploadOutput(
+            errors=[
+                AssetValidationError(
+                    code="file_too_large",
+                    message=f"File size exceeds maximum of {e.max_bytes} bytes for {kind_name}",
+                    field="file",
+                )
+            ],
+            success=False,
+        )
+    except IntegrityError as e:
+        # Validate integrity (TA-0008)
+        return UploadOutput(errors=validate_integrity(e.expected, e.actual), success=False)
+
+    try:
+        return _record_upload(
+            inp,
+            sha256=staged.sha256,
+            size=staged.size_bytes,
+            store=lambda storage_key: storage.commit_staged(staged, storage_key, inp.content_type),
+            asset_repo=asset_repo,
+            version_repo=version_repo,
+            time_port=time_port,
+        )
+    finally:
+        # No-op once committed; drops the spool file on any early exit
+        storage.discard_staged(staged)
+
+
+def _record_upload(
+    inp: UploadAssetInput,
+    *,
+    sha256: str,
+    size: int,
+    store: Callable[[str], Any],
+    asset_repo: AssetRepoPort,
+    version_repo: VersionRepoPort,
+    time_port: TimePort | None,
+) -> UploadOutput:
+    """Create asset/version records for validated bytes and store them."""
     is_new_asset = inp.asset_id is None
     asset_id: UUID
 
@@ -429,13 +541,7 @@ def run_upload(
     extension = mime_to_extension(inp.content_type)
     storage_key = generate_storage_key(asset_id, version_number, extension)
 
-    # Store in object storage (TA-0008: integrity verified during storage)
-    storage.put(
-        storage_key,
-        data_bytes,
-        inp.content_type,
-        expected_sha256=sha256,
-    )
+    store(storage_key)
 
     # Create version record
     version = AssetVersion(
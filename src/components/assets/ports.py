@@ -7,7 +7,7 @@ Spec refs: E2.1, E2.2, E2.3
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, BinaryIO, Protocol
+from typing import Any, BinaryIO, Protocol, runtime_checkable
 from uuid import UUID
 
 from src.core.entities import Asset, AssetVersion
@@ -99,6 +99,34 @@ class StoragePort(Protocol):
         ...
 
 
+@runtime_checkable
+class StagingStoragePort(Protocol):
+    """
+    Storage that can spool a stream before binding it to a key.
+
+    Lets uploads be hashed and size-checked chunk by chunk instead of
+    being read into memory first.
+    """
+
+    def stage(
+        self,
+        source: BinaryIO,
+        *,
+        max_bytes: int | None = None,
+        expected_sha256: str | None = None,
+    ) -> Any:
+        """Spool source to temporary storage; returns a handle with size_bytes and sha256."""
+        ...
+
+    def commit_staged(self, staged: Any, key: str, content_type: str) -> Any:
+        """Bind staged bytes to key."""
+        ...
+
+    def discard_staged(self, staged: Any) -> None:
+        """Drop staged bytes that will not be committed."""
+        ...
+
+
 class RulesPort(Protocol):
     """Port for accessing asset rules configuration."""
 
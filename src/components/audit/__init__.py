@@ -17,6 +17,13 @@ from ._impl import (
     EntityType,
     InMemoryAuditRepo,
     create_audit_service,
+    decode_cursor,
+    encode_cursor,
+)
+from ._writebehind import (
+    AuditWriteBehind,
+    WriteBehindConfig,
+    WriteBehindStats,
 )
 from .component import (
     run,
@@ -63,4 +70,10 @@ __all__ = [
     "DefaultTimePort",
     "InMemoryAuditRepo",
     "create_audit_service",
+    "decode_cursor",
+    "encode_cursor",
+    # Write-behind
+    "AuditWriteBehind",
+    "WriteBehindConfig",
+    "WriteBehindStats",
 ]
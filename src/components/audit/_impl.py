@@ -12,11 +12,13 @@ Key behaviors:
 - Log all admin actions (create, update, delete)
 - Capture actor, target, action, metadata
 - Query by entity, actor, action, time range
+- Newest-first ordering by (timestamp, id); keyset cursors for paging
 - Immutable log entries (no update/delete)
 """
 
 from __future__ import annotations
 
+import base64
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -105,6 +107,31 @@ class AuditQuery:
     end_time: datetime | None = None
     limit: int = 100
     offset: int = 0
+    # Keyset position: only entries strictly older than (timestamp, id)
+    before: tuple[datetime, UUID] | None = None
+
+
+# --- Keyset Cursors ---
+
+
+def encode_cursor(entry: AuditEntry) -> str:
+    """Opaque cursor pointing just past entry in newest-first order."""
+    raw = f"{entry.timestamp.isoformat()}|{entry.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor from encode_cursor(). Raises ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts, entry_id = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+        return datetime.fromisoformat(ts), UUID(entry_id)
+    except (UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid audit cursor: {cursor}") from e
+
+
+def _sort_key(entry: AuditEntry) -> tuple[datetime, str]:
+    return entry.timestamp, str(entry.id)
 
 
 # --- Repository Protocol ---
@@ -150,46 +177,35 @@ class InMemoryAuditRepo:
 
     def query(self, query: AuditQuery) -> list[AuditEntry]:
         """Query with filters."""
-        results = list(self._entries.values())
-
-        # Apply filters
-        if query.entity_type:
-            results = [e for e in results if e.entity_type == query.entity_type]
-        if query.entity_id:
-            results = [e for e in results if e.entity_id == query.entity_id]
-        if query.actor_id:
-            results = [e for e in results if e.actor_id == query.actor_id]
-        if query.action:
-            results = [e for e in results if e.action == query.action]
-        if query.start_time:
-            results = [e for e in results if e.timestamp >= query.start_time]
-        if query.end_time:
-            results = [e for e in results if e.timestamp <= query.end_time]
-
-        # Sort by timestamp descending
-        results.sort(key=lambda e: e.timestamp, reverse=True)
+        results = self._filter(query)
+
+        # Newest first; id breaks timestamp ties so cursors are stable
+        results.sort(key=_sort_key, reverse=True)
+
+        if query.before:
+            ts, entry_id = query.before
+            position = (ts, str(entry_id))
+            results = [e for e in results if _sort_key(e) < position]
+            return results[: query.limit]
 
         # Apply pagination
         return results[query.offset : query.offset + query.limit]
 
     def count(self, query: AuditQuery) -> int:
         """Count matching entries."""
-        results = list(self._entries.values())
-
-        if query.entity_type:
-            results = [e for e in results if e.entity_type == query.entity_type]
-        if query.entity_id:
-            results = [e for e in results if e.entity_id == query.entity_id]
-        if query.actor_id:
-            results = [e for e in results if e.actor_id == query.actor_id]
-        if query.action:
-            results = [e for e in results if e.action == query.action]
-        if query.start_time:
-            results = [e for e in results if e.timestamp >= query.start_time]
-        if query.end_time:
-            results = [e for e in results if e.timestamp <= query.end_time]
-
-        return len(results)
+        return len(self._filter(query))
+
+    def _filter(self, query: AuditQuery) -> list[AuditEntry]:
+        return [
+            e
+            for e in self._entries.values()
+            if (not query.entity_type or e.entity_type == query.entity_type)
+            and (not query.entity_id or e.entity_id == query.entity_id)
+            and (not query.actor_id or e.actor_id == query.actor_id)
+            and (not query.action or e.action == query.action)
+            and (not query.start_time or e.timestamp >= query.start_time)
+            and (not query.end_time or e.timestamp <= query.end_time)
+        ]
 
     def clear(self) -> None:
         """Clear all entries (for testing)."""
@@ -360,11 +376,13 @@ class AuditService:
         end_time: datetime | None = None,
         limit: int = 100,
         offset: int = 0,
+        before: tuple[datetime, UUID] | None = None,
     ) -> list[AuditEntry]:
         """
         Query audit entries (TA-0049).
 
-        Returns entries matching the filters.
+        Returns entries matching the filters, newest first. Pass `before`
+        (see decode_cursor) for keyset paging; offset is then ignored.
         """
         query = AuditQuery(
             entity_type=entity_type,
@@ -375,6 +393,7 @@ class AuditService:
             end_time=end_time,
             limit=limit,
             offset=offset,
+            before=before,
         )
         return self._repo.query(query)
 
@@ -0,0 +1,316 @@
+"""
+AuditWriteBehind (E8.1) - Bounded write-behind queue for audit entries.
+
+Wraps an AuditRepoPort so that save() only enqueues; a background thread
+writes entries in batches. Admin mutations no longer wait on an audit INSERT.
+
+Spec refs: E8.1, TA-0048, TA-0049
+
+Key behaviors:
+- save() returns immediately; a flush writes the whole queue in one
+  save_many() call (one transaction for the SQLite repo)
+- The queue is bounded; when it is full, save() writes synchronously
+  instead of dropping, so audit entries are never lost to backpressure
+- Reads (get_by_id/query/count) flush first, so callers see their own writes
+- If a batch write fails with one of the repo's retriable_errors (e.g. a
+  locked database), the batch goes back to the head of the queue and is
+  retried on the next flush, up to max_retries consecutive failures
+- Any other batch failure retries its entries one at a time; an entry that
+  still fails with a non-retriable error is logged and dropped, so one bad
+  entry cannot block the entries queued behind it
+- stop() drains the queue, retrying as above (shutdown hook); stats()
+  reports depth and latency
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.domain.stats import CounterSnapshot
+
+from ._impl import AuditEntry, AuditQuery, AuditRepoPort
+
+logger = logging.getLogger(__name__)
+
+
+# --- Configuration ---
+
+
+@dataclass(frozen=True)
+class WriteBehindConfig:
+    """Audit write-behind configuration."""
+
+    flush_interval_seconds: float = 0.5
+
+    # Wake the writer early once this many entries are queued
+    flush_high_water: int = 200
+
+    # Entries held in memory before save() falls back to a synchronous write
+    max_queue: int = 5_000
+
+    # Consecutive flushes failing with a retriable error before entries are dropped
+    max_retries: int = 5
+
+
+DEFAULT_WRITE_BEHIND_CONFIG = WriteBehindConfig()
+
+
+@dataclass(frozen=True)
+class WriteBehindStats(CounterSnapshot):
+    queue_depth: int
+    enqueued: int
+    sync_writes: int  # save() calls written inline because the queue was full
+    flushes: int
+    flush_errors: int
+    retries: int  # Flushes that requeued their batch after a retriable error
+    entries_flushed: int
+    entries_dropped: int  # Failed even when written on their own
+    last_flush_ms: float
+    max_flush_ms: float
+
+
+# --- Write-behind repository ---
+
+
+class AuditWriteBehind:
+    """
+    AuditRepoPort decorator that defers writes to a background thread.
+
+    The wrapped repo may provide save_many(entries); otherwise entries are
+    written one save() at a time. It may also provide retriable_errors, a
+    tuple of exception types worth retrying (transient storage errors);
+    anything else is treated as a problem with the entries themselves.
+    """
+
+    def __init__(
+        self,
+        repo: AuditRepoPort,
+        config: WriteBehindConfig | None = None,
+    ) -> None:
+        """Initialize write-behind queue."""
+        self._repo = repo
+        self._config = config or DEFAULT_WRITE_BEHIND_CONFIG
+        self._retriable: tuple[type[BaseException], ...] = getattr(repo, "retriable_errors", ())
+        self._failed_attempts = 0
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._queue: deque[AuditEntry] = deque()
+
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._enqueued = 0
+        self._sync_writes = 0
+        self._flushes = 0
+        self._flush_errors = 0
+        self._retries = 0
+        self._flushed = 0
+        self._dropped = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+
+    # --- AuditRepoPort ---
+
+    def save(self, entry: AuditEntry) -> AuditEntry:
+        """Queue entry for the next flush (written inline if the queue is full)."""
+        with self._lock:
+            if len(self._queue) < self._config.max_queue:
+                self._queue.append(entry)
+                self._enqueued += 1
+                depth = len(self._queue)
+            else:
+                depth = -1
+
+        if depth < 0:
+            # Backpressure: keep the entry, pay the write latency this once
+            self.flush()
+            self._repo.save(entry)
+            with self._lock:
+                self._sync_writes += 1
+            return entry
+
+        if not self.is_running:
+            # No writer thread (tests, scripts): behave as write-through
+            self.flush()
+        elif depth >= self._config.flush_high_water:
+            self._wake.set()
+        return entry
+
+    def get_by_id(self, entry_id: UUID) -> AuditEntry | None:
+        """Get entry by ID (after flushing pending writes)."""
+        self.flush()
+        return self._repo.get_by_id(entry_id)
+
+    def query(self, query: AuditQuery) -> list[AuditEntry]:
+        """Query entries (after flushing pending writes)."""
+        self.flush()
+        return self._repo.query(query)
+
+    def count(self, query: AuditQuery) -> int:
+        """Count entries (after flushing pending writes)."""
+        self.flush()
+        return self._repo.count(query)
+
+    # --- Flushing ---
+
+    def flush(self) -> int:
+        """
+        Write every queued entry in one batch.
+
+        Returns the number of entries written. A retriable failure puts the
+        batch back at the head of the queue (until max_retries consecutive
+        failures); any other failure retries each entry on its own and drops
+        the ones that fail with a non-retriable error.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._queue:
+                    return 0
+                batch = list(self._queue)
+                self._queue.clear()
+
+            started = time.perf_counter()
+            retriable = self._retriable_now()
+            failed = True
+            requeue: list[AuditEntry] = []
+            try:
+                self._write(batch)
+                written, failed = len(batch), False
+            except retriable as exc:
+                logger.warning(
+                    "Audit write-behind flush failed (%d entries), will retry: %s",
+                    len(batch),
+                    exc,
+                )
+                written, requeue = 0, batch
+            except Exception:
+                logger.exception("Audit write-behind flush failed (%d entries)", len(batch))
+                written, requeue = self._write_each(batch, retriable)
+
+            self._failed_attempts = self._failed_attempts + 1 if requeue else 0
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                if failed:
+                    self._flush_errors += 1
+                if requeue:
+                    # Oldest first, ahead of entries queued during the flush
+                    self._queue.extendleft(reversed(requeue))
+                    self._retries += 1
+                self._flushes += 1
+                self._flushed += written
+                self._dropped += len(batch) - written - len(requeue)
+                self._last_flush_ms = elapsed_ms
+                self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+            return written
+
+    def _retriable_now(self) -> tuple[type[BaseException], ...]:
+        """Error types to requeue on; none once max_retries is used up."""
+        if self._failed_attempts < self._config.max_retries:
+            return self._retriable
+        return ()
+
+    def _write(self, batch: Sequence[AuditEntry]) -> None:
+        save_many = getattr(self._repo, "save_many", None)
+        if save_many is not None:
+            save_many(batch)
+            return
+        for entry in batch:
+            self._repo.save(entry)
+
+    def _write_each(
+        self,
+        batch: Sequence[AuditEntry],
+        retriable: tuple[type[BaseException], ...],
+    ) -> tuple[int, list[AuditEntry]]:
+        """
+        Save entries one by one. Returns (entries written, entries to requeue).
+
+        Entries failing with a retriable error are requeued; any other
+        failure drops the entry.
+        """
+        written = 0
+        requeue: list[AuditEntry] = []
+        for entry in batch:
+            try:
+                self._repo.save(entry)
+            except retriable:
+                requeue.append(entry)
+                continue
+            except Exception:
+                logger.exception(
+                    "Dropping audit entry %s (%s %s %s)",
+                    entry.id,
+                    entry.action.value,
+                    entry.entity_type.value,
+                    entry.entity_id,
+                )
+                continue
+            written += 1
+        return written, requeue
+
+    # --- Background worker ---
+
+    def start(self) -> None:
+        """Start the background writer thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="audit-write-behind",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background thread and flush whatever is still queued."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        # Retriable failures requeue; keep flushing until entries are written or dropped
+        for _ in range(self._config.max_retries + 1):
+            self.flush()
+            with self._lock:
+                if not self._queue:
+                    break
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self._config.flush_interval_seconds)
+            self._wake.clear()
+            if self._stopping.is_set():
+                break
+            self.flush()
+
+    # --- Monitoring ---
+
+    def stats(self) -> WriteBehindStats:
+        """Snapshot of write-behind counters."""
+        with self._lock:
+            return WriteBehindStats(
+                queue_depth=len(self._queue),
+                enqueued=self._enqueued,
+                sync_writes=self._sync_writes,
+                flushes=self._flushes,
+                flush_errors=self._flush_errors,
+                retries=self._retries,
+                entries_flushed=self._flushed,
+                entries_dropped=self._dropped,
+                last_flush_ms=self._last_flush_ms,
+                max_flush_ms=self._max_flush_ms,
+            )
@@ -281,6 +281,7 @@ def run_list(
         status=inp.status,
         limit=inp.limit,
         offset=inp.offset,
+        include_blocks=inp.include_blocks,
     )
 
     return ContentListOutput(
@@ -65,6 +65,7 @@ class ListContentInput:
     status: ContentStatus | None = None
     limit: int = 50
     offset: int = 0
+    include_blocks: bool = True  # False: projection without blocks for listings
 
 
 @dataclass(frozen=True)
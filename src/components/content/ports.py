@@ -40,8 +40,13 @@ class ContentRepoPort(Protocol):
         status: ContentStatus | None = None,
         limit: int = 50,
         offset: int = 0,
+        include_blocks: bool = True,
     ) -> tuple[builtins.list[ContentItem], int]:
-        """List content with filters. Returns (items, total_count)."""
+        """
+        List content with filters. Returns (items, total_count).
+
+        include_blocks=False skips loading blocks (items have blocks=[]).
+        """
         ...
 
     def get_related_published(
@@ -6,6 +6,7 @@ Spec refs: Link management
 
 # Legacy _impl re-exports for backwards compatibility
 from ._impl import LinkService, validate_link_data
+from ._index import PublicLinkIndex
 from .component import (
     run_create,
     run_delete,
@@ -42,6 +43,8 @@ __all__ = [
     "LinkValidationError",
     # Ports
     "LinkRepoPort",
+    # Click-path index
+    "PublicLinkIndex",
     # Legacy _impl re-exports
     "LinkService",
     "validate_link_data",
@@ -8,7 +8,7 @@ Functional Core - pure business logic.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
 from src.domain.entities import ContentVisibility, LinkItem, LinkStatus
@@ -16,6 +16,9 @@ from src.domain.entities import ContentVisibility, LinkItem, LinkStatus
 from .models import LinkValidationError
 from .ports import LinkRepoPort
 
+if TYPE_CHECKING:
+    from ._index import PublicLinkIndex
+
 # --- Validation Functions ---
 
 
@@ -94,9 +97,10 @@ class LinkService:
     Manages navigation and social links.
     """
 
-    def __init__(self, repo: LinkRepoPort) -> None:
-        """Initialize service."""
+    def __init__(self, repo: LinkRepoPort, index: PublicLinkIndex | None = None) -> None:
+        """Initialize service (index is invalidated after every write)."""
         self._repo = repo
+        self._index = index
 
     def get_all(self) -> list[LinkItem]:
         """Get all links."""
@@ -155,6 +159,7 @@ class LinkService:
 
         # Save
         saved = self._repo.save(link)
+        self._invalidate_index()
         return saved, []
 
     def update(
@@ -223,6 +228,7 @@ class LinkService:
 
         # Save
         saved = self._repo.save(link)
+        self._invalidate_index()
         return saved, []
 
     def delete(self, link_id: UUID) -> tuple[bool, list[LinkValidationError]]:
@@ -244,4 +250,9 @@ class LinkService:
 
         # Delete
         self._repo.delete(link_id)
+        self._invalidate_index()
         return True, []
+
+    def _invalidate_index(self) -> None:
+        if self._index is not None:
+            self._index.invalidate()
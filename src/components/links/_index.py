@@ -0,0 +1,119 @@
+"""
+PublicLinkIndex - In-memory lookup of active public links for click tracking.
+
+The outbound routes resolve a link by slug or ID on every click and check
+free-form targets against the hosts of the site's links. Scanning
+repo.get_all() per click is one full table read per request; this index
+builds the lookups once and serves clicks from memory.
+
+Key behaviors:
+- Only links with status "active" and visibility "public" are indexed
+- get() resolves a slug or a str(UUID); allows_host() checks a target host
+- LinkService invalidates the index on create, update and delete; a load
+  that started before an invalidation is served once but not kept
+- The table is reloaded after max_age_seconds, so writes made by another
+  worker process (or directly through the repo) are picked up
+- reload() builds a new snapshot and swaps it in with a single reference
+  assignment, so readers never see a half-built table
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+from src.domain.entities import LinkItem
+
+from .ports import LinkRepoPort
+
+# Seconds before the table is reloaded to pick up writes from other processes
+MAX_AGE_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class _PublicLinks:
+    by_key: dict[str, LinkItem]  # Slug and str(id) -> link
+    hosts: frozenset[str]
+    loaded_at: float
+
+
+def _build(links: Iterable[LinkItem], loaded_at: float) -> _PublicLinks:
+    by_key: dict[str, LinkItem] = {}
+    hosts: set[str] = set()
+    for link in links:
+        if link.status != "active" or link.visibility != "public":
+            continue
+        # First link wins on a key clash, as in a scan of get_all()
+        by_key.setdefault(link.slug, link)
+        by_key.setdefault(str(link.id), link)
+        host = urlparse(link.url).hostname
+        if host:
+            hosts.add(host)
+    return _PublicLinks(by_key=by_key, hosts=frozenset(hosts), loaded_at=loaded_at)
+
+
+class PublicLinkIndex:
+    """Read-mostly slug/ID/host index over a link repository (thread-safe)."""
+
+    def __init__(
+        self,
+        repo: LinkRepoPort,
+        max_age_seconds: float = MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize index (loaded on first lookup)."""
+        self._repo = repo
+        self._max_age = max_age_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._table: _PublicLinks | None = None
+        self._generation = 0
+        self.reloads = 0
+
+    def get(self, key: str) -> LinkItem | None:
+        """Active public link with this slug or ID."""
+        return self._current().by_key.get(key)
+
+    def allows_host(self, host: str | None) -> bool:
+        """Check if an active public link points to this host."""
+        return host is not None and host in self._current().hosts
+
+    def invalidate(self) -> None:
+        """Drop the table; the next lookup reloads it."""
+        with self._lock:
+            self._generation += 1
+            self._table = None
+
+    def reload(self) -> None:
+        """Load the table from the repository now."""
+        with self._load_lock:
+            self._load()
+
+    def _current(self) -> _PublicLinks:
+        table = self._table
+        if table is not None and self._is_fresh(table):
+            return table
+        # One loader at a time; invalidate() never waits for it
+        with self._load_lock:
+            table = self._table
+            if table is not None and self._is_fresh(table):
+                return table
+            return self._load()
+
+    def _is_fresh(self, table: _PublicLinks) -> bool:
+        return self._clock() - table.loaded_at < self._max_age
+
+    def _load(self) -> _PublicLinks:
+        # Caller holds the load lock
+        with self._lock:
+            generation = self._generation
+        table = _build(self._repo.get_all(), self._clock())
+        with self._lock:
+            if generation == self._generation:
+                self._table = table
+            self.reloads += 1
+        return table
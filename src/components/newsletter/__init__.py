@@ -21,6 +21,13 @@ from src.components.newsletter.component import (
     unsubscribe_subscriber,
     validate_email,
 )
+from src.components.newsletter.export import (
+    EXPORT_FIELDS,
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    export_record,
+    stream_export,
+)
 from src.components.newsletter.models import (
     VALID_TRANSITIONS,
     ConfirmInput,
@@ -69,6 +76,12 @@ __all__ = [
     "unsubscribe_subscriber",
     "build_confirmation_url",
     "build_unsubscribe_url",
+    # Export
+    "stream_export",
+    "export_record",
+    "ExportFormat",
+    "EXPORT_FIELDS",
+    "EXPORT_MEDIA_TYPES",
     # Constants
     "DEFAULT_DISPOSABLE_DOMAINS",
     "EMAIL_REGEX",
@@ -0,0 +1,120 @@
+"""
+Newsletter subscriber export (C10).
+
+Encodes a stream of subscribers as CSV or JSON Lines for admin reporting.
+
+Spec refs: E16.4, TA-0087
+
+Key behaviors:
+- Works on any iterable, so the caller can feed rows straight from a
+  keyset-paginated repo query; nothing is materialised beyond one chunk
+- Output is yielded as bytes in chunks of roughly chunk_bytes
+- Optional gzip framing is applied on the fly (one gzip member)
+- Tokens are never exported (security)
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import zlib
+from collections.abc import Iterable, Iterator
+from typing import Literal
+
+from src.components.newsletter.models import NewsletterSubscriber
+
+ExportFormat = Literal["csv", "jsonl"]
+
+EXPORT_FIELDS = ("email", "status", "created_at", "confirmed_at", "unsubscribed_at")
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+}
+
+DEFAULT_CHUNK_BYTES = 64 * 1024
+
+# zlib window bits for a gzip header and trailer
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def export_record(subscriber: NewsletterSubscriber) -> dict[str, str | None]:
+    """Exported fields of one subscriber (no tokens)."""
+    return {
+        "email": subscriber.email,
+        "status": subscriber.status.value,
+        "created_at": subscriber.created_at.isoformat(),
+        "confirmed_at": subscriber.confirmed_at.isoformat() if subscriber.confirmed_at else None,
+        "unsubscribed_at": (
+            subscriber.unsubscribed_at.isoformat() if subscriber.unsubscribed_at else None
+        ),
+    }
+
+
+def _csv_chunks(subscribers: Iterable[NewsletterSubscriber], chunk_bytes: int) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    for subscriber in subscribers:
+        record = export_record(subscriber)
+        writer.writerow([record[f] or "" for f in EXPORT_FIELDS])
+        if buffer.tell() >= chunk_bytes:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _jsonl_chunks(subscribers: Iterable[NewsletterSubscriber], chunk_bytes: int) -> Iterator[str]:
+    lines: list[str] = []
+    size = 0
+    for subscriber in subscribers:
+        line = json.dumps(export_record(subscriber), separators=(",", ":")) + "\n"
+        lines.append(line)
+        size += len(line)
+        if size >= chunk_bytes:
+            yield "".join(lines)
+            lines.clear()
+            size = 0
+    yield "".join(lines)
+
+
+def stream_export(
+    subscribers: Iterable[NewsletterSubscriber],
+    fmt: ExportFormat = "csv",
+    *,
+    compress: bool = False,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> Iterator[bytes]:
+    """
+    Encode subscribers as CSV (with header row) or JSON Lines.
+
+    Args:
+        subscribers: Subscribers in export order (consumed lazily)
+        fmt: "csv" or "jsonl"
+        compress: Gzip the output
+        chunk_bytes: Approximate size of each uncompressed chunk
+
+    Yields:
+        Non-empty byte chunks
+    """
+    if fmt == "csv":
+        chunks = _csv_chunks(subscribers, chunk_bytes)
+    elif fmt == "jsonl":
+        chunks = _jsonl_chunks(subscribers, chunk_bytes)
+    else:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    if not compress:
+        for chunk in chunks:
+            if chunk:
+                yield chunk.encode("utf-8")
+        return
+
+    compressor = zlib.compressobj(wbits=_GZIP_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
@@ -18,6 +18,8 @@ Spec refs: E16.1, E16.2, E16.3, SM3, I8, I11, R7
 
 from __future__ import annotations
 
+import gzip
+import json
 from datetime import UTC, datetime, timedelta
 from uuid import UUID, uuid4
 
@@ -43,6 +45,7 @@ from src.components.newsletter import (
     generate_token,
     generate_unsubscribe_token,
     is_token_expired,
+    stream_export,
     unsubscribe_subscriber,
     validate_email,
 )
@@ -844,3 +847,44 @@ class TestNewsletterServiceGDPR:
         assert mock_repo.get_by_email("user@example.com") is None
 
 
+class TestStreamExport:
+    """Chunked CSV / JSON Lines export (TA-0087)."""
+
+    @pytest.fixture
+    def subscribers(self) -> list[NewsletterSubscriber]:
+        return [
+            create_subscriber(
+                email=f"user{i}@example.com",
+                confirmation_token=f"token-{i}",
+                unsubscribe_token=f"unsub-{i}",
+            )
+            for i in range(50)
+        ]
+
+    def test_csv_is_chunked(self, subscribers: list[NewsletterSubscriber]) -> None:
+        """Rows are yielded in several chunks, header first."""
+        chunks = list(stream_export(iter(subscribers), "csv", chunk_bytes=256))
+
+        assert len(chunks) > 1
+        lines = b"".join(chunks).decode().splitlines()
+        assert lines[0] == "email,status,created_at,confirmed_at,unsubscribed_at"
+        assert len(lines) == 51
+        assert b"token" not in b"".join(chunks)
+
+    def test_jsonl_records(self, subscribers: list[NewsletterSubscriber]) -> None:
+        """One JSON object per subscriber, no tokens."""
+        body = b"".join(stream_export(subscribers, "jsonl", chunk_bytes=256)).decode()
+
+        records = [json.loads(line) for line in body.splitlines()]
+        assert len(records) == 50
+        assert records[0]["email"] == "user0@example.com"
+        assert records[0]["status"] == "pending"
+        assert records[0]["confirmed_at"] is None
+        assert not any("token" in key for key in records[0])
+
+    def test_gzip_round_trip(self, subscribers: list[NewsletterSubscriber]) -> None:
+        """Compressed chunks concatenate into one valid gzip stream."""
+        plain = b"".join(stream_export(subscribers, "csv"))
+        chunks = list(stream_export(subscribers, "csv", compress=True, chunk_bytes=256))
+
+        assert gzip.decompress(b"".join(chunks)) == plain
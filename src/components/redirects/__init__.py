@@ -14,6 +14,7 @@ from ._impl import (
     RedirectValidationError,
     create_redirect_service,
     detect_loop,
+    find_loops,
     is_absolute_url,
     is_internal_path,
     normalize_path,
@@ -22,6 +23,7 @@ from ._impl import (
     validate_source_path,
     validate_target_path,
 )
+from ._index import CompiledRedirectIndex, RedirectIndexStats, RedirectIndexUnavailableError
 from .component import (
     run,
     run_create,
@@ -73,10 +75,14 @@ __all__ = [
     "RouteCheckerPort",
     "RulesPort",
     # _impl re-exports
+    "CompiledRedirectIndex",
     "RedirectConfig",
+    "RedirectIndexStats",
+    "RedirectIndexUnavailableError",
     "RedirectService",
     "create_redirect_service",
     "detect_loop",
+    "find_loops",
     "is_absolute_url",
     "is_internal_path",
     "normalize_path",
@@ -19,12 +19,16 @@ Key behaviors:
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 from urllib.parse import urlparse
 from uuid import UUID, uuid4
 
+if TYPE_CHECKING:
+    from ._index import CompiledRedirectIndex
+
 # --- Configuration ---
 
 
@@ -117,6 +121,14 @@ class RedirectRepoPort(Protocol):
         ...
 
 
+class RedirectLookupPort(Protocol):
+    """Source-path lookup used to walk chains (repo or compiled index)."""
+
+    def get_by_source(self, source_path: str) -> Redirect | None:
+        """Get redirect by source path."""
+        ...
+
+
 class RouteCheckerPort(Protocol):
     """Interface for checking existing routes."""
 
@@ -254,7 +266,7 @@ def validate_target_path(
 def detect_loop(
     source: str,
     target: str,
-    repo: RedirectRepoPort,
+    repo: RedirectLookupPort,
     config: RedirectConfig = DEFAULT_CONFIG,
 ) -> list[RedirectValidationError]:
     """
@@ -312,7 +324,7 @@ def detect_loop(
 
 def validate_chain_length(
     target: str,
-    repo: RedirectRepoPort,
+    repo: RedirectLookupPort,
     config: RedirectConfig = DEFAULT_CONFIG,
 ) -> list[RedirectValidationError]:
     """
@@ -349,6 +361,52 @@ def validate_chain_length(
     return errors
 
 
+def find_loops(redirects: Iterable[Redirect]) -> dict[str, str]:
+    """
+    Find every rule whose chain runs into a cycle (TA-0043).
+
+    Each source has at most one outgoing edge, so one walk per unvisited
+    node with colour marking classifies the whole graph in O(n).
+
+    Returns:
+        Map of normalized source path to the path where its chain first
+        revisits a node (the rule itself when it sits on the cycle).
+    """
+    edges: dict[str, str] = {}
+    for redirect in redirects:
+        edges.setdefault(normalize_path(redirect.source_path), normalize_path(redirect.target_path))
+
+    entry: dict[str, str | None] = {}
+    on_cycle: set[str] = set()
+
+    for start in edges:
+        if start in entry:
+            continue
+
+        path: list[str] = []
+        position: dict[str, int] = {}
+        node = start
+        while node in edges and node not in entry and node not in position:
+            position[node] = len(path)
+            path.append(node)
+            node = edges[node]
+
+        if node in position:
+            # New cycle: every member loops back to itself
+            cycle = path[position[node] :]
+            for member in cycle:
+                entry[member] = member
+            on_cycle.update(cycle)
+            path = path[: position[node]]
+
+        # Tail nodes inherit the point where their chain enters a cycle
+        for tail in reversed(path):
+            successor = edges[tail]
+            entry[tail] = successor if successor in on_cycle else entry.get(successor)
+
+    return {source: via for source, via in entry.items() if via is not None}
+
+
 def validate_collision(
     source: str,
     route_checker: RouteCheckerPort | None,
@@ -385,6 +443,9 @@ class RedirectService:
     Redirect service (E7.1).
 
     Manages URL redirects with validation.
+
+    When a CompiledRedirectIndex is supplied, resolve() and chain
+    validation read from it and every write rebuilds it.
     """
 
     def __init__(
@@ -393,12 +454,23 @@ class RedirectService:
         route_checker: RouteCheckerPort | None = None,
         time_port: TimePort | None = None,
         config: RedirectConfig | None = None,
+        index: CompiledRedirectIndex | None = None,
     ) -> None:
         """Initialize service."""
         self._repo = repo
         self._route_checker = route_checker
         self._time_port = time_port
         self._config = config or DEFAULT_CONFIG
+        self._index = index
+
+    @property
+    def _lookup(self) -> RedirectLookupPort:
+        """Chain lookups go through the compiled index when available."""
+        return self._index if self._index is not None else self._repo
+
+    def _rules_changed(self) -> None:
+        if self._index is not None:
+            self._index.rebuild()
 
     def _now(self) -> datetime:
         """Get current time via injected port (deterministic core)."""
@@ -467,10 +539,10 @@ class RedirectService:
             return None, errors
 
         # Check for loops (TA-0043)
-        errors.extend(detect_loop(norm_source, norm_target, self._repo, self._config))
+        errors.extend(detect_loop(norm_source, norm_target, self._lookup, self._config))
 
         # Check chain length (TA-0045)
-        errors.extend(validate_chain_length(norm_target, self._repo, self._config))
+        errors.extend(validate_chain_length(norm_target, self._lookup, self._config))
 
         # Check route collision
         errors.extend(
@@ -499,6 +571,7 @@ class RedirectService:
         )
 
         saved = self._repo.save(redirect)
+        self._rules_changed()
         return saved, []
 
     def update(
@@ -549,8 +622,8 @@ class RedirectService:
         # Validate if target changed
         if "target_path" in updates:
             errors.extend(validate_target_path(new_target, self._config))
-            errors.extend(detect_loop(norm_source, norm_target, self._repo, self._config))
-            errors.extend(validate_chain_length(norm_target, self._repo, self._config))
+            errors.extend(detect_loop(norm_source, norm_target, self._lookup, self._config))
+            errors.extend(validate_chain_length(norm_target, self._lookup, self._config))
 
         if errors:
             return redirect, errors
@@ -569,6 +642,7 @@ class RedirectService:
 
         redirect.updated_at = self._now()
         saved = self._repo.save(redirect)
+        self._rules_changed()
         return saved, []
 
     def delete(self, redirect_id: UUID) -> bool:
@@ -578,6 +652,7 @@ class RedirectService:
             return False
 
         self._repo.delete(redirect_id)
+        self._rules_changed()
         return True
 
     def resolve(self, path: str) -> tuple[str, int] | None:
@@ -587,6 +662,9 @@ class RedirectService:
         Returns:
             Tuple of (final_target, status_code) or None if no redirect.
         """
+        if self._index is not None:
+            return self._index.resolve(path)
+
         normalized = normalize_path(path)
         redirect = self._repo.get_by_source(normalized)
 
@@ -624,21 +702,30 @@ class RedirectService:
         results = []
         all_redirects = self._repo.list_all()
 
+        # One pass over the rule graph instead of a chain walk per rule
+        loops = find_loops(all_redirects) if self._config.prevent_loops else {}
+
         for redirect in all_redirects:
             errors: list[RedirectValidationError] = []
 
             # Check target validity
             errors.extend(validate_target_path(redirect.target_path, self._config))
 
-            # Check for loops
-            errors.extend(
-                detect_loop(
-                    redirect.source_path,
-                    redirect.target_path,
-                    self._repo,
-                    self._config,
+            # Check for loops (TA-0043)
+            source = normalize_path(redirect.source_path)
+            via = loops.get(source)
+            if via is not None:
+                if source == normalize_path(redirect.target_path):
+                    message = "Redirect cannot point to itself"
+                else:
+                    message = f"Redirect would create a loop via {via}"
+                errors.append(
+                    RedirectValidationError(
+                        code="redirect_loop",
+                        message=message,
+                        field="target_path",
+                    )
                 )
-            )
 
             if errors:
                 results.append((redirect, errors))
@@ -653,10 +740,12 @@ def create_redirect_service(
     repo: RedirectRepoPort,
     route_checker: RouteCheckerPort | None = None,
     config: RedirectConfig | None = None,
+    index: CompiledRedirectIndex | None = None,
 ) -> RedirectService:
     """Create a RedirectService."""
     return RedirectService(
         repo=repo,
         route_checker=route_checker,
         config=config,
+        index=index,
     )
@@ -0,0 +1,316 @@
+"""
+CompiledRedirectIndex (E7.2) - In-memory redirect table for the public path.
+
+Loads every rule once, pre-collapses enabled chains to their final target
+and status, and answers resolve() with a dict lookup instead of one
+repository round trip per hop.
+
+Spec refs: E7.1, E7.2, TA-0043, TA-0046
+
+Key behaviors:
+- Chains are collapsed at build time with the same hop cap as
+  RedirectService.resolve (max_chain_length)
+- Disabled rules never match and stop a chain, as on the DB path
+- rebuild() compiles a new snapshot and swaps it in with a single
+  reference assignment, so readers never see a half-built table
+- Raw paths that miss are remembered per snapshot in a bounded LRU, so the
+  common no-redirect case skips normalization entirely
+- Repos that provide version() are polled every few seconds and the table
+  is recompiled when it changes, so writes made by another worker process
+  are picked up without a restart
+- start() moves that polling to a background thread; once the table is
+  loaded, resolve() then never queries the repository (resolves_from_memory)
+- A failed load is not retried for a few seconds; until then lookups fail
+  fast instead of sending every request to the database
+- stats() reports lookup hit/miss counters
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.domain.stats import CounterSnapshot
+
+from ._impl import (
+    DEFAULT_CONFIG,
+    Redirect,
+    RedirectConfig,
+    RedirectRepoPort,
+    normalize_path,
+)
+
+logger = logging.getLogger(__name__)
+
+# --- Compiled Table ---
+
+
+# Upper bound on remembered raw-path misses per snapshot (least recent evicted)
+NEGATIVE_CACHE_SIZE = 4_096
+
+# Seconds between repo version() checks for writes made by other processes
+STALENESS_CHECK_SECONDS = 2.0
+
+# Seconds to wait after a failed load before querying the repository again
+LOAD_RETRY_SECONDS = 5.0
+
+
+class RedirectIndexUnavailableError(RuntimeError):
+    """The index could not be loaded and the retry delay has not passed."""
+
+
+@dataclass(frozen=True)
+class _CompiledTable:
+    """Snapshot swapped in by rebuild(); only the miss cache is mutable."""
+
+    rules: dict[str, Redirect]  # Normalized source -> rule (enabled or not)
+    resolved: dict[str, tuple[str, int]]  # Enabled source -> (final target, status)
+    version: Any = None  # repo.version() when compiled
+    # Raw paths known not to redirect, least recently used first
+    misses: OrderedDict[str, None] = field(default_factory=OrderedDict)
+
+
+@dataclass(frozen=True)
+class RedirectIndexStats(CounterSnapshot):
+    rules: int
+    resolvable: int  # Enabled rules in the collapsed table
+    hits: int
+    misses: int
+    negative_cache_hits: int  # Misses answered without normalizing the path
+    negative_cache_size: int
+    rebuilds: int
+
+
+def compile_table(
+    redirects: Iterable[Redirect],
+    config: RedirectConfig = DEFAULT_CONFIG,
+    version: Any = None,
+) -> _CompiledTable:
+    """Build the lookup tables from a full list of rules."""
+    rules: dict[str, Redirect] = {}
+    for redirect in redirects:
+        rules.setdefault(normalize_path(redirect.source_path), redirect)
+
+    resolved: dict[str, tuple[str, int]] = {}
+    for source, redirect in rules.items():
+        if not redirect.enabled:
+            continue
+
+        # Same walk as RedirectService.resolve, paid once per rule at build time
+        final_target = redirect.target_path
+        final_status = redirect.status_code
+        chain_count = 1
+        while chain_count < config.max_chain_length:
+            next_redirect = rules.get(normalize_path(final_target))
+            if next_redirect is None or not next_redirect.enabled:
+                break
+            final_target = next_redirect.target_path
+            final_status = next_redirect.status_code
+            chain_count += 1
+
+        resolved[source] = (final_target, final_status)
+
+    return _CompiledTable(rules=rules, resolved=resolved, version=version)
+
+
+class CompiledRedirectIndex:
+    """
+    Read-mostly redirect table backed by a repository.
+
+    The table is compiled lazily on first use and recompiled by rebuild()
+    after writes. Lookups never touch the repository, except for the
+    periodic version() check when the repo provides one (a cheap query
+    that changes whenever a rule is written) and no background refresher
+    has been started.
+    """
+
+    def __init__(
+        self,
+        repo: RedirectRepoPort,
+        config: RedirectConfig | None = None,
+        check_interval_seconds: float = STALENESS_CHECK_SECONDS,
+        retry_after_seconds: float = LOAD_RETRY_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize index."""
+        self._repo = repo
+        self._config = config or DEFAULT_CONFIG
+        self._check_interval = check_interval_seconds
+        self._retry_after = retry_after_seconds
+        self._clock = clock
+        self._version: Callable[[], Any] | None = getattr(repo, "version", None)
+
+        self._table: _CompiledTable | None = None
+        self._build_lock = threading.Lock()
+        self._miss_lock = threading.Lock()
+        self._checked_at = 0.0
+        self._failed_at: float | None = None
+
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+        # Best-effort counters; only the miss cache takes a lock
+        self._hits = 0
+        self._misses = 0
+        self._negative_hits = 0
+        self._rebuilds = 0
+
+    def _current(self) -> _CompiledTable:
+        table = self._table
+        if table is not None and (
+            self._version is None
+            or self._thread is not None
+            or self._clock() - self._checked_at < self._check_interval
+        ):
+            return table
+
+        with self._build_lock:
+            table = self._table
+            if table is None:
+                return self._load()
+            if self._clock() - self._checked_at < self._check_interval:
+                return table  # Another thread just checked
+            return self._refresh_if_stale(table)
+
+    def _load(self) -> _CompiledTable:
+        """Compile from the repository (caller holds the build lock)."""
+        now = self._clock()
+        if self._failed_at is not None and now - self._failed_at < self._retry_after:
+            raise RedirectIndexUnavailableError("Redirect index failed to load; retrying later")
+        try:
+            version = self._version() if self._version is not None else None
+            table = compile_table(self._repo.list_all(), self._config, version)
+        except Exception:
+            self._failed_at = now
+            raise
+        self._failed_at = None
+        self._checked_at = now
+        self._table = table
+        return table
+
+    def _refresh_if_stale(self, table: _CompiledTable) -> _CompiledTable:
+        """Recompile if the repo changed; keep the last good table on errors."""
+        assert self._version is not None
+        now = self._checked_at = self._clock()
+        if self._failed_at is not None and now - self._failed_at < self._retry_after:
+            return table
+        try:
+            if self._version() == table.version:
+                self._failed_at = None
+                return table
+            table = self._load()
+        except Exception:
+            # Log the first failure of a streak; keep serving the previous rules
+            if self._failed_at is None:
+                logger.exception("Redirect index refresh failed; serving the previous rules")
+            self._failed_at = now
+            return table
+        self._rebuilds += 1
+        return table
+
+    def rebuild(self) -> None:
+        """Recompile from the repository and atomically replace the table."""
+        with self._build_lock:
+            self._failed_at = None
+            self._load()
+            self._rebuilds += 1
+
+    def refresh(self) -> None:
+        """Load the table, or recompile it if the repository version changed."""
+        with self._build_lock:
+            table = self._table
+            if table is None:
+                self._load()
+            elif self._version is not None:
+                self._refresh_if_stale(table)
+
+    # --- Background refresh ---
+
+    def start(self) -> None:
+        """Load and version-check the table from a background thread."""
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="redirect-index", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread; lookups go back to checking inline."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stopping.set()
+        thread.join(timeout=5.0)
+        self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def resolves_from_memory(self) -> bool:
+        """True when resolve() cannot query the repository."""
+        return self._table is not None and (self._version is None or self._thread is not None)
+
+    def _run(self) -> None:
+        failing = False
+        while not self._stopping.is_set():
+            try:
+                self.refresh()
+            except RedirectIndexUnavailableError:
+                pass  # Waiting out the retry delay after a failed load
+            except Exception:
+                # Log the first failure of a streak; lookups keep failing fast
+                if not failing:
+                    logger.exception("Redirect index failed to load")
+                failing = True
+            else:
+                failing = False
+            self._stopping.wait(self._check_interval)
+
+    def resolve(self, path: str) -> tuple[str, int] | None:
+        """Resolve a path to (final_target, status_code), or None."""
+        table = self._current()
+        misses = table.misses
+        with self._miss_lock:
+            if path in misses:
+                misses.move_to_end(path)
+                self._negative_hits += 1
+                self._misses += 1
+                return None
+
+        result = table.resolved.get(normalize_path(path))
+        if result is None:
+            with self._miss_lock:
+                self._misses += 1
+                misses[path] = None
+                if len(misses) > NEGATIVE_CACHE_SIZE:
+                    misses.popitem(last=False)
+        else:
+            self._hits += 1
+        return result
+
+    def get_by_source(self, source_path: str) -> Redirect | None:
+        """Get the rule for a source path (lookup for chain validation)."""
+        return self._current().rules.get(normalize_path(source_path))
+
+    def __len__(self) -> int:
+        return len(self._current().rules)
+
+    def stats(self) -> RedirectIndexStats:
+        """Snapshot of index counters."""
+        table = self._table
+        return RedirectIndexStats(
+            rules=len(table.rules) if table else 0,
+            resolvable=len(table.resolved) if table else 0,
+            hits=self._hits,
+            misses=self._misses,
+            negative_cache_hits=self._negative_hits,
+            negative_cache_size=len(table.misses) if table else 0,
+            rebuilds=self._rebuilds,
+        )
@@ -14,19 +14,27 @@ from src.core.services.render_posts import (
     render_hard_break,
     render_heading,
     render_horizontal_rule,
-    render_image,
     render_list_item,
-    render_node,
     render_ordered_list,
     render_paragraph,
     render_text,
 )
 
+from ._engine import (
+    RenderCacheStats,
+    RenderedDocument,
+    RenderEngine,
+    document_cache_key,
+    get_render_engine,
+    render_document,
+)
 from ._impl import (
     DEFAULT_RENDER_CONFIG,
     PostRenderer,
     RenderConfig,
     create_post_renderer,
+    render_image,
+    render_node,
     render_post_body,
     render_rich_text,
 )
@@ -41,12 +49,14 @@ from .models import (
     ExtractTextInput,
     Heading,
     HeadingsOutput,
+    ImageVariant,
     RenderPostInput,
     RenderPostOutput,
     RenderPostsValidationError,
+    ResponsiveImage,
     TextOutput,
 )
-from .ports import RichTextPort, RulesPort
+from .ports import ResponsiveImagePort, RichTextPort, RulesPort
 
 __all__ = [
     # Entry points
@@ -64,14 +74,27 @@ __all__ = [
     "RenderPostOutput",
     "RenderPostsValidationError",
     "TextOutput",
+    # Responsive images
+    "ImageVariant",
+    "ResponsiveImage",
     # Ports
+    "ResponsiveImagePort",
     "RichTextPort",
     "RulesPort",
+    # Render engine
+    "RenderCacheStats",
+    "RenderEngine",
+    "RenderedDocument",
+    "document_cache_key",
+    "get_render_engine",
+    "render_document",
     # Legacy _impl re-exports
     "DEFAULT_RENDER_CONFIG",
     "PostRenderer",
     "RenderConfig",
     "create_post_renderer",
+    "render_image",
+    "render_node",
     "render_post_body",
     "render_rich_text",
     # Legacy service re-exports
@@ -82,9 +105,7 @@ __all__ = [
     "render_hard_break",
     "render_heading",
     "render_horizontal_rule",
-    "render_image",
     "render_list_item",
-    "render_node",
     "render_ordered_list",
     "render_paragraph",
     "render_text",
@@ -0,0 +1,426 @@
+"""
+Render Engine (E4.4) - Single-pass rich text renderer with a render cache.
+
+Renders a ProseMirror-style document to HTML iteratively, appending to one
+output list instead of building a string per node, and collects the plain
+text and the heading outline in the same walk. Results are cached per
+document, so a preview that asks for HTML, text and headings (or re-renders
+an unchanged draft) walks the tree once.
+
+Spec refs: E4.4, TA-0025
+Test assertions:
+- TA-0025: Rich text renders to valid semantic HTML
+
+Key behaviors:
+- Output is identical to the recursive node renderers (render_node)
+- Explicit stack, so deeply nested documents cannot hit the recursion limit
+- Cache key is a SHA-256 of the document plus the RenderConfig (and whether
+  the document was sanitized first). The document is serialized with
+  marshal: exact and type-preserving for JSON values, and several times
+  cheaper than json.dumps on large documents
+- Images known to config.image_sources get srcset/sizes and intrinsic
+  width/height; the source's repr (part of the key) changes when a new
+  image gains variants, so cached renders pick them up
+- Bounded LRU; stats() reports hits, misses and evictions
+- Cached results are shared: treat RenderedDocument fields as read-only
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import json
+import marshal
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from src.components.richtext import (
+    RichTextConfig,
+    RichTextService,
+    build_link_rel,
+    is_safe_url,
+)
+from src.domain.stats import CacheCounters
+
+if TYPE_CHECKING:
+    from ._impl import RenderConfig
+
+DEFAULT_RENDER_CACHE_SIZE = 256
+
+_WHITESPACE = re.compile(r"\s+")
+_NON_SLUG = re.compile(r"[^a-z0-9-]")
+_HYPHENS = re.compile(r"-+")
+
+# Stack operations
+_NODE = 0
+_EMIT = 1
+_HEADING = 2
+
+# Nodes rendered as a plain wrapper around their children
+_WRAPPERS: dict[str, tuple[str, str]] = {
+    "paragraph": ("<p>", "</p>"),
+    "blockquote": ("<blockquote>", "</blockquote>"),
+    "bulletList": ("<ul>", "</ul>"),
+    "listItem": ("<li>", "</li>"),
+}
+
+
+def _slugify(text: str) -> str:
+    """Create URL-safe slug from text (same rules as the node renderers)."""
+    slug = _WHITESPACE.sub("-", text.lower().strip())
+    slug = _NON_SLUG.sub("", slug)
+    return _HYPHENS.sub("-", slug).strip("-")
+
+
+# --- Results ---
+
+
+@dataclass(frozen=True)
+class RenderedDocument:
+    """Everything a single render pass produces."""
+
+    html: str
+    plain_text: str
+    headings: tuple[dict[str, Any], ...]
+
+    # Set when rendered with sanitize=True
+    sanitized: dict[str, Any] | None = None
+    changes: tuple[Any, ...] = ()  # RichTextValidationError (code, message, path)
+
+    def heading_list(self) -> list[dict[str, Any]]:
+        """Headings as fresh dicts (safe for callers to modify)."""
+        return [dict(h) for h in self.headings]
+
+
+@dataclass(frozen=True)
+class RenderCacheStats(CacheCounters):
+    evictions: int
+    size: int
+    max_size: int
+
+
+# --- Single-pass renderer ---
+
+
+class _Pass:
+    """State for one render walk."""
+
+    __slots__ = ("config", "rt_config", "rel", "out", "text", "headings")
+
+    def __init__(self, config: RenderConfig) -> None:
+        self.config = config
+        self.rt_config = config.rich_text_config or RichTextConfig()
+        self.rel = build_link_rel(self.rt_config)
+        self.out: list[str] = []
+        self.text: list[str] = []
+        self.headings: list[dict[str, Any]] = []
+
+    def run(self, root: dict[str, Any]) -> None:
+        out = self.out
+        text = self.text
+        stack: list[tuple[Any, ...]] = [(_NODE, root)]
+
+        while stack:
+            item = stack.pop()
+            op = item[0]
+            if op == _EMIT:
+                out.append(item[1])
+                continue
+            if op == _HEADING:
+                self._close_heading(*item[1:])
+                continue
+
+            node: dict[str, Any] = item[1]
+            node_type = node.get("type", "")
+
+            if node_type == "text":
+                value = node.get("text", "")
+                if value:
+                    text.append(value)
+                    self._text(value, node.get("marks"))
+                continue
+
+            wrapper = _WRAPPERS.get(node_type)
+            if wrapper is not None:
+                out.append(wrapper[0])
+                stack.append((_EMIT, wrapper[1]))
+            elif node_type == "heading":
+                self._open_heading(node, stack)
+            elif node_type == "orderedList":
+                start = node.get("attrs", {}).get("start", 1)
+                out.append(f'<ol start="{html.escape(str(start))}">' if start != 1 else "<ol>")
+                stack.append((_EMIT, "</ol>"))
+            elif node_type in ("codeBlock", "image", "hardBreak", "horizontalRule"):
+                self._leaf(node, node_type)
+                continue
+            # doc and unknown node types render their children unwrapped
+
+            children = node.get("content")
+            if children:
+                stack.extend((_NODE, child) for child in reversed(children))
+
+    # --- Inline ---
+
+    def _text(self, value: str, marks: list[dict[str, Any]] | None) -> None:
+        escaped = html.escape(value)
+        if not marks:
+            self.out.append(escaped)
+            return
+
+        closes: list[str] = []
+        for mark in marks:
+            tags = self._mark_tags(mark)
+            if tags is not None:
+                self.out.append(tags[0])
+                closes.append(tags[1])
+        self.out.append(escaped)
+        self.out.extend(reversed(closes))
+
+    def _mark_tags(self, mark: dict[str, Any]) -> tuple[str, str] | None:
+        mark_type = mark.get("type", "")
+        if mark_type in ("bold", "strong"):
+            return "<strong>", "</strong>"
+        if mark_type in ("italic", "em"):
+            return "<em>", "</em>"
+        if mark_type == "code":
+            return "<code>", "</code>"
+        if mark_type == "link":
+            attrs = mark.get("attrs", {})
+            href = attrs.get("href", "")
+            if not is_safe_url(href, self.rt_config):
+                return None  # Strip unsafe link, keep its text
+            title = attrs.get("title", "")
+            if title:
+                return (
+                    f'<a href="{html.escape(href)}" rel="{self.rel}" title="{html.escape(title)}">',
+                    "</a>",
+                )
+            return f'<a href="{html.escape(href)}" rel="{self.rel}">', "</a>"
+        return None
+
+    # --- Headings ---
+
+    def _open_heading(self, node: dict[str, Any], stack: list[tuple[Any, ...]]) -> None:
+        # The id depends on the heading's text, so its opening tag is a
+        # placeholder filled in once the children have been rendered
+        self.out.append("")
+        self.headings.append({})
+        level = node.get("attrs", {}).get("level", 1)
+        stack.append((_HEADING, level, len(self.out) - 1, len(self.text), len(self.headings) - 1))
+
+    def _close_heading(self, level: Any, open_at: int, text_at: int, heading_at: int) -> None:
+        heading_text = "".join(self.text[text_at:])
+        slug = _slugify(heading_text)
+        self.headings[heading_at] = {"level": level, "text": heading_text, "id": slug}
+
+        tag = f"h{max(1, min(6, level))}"
+        if self.config.add_heading_ids and slug:
+            self.out[open_at] = f'<{tag} id="{slug}">'
+        else:
+            self.out[open_at] = f"<{tag}>"
+        self.out.append(f"</{tag}>")
+
+    # --- Leaf blocks ---
+
+    def _leaf(self, node: dict[str, Any], node_type: str) -> None:
+        # Leaf renderers ignore children, but their text still counts
+        text_at = len(self.text)
+        self._collect_text(node)
+
+        if node_type == "codeBlock":
+            code = html.escape("".join(self.text[text_at:]))
+            language = node.get("attrs", {}).get("language", "")
+            css = self.config.code_block_class
+            if language:
+                self.out.append(
+                    f'<pre class="{css}"><code class="language-{html.escape(language)}">'
+                    f"{code}</code></pre>"
+                )
+            else:
+                self.out.append(f'<pre class="{css}"><code>{code}</code></pre>')
+        elif node_type == "image":
+            self.out.append(self._image(node.get("attrs", {})))
+        elif node_type == "hardBreak":
+            self.out.append("<br />")
+        else:
+            self.out.append("<hr />")
+
+    def _image(self, attrs: dict[str, Any]) -> str:
+        return image_tag(attrs, self.config, self.rt_config)
+
+    def _collect_text(self, node: dict[str, Any]) -> None:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.get("type") == "text":
+                value = current.get("text", "")
+                if value:
+                    self.text.append(value)
+                continue
+            children = current.get("content")
+            if children:
+                stack.extend(reversed(children))
+
+
+def render_document(doc: dict[str, Any], config: RenderConfig) -> RenderedDocument:
+    """Render HTML, plain text and headings in one uncached pass."""
+    walk = _Pass(config)
+    walk.run(doc)
+
+    body = "".join(walk.out)
+    if config.wrap_in_article:
+        body = f"<article>{body}</article>"
+
+    return RenderedDocument(
+        html=body,
+        plain_text="".join(walk.text),
+        headings=tuple(walk.headings),
+    )
+
+
+def image_tag(
+    attrs: dict[str, Any],
+    config: RenderConfig,
+    rt_config: RichTextConfig | None = None,
+) -> str:
+    """
+    Render an <img> tag ("" for an unsafe src).
+
+    When config.image_sources knows the src, the tag gets srcset/sizes for
+    its smaller variants and the intrinsic width/height (unless the node
+    sets them), so the browser reserves space before the image loads.
+    """
+    src = attrs.get("src", "")
+    if not is_safe_url(src, rt_config or config.rich_text_config or RichTextConfig()):
+        return ""  # Skip unsafe images
+
+    responsive = config.image_sources.responsive_image(src) if config.image_sources else None
+    width = attrs.get("width")
+    height = attrs.get("height")
+    if responsive is not None and not width and not height:
+        width, height = responsive.width, responsive.height
+
+    parts = [f'src="{html.escape(src)}"', f'alt="{html.escape(attrs.get("alt", ""))}"']
+    title = attrs.get("title", "")
+    if title:
+        parts.append(f'title="{html.escape(title)}"')
+    if width:
+        parts.append(f'width="{html.escape(str(width))}"')
+    if height:
+        parts.append(f'height="{html.escape(str(height))}"')
+    if responsive is not None and responsive.variants:
+        # The original is the largest candidate
+        candidates = [f"{v.url} {v.width}w" for v in responsive.variants]
+        candidates.append(f"{src} {responsive.width}w")
+        parts.append(f'srcset="{html.escape(", ".join(candidates))}"')
+        parts.append(f'sizes="{html.escape(config.image_sizes)}"')
+    parts.append(f'loading="{config.image_loading}"')
+    return f"<img {' '.join(parts)} />"
+
+
+# --- Cached engine ---
+
+
+def document_cache_key(
+    doc: dict[str, Any],
+    config: RenderConfig,
+    *,
+    sanitize: bool = False,
+) -> str:
+    """Hash of the document and everything that affects its render (stable per process)."""
+    try:
+        payload = marshal.dumps(doc)
+    except ValueError:
+        # Values outside the JSON types (e.g. datetimes): fall back to JSON text
+        payload = json.dumps(doc, sort_keys=True, default=str).encode()
+    hasher = hashlib.sha256(payload)
+    hasher.update(f"\0{config!r}\0{sanitize}".encode())
+    return hasher.hexdigest()
+
+
+class RenderEngine:
+    """
+    Render cache in front of render_document().
+
+    Thread-safe. Identical documents rendered with the same config are
+    rendered once; the LRU bounds memory for long-running admin sessions.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_RENDER_CACHE_SIZE) -> None:
+        """Initialize engine with an empty cache."""
+        self._max_entries = max_entries
+        self._cache: OrderedDict[str, RenderedDocument] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def render(
+        self,
+        doc: dict[str, Any],
+        config: RenderConfig,
+        *,
+        sanitize: bool = False,
+    ) -> RenderedDocument:
+        """
+        Render a document (from cache when unchanged).
+
+        With sanitize=True the document is passed through RichTextService.sanitize
+        first and the sanitized document and changes are cached with the HTML.
+        """
+        key = document_cache_key(doc, config, sanitize=sanitize)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        if sanitize:
+            service = RichTextService(config.rich_text_config or RichTextConfig())
+            sanitized, changes = service.sanitize(doc)
+            rendered = render_document(sanitized, config)
+            result = RenderedDocument(
+                html=rendered.html,
+                plain_text=rendered.plain_text,
+                headings=rendered.headings,
+                sanitized=sanitized,
+                changes=tuple(changes),
+            )
+        else:
+            result = render_document(doc, config)
+
+        if self._max_entries > 0:
+            with self._lock:
+                self._cache[key] = result
+                while len(self._cache) > self._max_entries:
+                    self._cache.popitem(last=False)
+                    self._evictions += 1
+        return result
+
+    def clear(self) -> None:
+        """Drop every cached render."""
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> RenderCacheStats:
+        """Snapshot of cache counters."""
+        with self._lock:
+            return RenderCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._cache),
+                max_size=self._max_entries,
+            )
+
+
+@lru_cache(maxsize=1)
+def get_render_engine() -> RenderEngine:
+    """Process-wide render engine shared by PostRenderer and the preview API."""
+    return RenderEngine()
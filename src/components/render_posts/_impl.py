@@ -12,6 +12,8 @@ Key behaviors:
 - Applies sanitization during rendering
 - Adds security attributes to links
 - Generates semantic HTML structure
+- render_rich_text and PostRenderer go through the shared RenderEngine
+  (single pass, cached); the per-node renderers below remain the reference
 """
 
 from __future__ import annotations
@@ -26,8 +28,14 @@ from src.components.richtext import (
     is_safe_url,
 )
 
+from ._engine import RenderedDocument, get_render_engine, image_tag
+from .ports import ResponsiveImagePort
+
 # --- Configuration ---
 
+# Images fill the content column, which is at most 768px wide
+DEFAULT_IMAGE_SIZES = "(max-width: 768px) 100vw, 768px"
+
 
 @dataclass(frozen=True)
 class RenderConfig:
@@ -42,6 +50,10 @@ class RenderConfig:
     code_block_class: str = "code-block"
     image_loading: str = "lazy"  # lazy, eager
 
+    # Responsive images: variant lookup and the srcset sizes hint
+    image_sources: ResponsiveImagePort | None = None
+    image_sizes: str = DEFAULT_IMAGE_SIZES
+
 
 DEFAULT_RENDER_CONFIG = RenderConfig()
 
@@ -222,33 +234,8 @@ def render_image(
     node: dict[str, Any],
     config: RenderConfig = DEFAULT_RENDER_CONFIG,
 ) -> str:
-    """Render an image."""
-    attrs = node.get("attrs", {})
-    src = attrs.get("src", "")
-    alt = attrs.get("alt", "")
-    title = attrs.get("title", "")
-    width = attrs.get("width")
-    height = attrs.get("height")
-
-    rt_config = config.rich_text_config or RichTextConfig()
-
-    # Validate URL
-    if not is_safe_url(src, rt_config):
-        return ""  # Skip unsafe images
-
-    parts = [f'src="{_escape(src)}"']
-    parts.append(f'alt="{_escape(alt)}"')
-
-    if title:
-        parts.append(f'title="{_escape(title)}"')
-    if width:
-        parts.append(f'width="{_escape(str(width))}"')
-    if height:
-        parts.append(f'height="{_escape(str(height))}"')
-
-    parts.append(f'loading="{config.image_loading}"')
-
-    return f"<img {' '.join(parts)} />"
+    """Render an image (with srcset/sizes when config.image_sources knows it)."""
+    return image_tag(node.get("attrs", {}), config)
 
 
 def render_hard_break(
@@ -346,12 +333,7 @@ def render_rich_text(
     Returns:
         Rendered HTML string
     """
-    content = render_node(doc, config)
-
-    if config.wrap_in_article:
-        return f"<article>{content}</article>"
-
-    return content
+    return get_render_engine().render(doc, config).html
 
 
 def render_post_body(
@@ -394,41 +376,21 @@ class PostRenderer:
         """Render document to HTML."""
         return render_rich_text(doc, self._config)
 
+    def render_all(self, doc: dict[str, Any], *, sanitize: bool = False) -> RenderedDocument:
+        """Render HTML, plain text and headings in one (cached) pass."""
+        return get_render_engine().render(doc, self._config, sanitize=sanitize)
+
     def render_post(self, rich_text_json: dict[str, Any]) -> str:
         """Render a post body."""
         return render_post_body(rich_text_json, self._config)
 
     def extract_text(self, doc: dict[str, Any]) -> str:
         """Extract plain text from document."""
-        return _extract_text(doc)
+        return self.render_all(doc).plain_text
 
     def extract_headings(self, doc: dict[str, Any]) -> list[dict[str, Any]]:
         """Extract headings for table of contents."""
-        headings: list[dict[str, Any]] = []
-        self._collect_headings(doc, headings)
-        return headings
-
-    def _collect_headings(
-        self,
-        node: dict[str, Any],
-        headings: list[dict[str, Any]],
-    ) -> None:
-        """Recursively collect headings."""
-        if node.get("type") == "heading":
-            attrs = node.get("attrs", {})
-            level = attrs.get("level", 1)
-            text = _extract_text(node)
-            slug = _slugify(text)
-            headings.append(
-                {
-                    "level": level,
-                    "text": text,
-                    "id": slug,
-                }
-            )
-
-        for child in node.get("content", []):
-            self._collect_headings(child, headings)
+        return self.render_all(doc).heading_list()
 
 
 # --- Factory ---
@@ -33,6 +33,26 @@ class Heading:
     id: str
 
 
+# --- Responsive Image Models ---
+
+
+@dataclass(frozen=True)
+class ImageVariant:
+    """A downscaled rendition of an image, for srcset."""
+
+    url: str
+    width: int
+
+
+@dataclass(frozen=True)
+class ResponsiveImage:
+    """Intrinsic size and smaller renditions of an image source."""
+
+    width: int
+    height: int
+    variants: tuple[ImageVariant, ...] = ()
+
+
 # --- Input Models ---
 
 
@@ -8,6 +8,21 @@ from __future__ import annotations
 
 from typing import Any, Protocol
 
+from .models import ResponsiveImage
+
+
+class ResponsiveImagePort(Protocol):
+    """
+    Port for looking up responsive renditions of an image src.
+
+    Its repr is part of the render cache key, so it must change whenever
+    a lookup result can change.
+    """
+
+    def responsive_image(self, src: str) -> ResponsiveImage | None:
+        """Get intrinsic size and variants for src (None if unknown)."""
+        ...
+
 
 class RichTextPort(Protocol):
     """Port for rich text component operations."""
@@ -10,10 +10,7 @@ from src.core.services.richtext import (
     RichTextNode,
     count_links,
     create_rich_text_service,
-    parse_attributes,
     sanitize_document,
-    sanitize_html,
-    sanitize_url,
     validate_link_count,
     validate_mark_attrs,
     validate_mark_type,
@@ -29,7 +26,11 @@ from ._impl import (
     RichTextService,
     build_link_rel,
     is_safe_url,
+    parse_attributes,
+    sanitize_html,
+    sanitize_url,
 )
+from ._sanitizer import HTMLSanitizer
 from .component import (
     run,
     run_sanitize,
@@ -69,14 +70,15 @@ __all__ = [
     "RichTextService",
     "build_link_rel",
     "is_safe_url",
+    "parse_attributes",
+    "sanitize_html",
+    "sanitize_url",
+    "HTMLSanitizer",
     # Legacy service re-exports
     "RichTextNode",
     "count_links",
     "create_rich_text_service",
-    "parse_attributes",
     "sanitize_document",
-    "sanitize_html",
-    "sanitize_url",
     "validate_link_count",
     "validate_mark_attrs",
     "validate_mark_type",
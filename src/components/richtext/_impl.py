@@ -19,9 +19,9 @@ Key behaviors:
 
 from __future__ import annotations
 
-import html
 import json
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -96,6 +96,7 @@ class RichTextValidationError:
     code: str
     message: str
     path: str | None = None
+    count: int = 1  # occurrences folded into this error
 
 
 # --- Rich Text Node Schema ---
@@ -309,6 +310,23 @@ def validate_schema(
 
 # --- Link Sanitization (TA-0022) ---
 
+# Ignored when matching a scheme. The WHATWG URL parser trims C0 controls and
+# spaces at the ends and drops tabs and newlines anywhere, so "java\tscript:"
+# still runs as javascript:. Dropping every C0 control, space, DEL and U+FFFD
+# (what the HTML parser makes of NUL) anywhere is stricter than browsers.
+_SCHEME_NOISE = re.compile(r"[\x00-\x20\x7f\ufffd]+")
+
+
+def has_forbidden_protocol(url: str, protocols: Iterable[str]) -> bool:
+    """
+    Check if URL starts with one of protocols (e.g. "javascript:").
+
+    The scheme is compared after removing the characters a browser would
+    ignore (_SCHEME_NOISE), so obfuscated schemes are caught.
+    """
+    url_lower = _SCHEME_NOISE.sub("", url).lower()
+    return any(url_lower.startswith(protocol) for protocol in protocols)
+
 
 def is_safe_url(url: str, config: RichTextConfig = DEFAULT_CONFIG) -> bool:
     """
@@ -318,15 +336,7 @@ def is_safe_url(url: str, config: RichTextConfig = DEFAULT_CONFIG) -> bool:
     """
     if not url:
         return True
-
-    url_lower = url.lower().strip()
-
-    # Check for forbidden protocols
-    for protocol in config.forbid_protocols:
-        if url_lower.startswith(protocol):
-            return False
-
-    return True
+    return not has_forbidden_protocol(url, config.forbid_protocols)
 
 
 def sanitize_url(url: str, config: RichTextConfig = DEFAULT_CONFIG) -> str | None:
@@ -382,104 +392,14 @@ def sanitize_html(
     Adds security attributes to links.
     Blocks forbidden protocols.
 
+    Repeated warnings are reported once, with a count (see HTMLSanitizer).
+
     Returns:
         Tuple of (sanitized_html, list of errors/warnings)
     """
-    errors: list[RichTextValidationError] = []
-    link_count = 0
-
-    def process_tag(match: re.Match[str]) -> str:
-        nonlocal link_count
-
-        is_closing = bool(match.group(1))
-        tag_name = match.group(2).lower()
-        attr_string = match.group(3)
-
-        # Check if tag is allowed
-        if tag_name not in config.allow_tags:
-            errors.append(
-                RichTextValidationError(
-                    code="stripped_tag",
-                    message=f"Tag '{tag_name}' was stripped",
-                )
-            )
-            return ""
-
-        if is_closing:
-            return f"</{tag_name}>"
-
-        # Parse and filter attributes
-        attrs = parse_attributes(attr_string)
-        allowed_attrs = config.allow_attrs.get(tag_name, frozenset())
-
-        filtered_attrs: dict[str, str] = {}
-        for name, value in attrs.items():
-            if name in allowed_attrs:
-                filtered_attrs[name] = value
-            else:
-                errors.append(
-                    RichTextValidationError(
-                        code="stripped_attribute",
-                        message=f"Attribute '{name}' stripped from '{tag_name}'",
-                    )
-                )
-
-        # Special handling for links
-        if tag_name == "a":
-            link_count += 1
-
-            # Check link limit
-            if link_count > config.max_links_per_doc:
-                errors.append(
-                    RichTextValidationError(
-                        code="max_links_exceeded",
-                        message=f"Maximum {config.max_links_per_doc} links allowed",
-                    )
-                )
-                return ""
-
-            # Sanitize href
-            href = filtered_attrs.get("href", "")
-            sanitized_href = sanitize_url(href, config)
-            if sanitized_href is None:
-                errors.append(
-                    RichTextValidationError(
-                        code="unsafe_url",
-                        message=f"Unsafe URL protocol in href: {href[:50]}",
-                    )
-                )
-                return ""
-            filtered_attrs["href"] = sanitized_href
-
-            # Add rel attributes
-            rel = build_link_rel(config)
-            if rel:
-                filtered_attrs["rel"] = rel
-
-        # Special handling for images
-        if tag_name == "img":
-            src = filtered_attrs.get("src", "")
-            sanitized_src = sanitize_url(src, config)
-            if sanitized_src is None:
-                errors.append(
-                    RichTextValidationError(
-                        code="unsafe_url",
-                        message=f"Unsafe URL protocol in src: {src[:50]}",
-                    )
-                )
-                return ""
-            filtered_attrs["src"] = sanitized_src
-
-        # Rebuild tag
-        if filtered_attrs:
-            attr_parts = [
-                f'{name}="{html.escape(value)}"' for name, value in filtered_attrs.items()
-            ]
-            return f"<{tag_name} {' '.join(attr_parts)}>"
-        return f"<{tag_name}>"
+    from ._sanitizer import HTMLSanitizer
 
-    sanitized = TAG_PATTERN.sub(process_tag, html_content)
-    return sanitized, errors
+    return HTMLSanitizer(config).sanitize(html_content)
 
 
 # --- Document Sanitization ---
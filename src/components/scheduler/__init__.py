@@ -13,10 +13,12 @@ from src.core.services.scheduler import (
 )
 
 from ._impl import (
+    ScheduleListener,
     SchedulerConfig,
     SchedulerError,
     SchedulerService,
     create_publish_job,
+    job_due_at,
 )
 from .component import (
     run,
@@ -76,6 +78,8 @@ __all__ = [
     "SchedulerError",
     "SchedulerService",
     "create_publish_job",
+    "ScheduleListener",
+    "job_due_at",
     # Legacy service re-exports
     "calculate_next_retry",
     "check_idempotency",
@@ -15,10 +15,15 @@ Key behaviors:
 - Workers claim jobs atomically to prevent double execution
 - Failed jobs retry with exponential backoff
 - DST-safe scheduling via TimePort
+- Due jobs are claimed in batches (one UPDATE ... RETURNING on repos
+  that provide claim_due_jobs)
+- Optional on_change listener is told whenever a job's due time changes,
+  so a worker can wake without polling
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Protocol
@@ -76,6 +81,8 @@ __all__ = [
     "PublishJobRepoPort",
     "SchedulerService",
     "ExecutionResult",
+    "ScheduleListener",
+    "job_due_at",
 ]
 
 # --- Repository Protocol ---
@@ -160,6 +167,20 @@ class TimePort(Protocol):
         ...
 
 
+# Called with (job_id, due_at_utc); due_at_utc is None when the job is no
+# longer pending (cancelled)
+ScheduleListener = Callable[[UUID, datetime | None], None]
+
+
+def job_due_at(job: PublishJob) -> datetime | None:
+    """When a pending job next becomes runnable (None if not pending)."""
+    if job.status == "queued":
+        return job.publish_at_utc
+    if job.status == "retry_wait":
+        return job.next_retry_at or job.publish_at_utc
+    return None
+
+
 # --- Backoff Calculation ---
 
 
@@ -262,12 +283,19 @@ class SchedulerService:
         publisher: ContentPublisherPort | None = None,
         time_port: TimePort | None = None,
         config: SchedulerConfig | None = None,
+        on_change: ScheduleListener | None = None,
     ) -> None:
         """Initialize scheduler service."""
         self._repo = repo
         self._publisher = publisher
         self._time = time_port
         self._config = config or DEFAULT_CONFIG
+        self._on_change = on_change
+
+    def _notify(self, job_id: UUID, due_at: datetime | None) -> None:
+        """Tell the listener (if any) that a job's due time changed."""
+        if self._on_change is not None:
+            self._on_change(job_id, due_at)
 
     def _now_utc(self) -> datetime:
         """Get current UTC time via injected port (deterministic core)."""
@@ -298,6 +326,8 @@ class SchedulerService:
         self,
         content_id: UUID,
         publish_at_utc: datetime,
+        *,
+        notify: bool = True,
     ) -> tuple[PublishJob | None, list[SchedulerError]]:
         """
         Schedule content for publishing (TA-0028).
@@ -307,6 +337,8 @@ class SchedulerService:
         Args:
             content_id: Content to publish
             publish_at_utc: Target publish time (UTC)
+            notify: Tell the on_change listener (False when the caller
+                executes the job itself, so a worker does not race it)
 
         Returns:
             Tuple of (job, errors). Job is None if errors.
@@ -337,6 +369,8 @@ class SchedulerService:
         # Create new job
         job = create_publish_job(content_id, publish_at_utc, now)
         saved = self._repo.save(job)
+        if notify:
+            self._notify(saved.id, saved.publish_at_utc)
         return saved, []
 
     def unschedule(self, job_id: UUID) -> tuple[bool, list[SchedulerError]]:
@@ -372,6 +406,7 @@ class SchedulerService:
             return False, errors
 
         self._repo.delete(job_id)
+        self._notify(job_id, None)
         return True, []
 
     def reschedule(
@@ -441,6 +476,7 @@ class SchedulerService:
         job.publish_at_utc = new_publish_at_utc
         job.updated_at = self._now_utc()
         saved = self._repo.save(job)
+        self._notify(saved.id, saved.publish_at_utc)
         return saved, []
 
     # --- Job Claiming (TA-0029) ---
@@ -479,6 +515,31 @@ class SchedulerService:
         claimed = self._repo.claim_job(job.id, worker_id, now)
         return claimed
 
+    def claim_due(
+        self,
+        worker_id: str,
+        limit: int = 10,
+    ) -> list[PublishJob]:
+        """
+        Claim up to limit due jobs for execution (TA-0029).
+
+        Uses the repo's batch claim when it has one (a single atomic
+        UPDATE ... RETURNING); otherwise claims one job at a time.
+        """
+        claim_batch = getattr(self._repo, "claim_due_jobs", None)
+        if claim_batch is None:
+            claimed: list[PublishJob] = []
+            while len(claimed) < limit:
+                job = self.claim_next(worker_id)
+                if job is None:
+                    break
+                claimed.append(job)
+            return claimed
+
+        # The batch query only selects jobs whose publish time has passed (R3)
+        jobs: list[PublishJob] = claim_batch(worker_id, self._now_utc(), limit)
+        return jobs
+
     def execute_job(
         self,
         job: PublishJob,
@@ -565,6 +626,7 @@ class SchedulerService:
             job.next_retry_at = next_retry
             job.claimed_by = None  # Release claim
             self._repo.save(job)
+            self._notify(job.id, next_retry)
 
             return ExecutionResult(
                 success=False,
@@ -601,17 +663,7 @@ class SchedulerService:
         Returns:
             List of execution results
         """
-        results: list[ExecutionResult] = []
-
-        for _ in range(max_jobs):
-            job = self.claim_next(worker_id)
-            if job is None:
-                break
-
-            result = self.execute_job(job)
-            results.append(result)
-
-        return results
+        return [self.execute_job(job) for job in self.claim_due(worker_id, max_jobs)]
 
     # --- Query Methods ---
 
@@ -664,6 +716,7 @@ def create_scheduler_service(
     publisher: ContentPublisherPort | None = None,
     time_port: TimePort | None = None,
     config: SchedulerConfig | None = None,
+    on_change: ScheduleListener | None = None,
 ) -> SchedulerService:
     """Create a SchedulerService."""
     return SchedulerService(
@@ -671,4 +724,5 @@ def create_scheduler_service(
         publisher=publisher,
         time_port=time_port,
         config=config,
+        on_change=on_change,
     )
@@ -15,6 +15,7 @@ Invariants:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import BinaryIO, Protocol
 
 
@@ -29,6 +30,15 @@ class StoredObject:
     etag: str
 
 
+@dataclass(frozen=True)
+class StagedObject:
+    """Bytes spooled to a temporary file, hashed, not yet bound to a key."""
+
+    path: Path
+    size_bytes: int
+    sha256: str
+
+
 class StoragePort(Protocol):
     """
     Object storage port interface.
@@ -153,6 +163,14 @@ class KeyNotFoundError(StorageError):
         super().__init__(f"Key not found: {key}")
 
 
+class ObjectTooLargeError(StorageError):
+    """Raised when a streamed object exceeds its size limit (write aborted)."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        super().__init__(f"Object exceeds maximum size of {max_bytes} bytes")
+
+
 class IntegrityError(StorageError):
     """Raised when data integrity check fails."""
 
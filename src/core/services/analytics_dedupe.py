@@ -10,7 +10,8 @@ Test assertions:
 
 Key behaviors:
 - Dedupe within configurable TTL window (default 10s)
-- Classify user agents as bot/real/unknown
+- Classify user agents as bot/real/unknown (patterns compiled once per
+  config into alternation regexes, results LRU-cached per UA string)
 - Exclude bot traffic from real counts
 - Privacy-preserving (no raw UA storage)
 """
@@ -18,11 +19,15 @@ Key behaviors:
 from __future__ import annotations
 
 import hashlib
+import re
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Protocol
 
+from src.domain.stats import CacheCounters
+
 # --- Enums ---
 
 
@@ -147,6 +152,105 @@ def get_timestamp_bucket(
 
 # --- Bot Classification ---
 
+# Distinct UA strings remembered per classifier; real traffic repeats a few
+# hundred strings, so this comfortably holds the working set.
+DEFAULT_UA_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class UAClassifierStats(CacheCounters):
+    size: int
+    max_size: int
+
+
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """
+    Compile substring patterns into one trie-factored alternation.
+
+    Patterns containing a shorter pattern ("googlebot" vs "bot") can never
+    change the answer and are dropped first; shared prefixes are factored
+    so the regex engine does not retry each alternative separately.
+    """
+    minimal: list[str] = []
+    for pattern in sorted({p.lower() for p in patterns if p}, key=len):
+        if not any(kept in pattern for kept in minimal):
+            minimal.append(pattern)
+    if not minimal:
+        return None
+
+    trie: dict[str, Any] = {}
+    for pattern in minimal:
+        node = trie
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict[str, Any]) -> str:
+        # In a minimal set a complete pattern is never a prefix of another
+        if "" in node:
+            return ""
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+    return re.compile(emit(trie))
+
+
+class UAClassifier:
+    """
+    Compiled user agent classifier (TA-0040).
+
+    Bot and real-browser patterns are each compiled into a single regex,
+    so a lookup is at most two scans of the UA instead of one per pattern.
+    Results are cached per raw UA string, which is where most of the win
+    comes from: real traffic repeats a small set of UAs.
+    """
+
+    def __init__(
+        self,
+        config: DedupeConfig = DEFAULT_CONFIG,
+        cache_size: int = DEFAULT_UA_CACHE_SIZE,
+    ) -> None:
+        """Initialize classifier."""
+        self._bot = _compile_patterns(config.bot_patterns)
+        self._real = _compile_patterns(config.real_browser_patterns)
+        self._cached = lru_cache(maxsize=cache_size)(self._classify)
+
+    def classify(self, user_agent: str | None) -> UAClass:
+        """Classify a user agent string."""
+        if not user_agent:
+            return UAClass.UNKNOWN
+        return self._cached(user_agent)
+
+    def stats(self) -> UAClassifierStats:
+        """Snapshot of cache counters."""
+        info = self._cached.cache_info()
+        return UAClassifierStats(
+            hits=info.hits,
+            misses=info.misses,
+            size=info.currsize,
+            max_size=info.maxsize or 0,
+        )
+
+    def clear_cache(self) -> None:
+        """Drop cached results and reset counters."""
+        self._cached.cache_clear()
+
+    def _classify(self, user_agent: str) -> UAClass:
+        ua_lower = user_agent.lower()
+
+        # Bot patterns take priority wherever they appear in the string
+        if self._bot is not None and self._bot.search(ua_lower):
+            return UAClass.BOT
+        if self._real is not None and self._real.search(ua_lower):
+            return UAClass.REAL
+        return UAClass.UNKNOWN
+
+
+@lru_cache(maxsize=8)
+def get_ua_classifier(config: DedupeConfig = DEFAULT_CONFIG) -> UAClassifier:
+    """Shared classifier for a config (compiled once per distinct config)."""
+    return UAClassifier(config)
+
 
 def classify_user_agent(
     user_agent: str | None,
@@ -157,22 +261,7 @@ def classify_user_agent(
 
     Returns BOT, REAL, or UNKNOWN based on patterns.
     """
-    if not user_agent:
-        return UAClass.UNKNOWN
-
-    ua_lower = user_agent.lower()
-
-    # Check for bot patterns first (they take priority)
-    for pattern in config.bot_patterns:
-        if pattern in ua_lower:
-            return UAClass.BOT
-
-    # Check for real browser patterns
-    for pattern in config.real_browser_patterns:
-        if pattern in ua_lower:
-            return UAClass.REAL
-
-    return UAClass.UNKNOWN
+    return get_ua_classifier(config).classify(user_agent)
 
 
 def is_bot(ua_class: UAClass, config: DedupeConfig = DEFAULT_CONFIG) -> bool:
@@ -284,6 +373,7 @@ class DedupeService:
         """Initialize service."""
         self._store = store or InMemoryDedupeStore()
         self._config = config or DEFAULT_CONFIG
+        self._classifier = get_ua_classifier(self._config)
 
     def check_and_record(
         self,
@@ -301,7 +391,7 @@ class DedupeService:
         Returns DedupeResult with duplicate status and classification.
         """
         # Classify user agent
-        ua_class = classify_user_agent(user_agent, self._config)
+        ua_class = self._classifier.classify(user_agent)
 
         # Generate dedupe key
         bucket = get_timestamp_bucket(timestamp, self._config.ttl_seconds)
@@ -330,7 +420,11 @@ class DedupeService:
 
     def classify(self, user_agent: str | None) -> UAClass:
         """Classify a user agent (TA-0040)."""
-        return classify_user_agent(user_agent, self._config)
+        return self._classifier.classify(user_agent)
+
+    def classifier_stats(self) -> UAClassifierStats:
+        """Cache counters of the user agent classifier."""
+        return self._classifier.stats()
 
     def should_count(self, ua_class: UAClass) -> bool:
         """Check if UA class should be counted."""
@@ -19,10 +19,9 @@ Key behaviors:
 
 from __future__ import annotations
 
-import html
 import json
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any
 
 # --- Configuration ---
@@ -314,19 +313,17 @@ def is_safe_url(url: str, config: RichTextConfig = DEFAULT_CONFIG) -> bool:
     """
     Check if URL is safe (no forbidden protocols).
 
+    Delegates the scheme check to the richtext component, which also
+    catches schemes hidden by tabs, newlines and control characters.
+
     Returns True if URL is safe, False if it uses a forbidden protocol.
     """
+    # Deferred: the component package imports this module
+    from src.components.richtext._impl import has_forbidden_protocol
+
     if not url:
         return True
-
-    url_lower = url.lower().strip()
-
-    # Check for forbidden protocols
-    for protocol in config.forbid_protocols:
-        if url_lower.startswith(protocol):
-            return False
-
-    return True
+    return not has_forbidden_protocol(url, config.forbid_protocols)
 
 
 def sanitize_url(url: str, config: RichTextConfig = DEFAULT_CONFIG) -> str | None:
@@ -378,108 +375,22 @@ def sanitize_html(
     """
     Sanitize HTML content (TA-0021).
 
-    Strips disallowed tags and attributes.
-    Adds security attributes to links.
-    Blocks forbidden protocols.
+    Delegates to the richtext component's HTMLSanitizer, so both entry
+    points share one allowlist scanner. Repeated warnings come back once
+    per distinct warning.
 
     Returns:
         Tuple of (sanitized_html, list of errors/warnings)
     """
-    errors: list[RichTextValidationError] = []
-    link_count = 0
-
-    def process_tag(match: re.Match[str]) -> str:
-        nonlocal link_count
-
-        is_closing = bool(match.group(1))
-        tag_name = match.group(2).lower()
-        attr_string = match.group(3)
-
-        # Check if tag is allowed
-        if tag_name not in config.allow_tags:
-            errors.append(
-                RichTextValidationError(
-                    code="stripped_tag",
-                    message=f"Tag '{tag_name}' was stripped",
-                )
-            )
-            return ""
-
-        if is_closing:
-            return f"</{tag_name}>"
-
-        # Parse and filter attributes
-        attrs = parse_attributes(attr_string)
-        allowed_attrs = config.allow_attrs.get(tag_name, frozenset())
-
-        filtered_attrs: dict[str, str] = {}
-        for name, value in attrs.items():
-            if name in allowed_attrs:
-                filtered_attrs[name] = value
-            else:
-                errors.append(
-                    RichTextValidationError(
-                        code="stripped_attribute",
-                        message=f"Attribute '{name}' stripped from '{tag_name}'",
-                    )
-                )
-
-        # Special handling for links
-        if tag_name == "a":
-            link_count += 1
-
-            # Check link limit
-            if link_count > config.max_links_per_doc:
-                errors.append(
-                    RichTextValidationError(
-                        code="max_links_exceeded",
-                        message=f"Maximum {config.max_links_per_doc} links allowed",
-                    )
-                )
-                return ""
-
-            # Sanitize href
-            href = filtered_attrs.get("href", "")
-            sanitized_href = sanitize_url(href, config)
-            if sanitized_href is None:
-                errors.append(
-                    RichTextValidationError(
-                        code="unsafe_url",
-                        message=f"Unsafe URL protocol in href: {href[:50]}",
-                    )
-                )
-                return ""
-            filtered_attrs["href"] = sanitized_href
-
-            # Add rel attributes
-            rel = build_link_rel(config)
-            if rel:
-                filtered_attrs["rel"] = rel
-
-        # Special handling for images
-        if tag_name == "img":
-            src = filtered_attrs.get("src", "")
-            sanitized_src = sanitize_url(src, config)
-            if sanitized_src is None:
-                errors.append(
-                    RichTextValidationError(
-                        code="unsafe_url",
-                        message=f"Unsafe URL protocol in src: {src[:50]}",
-                    )
-                )
-                return ""
-            filtered_attrs["src"] = sanitized_src
-
-        # Rebuild tag
-        if filtered_attrs:
-            attr_parts = [
-                f'{name}="{html.escape(value)}"' for name, value in filtered_attrs.items()
-            ]
-            return f"<{tag_name} {' '.join(attr_parts)}>"
-        return f"<{tag_name}>"
-
-    sanitized = TAG_PATTERN.sub(process_tag, html_content)
-    return sanitized, errors
+    # Deferred: the component package imports this module
+    from src.components.richtext import HTMLSanitizer
+    from src.components.richtext import RichTextConfig as ComponentConfig
+
+    component_config = ComponentConfig(**{f.name: getattr(config, f.name) for f in fields(config)})
+    sanitized, warnings = HTMLSanitizer(component_config).sanitize(html_content)
+    return sanitized, [
+        RichTextValidationError(code=w.code, message=w.message, path=w.path) for w in warnings
+    ]
 
 
 # --- Document Sanitization ---
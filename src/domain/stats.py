@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+
+def ratio(part: float, whole: float) -> float:
+    """part / whole, or 0.0 while nothing has been counted."""
+    return part / whole if whole else 0.0
+
+
+@dataclass(frozen=True)
+class CounterSnapshot:
+    """
+    Point-in-time copy of a component's counters, as returned by its stats().
+
+    Counters are totals since the component was created; subclasses add
+    their own fields and any rates derived from them.
+    """
+
+
+@dataclass(frozen=True)
+class CacheCounters(CounterSnapshot):
+    """Counter snapshot for a cache whose lookups are either hits or misses."""
+
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        return ratio(self.hits, self.hits + self.misses)
@@ -29,7 +29,9 @@ class ContentRepoPort(Protocol):
 
     def get_by_slug(self, slug: str, item_type: str) -> ContentItem | None: ...
 
-    def list_items(self, filters: dict[str, Any]) -> list[ContentItem]: ...
+    def list_items(
+        self, filters: dict[str, Any], include_blocks: bool = True
+    ) -> list[ContentItem]: ...
 
     def delete(self, item_id: UUID) -> None: ...
 
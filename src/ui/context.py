@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -19,8 +20,8 @@ if TYPE_CHECKING:
 from src.adapters.auth.crypto import Argon2AuthAdapter
 from src.adapters.auth.session_store import InMemorySessionStore
 from src.adapters.clock import SystemClock
-from src.adapters.fs.filestore import FileSystemStore
-from src.adapters.render.mpl_renderer import MatplotlibRenderer
+from src.adapters.rate_limiter import get_shared_rate_limiter
+from src.adapters.render.chart_service import get_shared_chart_service
 from src.adapters.sqlite.repos import (
     SQLiteAssetRepo,
     SQLiteCollabRepo,
@@ -79,8 +80,8 @@ class ServiceContext:
         collab_repo = SQLiteCollabRepo(db_path)
         publish_job_repo = SQLitePublishJobRepo(db_path)
 
-        fs_store = FileSystemStore(fs_path)
-        renderer = MatplotlibRenderer(fs_store)
+        # Shared by every session, so sessions do not each spawn render workers
+        renderer = get_shared_chart_service(Path(fs_path) / "charts")
         auth_adapter = Argon2AuthAdapter()
         clock = SystemClock()
         session_store = InMemorySessionStore()
@@ -89,7 +90,7 @@ class ServiceContext:
         policy = PolicyEngine(rules)
         validator = BlockValidator(rules.blocks)
 
-        rate_limiter = RateLimiter(rules.rate_limits)
+        rate_limiter = RateLimiter(rules.rate_limits, engine=get_shared_rate_limiter())
 
         return cls(
             user_repo=user_repo,
@@ -4,6 +4,10 @@ import sqlite3
 
 import flet as ft
 
+from src.adapters.render.chart_service import (
+    ChartRenderService,
+    shutdown_shared_chart_services,
+)
 from src.app_shell.admin.content_admin import ContentEditContent, ContentListContent
 
 # Legacy/Refactored Imports
@@ -94,6 +98,10 @@ def main(page: ft.Page) -> None:
 
     # 4. Create Context
     ctx = ServiceContext.create(DB_PATH, FS_PATH, rules)
+    if isinstance(ctx.renderer, ChartRenderService):
+        # Spawn the shared chart workers with the first session so the first
+        # chart does not wait for matplotlib imports (no-op afterwards)
+        ctx.renderer.start()
 
     # 5. Bootstrap Owner
     bootstrap_system(ctx)
@@ -305,4 +313,8 @@ def main(page: ft.Page) -> None:
 
 
 if __name__ == "__main__":
-    ft.app(target=main)
+    try:
+        ft.app(target=main)
+    finally:
+        # Chart workers are shared across sessions; stop them once the app exits
+        shutdown_shared_chart_services()
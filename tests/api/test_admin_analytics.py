@@ -663,3 +663,72 @@ class TestEventTypeFilter:
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 5
+
+
+class TestLinkClicksEndpoints:
+    """Test per-link outbound click endpoints (TA-0038)."""
+
+    @staticmethod
+    def _click(service: AggregateService, link_id: str, ts: datetime) -> None:
+        service.record(
+            AggregateInput(
+                event_type="outbound_click",
+                timestamp=ts,
+                link_id=link_id,
+                ua_class=UAClass.REAL,
+            )
+        )
+
+    def test_link_clicks_per_bucket(
+        self,
+        client: TestClient,
+        aggregate_service: AggregateService,
+    ) -> None:
+        """Clicks on one link are returned per time bucket."""
+        link_id, other = str(uuid4()), str(uuid4())
+        for hour in (9, 9, 14):
+            self._click(aggregate_service, link_id, datetime(2024, 6, 15, hour, tzinfo=UTC))
+        self._click(aggregate_service, other, datetime(2024, 6, 15, 9, tzinfo=UTC))
+
+        response = client.get(
+            f"/analytics/links/{link_id}",
+            params={
+                "start": "2024-06-15T00:00:00Z",
+                "end": "2024-06-16T00:00:00Z",
+                "bucket_type": "hour",
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["link_id"] == link_id
+        assert data["bucket_type"] == "hour"
+        assert data["total"] == 3
+        assert [p["count"] for p in data["points"]] == [2, 1]
+
+    def test_link_clicks_invalid_link_id(self, client: TestClient) -> None:
+        """Non-UUID link IDs are rejected."""
+        response = client.get("/analytics/links/not-a-uuid")
+
+        assert response.status_code == 400
+
+    def test_top_links(
+        self,
+        client: TestClient,
+        aggregate_service: AggregateService,
+    ) -> None:
+        """Links are ranked by clicks."""
+        ts = datetime(2024, 6, 15, 12, 0, 0, tzinfo=UTC)
+        popular, quiet = str(uuid4()), str(uuid4())
+        for _ in range(3):
+            self._click(aggregate_service, popular, ts)
+        self._click(aggregate_service, quiet, ts)
+
+        response = client.get(
+            "/analytics/links",
+            params={"start": "2024-06-15T00:00:00Z", "end": "2024-06-16T00:00:00Z"},
+        )
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert items == [{"link_id": popular, "count": 3}, {"link_id": quiet, "count": 1}]
@@ -201,6 +201,34 @@ class TestQueryAuditLogs:
         page2_ids = {i["id"] for i in page2["items"]}
         assert page1_ids.isdisjoint(page2_ids)
 
+    def test_query_cursor_pagination(
+        self,
+        client: TestClient,
+        audit_service: AuditService,
+        time_port: MockTimePort,
+    ) -> None:
+        """Keyset cursor walks every entry exactly once, newest first."""
+        for i in range(7):
+            audit_service.log_create(EntityType.CONTENT, f"post-{i}")
+            time_port.advance(1)
+
+        seen: list[str] = []
+        params: dict[str, str | int] = {"limit": 3}
+        while True:
+            data = client.get("/audit", params=params).json()
+            seen.extend(i["entity_id"] for i in data["items"])
+            if not data["next_cursor"]:
+                break
+            params = {"limit": 3, "cursor": data["next_cursor"]}
+
+        assert seen == [f"post-{i}" for i in reversed(range(7))]
+
+    def test_query_invalid_cursor(self, client: TestClient) -> None:
+        """Malformed cursor returns 400."""
+        response = client.get("/audit", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+
     def test_query_invalid_entity_type(self, client: TestClient) -> None:
         """Invalid entity type returns 400."""
         response = client.get("/audit", params={"entity_type": "invalid"})
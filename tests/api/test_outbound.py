@@ -7,31 +7,93 @@ Test assertions:
 
 from __future__ import annotations
 
+import threading
+from datetime import UTC, datetime
+from uuid import UUID
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from src.api.deps import get_public_link_index
 from src.api.routes import outbound
 from src.api.routes.outbound import (
+    OutboundEventRecorder,
     is_safe_url,
     preserve_utm_params,
     reset_event_recorder,
 )
+from src.components.analytics import (
+    AnalyticsIngestionService,
+    IngestQueue,
+    IngestQueueConfig,
+    InMemoryEventStore,
+)
+from src.components.links import PublicLinkIndex
+from src.domain.entities import LinkItem
 
 # --- Test Setup ---
 
 
+class InMemoryLinkRepo:
+    """In-memory link repository."""
+
+    def __init__(self) -> None:
+        self.links: dict[UUID, LinkItem] = {}
+
+    def save(self, link: LinkItem) -> LinkItem:
+        self.links[link.id] = link
+        return link
+
+    def get_all(self) -> list[LinkItem]:
+        return list(self.links.values())
+
+    def delete(self, link_id: UUID) -> None:
+        self.links.pop(link_id, None)
+
+
+@pytest.fixture
+def link_repo() -> InMemoryLinkRepo:
+    """Site links; their hosts are the only allowed /go targets."""
+    repo = InMemoryLinkRepo()
+    for slug, url in (
+        ("newsletter-signup", "https://example.com/signup"),
+        ("cta-button-1", "https://example.com/page"),
+        ("promo", "https://example.com/offer"),
+    ):
+        repo.save(LinkItem(slug=slug, title=slug, url=url))
+    return repo
+
+
+def link_by_slug(repo: InMemoryLinkRepo, slug: str) -> LinkItem:
+    return next(link for link in repo.get_all() if link.slug == slug)
+
+
+@pytest.fixture
+def event_store() -> InMemoryEventStore:
+    """Store receiving events ingested from clicks."""
+    return InMemoryEventStore()
+
+
+@pytest.fixture
+def ingest_queue(event_store: InMemoryEventStore) -> IngestQueue:
+    """Ingest queue without a worker thread (clicks are ingested inline)."""
+    return IngestQueue(AnalyticsIngestionService(event_store=event_store))
+
+
 @pytest.fixture(autouse=True)
-def reset_recorder() -> None:
+def reset_recorder(ingest_queue: IngestQueue) -> None:
     """Reset event recorder before each test."""
-    reset_event_recorder()
+    reset_event_recorder(ingest_queue)
 
 
 @pytest.fixture
-def app() -> FastAPI:
+def app(link_repo: InMemoryLinkRepo) -> FastAPI:
     """Test FastAPI app with outbound routes."""
     app = FastAPI()
     app.include_router(outbound.router, prefix="/out")
+    index = PublicLinkIndex(link_repo)
+    app.dependency_overrides[get_public_link_index] = lambda: index
     return app
 
 
@@ -268,44 +330,95 @@ class TestOutboundUrlValidation:
 
         assert response.status_code == 400
 
+    def test_rejects_arbitrary_external_url(self, client: TestClient) -> None:
+        """Hosts no site link points to are rejected (no open redirect)."""
+        response = client.get(
+            "/out/go",
+            params={"url": "https://evil.example/login"},
+        )
+
+        assert response.status_code == 400
+        assert "location" not in response.headers
+        assert outbound.get_event_recorder().get_events() == []
+
+    def test_rejects_userinfo_host_spoofing(self, client: TestClient) -> None:
+        """An allowed host in the userinfo part does not pass."""
+        response = client.get(
+            "/out/go",
+            params={"url": "https://example.com@evil.example/login"},
+        )
+
+        assert response.status_code == 400
+
+    def test_rejects_host_of_inactive_link(
+        self, client: TestClient, link_repo: InMemoryLinkRepo
+    ) -> None:
+        """Only active public links allow their host."""
+        link_repo.save(
+            LinkItem(slug="old", title="Old", url="https://retired.example/", status="disabled")
+        )
+
+        response = client.get("/out/go", params={"url": "https://retired.example/"})
+
+        assert response.status_code == 400
+
 
 class TestNamedLinkTracking:
     """Test named link tracking endpoint."""
 
     def test_redirects_with_link_id(self, client: TestClient) -> None:
         """Redirects with link ID path param."""
-        response = client.get(
-            "/out/click/newsletter-signup",
-            params={"url": "https://example.com/signup"},
-        )
+        response = client.get("/out/click/newsletter-signup")
 
         assert response.status_code == 302
+        assert response.headers["location"] == "https://example.com/signup"
 
-    def test_records_link_id_from_path(self, client: TestClient) -> None:
-        """Link ID from path is recorded."""
-        client.get(
-            "/out/click/cta-button-1",
-            params={"url": "https://example.com/page"},
-        )
+    def test_records_link_id_from_path(
+        self, client: TestClient, link_repo: InMemoryLinkRepo
+    ) -> None:
+        """The stored ID of the link named in the path is recorded."""
+        client.get("/out/click/cta-button-1")
 
         recorder = outbound.get_event_recorder()
         events = recorder.get_events()
 
-        assert events[0]["link_id"] == "cta-button-1"
+        assert events[0]["link_id"] == str(link_by_slug(link_repo, "cta-button-1").id)
 
     def test_preserves_utm_in_named_link(self, client: TestClient) -> None:
         """UTM params preserved in named link redirect."""
         response = client.get(
             "/out/click/promo",
-            params={
-                "url": "https://example.com/offer",
-                "utm_source": "twitter",
-            },
+            params={"utm_source": "twitter"},
         )
 
         location = response.headers["location"]
         assert "utm_source=twitter" in location
 
+    def test_ignores_caller_supplied_url(self, client: TestClient) -> None:
+        """The redirect goes to the stored URL, never to ?url=."""
+        response = client.get(
+            "/out/click/promo",
+            params={"url": "https://evil.example/login"},
+        )
+
+        assert response.status_code == 302
+        assert response.headers["location"] == "https://example.com/offer"
+
+    def test_resolves_link_by_id(self, client: TestClient, link_repo: InMemoryLinkRepo) -> None:
+        """Links can also be addressed by their ID."""
+        link = link_by_slug(link_repo, "promo")
+
+        response = client.get(f"/out/click/{link.id}")
+
+        assert response.headers["location"] == "https://example.com/offer"
+
+    def test_unknown_link_is_not_found(self, client: TestClient) -> None:
+        """Unknown links 404 and are not counted."""
+        response = client.get("/out/click/nope", params={"url": "https://example.com/"})
+
+        assert response.status_code == 404
+        assert outbound.get_event_recorder().get_events() == []
+
 
 class TestAllUtmParams:
     """Test all UTM parameters are supported."""
@@ -354,3 +467,97 @@ class TestAllUtmParams:
         assert utm["utm_campaign"] == "summer_sale"
         assert utm["utm_content"] == "banner1"
         assert utm["utm_term"] == "shoes"
+
+
+class TestClickIngestion:
+    """Clicks go through analytics ingestion as outbound_click events."""
+
+    def test_click_is_ingested(
+        self,
+        client: TestClient,
+        event_store: InMemoryEventStore,
+        link_repo: InMemoryLinkRepo,
+    ) -> None:
+        """A click becomes a validated outbound_click event."""
+        client.get(
+            "/out/click/cta-button-1",
+            params={"utm_source": "newsletter"},
+            headers={"Referer": "https://mysite.com/post/123"},
+        )
+
+        (event,) = event_store.get_all()
+        assert event.event_type.value == "outbound_click"
+        assert event.link_id == str(link_by_slug(link_repo, "cta-button-1").id)
+        assert event.utm_source == "newsletter"
+        assert event.referrer == "https://mysite.com/post/123"
+
+    def test_target_url_and_raw_ua_not_ingested(
+        self, client: TestClient, event_store: InMemoryEventStore
+    ) -> None:
+        """Only the UA class is kept; the target URL stays out of analytics."""
+        client.get(
+            "/out/go",
+            params={"url": "https://example.com/private?token=abc"},
+            headers={"User-Agent": "Googlebot/2.1 (+http://www.google.com/bot.html)"},
+        )
+
+        (event,) = event_store.get_all()
+        assert event.ua_class.value == "bot"
+        assert "example.com" not in repr(event)
+
+    def test_redirect_does_not_wait_for_ingestion(self, client: TestClient) -> None:
+        """The 302 is returned while ingestion is still blocked."""
+        release = threading.Event()
+
+        class BlockingStore(InMemoryEventStore):
+            def store(self, event: object) -> None:
+                release.wait(5)
+
+        queue = IngestQueue(AnalyticsIngestionService(event_store=BlockingStore()))
+        queue.start()
+        reset_event_recorder(queue)
+        try:
+            for _ in range(3):
+                response = client.get("/out/go", params={"url": "https://example.com/"})
+                assert response.status_code == 302
+            assert queue.stats().ingested == 0
+        finally:
+            release.set()
+            queue.stop()
+        assert queue.stats().ingested == 3
+
+    def test_full_queue_still_redirects(self, client: TestClient) -> None:
+        """A dropped click never fails the redirect."""
+        queue = IngestQueue(
+            AnalyticsIngestionService(event_store=InMemoryEventStore()),
+            IngestQueueConfig(max_queue=0),
+        )
+        reset_event_recorder(queue)
+
+        response = client.get("/out/go", params={"url": "https://example.com/"})
+
+        assert response.status_code == 302
+        assert queue.stats().dropped == 1
+
+
+class TestRecentEvents:
+    """The recorder keeps a bounded window of recent clicks."""
+
+    def test_recent_events_are_bounded(self, ingest_queue: IngestQueue) -> None:
+        recorder = OutboundEventRecorder(ingest_queue, recent_limit=3)
+        for i in range(10):
+            recorder.record(
+                target_url=f"https://example.com/{i}",
+                link_id=None,
+                referrer=None,
+                timestamp=datetime.now(UTC),
+                utm_params={},
+            )
+
+        events = recorder.get_events()
+        assert [e["target_url"] for e in events] == [
+            "https://example.com/7",
+            "https://example.com/8",
+            "https://example.com/9",
+        ]
+        assert ingest_queue.stats().ingested == 10
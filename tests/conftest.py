@@ -1,6 +1,8 @@
 import os
 import sqlite3
 from pathlib import Path
+from typing import Any
+from uuid import UUID
 
 import pytest
 
@@ -9,6 +11,38 @@ from src.rules.loader import load_rules
 from src.ui.context import ServiceContext
 
 
+class FakeClock[T]:
+    """Injectable clock that only moves when a test sets or advances `now`."""
+
+    def __init__(self, start: T) -> None:
+        self.now = start
+
+    def __call__(self) -> T:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock[float]:
+    """Monotonic-style clock (seconds). Override in a module for other time types."""
+    return FakeClock(1_000_000.0)
+
+
+class StubVersionRepo:
+    """Asset version lookups for the public asset routes."""
+
+    def __init__(self) -> None:
+        self.versions: dict[UUID, Any] = {}
+
+    def get_by_id(self, version_id: UUID) -> Any | None:
+        return self.versions.get(version_id)
+
+    def get_latest(self, asset_id: UUID) -> Any | None:
+        for version in self.versions.values():
+            if version.asset_id == asset_id and getattr(version, "is_latest", True):
+                return version
+        return None
+
+
 @pytest.fixture
 def test_data_dir(tmp_path):
     return str(tmp_path)
@@ -58,7 +58,8 @@ def client_with_db(override_settings, test_db_path):
             password_hash TEXT,
             status TEXT,
             created_at TEXT,
-            updated_at TEXT
+            updated_at TEXT,
+            auth_version INTEGER NOT NULL DEFAULT 0
         )
     """)
     conn.execute("""
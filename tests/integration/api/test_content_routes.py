@@ -50,7 +50,8 @@ def setup_db(test_db_path):
             password_hash TEXT,
             status TEXT,
             created_at TEXT,
-            updated_at TEXT
+            updated_at TEXT,
+            auth_version INTEGER NOT NULL DEFAULT 0
         )
     """)
     conn.execute("""
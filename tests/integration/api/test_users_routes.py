@@ -11,7 +11,7 @@ from fastapi.testclient import TestClient
 
 from src.adapters.sqlite.repos import SQLiteUserRepo
 from src.api.auth_utils import get_password_hash
-from src.api.deps import Settings, get_settings
+from src.api.deps import Settings, get_principal_cache, get_settings, get_user_repo
 from src.api.main import app
 from src.domain.entities import User
 
@@ -50,7 +50,8 @@ def setup_db(test_db_path):
             password_hash TEXT,
             status TEXT,
             created_at TEXT,
-            updated_at TEXT
+            updated_at TEXT,
+            auth_version INTEGER NOT NULL DEFAULT 0
         )
     """)
     conn.execute("""
@@ -223,3 +224,59 @@ def test_unauthenticated_access(client_with_db, setup_db):
     client_with_db.cookies.clear()
     resp = client_with_db.get("/api/users")
     assert resp.status_code == 401
+
+
+def test_disabled_user_is_rejected_despite_cache(authenticated_viewer, viewer_user, setup_db):
+    assert authenticated_viewer.get("/api/auth/me").status_code == 200
+    assert authenticated_viewer.get("/api/auth/me").status_code == 200  # principal cached
+
+    viewer_user.status = "disabled"
+    SQLiteUserRepo(setup_db).save(viewer_user)
+
+    resp = authenticated_viewer.get("/api/auth/me")
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Inactive user"
+
+
+def test_save_from_another_worker_invalidates_cached_principal(
+    authenticated_viewer, viewer_user, setup_db, monkeypatch
+):
+    assert authenticated_viewer.get("/api/auth/me").status_code == 200
+    assert authenticated_viewer.get("/api/auth/me").status_code == 200  # principal cached
+
+    # Another worker process: its in-process invalidation never reaches this cache
+    monkeypatch.setattr("src.adapters.sqlite.repos.invalidate_principal", lambda user_id: None)
+    viewer_user.status = "disabled"
+    SQLiteUserRepo(setup_db).save(viewer_user)
+
+    resp = authenticated_viewer.get("/api/auth/me")
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Inactive user"
+
+
+def test_repeated_calls_hit_principal_cache(authenticated_admin, test_db_path):
+    for _ in range(3):
+        assert authenticated_admin.get("/api/auth/me").status_code == 200
+
+    settings = app.dependency_overrides[get_settings]()
+    stats = get_principal_cache(get_user_repo(settings), settings).stats()
+    assert stats.misses == 1  # only the first call decoded and queried
+    assert stats.hits == 2
+    assert stats.size == 1
+
+
+def test_principal_cache_stats(authenticated_admin):
+    authenticated_admin.get("/api/auth/me")
+
+    resp = authenticated_admin.get("/api/users/principal-cache/stats")
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["hits"] >= 1
+    assert data["size"] == 1
+    assert 0 < data["hit_rate"] <= 1
+
+
+def test_principal_cache_stats_forbidden_for_non_admin(authenticated_viewer):
+    resp = authenticated_viewer.get("/api/users/principal-cache/stats")
+    assert resp.status_code == 403
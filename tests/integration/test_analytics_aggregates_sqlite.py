@@ -0,0 +1,344 @@
+"""
+Tests for the SQLite analytics aggregate store (E6.4).
+
+Covers the batched upsert used by AggregatePipeline and the
+persisted buckets read back by the dashboard service.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.sqlite.migrator import SQLiteMigrator
+from src.adapters.sqlite.pool import close_all_pools, get_pool
+from src.adapters.sqlite_db import SQLiteAnalyticsAggregateRepo
+from src.api.deps import get_analytics_pipeline, shutdown_analytics_pipeline
+from src.components.analytics import AggregatePipeline
+from src.components.analytics._aggregate import (
+    AggregateIncrement,
+    AggregateInput,
+    AggregateService,
+    BucketType,
+    InMemoryAggregateRepo,
+    UAClass,
+)
+
+NOW = datetime(2024, 6, 15, 14, 30, tzinfo=UTC)
+DAY_START = datetime(2024, 6, 15, tzinfo=UTC)
+DAY_END = datetime(2024, 6, 16, tzinfo=UTC)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = str(tmp_path / "analytics.db")
+    SQLiteMigrator(path, "migrations").run_migrations()
+    yield SQLiteAnalyticsAggregateRepo(path)
+    close_all_pools()
+
+
+def _increment(count: int = 1, **dims: object) -> AggregateIncrement:
+    return AggregateIncrement(
+        bucket_type="day",
+        bucket_start=DAY_START,
+        event_type="page_view",
+        dimensions={"ua_class": "real", **dims},
+        count_total=count,
+        count_real=count,
+    )
+
+
+class TestUpsertIncrements:
+    def test_batches_accumulate_on_unique_key(self, repo):
+        content_id = uuid4()
+        repo.upsert_increments([_increment(3, content_id=content_id)])
+        repo.upsert_increments([_increment(4, content_id=content_id)])
+
+        (bucket,) = repo.query("day", DAY_START, DAY_END)
+        assert bucket.count_total == 7
+        assert bucket.count_real == 7
+        assert bucket.content_id == content_id
+
+    def test_null_dimensions_share_one_row(self, repo):
+        repo.upsert_increments([_increment(utm_source=None), _increment()])
+
+        (bucket,) = repo.query("day", DAY_START, DAY_END)
+        assert bucket.count_total == 2
+
+    def test_distinct_dimensions_get_distinct_rows(self, repo):
+        repo.upsert_increments(
+            [_increment(utm_source="twitter"), _increment(utm_source="newsletter")]
+        )
+        assert len(repo.query("day", DAY_START, DAY_END)) == 2
+
+    def test_legacy_get_or_create_targets_same_row(self, repo):
+        repo.upsert_increments([_increment(2, utm_source="twitter")])
+        bucket = repo.get_or_create_bucket(
+            "day", DAY_START, "page_view", {"ua_class": "real", "utm_source": "twitter"}
+        )
+        repo.increment(bucket.id, count_total=1, count_real=1)
+
+        (row,) = repo.query("day", DAY_START, DAY_END)
+        assert row.count_total == 3
+
+
+class _FixedTime:
+    def now_utc(self) -> datetime:
+        return NOW
+
+
+class TestRetention:
+    def test_delete_before_prunes_one_bucket_type(self, repo):
+        cutoff = NOW - timedelta(days=7)
+        for bucket_type in ("minute", "hour"):
+            for start in (cutoff - timedelta(minutes=1), cutoff, NOW):
+                repo.upsert_increments(
+                    [AggregateIncrement(bucket_type, start, "page_view", {}, count_total=1)]
+                )
+
+        assert repo.delete_before("minute", cutoff) == 1
+
+        window = (cutoff - timedelta(days=1), NOW + timedelta(days=1))
+        assert [b.bucket_start for b in repo.query("minute", *window)] == [cutoff, NOW]
+        assert len(repo.query("hour", *window)) == 3
+
+    def test_pipeline_sweep_uses_minute_retention(self, repo):
+        service = AggregateService(time_port=_FixedTime())
+        pipeline = AggregatePipeline(sink=repo, service=service)
+        for days_ago in (8, 1):
+            pipeline.record(
+                AggregateInput(
+                    event_type="page_view",
+                    timestamp=NOW - timedelta(days=days_ago),
+                    ua_class=UAClass.REAL,
+                )
+            )
+        pipeline.flush()
+
+        assert pipeline.sweep() == 1
+        window = (NOW - timedelta(days=30), NOW)
+        assert len(repo.query("minute", *window)) == 1
+        assert len(repo.query("day", *window)) == 2
+
+
+class TestPipelineToDashboard:
+    def test_buffered_events_visible_after_flush(self, repo):
+        pipeline = AggregatePipeline(sink=repo)
+        for ua in (UAClass.REAL, UAClass.REAL, UAClass.BOT):
+            pipeline.record(AggregateInput(event_type="page_view", timestamp=NOW, ua_class=ua))
+        pipeline.flush()
+
+        service = AggregateService(repo=repo)
+        totals = service.get_totals(BucketType.DAY, DAY_START, DAY_END)
+        assert totals == {"total": 2, "total_with_bots": 3, "real": 2, "bot": 1}
+
+        series = service.get_time_series(BucketType.MINUTE, DAY_START, DAY_END)
+        assert series == [{"timestamp": datetime(2024, 6, 15, 14, 30, tzinfo=UTC), "count": 2}]
+
+    def test_one_pipeline_per_database(self, tmp_path):
+        first_path, second_path = str(tmp_path / "a.db"), str(tmp_path / "b.db")
+        try:
+            first = get_analytics_pipeline(first_path)
+            second = get_analytics_pipeline(second_path)
+
+            assert first is not second
+            assert get_analytics_pipeline(first_path) is first
+        finally:
+            shutdown_analytics_pipeline()
+
+        assert not first.is_running
+
+
+def _seed(repo) -> InMemoryAggregateRepo:
+    """Write the same events through both stores; returns the in-memory twin."""
+    twin = InMemoryAggregateRepo()
+    service = AggregateService()
+    content_a, content_b = uuid4(), uuid4()
+    events = [
+        AggregateInput(
+            event_type="page_view",
+            timestamp=NOW,
+            content_id=content_a,
+            utm_source="twitter",
+            utm_medium="social",
+            referrer_domain="t.co",
+            ua_class=UAClass.REAL,
+        ),
+        AggregateInput(
+            event_type="page_view",
+            timestamp=NOW.replace(hour=9),
+            content_id=content_a,
+            ua_class=UAClass.REAL,
+        ),
+        AggregateInput(
+            event_type="page_view",
+            timestamp=NOW,
+            content_id=content_b,
+            referrer_domain="example.com",
+            ua_class=UAClass.BOT,
+        ),
+        AggregateInput(event_type="outbound_click", timestamp=NOW, ua_class=UAClass.REAL),
+    ]
+    increments = [inc for event in events for inc in service.build_increments(event)]
+    repo.upsert_increments(increments)
+    twin.upsert_increments(increments)
+    return twin
+
+
+class TestPushedDownQueries:
+    @pytest.mark.parametrize("exclude_bots", [True, False])
+    def test_dashboard_matches_python_summary(self, repo, exclude_bots):
+        twin = _seed(repo)
+        sql = AggregateService(repo=repo)
+        python = AggregateService(repo=twin)
+
+        for bt in (BucketType.DAY, BucketType.HOUR):
+            got = sql.get_dashboard(bt, DAY_START, DAY_END, exclude_bots=exclude_bots)
+            want = python.get_dashboard(bt, DAY_START, DAY_END, exclude_bots=exclude_bots)
+            assert got.totals == want.totals
+            assert got.time_series == want.time_series
+            assert got.top_content == want.top_content
+            assert sorted(got.top_sources, key=repr) == sorted(want.top_sources, key=repr)
+            assert got.top_referrers == want.top_referrers
+
+    def test_getters_match_python(self, repo):
+        twin = _seed(repo)
+        sql = AggregateService(repo=repo)
+        python = AggregateService(repo=twin)
+
+        assert sql.get_totals(BucketType.DAY, DAY_START, DAY_END) == python.get_totals(
+            BucketType.DAY, DAY_START, DAY_END
+        )
+        assert sql.get_time_series(
+            BucketType.HOUR, DAY_START, DAY_END, event_type="page_view"
+        ) == python.get_time_series(BucketType.HOUR, DAY_START, DAY_END, event_type="page_view")
+        assert sql.get_top_content(BucketType.DAY, DAY_START, DAY_END, limit=1) == (
+            python.get_top_content(BucketType.DAY, DAY_START, DAY_END, limit=1)
+        )
+        assert sql.get_top_referrers(
+            BucketType.DAY, DAY_START, DAY_END, exclude_bots=False
+        ) == python.get_top_referrers(BucketType.DAY, DAY_START, DAY_END, exclude_bots=False)
+
+    def test_empty_range(self, repo):
+        summary = AggregateService(repo=repo).get_dashboard(BucketType.DAY, DAY_START, DAY_END)
+        assert summary.totals == {"total": 0, "total_with_bots": 0, "real": 0, "bot": 0}
+        assert summary.time_series == []
+        assert summary.top_content == []
+
+    def test_non_utc_bounds_are_normalized(self, repo):
+        _seed(repo)
+        plus_two = timezone(timedelta(hours=2))
+        totals = AggregateService(repo=repo).get_totals(
+            BucketType.DAY, DAY_START.astimezone(plus_two), DAY_END.astimezone(plus_two)
+        )
+        assert totals["total_with_bots"] == 4
+
+    def test_unknown_dimension_rejected(self, repo):
+        with pytest.raises(ValueError):
+            repo.top_values(("count_total",), "day", DAY_START, DAY_END, "page_view")
+
+    def test_dashboard_scan_uses_covering_index(self, repo):
+        with get_pool(repo.db_path).connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT event_type, content_id, SUM(count_real) "
+                "FROM analytics_aggregates "
+                "WHERE bucket_type = 'day' AND bucket_start >= ? AND bucket_start < ? "
+                "GROUP BY content_id",
+                (DAY_START.isoformat(), DAY_END.isoformat()),
+            ).fetchall()
+        assert any("COVERING INDEX idx_analytics_agg_dashboard" in r["detail"] for r in plan)
+
+
+class TestLinkClicks:
+    @pytest.fixture
+    def links(self, repo):
+        """Outbound clicks on two links through both stores; returns (twin, a, b)."""
+        twin = InMemoryAggregateRepo()
+        service = AggregateService()
+        link_a, link_b = uuid4(), uuid4()
+        events = [
+            AggregateInput(event_type="outbound_click", timestamp=NOW, link_id=str(link_a)),
+            AggregateInput(
+                event_type="outbound_click",
+                timestamp=NOW,
+                link_id=str(link_a),
+                utm_source="newsletter",
+                ua_class=UAClass.REAL,
+            ),
+            AggregateInput(
+                event_type="outbound_click",
+                timestamp=NOW.replace(hour=9),
+                link_id=str(link_a),
+                ua_class=UAClass.REAL,
+            ),
+            AggregateInput(
+                event_type="outbound_click",
+                timestamp=NOW,
+                link_id=str(link_a),
+                ua_class=UAClass.BOT,
+            ),
+            AggregateInput(
+                event_type="outbound_click",
+                timestamp=NOW,
+                link_id=str(link_b),
+                ua_class=UAClass.REAL,
+            ),
+            # A page view is not a click, even with a link id
+            AggregateInput(
+                event_type="page_view",
+                timestamp=NOW,
+                link_id=str(link_a),
+                ua_class=UAClass.REAL,
+            ),
+        ]
+        increments = [inc for event in events for inc in service.build_increments(event)]
+        repo.upsert_increments(increments)
+        twin.upsert_increments(increments)
+        return twin, link_a, link_b
+
+    def test_clicks_per_bucket_for_one_link(self, repo, links):
+        _, link_a, _ = links
+        service = AggregateService(repo=repo)
+
+        assert service.get_link_clicks(link_a, BucketType.HOUR, DAY_START, DAY_END) == [
+            {"timestamp": datetime(2024, 6, 15, 9, tzinfo=UTC), "count": 1},
+            {"timestamp": datetime(2024, 6, 15, 14, tzinfo=UTC), "count": 2},
+        ]
+        totals = service.get_totals(
+            BucketType.DAY, DAY_START, DAY_END, event_type="outbound_click", link_id=link_a
+        )
+        assert totals == {"total": 3, "total_with_bots": 4, "real": 3, "bot": 1}
+
+    def test_link_queries_match_python(self, repo, links):
+        twin, link_a, link_b = links
+        sql = AggregateService(repo=repo)
+        python = AggregateService(repo=twin)
+
+        for link_id in (link_a, link_b, uuid4()):
+            for exclude_bots in (True, False):
+                assert sql.get_link_clicks(
+                    link_id, BucketType.HOUR, DAY_START, DAY_END, exclude_bots=exclude_bots
+                ) == python.get_link_clicks(
+                    link_id, BucketType.HOUR, DAY_START, DAY_END, exclude_bots=exclude_bots
+                )
+        assert sql.get_top_links(BucketType.DAY, DAY_START, DAY_END) == python.get_top_links(
+            BucketType.DAY, DAY_START, DAY_END
+        )
+        assert sql.get_top_links(BucketType.DAY, DAY_START, DAY_END)[0] == {
+            "link_id": link_a,
+            "count": 3,
+        }
+
+    def test_link_series_uses_link_index(self, repo):
+        with get_pool(repo.db_path).connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT bucket_start, SUM(count_real) "
+                "FROM analytics_aggregates "
+                "WHERE bucket_type = 'hour' AND bucket_start >= ? AND bucket_start < ? "
+                "AND event_type = 'outbound_click' AND link_id = ? "
+                "GROUP BY bucket_start",
+                (DAY_START.isoformat(), DAY_END.isoformat(), str(uuid4())),
+            ).fetchall()
+        assert any("COVERING INDEX idx_analytics_agg_link" in r["detail"] for r in plan)
@@ -0,0 +1,255 @@
+"""
+Tests for the SQLite audit repository and write-behind queue (E8.1).
+
+Covers persistence, indexed filters, keyset pagination and batched
+write-behind flushes into audit_events.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.sqlite.migrator import SQLiteMigrator
+from src.adapters.sqlite.pool import close_all_pools, get_pool
+from src.adapters.sqlite_db import SQLiteAuditRepo
+from src.components.audit import (
+    AuditAction,
+    AuditEntry,
+    AuditQuery,
+    AuditService,
+    AuditWriteBehind,
+    EntityType,
+    WriteBehindConfig,
+    decode_cursor,
+    encode_cursor,
+)
+
+NOW = datetime(2024, 6, 15, 14, 30, tzinfo=UTC)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "audit.db")
+    SQLiteMigrator(path, "migrations").run_migrations()
+    yield path
+    close_all_pools()
+
+
+@pytest.fixture
+def repo(db_path: str) -> SQLiteAuditRepo:
+    return SQLiteAuditRepo(db_path)
+
+
+def make_entry(
+    minutes: int = 0,
+    action: AuditAction = AuditAction.UPDATE,
+    entity_type: EntityType = EntityType.CONTENT,
+    entity_id: str | None = "c1",
+    actor_id=None,
+) -> AuditEntry:
+    return AuditEntry(
+        id=uuid4(),
+        timestamp=NOW + timedelta(minutes=minutes),
+        action=action,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        actor_id=actor_id,
+        actor_name="Admin",
+        description="Changed",
+        metadata={"changes": {"title": {"old": "a", "new": "b"}}},
+        ip_address="10.0.0.1",
+    )
+
+
+# --- Persistence ---
+
+
+class TestSQLiteAuditRepo:
+    def test_round_trip(self, repo: SQLiteAuditRepo) -> None:
+        entry = make_entry(actor_id=uuid4())
+        repo.save(entry)
+
+        assert repo.get_by_id(entry.id) == entry
+
+    def test_null_entity_id(self, repo: SQLiteAuditRepo) -> None:
+        entry = make_entry(entity_type=EntityType.SYSTEM, entity_id=None)
+        repo.save(entry)
+
+        loaded = repo.get_by_id(entry.id)
+        assert loaded is not None and loaded.entity_id is None
+
+    def test_filters_and_count(self, repo: SQLiteAuditRepo) -> None:
+        actor = uuid4()
+        repo.save_many(
+            [
+                make_entry(0, AuditAction.CREATE, actor_id=actor),
+                make_entry(1, AuditAction.UPDATE, actor_id=actor),
+                make_entry(2, AuditAction.DELETE, EntityType.ASSET, "a1"),
+            ]
+        )
+
+        by_actor = repo.query(AuditQuery(actor_id=actor))
+        assert [e.action for e in by_actor] == [AuditAction.UPDATE, AuditAction.CREATE]
+        assert repo.count(AuditQuery(entity_type=EntityType.ASSET, entity_id="a1")) == 1
+        assert repo.count(AuditQuery(action=AuditAction.CREATE)) == 1
+        assert repo.count(AuditQuery(start_time=NOW + timedelta(minutes=1))) == 2
+
+    def test_keyset_pagination(self, repo: SQLiteAuditRepo) -> None:
+        # Two entries per timestamp exercise the id tie-breaker
+        entries = [make_entry(i // 2) for i in range(9)]
+        repo.save_many(entries)
+
+        seen: list[AuditEntry] = []
+        before = None
+        while True:
+            page = repo.query(AuditQuery(limit=4, before=before))
+            seen.extend(page)
+            if len(page) < 4:
+                break
+            before = decode_cursor(encode_cursor(page[-1]))
+
+        assert len(seen) == 9
+        assert {e.id for e in seen} == {e.id for e in entries}
+        keys = [(e.timestamp, str(e.id)) for e in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    @pytest.mark.parametrize(
+        ("where", "index"),
+        [
+            ("target_type = 'content' AND target_id = 'c1'", "idx_audit_events_target"),
+            ("actor_user_id = 'x'", "idx_audit_events_actor"),
+            ("action = 'update'", "idx_audit_events_action"),
+        ],
+    )
+    def test_filters_use_indexes(self, db_path: str, where: str, index: str) -> None:
+        with get_pool(db_path).connection(None) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM audit_events "
+                f"WHERE {where} ORDER BY created_at DESC, id DESC LIMIT 50"
+            ).fetchall()
+        details = " ".join(str(row[-1]) for row in plan)
+
+        assert index in details
+        assert "TEMP B-TREE" not in details
+
+
+# --- Write-behind ---
+
+
+class TestAuditWriteBehind:
+    def test_entries_batched_into_one_flush(self, repo: SQLiteAuditRepo) -> None:
+        writer = AuditWriteBehind(repo)
+        writer.start()
+        try:
+            service = AuditService(repo=writer)
+            for i in range(20):
+                service.log(AuditAction.UPDATE, EntityType.CONTENT, entity_id=f"c{i}")
+        finally:
+            writer.stop()
+
+        stats = writer.stats()
+        assert stats.entries_flushed == 20
+        assert stats.queue_depth == 0
+        assert repo.count(AuditQuery()) == 20
+
+    def test_reads_see_queued_writes(self, repo: SQLiteAuditRepo) -> None:
+        writer = AuditWriteBehind(repo)
+        writer.start()
+        try:
+            entry = make_entry()
+            writer.save(entry)
+
+            assert writer.get_by_id(entry.id) == entry
+        finally:
+            writer.stop()
+
+    def test_non_json_metadata_is_written(self, repo: SQLiteAuditRepo) -> None:
+        writer = AuditWriteBehind(repo)
+        entry = make_entry()
+        entry.metadata["changes"] = {"published_at": {"old": None, "new": NOW}}
+
+        writer.save(entry)
+
+        assert writer.count(AuditQuery()) == 1
+        assert writer.stats().flush_errors == 0
+        saved = repo.get_by_id(entry.id)
+        assert saved is not None
+        assert saved.metadata["changes"]["published_at"]["new"] == str(NOW)
+
+    def test_failing_entry_is_dropped_not_retried(self, repo: SQLiteAuditRepo) -> None:
+        poison = make_entry()
+
+        class PoisonRepo(SQLiteAuditRepo):
+            def save_many(self, entries):
+                if any(e.id == poison.id for e in entries):
+                    raise ValueError("cannot serialize")
+                super().save_many(entries)
+
+        writer = AuditWriteBehind(PoisonRepo(repo.db_path))
+        writer.start()
+        try:
+            writer.save(poison)
+            for minutes in range(1, 4):
+                writer.save(make_entry(minutes))
+        finally:
+            writer.stop()
+
+        stats = writer.stats()
+        assert stats.queue_depth == 0
+        assert stats.entries_flushed == 3
+        assert stats.entries_dropped == 1
+        assert repo.count(AuditQuery()) == 3
+        assert repo.get_by_id(poison.id) is None
+
+    def test_locked_database_requeues_batch(self, repo: SQLiteAuditRepo) -> None:
+        class LockedRepo(SQLiteAuditRepo):
+            failures = 2
+
+            def save_many(self, entries):
+                if self.failures:
+                    self.failures -= 1
+                    raise sqlite3.OperationalError("database is locked")
+                super().save_many(entries)
+
+        writer = AuditWriteBehind(LockedRepo(repo.db_path))
+        entries = [make_entry(minutes) for minutes in range(3)]
+        for entry in entries[:2]:
+            writer.save(entry)  # Write-through attempt fails; kept queued
+        assert writer.stats().queue_depth == 2
+
+        writer.save(entries[2])
+
+        stats = writer.stats()
+        assert (stats.queue_depth, stats.retries, stats.entries_dropped) == (0, 2, 0)
+        assert [e.id for e in repo.query(AuditQuery())] == [e.id for e in reversed(entries)]
+
+    def test_retries_are_bounded(self, repo: SQLiteAuditRepo) -> None:
+        class DownRepo(SQLiteAuditRepo):
+            def save_many(self, entries):
+                raise sqlite3.OperationalError("disk I/O error")
+
+        writer = AuditWriteBehind(DownRepo(repo.db_path), WriteBehindConfig(max_retries=2))
+        writer.save(make_entry())
+        writer.stop()
+
+        stats = writer.stats()
+        assert (stats.queue_depth, stats.retries, stats.entries_dropped) == (0, 2, 1)
+
+    def test_integrity_error_drops_only_that_entry(self, repo: SQLiteAuditRepo) -> None:
+        duplicate = make_entry()
+        repo.save(duplicate)
+        writer = AuditWriteBehind(repo)
+        writer.start()
+        try:
+            writer.save(duplicate)
+            writer.save(make_entry(1))
+        finally:
+            writer.stop()
+
+        stats = writer.stats()
+        assert (stats.entries_flushed, stats.entries_dropped, stats.retries) == (1, 1, 0)
+        assert repo.count(AuditQuery()) == 2
@@ -0,0 +1,87 @@
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.sqlite.migrator import SQLiteMigrator
+from src.adapters.sqlite.repos import SQLitePublishJobRepo
+from src.api.deps import Settings, get_clock, get_content_repo, get_publish_job_repo
+from src.api.routes.admin_schedule import get_scheduler_service
+from src.components.scheduler import create_publish_job
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "test_jobs.db")
+
+
+@pytest.fixture
+def repo(db_path):
+    SQLiteMigrator(db_path, "migrations").run_migrations()
+    return SQLitePublishJobRepo(db_path)
+
+
+NOW = datetime(2024, 6, 15, 12, 0, tzinfo=UTC)
+
+
+def _content(db_path):
+    content_id = uuid4()
+    # Plain connection: foreign keys are off, so no owner user is needed
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "INSERT INTO content_items (id, type, slug, title, status, owner_user_id, "
+            "visibility, created_at, updated_at) VALUES (?, 'post', ?, 't', 'scheduled', "
+            "'u', 'public', ?, ?)",
+            (str(content_id), str(content_id), NOW.isoformat(), NOW.isoformat()),
+        )
+    return content_id
+
+
+def _job(repo, minutes):
+    content_id = _content(repo.db_path)
+    job = create_publish_job(content_id, NOW + timedelta(minutes=minutes), NOW)
+    return repo.save(job)
+
+
+def test_claim_due_jobs_claims_batch_in_order(repo):
+    late = _job(repo, -1)
+    early = _job(repo, -10)
+    _job(repo, -5)
+    future = _job(repo, 10)
+
+    claimed = repo.claim_due_jobs("worker-1", NOW, limit=2)
+
+    assert [j.id for j in claimed][0] == early.id
+    assert len(claimed) == 2
+    assert all(j.status == "running" and j.claimed_by == "worker-1" for j in claimed)
+    assert late.id not in {j.id for j in claimed}
+    assert repo.get_by_id(future.id).status == "queued"
+
+
+def test_claim_due_jobs_never_claims_twice(repo):
+    for minutes in (-3, -2, -1):
+        _job(repo, minutes)
+
+    first = repo.claim_due_jobs("worker-1", NOW, limit=10)
+    second = repo.claim_due_jobs("worker-2", NOW, limit=10)
+
+    assert len(first) == 3
+    assert second == []
+
+
+def test_scheduler_service_persists_jobs_in_sqlite(repo, db_path):
+    settings = Settings()
+    settings.db_path = db_path
+    service = get_scheduler_service(
+        get_publish_job_repo(settings), get_content_repo(settings), get_clock(), None, None
+    )
+    publish_at = datetime.now(UTC) + timedelta(hours=1)
+
+    job, errors = service.schedule(_content(db_path), publish_at)
+
+    assert errors == []
+    # Visible to a separate repo instance, as another worker would see it
+    stored = SQLitePublishJobRepo(db_path).get_by_id(job.id)
+    assert stored is not None
+    assert stored.status == "queued"
@@ -0,0 +1,281 @@
+"""
+Query plan regression tests for the SQLite repos.
+
+Seeds a database at realistic volume (100k content items, 50k publish jobs,
+10k redirects), then calls each repo method with SQL tracing
+on the pooled connection and checks EXPLAIN QUERY PLAN for every statement
+it issued. A plan step "SCAN <table>" without an index is a full table scan
+and fails the test, so a query or migration change that drops index use is
+caught here rather than in production latency.
+
+The app never runs ANALYZE, so neither does the seed: plans are checked
+with the planner's default estimates, as production sees them.
+
+sqlite_db.SQLiteRedirectRepo and SQLiteAssetVersionRepo are not covered:
+their tables (redirect_rules, asset_versions) are not created by migrations.
+"""
+
+import sqlite3
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.adapters import sqlite_db
+from src.adapters.sqlite import repos
+from src.adapters.sqlite.migrator import SQLiteMigrator
+from src.adapters.sqlite.pool import get_pool
+from src.components.newsletter.models import SubscriberStatus
+
+N_CONTENT = 100_000
+N_JOBS = 50_000
+N_REDIRECTS = 10_000
+
+OWNER_ID = str(UUID(int=1))
+NOW = datetime(2024, 6, 15, 12, 0, tzinfo=UTC)
+
+TYPES = ("post", "page", "resource_pdf")
+# Mostly published, as on a long-running site
+CONTENT_STATUSES = ("published",) * 7 + ("draft", "draft", "scheduled", "archived")
+# Nearly all jobs have run; a few are still pending
+JOB_STATUSES = ("succeeded",) * 17 + ("failed", "queued", "retry_wait")
+
+_PLANNED = ("SELECT", "UPDATE", "DELETE", "WITH")
+
+
+def _uuid(prefix: int, i: int) -> str:
+    return str(UUID(int=(prefix << 64) | i))
+
+
+def _content_id(i: int) -> str:
+    return _uuid(1, i)
+
+
+def _job_id(i: int) -> str:
+    return _uuid(2, i)
+
+
+def _redirect_id(i: int) -> str:
+    return _uuid(3, i)
+
+
+def _iso(i: int, minutes: int = 1) -> str:
+    return (NOW - timedelta(minutes=i * minutes)).isoformat()
+
+
+def _seed(db_path: str) -> None:
+    # Plain connection: foreign keys are off, so the owner user need not exist
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany(
+            "INSERT INTO content_items (id, type, slug, title, summary, status, publish_at, "
+            "published_at, owner_user_id, visibility, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, '', ?, ?, ?, ?, 'public', ?, ?)",
+            (
+                (
+                    _content_id(i),
+                    TYPES[i % len(TYPES)],
+                    f"item-{i}",
+                    f"Item {i}",
+                    status := CONTENT_STATUSES[i % len(CONTENT_STATUSES)],
+                    _iso(-i) if status == "scheduled" else None,
+                    _iso(i) if status == "published" else None,
+                    OWNER_ID,
+                    _iso(i),
+                    _iso(i),
+                )
+                for i in range(N_CONTENT)
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO content_blocks (id, content_item_id, block_type, data_json, position) "
+            "VALUES (?, ?, 'markdown', '{}', ?)",
+            ((_uuid(4, i), _content_id(i // 2), i % 2) for i in range(N_CONTENT * 2)),
+        )
+        conn.executemany(
+            "INSERT INTO publish_jobs (id, content_id, publish_at_utc, status, attempts, "
+            "next_retry_at, created_at, updated_at) VALUES (?, ?, ?, ?, 0, ?, ?, ?)",
+            (
+                (
+                    _job_id(i),
+                    _content_id(i),
+                    _iso(i - N_JOBS // 2, minutes=10),
+                    status := JOB_STATUSES[i % len(JOB_STATUSES)],
+                    _iso(i - N_JOBS // 2, minutes=9) if status == "retry_wait" else None,
+                    _iso(i),
+                    _iso(i),
+                )
+                for i in range(N_JOBS)
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO redirects (id, source_path, target_path, status_code, enabled, "
+            "created_at, updated_at) VALUES (?, ?, ?, 301, 1, ?, ?)",
+            (
+                (_redirect_id(i), f"/old/{i}", f"/new/{i}", _iso(i), _iso(i))
+                for i in range(N_REDIRECTS)
+            ),
+        )
+    conn.close()
+
+
+@pytest.fixture(scope="module")
+def db_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("plans") / "plans.db")
+    SQLiteMigrator(path, "migrations").run_migrations()
+    _seed(path)
+    return path
+
+
+def _capture(db_path: str, fn: Callable[[], Any]) -> list[str]:
+    """Run fn and return the (parameter-expanded) SQL it issued on this thread."""
+    statements: list[str] = []
+    conn = get_pool(db_path).acquire()
+    conn.set_trace_callback(statements.append)
+    try:
+        fn()
+    finally:
+        conn.set_trace_callback(None)
+        conn.close()
+    return [s for s in statements if s.lstrip().upper().startswith(_PLANNED)]
+
+
+def _full_scans(db_path: str, sql: str) -> list[str]:
+    """Plan steps that read a whole table without an index."""
+    with get_pool(db_path).connection() as conn:
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+    return [
+        r["detail"]
+        for r in plan
+        if r["detail"].startswith("SCAN ") and " USING " not in r["detail"]
+    ]
+
+
+# (id, call) pairs; each call gets the seeded db path
+CASES: list[tuple[str, Callable[[str], Any]]] = [
+    # repos.SQLiteContentRepo
+    ("content.get_by_id", lambda p: repos.SQLiteContentRepo(p).get_by_id(UUID(_content_id(5)))),
+    ("content.get_by_slug", lambda p: repos.SQLiteContentRepo(p).get_by_slug("item-7", "page")),
+    ("content.list", lambda p: repos.SQLiteContentRepo(p).list()),
+    ("content.list_status", lambda p: repos.SQLiteContentRepo(p).list(status="draft")),
+    ("content.list_type", lambda p: repos.SQLiteContentRepo(p).list(content_type="page")),
+    (
+        "content.list_type_status",
+        lambda p: repos.SQLiteContentRepo(p).list(content_type="post", status="published"),
+    ),
+    (
+        "content.list_items",
+        lambda p: repos.SQLiteContentRepo(p).list_items({"status": "scheduled"}),
+    ),
+    ("content.list_published_refs", lambda p: repos.SQLiteContentRepo(p).list_published_refs()),
+    (
+        "content.get_related_published",
+        lambda p: repos.SQLiteContentRepo(p).get_related_published(exclude_id=uuid4()),
+    ),
+    ("content.delete", lambda p: repos.SQLiteContentRepo(p).delete(UUID(_content_id(11)))),
+    # repos.SQLitePublishJobRepo
+    ("jobs.get_by_id", lambda p: repos.SQLitePublishJobRepo(p).get_by_id(UUID(_job_id(3)))),
+    (
+        "jobs.get_by_idempotency_key",
+        lambda p: repos.SQLitePublishJobRepo(p).get_by_idempotency_key(uuid4(), NOW),
+    ),
+    ("jobs.list_due_jobs", lambda p: repos.SQLitePublishJobRepo(p).list_due_jobs(NOW)),
+    (
+        "jobs.claim_job",
+        lambda p: repos.SQLitePublishJobRepo(p).claim_job(UUID(_job_id(18)), "w", NOW),
+    ),
+    (
+        "jobs.claim_due_jobs",
+        lambda p: repos.SQLitePublishJobRepo(p).claim_due_jobs("w", NOW, limit=20),
+    ),
+    (
+        "jobs.list_in_range",
+        lambda p: repos.SQLitePublishJobRepo(p).list_in_range(NOW, NOW + timedelta(days=7)),
+    ),
+    (
+        "jobs.list_in_range_status",
+        lambda p: repos.SQLitePublishJobRepo(p).list_in_range(
+            NOW, NOW + timedelta(days=7), statuses=["queued", "retry_wait"]
+        ),
+    ),
+    ("jobs.delete", lambda p: repos.SQLitePublishJobRepo(p).delete(UUID(_job_id(21)))),
+    # repos.SQLiteRedirectRepo
+    ("redirects.get_by_id", lambda p: repos.SQLiteRedirectRepo(p).get_by_id(UUID(_redirect_id(1)))),
+    ("redirects.get_by_source", lambda p: repos.SQLiteRedirectRepo(p).get_by_source("/old/42")),
+    ("redirects.list_all", lambda p: repos.SQLiteRedirectRepo(p).list_all()),
+    ("redirects.delete", lambda p: repos.SQLiteRedirectRepo(p).delete(UUID(_redirect_id(2)))),
+    # sqlite_db.SQLiteContentRepoAdapter
+    (
+        "v3.content.get_by_slug",
+        lambda p: sqlite_db.SQLiteContentRepoAdapter(p).get_by_slug("item-8", "resource_pdf"),
+    ),
+    (
+        "v3.content.list_items",
+        lambda p: sqlite_db.SQLiteContentRepoAdapter(p).list_items({"status": "archived"}),
+    ),
+    (
+        "v3.content.get_related_published",
+        lambda p: sqlite_db.SQLiteContentRepoAdapter(p).get_related_published(exclude_id=uuid4()),
+    ),
+    (
+        "v3.content.list_scheduled_before",
+        lambda p: sqlite_db.SQLiteContentRepoAdapter(p).list_scheduled_before(NOW),
+    ),
+    # sqlite_db.SQLitePublishJobRepo
+    (
+        "v3.jobs.get_by_idempotency_key",
+        lambda p: sqlite_db.SQLitePublishJobRepo(p).get_by_idempotency_key(uuid4(), NOW),
+    ),
+    (
+        "v3.jobs.claim_next_runnable",
+        lambda p: sqlite_db.SQLitePublishJobRepo(p).claim_next_runnable("w", NOW),
+    ),
+    ("v3.jobs.list_pending", lambda p: sqlite_db.SQLitePublishJobRepo(p).list_pending()),
+    (
+        "v3.jobs.list_by_content",
+        lambda p: sqlite_db.SQLitePublishJobRepo(p).list_by_content(UUID(_content_id(9))),
+    ),
+    (
+        "v3.jobs.list_in_range",
+        lambda p: sqlite_db.SQLitePublishJobRepo(p).list_in_range(
+            NOW - timedelta(days=1), NOW, statuses=["failed"]
+        ),
+    ),
+    # sqlite_db.SQLiteNewsletterSubscriberRepo
+    (
+        "v3.newsletter.iter_all",
+        lambda p: list(sqlite_db.SQLiteNewsletterSubscriberRepo(p).iter_all()),
+    ),
+    (
+        "v3.newsletter.iter_all_status",
+        lambda p: list(
+            sqlite_db.SQLiteNewsletterSubscriberRepo(p).iter_all(SubscriberStatus.CONFIRMED)
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize("call", [c for _, c in CASES], ids=[name for name, _ in CASES])
+def test_repo_query_uses_index(db_path, call):
+    statements = _capture(db_path, lambda: call(db_path))
+
+    assert statements, "no SQL captured"
+    scans = {sql: found for sql in statements if (found := _full_scans(db_path, sql))}
+    assert not scans, f"full table scan: {scans}"
+
+
+def test_unindexed_query_is_reported(db_path):
+    """The harness itself flags a scan (guards against a vacuous pass)."""
+    assert _full_scans(db_path, "SELECT * FROM content_items WHERE title = 'x'") == [
+        "SCAN content_items"
+    ]
+
+
+def test_due_jobs_seek_status_index(db_path):
+    (sql,) = _capture(db_path, lambda: repos.SQLitePublishJobRepo(db_path).list_due_jobs(NOW))
+
+    with get_pool(db_path).connection() as conn:
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+    assert any("idx_publish_jobs_status_due" in r["detail"] for r in plan)
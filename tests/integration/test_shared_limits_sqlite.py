@@ -0,0 +1,210 @@
+"""
+Tests for the SQLite-backed shared rate-limit and dedupe store.
+
+Covers cross-process enforcement (several worker processes on one file),
+local batching, expiry and batched cleanup.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from typing import Any
+
+import pytest
+
+from src.adapters.sqlite.pool import close_all_pools
+from src.adapters.sqlite.shared_limits import SQLiteDedupeStore, SQLiteRateLimitStore
+from tests.conftest import FakeClock
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    yield str(tmp_path / "limits.db")
+    close_all_pools()
+
+
+# --- Worker processes ---
+
+
+def _hit_worker(db_path: str, attempts: int, queue: multiprocessing.Queue) -> None:
+    store = SQLiteRateLimitStore(db_path, sync_interval=0)
+    allowed = sum(store.hit("login:1.2.3.4", 5, 60) for _ in range(attempts))
+    queue.put(allowed)
+
+
+def _dedupe_worker(db_path: str, keys: int, queue: multiprocessing.Queue) -> None:
+    store = SQLiteDedupeStore(db_path)
+    queue.put(sum(store.add(f"event-{i}", 60) for i in range(keys)))
+
+
+def _run_workers(target, db_path: str, arg: int, workers: int = 4) -> list[int]:
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    procs = [ctx.Process(target=target, args=(db_path, arg, queue)) for _ in range(workers)]
+    for proc in procs:
+        proc.start()
+    results = [queue.get(timeout=60) for _ in procs]
+    for proc in procs:
+        proc.join(timeout=60)
+    return results
+
+
+# --- Cross-process ---
+
+
+class TestMultiProcess:
+    def test_rate_limit_shared_by_workers(self, db_path: str) -> None:
+        SQLiteRateLimitStore(db_path)
+
+        results = _run_workers(_hit_worker, db_path, 10)
+
+        # Small limits sync every hit, so the limit holds exactly
+        assert sum(results) == 5
+
+    def test_dedupe_shared_by_workers(self, db_path: str) -> None:
+        SQLiteDedupeStore(db_path)
+
+        results = _run_workers(_dedupe_worker, db_path, 50)
+
+        assert sum(results) == 50
+
+
+# --- Rate Limits ---
+
+
+class TestSQLiteRateLimitStore:
+    def test_hit_enforces_limit(self, db_path: str, clock: FakeClock[float]) -> None:
+        store = SQLiteRateLimitStore(db_path, clock=clock)
+
+        assert [store.hit("k", 3, 60) for _ in range(4)] == [True, True, True, False]
+
+    def test_instances_share_counters(self, db_path: str, clock: FakeClock[float]) -> None:
+        first = SQLiteRateLimitStore(db_path, clock=clock, sync_interval=0)
+        second = SQLiteRateLimitStore(db_path, clock=clock, sync_interval=0)
+
+        assert first.hit("k", 2, 60) is True
+        assert second.hit("k", 2, 60) is True
+        assert first.hit("k", 2, 60) is False
+
+    def test_hits_batched_for_large_limits(self, db_path: str, clock: FakeClock[float]) -> None:
+        store = SQLiteRateLimitStore(db_path, clock=clock, max_batch=10)
+        for _ in range(25):
+            store.hit("k", 600, 60)
+
+        stats = store.stats()
+        assert stats.flushed_hits == 20
+        assert stats.syncs == 2  # two full batches; a new key is not loaded on its own
+
+        store.flush()
+        assert store.stats().flushed_hits == 25
+
+    def test_new_key_counted_locally_until_batch_fills(
+        self, db_path: str, clock: FakeClock[float]
+    ) -> None:
+        store = SQLiteRateLimitStore(db_path, clock=clock, max_batch=10)
+        other = SQLiteRateLimitStore(db_path, clock=clock, sync_interval=0)
+        for _ in range(9):
+            store.hit("k", 600, 60)
+        assert store.stats().syncs == 0
+
+        store.hit("k", 600, 60)
+        assert other.peek("k", 15, 60) == (True, 5)
+
+    def test_sync_does_not_block_other_keys(self, db_path: str) -> None:
+        store = SQLiteRateLimitStore(db_path)
+        # A key on a different lock stripe than "slow"
+        fast = next(
+            f"fast-{i}"
+            for i in range(100)
+            if store._stripe(f"fast-{i}") is not store._stripe("slow")
+        )
+        entered, release = threading.Event(), threading.Event()
+        load_counter = store._load_counter
+
+        def blocking_load(conn: Any, key: str, window: float, now: float) -> Any:
+            if key == "slow":
+                entered.set()
+                release.wait(10)
+            return load_counter(conn, key, window, now)
+
+        store._load_counter = blocking_load  # type: ignore[method-assign]
+        slow = threading.Thread(target=store.hit, args=("slow", 5, 60))
+        slow.start()
+        try:
+            assert entered.wait(5)
+            done = threading.Thread(target=lambda: [store.hit(fast, 600, 60) for _ in range(3)])
+            done.start()
+            done.join(5)
+            assert not done.is_alive()
+        finally:
+            release.set()
+            slow.join(5)
+
+        assert store.stats().allowed == 4
+
+    def test_peek_and_record(self, db_path: str, clock: FakeClock[float]) -> None:
+        store = SQLiteRateLimitStore(db_path, clock=clock)
+
+        assert store.peek("k", 1, 3600) == (True, 1)
+        store.record("k", 3600)
+        assert store.peek("k", 1, 3600) == (False, 0)
+
+    def test_expired_rows_purged(self, db_path: str, clock: FakeClock[float]) -> None:
+        store = SQLiteRateLimitStore(db_path, clock=clock)
+        for i in range(20):
+            store.hit(f"ip-{i}", 5, 60)
+
+        clock.now += 121
+
+        assert store.sweep() == 20
+        assert store.stats().local_keys == 0
+
+    def test_reset(self, db_path: str, clock: FakeClock[float]) -> None:
+        store = SQLiteRateLimitStore(db_path, clock=clock)
+        store.hit("k", 1, 60)
+
+        store.reset("k")
+
+        assert store.hit("k", 1, 60) is True
+
+
+# --- Dedupe ---
+
+
+class TestSQLiteDedupeStore:
+    def test_add_and_exists(self, db_path: str, clock: FakeClock[float]) -> None:
+        store = SQLiteDedupeStore(db_path, clock=clock)
+
+        assert store.add("key", 10) is True
+        assert store.add("key", 10) is False
+        assert store.exists("key") is True
+        assert store.exists("other") is False
+
+    def test_claimed_by_other_instance(self, db_path: str, clock: FakeClock[float]) -> None:
+        first = SQLiteDedupeStore(db_path, clock=clock)
+        second = SQLiteDedupeStore(db_path, clock=clock)
+
+        assert first.add("key", 10) is True
+        assert second.add("key", 10) is False
+
+    def test_expired_key_reclaimed(self, db_path: str, clock: FakeClock[float]) -> None:
+        first = SQLiteDedupeStore(db_path, clock=clock)
+        second = SQLiteDedupeStore(db_path, clock=clock)
+        first.add("key", 10)
+
+        clock.now += 11
+
+        assert first.exists("key") is False
+        assert second.add("key", 10) is True
+
+    def test_cleanup_expired(self, db_path: str, clock: FakeClock[float]) -> None:
+        store = SQLiteDedupeStore(db_path, clock=clock)
+        for i in range(3):
+            store.add(f"key-{i}", 1)
+        store.add("live", 60)
+
+        clock.now += 2
+
+        assert store.cleanup_expired() == 3
+        assert store.exists("live") is True
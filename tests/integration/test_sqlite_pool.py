@@ -0,0 +1,224 @@
+"""
+Tests for the shared SQLite connection pool.
+
+Covers thread affinity, PRAGMA tuning, release semantics, the
+SQLiteUnitOfWork dedicated path and pool statistics.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.sqlite.migrator import SQLiteMigrator
+from src.adapters.sqlite.pool import (
+    SQLiteConnectionPool,
+    close_all_pools,
+    get_pool,
+    get_pool_stats,
+)
+from src.adapters.sqlite.repos import SQLiteContentRepo
+from src.adapters.sqlite_db import SQLiteUnitOfWork
+from src.domain.entities import ContentBlock, ContentItem
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "pool.db")
+    SQLiteMigrator(path, "migrations").run_migrations()
+    yield path
+    close_all_pools()
+
+
+@pytest.fixture
+def owner_id(db_path):
+    uid = str(uuid4())
+    conn = sqlite3.connect(db_path)
+    now = datetime.now(UTC).isoformat()
+    conn.execute(
+        "INSERT INTO users "
+        "(id, email, display_name, password_hash, status, created_at, updated_at) "
+        "VALUES (?, ?, 'Owner', 'hash', 'active', ?, ?)",
+        (uid, f"{uid}@example.com", now, now),
+    )
+    conn.commit()
+    conn.close()
+    return uid
+
+
+class TestThreadAffinity:
+    def test_same_thread_reuses_connection(self, db_path):
+        pool = SQLiteConnectionPool(db_path)
+        first = pool.acquire()
+        first.close()
+        second = pool.acquire()
+        second.close()
+
+        assert first is second
+        stats = pool.stats()
+        assert stats.connections_opened == 1
+        assert stats.acquires == 2
+        assert stats.reuses == 1
+        pool.close_all()
+
+    def test_threads_get_distinct_connections(self, db_path):
+        pool = SQLiteConnectionPool(db_path)
+        seen: list[int] = []
+
+        def worker():
+            conn = pool.acquire()
+            seen.append(id(conn))
+            conn.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(set(seen)) == 3
+        pool.close_all()
+
+    def test_nested_acquire_shares_connection(self, db_path):
+        pool = SQLiteConnectionPool(db_path)
+        outer = pool.acquire()
+        inner = pool.acquire()
+        assert inner is outer
+        inner.close()
+        # Outer is still usable after the inner release
+        assert outer.execute("SELECT 1 AS one").fetchone()["one"] == 1
+        outer.close()
+        pool.close_all()
+
+    def test_nested_commit_covers_outer_writes(self, db_path):
+        pool = SQLiteConnectionPool(db_path)
+        outer = pool.acquire()
+        outer.execute(
+            "INSERT INTO audit_events "
+            "(id, actor_user_id, action, target_type, target_id, meta_json, created_at) "
+            "VALUES ('a1', NULL, 'x', 't', '1', '{}', '2025-01-01')"
+        )
+        inner = pool.acquire()
+        inner.commit()
+        inner.close()
+        outer.rollback()
+        outer.close()
+
+        # The inner commit already made the outer insert durable
+        with pool.connection() as conn:
+            row = conn.execute("SELECT COUNT(*) AS n FROM audit_events").fetchone()
+        assert row["n"] == 1
+        pool.close_all()
+
+
+class TestPragmas:
+    def test_tuned_pragmas_applied(self, db_path):
+        pool = SQLiteConnectionPool(db_path)
+        with pool.connection(row_factory=None) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        pool.close_all()
+
+
+class TestReleaseSemantics:
+    def test_uncommitted_work_rolled_back_on_release(self, db_path):
+        pool = SQLiteConnectionPool(db_path)
+        conn = pool.acquire()
+        conn.execute(
+            "INSERT INTO audit_events "
+            "(id, actor_user_id, action, target_type, target_id, meta_json, created_at) "
+            "VALUES ('a1', NULL, 'x', 't', '1', '{}', '2025-01-01')"
+        )
+        conn.close()
+
+        with pool.connection() as conn:
+            row = conn.execute("SELECT COUNT(*) AS n FROM audit_events").fetchone()
+        assert row["n"] == 0
+        pool.close_all()
+
+    def test_row_factory_restored_after_nested_release(self, db_path):
+        pool = SQLiteConnectionPool(db_path)
+        outer = pool.acquire()
+        inner = pool.acquire(sqlite3.Row)
+        inner.close()
+        row = outer.execute("SELECT 1 AS one").fetchone()
+        assert isinstance(row, dict)
+        outer.close()
+        pool.close_all()
+
+    def test_replaced_database_file_is_reopened(self, tmp_path):
+        path = str(tmp_path / "replaced.db")
+        pool = SQLiteConnectionPool(path)
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.commit()
+
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        sqlite3.connect(path).close()
+
+        with pool.connection() as conn:
+            tables = conn.execute("SELECT name FROM sqlite_master").fetchall()
+        assert tables == []
+        assert pool.stats().stale_reopens == 1
+        pool.close_all()
+
+
+class TestUnitOfWork:
+    def test_uow_uses_dedicated_connection(self, db_path):
+        shared = get_pool(db_path).acquire()
+        with SQLiteUnitOfWork(db_path) as uow:
+            assert uow._conn is not shared
+        shared.close()
+
+    def test_uow_rollback_discards_and_connection_is_recycled(self, db_path, owner_id):
+        now = datetime.now(UTC)
+        with pytest.raises(RuntimeError):
+            with SQLiteUnitOfWork(db_path) as uow:
+                uow.audit_log._get_conn().execute(
+                    "INSERT INTO audit_events "
+                    "(id, actor_user_id, action, target_type, target_id, meta_json, created_at) "
+                    "VALUES (?, NULL, 'x', 't', '1', '{}', ?)",
+                    (str(uuid4()), now.isoformat()),
+                )
+                raise RuntimeError("boom")
+
+        with SQLiteUnitOfWork(db_path) as uow:
+            assert uow.audit_log.list_recent() == []
+
+        stats = get_pool(db_path).stats()
+        assert stats.dedicated_in_use == 0
+        assert stats.dedicated_idle == 1
+
+
+class TestReposUsePool:
+    def test_content_repo_round_trip_reuses_connection(self, db_path, owner_id):
+        repo = SQLiteContentRepo(db_path)
+        item = ContentItem(
+            type="post",
+            slug="pooled",
+            title="Pooled",
+            status="draft",
+            owner_user_id=owner_id,
+            visibility="public",
+            blocks=[ContentBlock(block_type="markdown", data_json={"text": "hi"})],
+        )
+        repo.save(item)
+        for _ in range(5):
+            assert repo.get_by_id(item.id) is not None
+
+        stats = get_pool(db_path).stats()
+        assert stats.connections_opened == 1
+        assert stats.reuses >= 5
+
+    def test_pool_stats_listed(self, db_path):
+        get_pool(db_path).acquire().close()
+        assert any(s.db_path == db_path for s in get_pool_stats())
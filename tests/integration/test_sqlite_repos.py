@@ -1,12 +1,15 @@
 import sqlite3
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
 
 from src.adapters.sqlite.migrator import SQLiteMigrator
-from src.adapters.sqlite.repos import SQLiteContentRepo
+from src.adapters.sqlite.repos import SQLiteContentRepo, SQLiteRedirectRepo
+from src.components.C2_PublicTemplates import SitemapStore
+from src.components.redirects import CompiledRedirectIndex, RedirectService
 from src.domain.entities import ContentBlock, ContentItem
+from tests.conftest import FakeClock
 
 
 @pytest.fixture
@@ -111,3 +114,138 @@ def test_delete_content(repo, user_repo):
 
     repo.delete(item_id)
     assert repo.get_by_id(item_id) is None
+
+
+def _make_item(owner_id, slug, status="published", n_blocks=2):
+    return ContentItem(
+        type="post",
+        slug=slug,
+        title=slug.title(),
+        status=status,
+        owner_user_id=owner_id,
+        visibility="public",
+        published_at=datetime.now() if status == "published" else None,
+        blocks=[
+            ContentBlock(block_type="markdown", data_json={"text": f"{slug}-{i}"})
+            for i in range(n_blocks)
+        ],
+    )
+
+
+def _count_statements(db_path, fn):
+    """Run fn and count SQL statements issued on this thread's pooled connection."""
+    from src.adapters.sqlite.pool import get_pool
+
+    statements: list[str] = []
+    conn = get_pool(db_path).acquire()
+    conn.set_trace_callback(statements.append)
+    try:
+        result = fn()
+    finally:
+        conn.set_trace_callback(None)
+        conn.close()
+    return result, statements
+
+
+def test_list_hydrates_blocks_in_batch(repo, user_repo, db_path):
+    for i in range(5):
+        repo.save(_make_item(user_repo, f"batch-{i}", n_blocks=3))
+
+    (items, total), statements = _count_statements(db_path, lambda: repo.list(status="published"))
+
+    assert total == 5
+    assert len(items) == 5
+    for item in items:
+        assert [b.data_json["text"] for b in item.blocks] == [f"{item.slug}-{i}" for i in range(3)]
+    # count + items + one blocks query, regardless of item count
+    assert len(statements) == 3
+
+
+def test_list_projection_skips_blocks(repo, user_repo, db_path):
+    repo.save(_make_item(user_repo, "projected"))
+
+    (items, total), statements = _count_statements(db_path, lambda: repo.list(include_blocks=False))
+
+    assert total == 1
+    assert items[0].slug == "projected"
+    assert items[0].blocks == []
+    assert not any("content_blocks" in s for s in statements)
+
+
+def test_get_by_slug_single_lookup(repo, user_repo, db_path):
+    repo.save(_make_item(user_repo, "by-slug"))
+
+    item, statements = _count_statements(db_path, lambda: repo.get_by_slug("by-slug", "post"))
+
+    assert item is not None
+    assert len(item.blocks) == 2
+    assert len(statements) == 2
+
+
+def test_get_related_published_batch(repo, user_repo, db_path):
+    current = _make_item(user_repo, "current")
+    repo.save(current)
+    for i in range(3):
+        repo.save(_make_item(user_repo, f"related-{i}"))
+    repo.save(_make_item(user_repo, "draft-one", status="draft"))
+
+    related, statements = _count_statements(
+        db_path, lambda: repo.get_related_published(exclude_id=current.id, limit=10)
+    )
+
+    assert {r.slug for r in related} == {"related-0", "related-1", "related-2"}
+    assert all(len(r.blocks) == 2 for r in related)
+    assert len(statements) == 2
+
+
+def test_list_published_refs_unbounded(repo, user_repo, db_path):
+    for i in range(120):
+        repo.save(_make_item(user_repo, f"ref-{i}", n_blocks=0))
+    repo.save(_make_item(user_repo, "ref-draft", status="draft", n_blocks=0))
+
+    refs, statements = _count_statements(db_path, repo.list_published_refs)
+
+    assert len(refs) == 120
+    assert "ref-draft" not in {slug for _, slug, _, _, _ in refs}
+    assert all(published_at is not None for _, _, _, published_at, _ in refs)
+    assert len(statements) == 1
+
+
+def test_sitemap_store_sees_writes_from_other_processes(repo, user_repo, db_path):
+    # The reader has its own repo, as another worker process would
+    clock = FakeClock(datetime(2100, 1, 1, tzinfo=UTC))
+    store = SitemapStore(SQLiteContentRepo(db_path), clock=clock, check_interval_seconds=10)
+    repo.save(_make_item(user_repo, "first", n_blocks=0))
+    assert [row[0] for row in store.snapshot().rows] == ["first"]
+
+    draft = _make_item(user_repo, "second", status="draft", n_blocks=0)
+    repo.save(draft)
+    draft.status = "published"
+    draft.published_at = datetime.now()
+    draft.updated_at = datetime.now() + timedelta(seconds=1)
+    repo.save(draft)
+
+    clock.now += timedelta(seconds=10)
+    assert sorted(row[0] for row in store.snapshot().rows) == ["first", "second"]
+
+
+def test_redirect_index_sees_writes_from_other_processes(repo, db_path, clock):
+    # One repo + index per worker process, sharing the database file
+    writer_index = CompiledRedirectIndex(SQLiteRedirectRepo(db_path), clock=clock)
+    reader_repo = SQLiteRedirectRepo(db_path)
+    reader_index = CompiledRedirectIndex(reader_repo, check_interval_seconds=2, clock=clock)
+    service = RedirectService(repo=SQLiteRedirectRepo(db_path), index=writer_index)
+    assert reader_index.resolve("/old") is None
+    version = reader_repo.version()
+
+    created, _ = service.create("/old", "/new")
+    assert created is not None
+    assert reader_repo.version() != version
+    assert reader_index.resolve("/old") is None  # Not checked yet
+
+    clock.now += 2
+    assert reader_index.resolve("/old") == ("/new", 301)
+
+    service.delete(created.id)
+    clock.now += 2
+    assert reader_index.resolve("/old") is None
@@ -57,7 +57,8 @@ def setup_test_db():
             password_hash TEXT NOT NULL,
             status TEXT NOT NULL,
             created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL
+            updated_at TEXT NOT NULL,
+            auth_version INTEGER NOT NULL DEFAULT 0
         )
     """)
 
@@ -5,6 +5,8 @@ Spec refs: E16.4
 Test assertions: TA-0084, TA-0085, TA-0086, TA-0087
 """
 
+import gzip
+import json
 import sqlite3
 from collections.abc import Generator
 from datetime import UTC, datetime
@@ -295,6 +297,71 @@ class TestExportSubscribers:
         assert "confirmation_token" not in content
         assert "unsubscribe_token" not in content
 
+    def test_export_csv_has_no_row_cap(self, client: TestClient, test_db_path: str) -> None:
+        """TA-0087: Every subscriber is exported (the old export stopped at 10k)."""
+        created = datetime(2024, 1, 1, tzinfo=UTC).isoformat()
+        with sqlite3.connect(test_db_path) as conn:
+            conn.executemany(
+                "INSERT INTO newsletter_subscribers (id, email, status, created_at) "
+                "VALUES (?, ?, 'confirmed', ?)",
+                ((str(uuid4()), f"user{i}@example.com", created) for i in range(10_050)),
+            )
+
+        response = client.get("/api/admin/newsletter/subscribers/export/csv")
+
+        assert response.status_code == 200
+        lines = response.text.strip().split("\n")
+        assert len(lines) == 10_051  # header + every subscriber
+        assert len(set(lines)) == 10_051
+
+    def test_export_csv_gzip(
+        self, client: TestClient, sample_subscribers: list[NewsletterSubscriber]
+    ) -> None:
+        """Gzipped export decompresses to the plain CSV."""
+        plain = client.get("/api/admin/newsletter/subscribers/export/csv")
+        response = client.get("/api/admin/newsletter/subscribers/export/csv?gzip=true")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        assert "newsletter_subscribers.csv.gz" in response.headers["content-disposition"]
+        assert gzip.decompress(response.content) == plain.content
+
+    def test_export_jsonl(
+        self, client: TestClient, sample_subscribers: list[NewsletterSubscriber]
+    ) -> None:
+        """JSON Lines export with status filter."""
+        response = client.get("/api/admin/newsletter/subscribers/export/jsonl?status=confirmed")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["email"] for r in records] == ["confirmed@example.com"]
+        assert "unsubscribe_token" not in response.text
+
+
+class TestSubscriberRepoIterAll:
+    """Keyset-paginated iteration behind the export."""
+
+    def test_pages_cover_every_row_once(self, test_repo: SQLiteNewsletterSubscriberRepo) -> None:
+        """Rows sharing a created_at are split across pages without loss."""
+        same_time = datetime(2024, 1, 1, tzinfo=UTC)
+        for i in range(7):
+            test_repo.save(
+                NewsletterSubscriber(
+                    id=uuid4(),
+                    email=f"user{i}@example.com",
+                    status=SubscriberStatus.CONFIRMED if i % 2 else SubscriberStatus.PENDING,
+                    created_at=same_time,
+                )
+            )
+
+        emails = [s.email for s in test_repo.iter_all(batch_size=2)]
+        confirmed = list(test_repo.iter_all(SubscriberStatus.CONFIRMED, batch_size=2))
+
+        assert sorted(emails) == [f"user{i}@example.com" for i in range(7)]
+        assert len(confirmed) == 3
+        assert all(s.status == SubscriberStatus.CONFIRMED for s in confirmed)
+
 
 # --- Stats Endpoint Tests ---
 
@@ -17,6 +17,7 @@ from src.components.analytics import (
     DedupeService,
     InMemoryDedupeStore,
     UAClass,
+    UAClassifier,
     classify_user_agent,
     create_dedupe_service,
     generate_dedupe_key,
@@ -210,6 +211,70 @@ class TestClassifyUserAgent:
         assert result == UAClass.BOT
 
 
+class TestUAClassifier:
+    """Test the compiled, cached classifier."""
+
+    def test_matches_substring_semantics(self) -> None:
+        """Compiled patterns agree with a per-pattern substring scan."""
+        config = DedupeConfig()
+        classifier = UAClassifier(config)
+        samples = [
+            "Mozilla/5.0 (compatible; AhrefsBot/7.0)",
+            "Mozilla/5.0 Chrome/120.0",
+            "Opera/9.80 (Windows NT 6.1)",
+            "Java/17.0.2",
+            "Go-http-client/2.0",
+            "facebookexternalhit/1.1",
+            "ClaudeBot/1.0",
+            "CustomApp/1.0",
+        ]
+
+        for ua in samples:
+            lowered = ua.lower()
+            if any(p in lowered for p in config.bot_patterns):
+                expected = UAClass.BOT
+            elif any(p in lowered for p in config.real_browser_patterns):
+                expected = UAClass.REAL
+            else:
+                expected = UAClass.UNKNOWN
+            assert classifier.classify(ua) == expected, ua
+
+    def test_repeated_ua_served_from_cache(self) -> None:
+        """Repeated UA strings hit the cache."""
+        classifier = UAClassifier()
+        for _ in range(4):
+            classifier.classify("curl/8.0")
+
+        stats = classifier.stats()
+        assert (stats.hits, stats.misses, stats.size) == (3, 1, 1)
+        assert stats.hit_rate == 0.75
+
+    def test_cache_is_bounded(self) -> None:
+        """Cache never grows past its size."""
+        classifier = UAClassifier(cache_size=2)
+        for i in range(5):
+            classifier.classify(f"Agent/{i}")
+
+        assert classifier.stats().size == 2
+
+    def test_custom_patterns(self) -> None:
+        """Each config compiles its own pattern set."""
+        config = DedupeConfig(bot_patterns=("monitor",), real_browser_patterns=())
+        classifier = UAClassifier(config)
+
+        assert classifier.classify("UptimeMonitor/1.0") == UAClass.BOT
+        assert classifier.classify("Mozilla/5.0 Chrome/120.0") == UAClass.UNKNOWN
+
+    def test_service_exposes_stats(self, service: DedupeService) -> None:
+        """DedupeService reports classifier cache counters."""
+        before = service.classifier_stats()
+        service.classify("Mozilla/5.0 Firefox/120.0")
+        service.classify("Mozilla/5.0 Firefox/120.0")
+
+        after = service.classifier_stats()
+        assert after.hits + after.misses == before.hits + before.misses + 2
+
+
 class TestIsBotAndShouldCount:
     """Test bot checking and counting logic."""
 
@@ -14,16 +14,19 @@ import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from src.api.routes.analytics_ingest import router
+from src.api.routes.analytics_ingest import get_ingestion_service, router
+from src.components.analytics import AnalyticsIngestionService, InMemoryEventStore
 
 # --- Test Client Setup ---
 
 
 @pytest.fixture
 def client() -> TestClient:
-    """Test client."""
+    """Test client (events go to an in-memory store, not the pipeline)."""
+    service = AnalyticsIngestionService(event_store=InMemoryEventStore())
     app = FastAPI()
     app.include_router(router)
+    app.dependency_overrides[get_ingestion_service] = lambda: service
     return TestClient(app)
 
 
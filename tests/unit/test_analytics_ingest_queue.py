@@ -0,0 +1,135 @@
+"""
+Tests for the non-blocking IngestQueue (E6.1).
+
+Test assertions:
+- Queued payloads get the same validation as /a/event and reach the store
+- A full queue drops instead of blocking the caller
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from src.components.analytics import (
+    AnalyticsIngestionService,
+    IngestionConfig,
+    IngestQueue,
+    IngestQueueConfig,
+    InMemoryEventStore,
+)
+from src.components.analytics._impl import AnalyticsEvent, IngestionError
+
+
+@pytest.fixture
+def store() -> InMemoryEventStore:
+    return InMemoryEventStore()
+
+
+@pytest.fixture
+def queue(store: InMemoryEventStore) -> IngestQueue:
+    return IngestQueue(AnalyticsIngestionService(event_store=store))
+
+
+class BlockingService(AnalyticsIngestionService):
+    """Ingestion service that waits for a signal before each event."""
+
+    def __init__(self, store: InMemoryEventStore) -> None:
+        super().__init__(event_store=store)
+        self.release = threading.Event()
+
+    def ingest(
+        self, data: dict[str, Any], client_key: str | None = None
+    ) -> tuple[AnalyticsEvent | None, list[IngestionError]]:
+        self.release.wait(5)
+        return super().ingest(data, client_key)
+
+
+class TestSubmit:
+    def test_ingests_inline_without_worker(
+        self, queue: IngestQueue, store: InMemoryEventStore
+    ) -> None:
+        assert queue.submit({"event_type": "outbound_click", "link_id": "cta"})
+
+        (event,) = store.get_all()
+        assert event.link_id == "cta"
+        assert queue.stats().ingested == 1
+
+    def test_invalid_payload_is_rejected(
+        self, queue: IngestQueue, store: InMemoryEventStore
+    ) -> None:
+        queue.submit({"event_type": "outbound_click", "user_agent": "Mozilla/5.0"})
+        queue.submit({"event_type": "form_submit"})
+
+        assert store.get_all() == []
+        stats = queue.stats()
+        assert stats.rejected == 2
+        assert stats.ingested == 0
+
+    def test_payload_keeps_its_timestamp(
+        self, queue: IngestQueue, store: InMemoryEventStore
+    ) -> None:
+        ts = datetime.now(UTC).replace(microsecond=0)
+        queue.submit({"event_type": "outbound_click", "ts": ts})
+
+        assert store.get_all()[0].timestamp == ts
+
+    def test_rate_limit_applies_per_client(self, store: InMemoryEventStore) -> None:
+        service = AnalyticsIngestionService(
+            event_store=store, config=IngestionConfig(rate_limit_max_requests=2)
+        )
+        queue = IngestQueue(service)
+        for _ in range(3):
+            queue.submit({"event_type": "outbound_click"}, client_key="1.2.3.4")
+        queue.submit({"event_type": "outbound_click"}, client_key="5.6.7.8")
+
+        assert len(store.get_all()) == 3
+        assert queue.stats().rejected == 1
+
+
+class TestWorker:
+    def test_full_queue_drops_without_blocking(self, store: InMemoryEventStore) -> None:
+        service = BlockingService(store)
+        queue = IngestQueue(service, IngestQueueConfig(max_queue=2))
+        queue.start()
+        try:
+            results = [queue.submit({"event_type": "outbound_click"}) for _ in range(5)]
+        finally:
+            service.release.set()
+            queue.stop()
+
+        # The worker may have taken one payload off the queue before blocking
+        assert results.count(True) in (2, 3)
+        stats = queue.stats()
+        assert stats.dropped == results.count(False)
+        assert stats.ingested == results.count(True)
+        assert stats.drop_rate > 0
+
+    def test_stop_drains_queue(self, store: InMemoryEventStore) -> None:
+        service = BlockingService(store)
+        queue = IngestQueue(service, IngestQueueConfig(drain_interval_seconds=60))
+        queue.start()
+        assert queue.is_running
+        for _ in range(3):
+            queue.submit({"event_type": "page_view"})
+        service.release.set()
+        queue.stop()
+
+        assert not queue.is_running
+        assert queue.stats().queue_depth == 0
+        assert len(store.get_all()) == 3
+
+    def test_service_errors_are_counted(self, store: InMemoryEventStore) -> None:
+        class FailingStore(InMemoryEventStore):
+            def store(self, event: AnalyticsEvent) -> None:
+                raise RuntimeError("pipeline unavailable")
+
+        queue = IngestQueue(AnalyticsIngestionService(event_store=FailingStore()))
+        queue.submit({"event_type": "outbound_click"})
+        queue.submit({"event_type": "outbound_click"})
+
+        assert queue.stats().errors == 2
+        assert queue.stats().queue_depth == 0
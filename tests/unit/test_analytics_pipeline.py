@@ -0,0 +1,282 @@
+"""
+Tests for the write-batched AggregatePipeline (E6.4).
+
+Test assertions:
+- TA-0041: Buffered events produce the same buckets as direct recording
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from src.components.analytics import (
+    AggregatePipeline,
+    PipelineConfig,
+    PipelineEventStore,
+)
+from src.components.analytics._aggregate import (
+    AggregateIncrement,
+    AggregateInput,
+    AggregateService,
+    BucketType,
+    InMemoryAggregateRepo,
+    UAClass,
+)
+from src.components.analytics._impl import AnalyticsEvent, EventType
+from src.components.analytics._impl import UAClass as IngestUAClass
+
+NOW = datetime(2024, 6, 15, 14, 30, 45, tzinfo=UTC)
+
+
+class RecordingSink(InMemoryAggregateRepo):
+    """In-memory sink that records each batch it receives."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[AggregateIncrement]] = []
+        self.fail = False
+
+    def upsert_increments(self, increments: Sequence[AggregateIncrement]) -> None:
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.batches.append(list(increments))
+        super().upsert_increments(increments)
+
+
+@pytest.fixture
+def sink() -> RecordingSink:
+    return RecordingSink()
+
+
+@pytest.fixture
+def pipeline(sink: RecordingSink) -> AggregatePipeline:
+    return AggregatePipeline(sink=sink)
+
+
+def _event(**kwargs: object) -> AggregateInput:
+    defaults: dict[str, object] = {
+        "event_type": "page_view",
+        "timestamp": NOW,
+        "ua_class": UAClass.REAL,
+    }
+    defaults.update(kwargs)
+    return AggregateInput(**defaults)  # type: ignore[arg-type]
+
+
+class TestCoalescing:
+    def test_repeated_events_coalesce_into_one_row_per_bucket(
+        self, pipeline: AggregatePipeline, sink: RecordingSink
+    ) -> None:
+        content_id = uuid4()
+        for _ in range(50):
+            pipeline.record(_event(content_id=content_id))
+
+        assert pipeline.stats().queue_depth == 3  # minute, hour, day
+        assert pipeline.flush() == 3
+        assert len(sink.batches) == 1
+
+        day = sink.query(
+            "day", datetime(2024, 6, 15, tzinfo=UTC), datetime(2024, 6, 16, tzinfo=UTC)
+        )
+        assert len(day) == 1
+        assert day[0].count_total == 50
+        assert day[0].count_real == 50
+        assert day[0].content_id == content_id
+
+    def test_distinct_dimensions_stay_separate(
+        self, pipeline: AggregatePipeline, sink: RecordingSink
+    ) -> None:
+        pipeline.record(_event(utm_source="twitter"))
+        pipeline.record(_event(utm_source="newsletter"))
+        pipeline.record(_event(ua_class=UAClass.BOT))
+        pipeline.flush()
+
+        hour = sink.query(
+            BucketType.HOUR.value,
+            datetime(2024, 6, 15, 14, tzinfo=UTC),
+            datetime(2024, 6, 15, 15, tzinfo=UTC),
+        )
+        assert len(hour) == 3
+        assert sum(b.count_bot for b in hour) == 1
+        assert sum(b.count_real for b in hour) == 2
+
+    def test_flush_with_nothing_pending_is_noop(
+        self, pipeline: AggregatePipeline, sink: RecordingSink
+    ) -> None:
+        assert pipeline.flush() == 0
+        assert sink.batches == []
+
+
+class TestBackpressure:
+    def test_events_beyond_bound_are_dropped(self, sink: RecordingSink) -> None:
+        pipeline = AggregatePipeline(sink=sink, config=PipelineConfig(max_pending_rows=6))
+
+        assert pipeline.record(_event(utm_source="a")) is True
+        assert pipeline.record(_event(utm_source="b")) is True
+        assert pipeline.record(_event(utm_source="c")) is False
+        # Events that only touch existing rows are still accepted
+        assert pipeline.record(_event(utm_source="a")) is True
+
+        stats = pipeline.stats()
+        assert stats.queue_depth == 6
+        assert stats.events_accepted == 3
+        assert stats.events_dropped == 1
+
+    def test_failed_flush_is_retried(
+        self, pipeline: AggregatePipeline, sink: RecordingSink
+    ) -> None:
+        pipeline.record(_event())
+        sink.fail = True
+        assert pipeline.flush() == 0
+
+        pipeline.record(_event())
+        stats = pipeline.stats()
+        assert stats.flush_errors == 1
+        assert stats.queue_depth == 3
+
+        sink.fail = False
+        assert pipeline.flush() == 3
+        day = sink.query(
+            "day", datetime(2024, 6, 15, tzinfo=UTC), datetime(2024, 6, 16, tzinfo=UTC)
+        )
+        assert day[0].count_total == 2
+
+    def test_failed_flush_respects_bound(self, sink: RecordingSink) -> None:
+        pipeline = AggregatePipeline(sink=sink, config=PipelineConfig(max_pending_rows=3))
+        pipeline.record(_event(utm_source="a"))
+
+        def fail_after_new_event(increments: Sequence[AggregateIncrement]) -> None:
+            # Another request buffers an event while the flush is in flight
+            pipeline.record(_event(utm_source="b"))
+            raise RuntimeError("database unavailable")
+
+        sink.upsert_increments = fail_after_new_event  # type: ignore[method-assign]
+        pipeline.flush()
+
+        stats = pipeline.stats()
+        assert stats.queue_depth == 3
+        assert stats.rows_dropped == 3
+
+
+class TestLifecycle:
+    def test_stats_report_flush_latency(self, pipeline: AggregatePipeline) -> None:
+        pipeline.record(_event())
+        pipeline.flush()
+
+        stats = pipeline.stats()
+        assert stats.flushes == 1
+        assert stats.rows_flushed == 3
+        assert stats.last_flush_rows == 3
+        assert stats.last_flush_ms >= 0.0
+        assert stats.max_flush_ms >= stats.last_flush_ms
+
+    def test_background_thread_flushes_and_stop_drains(self, sink: RecordingSink) -> None:
+        pipeline = AggregatePipeline(
+            sink=sink, config=PipelineConfig(flush_interval_seconds=60, flush_high_water=3)
+        )
+        pipeline.start()
+        assert pipeline.is_running
+
+        pipeline.record(_event())  # Reaches the high-water mark and wakes the flusher
+        pipeline.record(_event(utm_source="late"))
+        pipeline.stop()
+
+        assert not pipeline.is_running
+        assert pipeline.stats().queue_depth == 0
+        assert sum(len(batch) for batch in sink.batches) == 6
+
+
+class TestRetention:
+    @pytest.fixture
+    def pipeline(self, sink: RecordingSink) -> AggregatePipeline:
+        service = AggregateService(time_port=SimpleNamespace(now_utc=lambda: NOW))
+        return AggregatePipeline(sink=sink, service=service)
+
+    @staticmethod
+    def _bucket_types(sink: RecordingSink) -> list[str]:
+        since = NOW - timedelta(days=30)
+        return sorted(
+            bucket.bucket_type
+            for bucket_type in BucketType
+            for bucket in sink.query(bucket_type.value, since, NOW + timedelta(days=1))
+        )
+
+    def test_sweep_prunes_only_expired_minute_buckets(
+        self, pipeline: AggregatePipeline, sink: RecordingSink
+    ) -> None:
+        pipeline.record(_event(timestamp=NOW - timedelta(days=8)))
+        pipeline.record(_event(timestamp=NOW - timedelta(days=6)))
+        pipeline.flush()
+
+        assert pipeline.sweep() == 1
+
+        # The recent minute bucket and every hour/day bucket are kept
+        assert self._bucket_types(sink) == ["day", "day", "hour", "hour", "minute"]
+
+    def test_sink_without_delete_is_not_swept(self) -> None:
+        class AppendOnlySink:
+            def upsert_increments(self, increments: Sequence[AggregateIncrement]) -> None:
+                pass
+
+        assert AggregatePipeline(sink=AppendOnlySink()).sweep() == 0
+
+    def test_background_thread_sweeps(self, sink: RecordingSink) -> None:
+        sink.upsert_increments(
+            [AggregateIncrement("minute", datetime(2020, 1, 1, tzinfo=UTC), "page_view", {})]
+        )
+        pipeline = AggregatePipeline(sink=sink, config=PipelineConfig(flush_interval_seconds=0.01))
+
+        pipeline.start()
+        try:
+            deadline = time.monotonic() + 2
+            while sink.query("minute", datetime(2019, 1, 1, tzinfo=UTC), NOW):
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+        finally:
+            pipeline.stop()
+
+
+class TestPipelineEventStore:
+    def test_ingested_event_is_bucketed(
+        self, pipeline: AggregatePipeline, sink: RecordingSink
+    ) -> None:
+        store = PipelineEventStore(pipeline)
+        link_id = uuid4()
+        store.store(
+            AnalyticsEvent(
+                event_type=EventType.OUTBOUND_CLICK,
+                timestamp=NOW,
+                link_id=str(link_id),
+                referrer="https://www.example.com/some/path?q=1",
+                ua_class=IngestUAClass.BOT,
+            )
+        )
+        pipeline.flush()
+
+        (bucket,) = sink.query(
+            "day", datetime(2024, 6, 15, tzinfo=UTC), datetime(2024, 6, 16, tzinfo=UTC)
+        )
+        assert bucket.event_type == "outbound_click"
+        assert bucket.link_id == link_id
+        assert bucket.referrer_domain == "example.com"
+        assert bucket.count_bot == 1
+        assert bucket.count_real == 0
+
+    def test_non_uuid_link_id_is_not_bucketed(
+        self, pipeline: AggregatePipeline, sink: RecordingSink
+    ) -> None:
+        PipelineEventStore(pipeline).store(
+            AnalyticsEvent(event_type=EventType.OUTBOUND_CLICK, timestamp=NOW, link_id="link-1")
+        )
+        pipeline.flush()
+
+        (bucket,) = sink.query(
+            "day", datetime(2024, 6, 15, tzinfo=UTC), datetime(2024, 6, 16, tzinfo=UTC)
+        )
+        assert bucket.link_id is None
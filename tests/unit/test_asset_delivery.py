@@ -0,0 +1,234 @@
+"""
+Tests for streaming, range-capable asset delivery (E2.2).
+
+Test assertions:
+- TA-0009: Headers correctness (ETag, Accept-Ranges, Content-Length)
+- TA-0010: ETag stable; If-None-Match still answers 304
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.adapters.local_storage import LocalFileStorage
+from src.api.asset_delivery import RangeNotSatisfiableError, parse_range_header
+from src.api.deps import get_asset_repo, get_current_user, get_object_storage, get_version_repo
+from src.api.routes import assets
+from src.api.routes.public_assets import build_etag, router
+from tests.conftest import StubVersionRepo
+
+BODY = bytes(range(256)) * 40  # 10 KiB of non-repeating-per-256 bytes
+
+
+@dataclass
+class StubVersion:
+    id: UUID
+    asset_id: UUID
+    storage_key: str
+    sha256: str
+    mime_type: str
+    filename_original: str
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> LocalFileStorage:
+    return LocalFileStorage(tmp_path / "objects")
+
+
+@pytest.fixture
+def version(storage: LocalFileStorage) -> StubVersion:
+    asset_id = uuid4()
+    key = f"assets/{asset_id}/v1.pdf"
+    stored = storage.put(key, BODY, "application/pdf")
+    return StubVersion(
+        id=uuid4(),
+        asset_id=asset_id,
+        storage_key=key,
+        sha256=stored.sha256,
+        mime_type="application/pdf",
+        filename_original="paper.pdf",
+    )
+
+
+@pytest.fixture
+def client(storage: LocalFileStorage, version: StubVersion) -> TestClient:
+    repo = StubVersionRepo()
+    repo.versions[version.id] = version
+
+    app = FastAPI()
+    app.include_router(router, prefix="/assets")
+    app.dependency_overrides[get_object_storage] = lambda: storage
+    app.dependency_overrides[get_version_repo] = lambda: repo
+    return TestClient(app)
+
+
+def _url(version: StubVersion) -> str:
+    return f"/assets/{version.asset_id}/v/{version.id}"
+
+
+# --- Range Parsing ---
+
+
+class TestParseRangeHeader:
+    def test_absent_header_serves_full_body(self) -> None:
+        assert parse_range_header(None, 100) is None
+
+    def test_single_range(self) -> None:
+        assert parse_range_header("bytes=0-9", 100) == [(0, 9)]
+
+    def test_open_ended_and_suffix_ranges(self) -> None:
+        assert parse_range_header("bytes=90-", 100) == [(90, 99)]
+        assert parse_range_header("bytes=-10", 100) == [(90, 99)]
+        assert parse_range_header("bytes=-500", 100) == [(0, 99)]
+
+    def test_end_clamped_to_size(self) -> None:
+        assert parse_range_header("bytes=50-1000", 100) == [(50, 99)]
+
+    def test_overlapping_ranges_coalesced(self) -> None:
+        assert parse_range_header("bytes=10-20,0-5,15-30,6-9", 100) == [(0, 30)]
+
+    @pytest.mark.parametrize("header", ["items=0-1", "bytes=", "bytes=5", "bytes=9-3", "bytes=a-b"])
+    def test_malformed_header_ignored(self, header: str) -> None:
+        assert parse_range_header(header, 100) is None
+
+    def test_too_many_ranges_ignored(self) -> None:
+        header = "bytes=" + ",".join(f"{i * 2}-{i * 2}" for i in range(40))
+        assert parse_range_header(header, 100) is None
+
+    def test_unsatisfiable_range_raises(self) -> None:
+        with pytest.raises(RangeNotSatisfiableError):
+            parse_range_header("bytes=100-200", 100)
+        with pytest.raises(RangeNotSatisfiableError):
+            parse_range_header("bytes=-0", 100)
+
+
+# --- Endpoint Delivery ---
+
+
+class TestStreamingDelivery:
+    def test_full_body_streamed_with_length_and_ranges(
+        self, client: TestClient, version: StubVersion
+    ) -> None:
+        response = client.get(_url(version))
+
+        assert response.status_code == 200
+        assert response.content == BODY
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["content-length"] == str(len(BODY))
+        assert response.headers["etag"] == build_etag(version.sha256)
+        assert response.headers["x-content-sha256"] == hashlib.sha256(BODY).hexdigest()
+
+    def test_single_range_returns_206(self, client: TestClient, version: StubVersion) -> None:
+        response = client.get(_url(version), headers={"Range": "bytes=100-199"})
+
+        assert response.status_code == 206
+        assert response.content == BODY[100:200]
+        assert response.headers["content-range"] == f"bytes 100-199/{len(BODY)}"
+        assert response.headers["content-length"] == "100"
+
+    def test_multi_range_returns_multipart(self, client: TestClient, version: StubVersion) -> None:
+        response = client.get(_url(version), headers={"Range": "bytes=0-3,-4"})
+
+        assert response.status_code == 206
+        content_type = response.headers["content-type"]
+        assert content_type.startswith("multipart/byteranges; boundary=")
+        boundary = content_type.split("boundary=")[1]
+        assert response.headers["content-length"] == str(len(response.content))
+
+        body = response.content
+        assert body.endswith(f"--{boundary}--\r\n".encode())
+        assert f"Content-Range: bytes 0-3/{len(BODY)}".encode() in body
+        assert f"Content-Range: bytes {len(BODY) - 4}-{len(BODY) - 1}/{len(BODY)}".encode() in body
+        assert b"\r\n\r\n" + BODY[:4] + b"\r\n" in body
+        assert b"\r\n\r\n" + BODY[-4:] + b"\r\n" in body
+
+    def test_unsatisfiable_range_returns_416(
+        self, client: TestClient, version: StubVersion
+    ) -> None:
+        response = client.get(_url(version), headers={"Range": f"bytes={len(BODY)}-"})
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(BODY)}"
+
+    def test_stale_if_range_serves_full_body(
+        self, client: TestClient, version: StubVersion
+    ) -> None:
+        response = client.get(_url(version), headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+        assert response.status_code == 200
+        assert response.content == BODY
+
+        matching = client.get(
+            _url(version),
+            headers={"Range": "bytes=0-9", "If-Range": build_etag(version.sha256)},
+        )
+        assert matching.status_code == 206
+
+    def test_if_none_match_still_returns_304(
+        self, client: TestClient, version: StubVersion
+    ) -> None:
+        response = client.get(
+            _url(version),
+            headers={"If-None-Match": build_etag(version.sha256), "Range": "bytes=0-9"},
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_latest_route_supports_ranges(self, client: TestClient, version: StubVersion) -> None:
+        response = client.get(f"/assets/{version.asset_id}/latest", headers={"Range": "bytes=-1"})
+
+        assert response.status_code == 206
+        assert response.content == BODY[-1:]
+
+    def test_missing_object_returns_404(
+        self, client: TestClient, version: StubVersion, storage: LocalFileStorage
+    ) -> None:
+        data_path, _ = storage._key_to_paths(version.storage_key)
+        data_path.unlink()
+
+        assert client.get(_url(version)).status_code == 404
+
+
+class TestIntegrityFailure:
+    """Bytes that no longer match their hash are refused, not served (I3)."""
+
+    @pytest.fixture
+    def corrupted(self, storage: LocalFileStorage, version: StubVersion) -> StubVersion:
+        data_path, _ = storage._key_to_paths(version.storage_key)
+        data_path.write_bytes(b"x" * len(BODY))
+        return version
+
+    def test_public_route_returns_500(self, client: TestClient, corrupted: StubVersion) -> None:
+        response = client.get(_url(corrupted))
+
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Asset content failed integrity check"
+
+    def test_admin_content_route_returns_500(
+        self, storage: LocalFileStorage, corrupted: StubVersion
+    ) -> None:
+        asset = SimpleNamespace(
+            id=corrupted.asset_id,
+            storage_path=corrupted.storage_key,
+            mime_type=corrupted.mime_type,
+        )
+        asset_repo = SimpleNamespace(get_by_id=lambda asset_id: asset)
+
+        app = FastAPI()
+        app.include_router(assets.router, prefix="/api/assets")
+        app.dependency_overrides[get_object_storage] = lambda: storage
+        app.dependency_overrides[get_asset_repo] = lambda: asset_repo
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=uuid4())
+
+        response = TestClient(app).get(f"/api/assets/{corrupted.asset_id}/content")
+
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Asset content failed integrity check"
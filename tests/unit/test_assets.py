@@ -12,19 +12,25 @@ from __future__ import annotations
 
 import hashlib
 from io import BytesIO
+from pathlib import Path
+from typing import Any
 from uuid import UUID, uuid4
 
 import pytest
 
+from src.adapters.local_storage import LocalFileStorage
 from src.components.assets import (
     DEFAULT_ASSET_KINDS,
     AssetKindConfig,
     AssetService,
+    UploadAssetInput,
+    UploadOutput,
     compute_sha256,
     create_asset_service,
     generate_storage_key,
     get_asset_kind,
     mime_to_extension,
+    run_upload,
     validate_integrity,
     validate_mime_type,
     validate_size,
@@ -610,6 +616,114 @@ class TestVersionManagement:
         assert len(versions) == 2
 
 
+# --- Streaming Upload Tests ---
+
+
+class TestStreamingUpload:
+    """Uploads into staging-capable storage are spooled, not buffered."""
+
+    @pytest.fixture
+    def local_storage(self, tmp_path: Path) -> LocalFileStorage:
+        return LocalFileStorage(tmp_path)
+
+    def _upload(
+        self,
+        data: BytesIO,
+        content_type: str,
+        asset_repo: MockAssetRepo,
+        version_repo: MockAssetVersionRepo,
+        storage: LocalFileStorage,
+        **kwargs: Any,
+    ) -> UploadOutput:
+        inp = UploadAssetInput(
+            data=data,
+            filename="upload.bin",
+            content_type=content_type,
+            user_id=uuid4(),
+            **kwargs,
+        )
+        return run_upload(inp, asset_repo=asset_repo, version_repo=version_repo, storage=storage)
+
+    def test_stream_stored_with_hash(
+        self,
+        asset_repo: MockAssetRepo,
+        version_repo: MockAssetVersionRepo,
+        local_storage: LocalFileStorage,
+        test_pdf_data: bytes,
+    ) -> None:
+        result = self._upload(
+            BytesIO(test_pdf_data), "application/pdf", asset_repo, version_repo, local_storage
+        )
+
+        assert result.success
+        assert result.sha256 == hashlib.sha256(test_pdf_data).hexdigest()
+        stored, _ = local_storage.get(result.storage_key)
+        assert stored == test_pdf_data
+
+    def test_oversize_rejected_without_storing(
+        self,
+        asset_repo: MockAssetRepo,
+        version_repo: MockAssetVersionRepo,
+        local_storage: LocalFileStorage,
+    ) -> None:
+        source = BytesIO(b"x" * 12_000_000)
+
+        result = self._upload(source, "image/png", asset_repo, version_repo, local_storage)
+
+        assert [e.code for e in result.errors] == ["file_too_large"]
+        assert "10000000" in result.errors[0].message
+        assert source.tell() < 12_000_000
+        assert asset_repo.assets == {}
+
+    def test_invalid_mime_not_read(
+        self,
+        asset_repo: MockAssetRepo,
+        version_repo: MockAssetVersionRepo,
+        local_storage: LocalFileStorage,
+    ) -> None:
+        source = BytesIO(b"payload")
+
+        result = self._upload(source, "application/x-evil", asset_repo, version_repo, local_storage)
+
+        assert [e.code for e in result.errors] == ["invalid_mime_type"]
+        assert source.tell() == 0
+
+    def test_integrity_mismatch_rejected(
+        self,
+        asset_repo: MockAssetRepo,
+        version_repo: MockAssetVersionRepo,
+        local_storage: LocalFileStorage,
+    ) -> None:
+        result = self._upload(
+            BytesIO(b"data"),
+            "image/png",
+            asset_repo,
+            version_repo,
+            local_storage,
+            expected_sha256="0" * 64,
+        )
+
+        assert [e.code for e in result.errors] == ["integrity_mismatch"]
+
+    def test_missing_asset_leaves_no_spool_file(
+        self,
+        asset_repo: MockAssetRepo,
+        version_repo: MockAssetVersionRepo,
+        local_storage: LocalFileStorage,
+    ) -> None:
+        result = self._upload(
+            BytesIO(b"data"),
+            "image/png",
+            asset_repo,
+            version_repo,
+            local_storage,
+            asset_id=uuid4(),
+        )
+
+        assert [e.code for e in result.errors] == ["asset_not_found"]
+        assert list((local_storage.base_path / "_staging").iterdir()) == []
+
+
 # --- Factory Tests ---
 
 
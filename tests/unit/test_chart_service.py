@@ -0,0 +1,180 @@
+"""Tests for the off-thread chart render service and its caches."""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.adapters.render import chart_service
+from src.adapters.render.chart_service import ChartDiskCache, ChartRenderService
+from src.adapters.render.mpl_renderer import chart_cache_name
+
+SPEC = {"type": "bar", "title": "Chart", "data": {"x": ["A", "B"], "y": [1, 2]}}
+
+
+@pytest.fixture
+def slow_render(monkeypatch):
+    """Count in-process renders and make each one slow enough to overlap."""
+    calls: list[str] = []
+
+    def render(spec, width, height, dpi, fmt="png"):
+        calls.append(spec.get("title", ""))
+        time.sleep(0.2)
+        return f"{fmt}:{spec.get('title', '')}".encode()
+
+    monkeypatch.setattr(chart_service, "render_chart_image", render)
+    return calls
+
+
+def test_concurrent_requests_share_one_render(tmp_path: Path, slow_render) -> None:
+    service = ChartRenderService(tmp_path, max_workers=0)
+    results: list[bytes] = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(service.render_chart(SPEC)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == [b"png:Chart"] * 8
+    assert len(slow_render) == 1
+    stats = service.stats()
+    assert stats.renders == 1
+    assert stats.coalesced + stats.memory_hits == 7
+
+
+def test_memory_then_disk_tier(tmp_path: Path, slow_render) -> None:
+    service = ChartRenderService(tmp_path, max_workers=0)
+    service.render_chart(SPEC)
+    service.render_chart(SPEC)
+    assert service.stats().memory_hits == 1
+
+    # A fresh service (restart) finds the chart on disk
+    restarted = ChartRenderService(tmp_path, max_workers=0)
+    assert restarted.render_chart(SPEC) == b"png:Chart"
+    assert restarted.stats().disk_hits == 1
+    assert len(slow_render) == 1
+    assert (tmp_path / chart_cache_name(SPEC, 800, 600, 100)).exists()
+
+
+def test_svg_is_cached_separately(tmp_path: Path, slow_render) -> None:
+    service = ChartRenderService(tmp_path, max_workers=0)
+
+    assert service.render_chart(SPEC, fmt="svg") == b"svg:Chart"
+    assert service.render_chart(SPEC) == b"png:Chart"
+    assert chart_cache_name(SPEC, 800, 600, 100, "svg").endswith(".svg")
+    assert len(slow_render) == 2
+
+
+def test_failed_render_is_not_cached(tmp_path: Path, monkeypatch) -> None:
+    attempts: list[int] = []
+
+    def render(spec, width, height, dpi, fmt="png"):
+        attempts.append(1)
+        raise ValueError("bad spec")
+
+    monkeypatch.setattr(chart_service, "render_chart_image", render)
+    service = ChartRenderService(tmp_path, max_workers=0)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            service.render_chart(SPEC)
+    assert len(attempts) == 2
+    assert service.stats().failures == 2
+
+
+def test_memory_tier_is_bounded(tmp_path: Path, slow_render) -> None:
+    service = ChartRenderService(tmp_path, max_workers=0, memory_max_bytes=20)
+    for title in ("one", "two", "three"):
+        service.render_chart({**SPEC, "title": title})
+
+    stats = service.stats()
+    assert stats.memory_bytes <= 20
+    assert stats.memory_evictions >= 1
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = ChartDiskCache(tmp_path, max_bytes=250)
+    cache.put("a.png", b"a" * 100)
+    cache.put("b.png", b"b" * 100)
+    assert cache.get("a.png") is not None  # "b" is now least recently used
+
+    cache.put("c.png", b"c" * 100)
+
+    assert cache.get("b.png") is None
+    assert cache.get("a.png") == b"a" * 100
+    assert not (tmp_path / "b.png").exists()
+    assert cache.size_bytes == 200
+    assert cache.evictions == 1
+
+
+def test_disk_cache_adopts_existing_files_by_mtime(tmp_path: Path) -> None:
+    for i, name in enumerate(("old.png", "mid.svg", "new.png")):
+        path = tmp_path / name
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (1_000_000 + i, 1_000_000 + i))
+    (tmp_path / "notes.txt").write_bytes(b"x" * 1000)
+
+    cache = ChartDiskCache(tmp_path, max_bytes=200)
+
+    assert not (tmp_path / "old.png").exists()
+    assert (tmp_path / "mid.svg").exists()
+    assert (tmp_path / "notes.txt").exists()
+    assert cache.size_bytes == 200
+
+
+def test_process_pool_renders_png_and_svg(tmp_path: Path) -> None:
+    service = ChartRenderService(tmp_path, max_workers=1)
+    try:
+        service.start()
+        png = service.render_chart(SPEC, 300, 200, 100)
+        svg = service.render_chart(SPEC, 300, 200, 100, fmt="svg")
+    finally:
+        service.shutdown()
+
+    assert png.startswith(b"\x89PNG")
+    assert b"<svg" in svg
+    assert service.stats().renders == 2
+
+
+def test_start_is_idempotent(tmp_path: Path, monkeypatch) -> None:
+    pools: list[object] = []
+
+    class FakePool:
+        def __init__(self, **kwargs) -> None:
+            pools.append(self)
+
+        def submit(self, fn, *args):
+            return None
+
+        def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+            pass
+
+    monkeypatch.setattr(chart_service, "ProcessPoolExecutor", FakePool)
+    service = ChartRenderService(tmp_path, max_workers=2)
+
+    service.start()
+    service.start()
+
+    assert len(pools) == 1
+
+
+def test_shared_service_per_cache_dir(tmp_path: Path) -> None:
+    try:
+        first = chart_service.get_shared_chart_service(tmp_path / "charts")
+        again = chart_service.get_shared_chart_service(str(tmp_path / "charts"))
+        other = chart_service.get_shared_chart_service(tmp_path / "other")
+
+        assert first is again
+        assert other is not first
+    finally:
+        chart_service.shutdown_shared_chart_services()
+
+    # Shut down services are dropped; the next caller gets a fresh one
+    assert chart_service.get_shared_chart_service(tmp_path / "charts") is not first
+    chart_service.shutdown_shared_chart_services()
@@ -0,0 +1,57 @@
+"""Tests for the client address used as the rate-limit key."""
+
+from __future__ import annotations
+
+import pytest
+from starlette.requests import Request
+
+from src.api.client_address import client_address, parse_trusted_proxies
+
+PROXIES = parse_trusted_proxies("10.0.0.1, 192.168.0.0/16")
+
+
+def _request(peer: str | None, forwarded: str | None = None) -> Request:
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded is not None else []
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": headers,
+            "client": (peer, 1234) if peer is not None else None,
+        }
+    )
+
+
+def test_parse_trusted_proxies() -> None:
+    assert [str(n) for n in PROXIES] == ["10.0.0.1/32", "192.168.0.0/16"]
+    assert parse_trusted_proxies("") == ()
+
+
+def test_forwarded_for_ignored_without_trusted_proxies() -> None:
+    assert client_address(_request("203.0.113.5", "198.51.100.7")) == "203.0.113.5"
+
+
+def test_forwarded_for_ignored_from_untrusted_peer() -> None:
+    request = _request("203.0.113.5", "198.51.100.7")
+
+    assert client_address(request, PROXIES) == "203.0.113.5"
+
+
+@pytest.mark.parametrize(
+    ("forwarded", "expected"),
+    [
+        ("198.51.100.7", "198.51.100.7"),
+        # Entries left of the first untrusted hop were written by the client
+        ("1.2.3.4, 198.51.100.7", "198.51.100.7"),
+        ("198.51.100.7, 192.168.1.10", "198.51.100.7"),
+        ("192.168.1.10", "192.168.1.10"),
+        ("", "10.0.0.1"),
+    ],
+)
+def test_forwarded_for_from_trusted_proxy(forwarded: str, expected: str) -> None:
+    assert client_address(_request("10.0.0.1", forwarded), PROXIES) == expected
+
+
+def test_no_peer_is_unknown() -> None:
+    assert client_address(_request(None, "198.51.100.7"), PROXIES) == "unknown"
@@ -89,11 +89,13 @@ def db_path(tmp_path: Path) -> str:
             utm_campaign TEXT,
             referrer_domain TEXT,
             ua_class TEXT DEFAULT 'unknown',
+            dims_key TEXT NOT NULL,
             count_total INTEGER DEFAULT 0,
             count_real INTEGER DEFAULT 0,
             count_bot INTEGER DEFAULT 0,
             created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL
+            updated_at TEXT NOT NULL,
+            UNIQUE(bucket_type, bucket_start, event_type, dims_key)
         );
 
         -- Redirect rules (E7)
@@ -0,0 +1,339 @@
+"""
+Tests for responsive image derivatives (E2.2).
+
+Covers generation and storage of width variants, the src -> srcset lookup
+used by the renderer, and serving variants with immutable cache headers.
+"""
+
+from __future__ import annotations
+
+import io
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from src.adapters.image_derivatives import (
+    DerivativeIndex,
+    ImageDerivativeWorker,
+    derivative_key,
+    encode_derivatives,
+    generate_derivatives,
+    load_manifest,
+    manifest_key,
+)
+from src.adapters.local_storage import LocalFileStorage
+from src.api.deps import get_derivative_index, get_object_storage, get_version_repo
+from src.api.routes.public_assets import CACHE_CONTROL_IMMUTABLE, build_etag, router
+from src.components.render_posts import RenderConfig, RenderEngine, render_image
+from src.core.entities import AssetVersion
+from tests.conftest import FakeClock, StubVersionRepo
+
+
+def _png(width: int, height: int, color: str | tuple[int, ...] = "red") -> bytes:
+    buffer = io.BytesIO()
+    mode = "RGBA" if isinstance(color, tuple) else "RGB"
+    Image.new(mode, (width, height), color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> LocalFileStorage:
+    return LocalFileStorage(tmp_path / "objects")
+
+
+@pytest.fixture
+def repo() -> StubVersionRepo:
+    return StubVersionRepo()
+
+
+def _store_version(
+    storage: LocalFileStorage,
+    repo: StubVersionRepo,
+    data: bytes,
+    mime_type: str = "image/png",
+) -> AssetVersion:
+    asset_id = uuid4()
+    key = f"assets/{asset_id}/v1/{asset_id}_v1.png"
+    stored = storage.put(key, data, mime_type)
+    version = AssetVersion(
+        asset_id=asset_id,
+        version_number=1,
+        storage_key=key,
+        sha256=stored.sha256,
+        size_bytes=stored.size_bytes,
+        mime_type=mime_type,
+        filename_original="photo.png",
+        is_latest=True,
+        created_by_user_id=uuid4(),
+        created_at=datetime(2024, 1, 1),
+    )
+    repo.versions[version.id] = version
+    return version
+
+
+# --- Encoding and storage ---
+
+
+class TestGenerateDerivatives:
+    def test_only_narrower_widths_are_produced(self) -> None:
+        (width, height), encoded = encode_derivatives(_png(1000, 500))
+
+        assert (width, height) == (1000, 500)
+        assert [(w, h) for w, h, _ in encoded] == [(320, 160), (640, 320), (960, 480)]
+        for w, h, blob in encoded:
+            with Image.open(io.BytesIO(blob)) as image:
+                assert image.format == "WEBP"
+                assert image.size == (w, h)
+
+    def test_alpha_is_preserved(self) -> None:
+        _, encoded = encode_derivatives(_png(700, 700, color=(255, 0, 0, 128)))
+
+        with Image.open(io.BytesIO(encoded[0][2])) as image:
+            assert image.mode == "RGBA"
+
+    def test_variants_stored_content_addressed_next_to_original(
+        self, storage: LocalFileStorage, repo: StubVersionRepo
+    ) -> None:
+        version = _store_version(storage, repo, _png(1400, 700))
+
+        manifest = generate_derivatives(storage, version.storage_key, version.mime_type)
+
+        assert manifest is not None
+        assert (manifest.width, manifest.height) == (1400, 700)
+        assert [d.width for d in manifest.derivatives] == [320, 640, 960, 1280]
+        directory = version.storage_key.rsplit("/", 1)[0]
+        for derivative in manifest.derivatives:
+            assert derivative.storage_key == derivative_key(version.storage_key, derivative.sha256)
+            assert derivative.storage_key.startswith(f"{directory}/derived/")
+            _, stored = storage.get(derivative.storage_key)
+            assert stored.sha256 == derivative.sha256
+            assert stored.content_type == "image/webp"
+        assert manifest_key(version.storage_key) == f"{directory}/derivatives.json"
+        assert load_manifest(storage, version.storage_key) == manifest
+
+    def test_generation_is_idempotent(
+        self, storage: LocalFileStorage, repo: StubVersionRepo
+    ) -> None:
+        version = _store_version(storage, repo, _png(800, 600))
+        first = generate_derivatives(storage, version.storage_key, version.mime_type)
+
+        assert generate_derivatives(storage, version.storage_key, version.mime_type) == first
+
+    def test_small_image_records_size_without_variants(
+        self, storage: LocalFileStorage, repo: StubVersionRepo
+    ) -> None:
+        version = _store_version(storage, repo, _png(200, 100))
+
+        manifest = generate_derivatives(storage, version.storage_key, version.mime_type)
+
+        assert manifest is not None
+        assert (manifest.width, manifest.height, manifest.derivatives) == (200, 100, ())
+
+    def test_unsupported_types_are_skipped(
+        self, storage: LocalFileStorage, repo: StubVersionRepo
+    ) -> None:
+        version = _store_version(storage, repo, b"GIF89a", mime_type="image/gif")
+
+        assert generate_derivatives(storage, version.storage_key, version.mime_type) is None
+        assert load_manifest(storage, version.storage_key) is None
+
+
+# --- Worker ---
+
+
+class TestImageDerivativeWorker:
+    def test_submit_generates_in_background(
+        self, storage: LocalFileStorage, repo: StubVersionRepo
+    ) -> None:
+        version = _store_version(storage, repo, _png(700, 350))
+        worker = ImageDerivativeWorker(storage)
+        worker.start()
+        try:
+            future = worker.submit(version)
+            assert future is not None
+            manifest = future.result(timeout=30)
+        finally:
+            worker.stop()
+
+        assert manifest is not None
+        assert [d.width for d in manifest.derivatives] == [320, 640]
+        assert worker.stats().generated == 1
+        assert not worker.is_running
+
+    def test_undecodable_image_is_counted_not_raised(
+        self, storage: LocalFileStorage, repo: StubVersionRepo
+    ) -> None:
+        version = _store_version(storage, repo, b"not a png")
+        worker = ImageDerivativeWorker(storage)
+        worker.start()
+        try:
+            future = worker.submit(version)
+            assert future is not None
+            assert future.result(timeout=30) is None
+        finally:
+            worker.stop()
+
+        stats = worker.stats()
+        assert (stats.generated, stats.failed, stats.pending) == (0, 1, 0)
+
+    def test_submit_is_noop_when_stopped_or_not_an_image(
+        self, storage: LocalFileStorage, repo: StubVersionRepo
+    ) -> None:
+        worker = ImageDerivativeWorker(storage)
+        assert worker.submit(_store_version(storage, repo, _png(700, 350))) is None
+
+        worker.start()
+        try:
+            gif = _store_version(storage, repo, b"GIF89a", mime_type="image/gif")
+            assert worker.submit(gif) is None
+        finally:
+            worker.stop()
+
+
+# --- Lookup for rendering ---
+
+
+class TestDerivativeIndex:
+    def test_resolves_versioned_and_latest_srcs(
+        self, storage: LocalFileStorage, repo: StubVersionRepo
+    ) -> None:
+        version = _store_version(storage, repo, _png(1000, 750))
+        generate_derivatives(storage, version.storage_key, version.mime_type)
+        index = DerivativeIndex(storage, repo)
+
+        responsive = index.responsive_image(f"/assets/{version.asset_id}/v/{version.id}")
+
+        assert responsive is not None
+        assert (responsive.width, responsive.height) == (1000, 750)
+        base = f"/assets/{version.asset_id}/v/{version.id}/w"
+        assert [(v.url, v.width) for v in responsive.variants] == [
+            (f"{base}/320", 320),
+            (f"{base}/640", 640),
+            (f"{base}/960", 960),
+        ]
+        latest = index.responsive_image(f"https://lab.example/assets/{version.asset_id}/latest")
+        assert latest is not None
+        assert latest.variants[0].url == f"https://lab.example{base}/320"
+
+    def test_unknown_srcs_resolve_to_none(
+        self, storage: LocalFileStorage, repo: StubVersionRepo
+    ) -> None:
+        version = _store_version(storage, repo, _png(1000, 750))
+        index = DerivativeIndex(storage, repo)
+
+        assert index.responsive_image("https://example.com/photo.png") is None
+        assert index.responsive_image(f"/assets/{uuid4()}/v/{version.id}") is None
+        # Not generated yet
+        assert index.responsive_image(f"/assets/{version.asset_id}/v/{version.id}") is None
+
+    def test_missing_manifest_is_rechecked_after_ttl(
+        self, storage: LocalFileStorage, repo: StubVersionRepo, clock: FakeClock[float]
+    ) -> None:
+        version = _store_version(storage, repo, _png(1000, 750))
+        index = DerivativeIndex(storage, repo, negative_ttl_seconds=30, clock=clock)
+        src = f"/assets/{version.asset_id}/v/{version.id}"
+        assert index.responsive_image(src) is None
+
+        # Written by another process: not seen until the miss expires
+        generate_derivatives(storage, version.storage_key, version.mime_type)
+        assert index.responsive_image(src) is None
+        clock.now += 31
+        assert index.responsive_image(src) is not None
+
+    def test_worker_publishes_to_live_indexes(
+        self, storage: LocalFileStorage, repo: StubVersionRepo
+    ) -> None:
+        version = _store_version(storage, repo, _png(1000, 750))
+        index = DerivativeIndex(storage, repo)
+        src = f"/assets/{version.asset_id}/v/{version.id}"
+        assert index.responsive_image(src) is None
+        before = repr(index)
+
+        worker = ImageDerivativeWorker(storage)
+        worker.start()
+        try:
+            future = worker.submit(version)
+            assert future is not None
+            future.result(timeout=30)
+        finally:
+            worker.stop()
+
+        assert index.responsive_image(src) is not None
+        assert repr(index) != before
+
+
+class TestResponsiveRendering:
+    def test_render_cache_picks_up_new_variants(
+        self, storage: LocalFileStorage, repo: StubVersionRepo
+    ) -> None:
+        version = _store_version(storage, repo, _png(1000, 750))
+        index = DerivativeIndex(storage, repo, negative_ttl_seconds=0)
+        config = RenderConfig(image_sources=index)
+        src = f"/assets/{version.asset_id}/v/{version.id}"
+        doc = {"type": "doc", "content": [{"type": "image", "attrs": {"src": src}}]}
+        engine = RenderEngine()
+
+        assert "srcset" not in engine.render(doc, config).html
+        generate_derivatives(storage, version.storage_key, version.mime_type)
+        index.responsive_image(src)  # first lookup after generation
+
+        html = engine.render(doc, config).html
+        assert f'srcset="{src}/w/320 320w, {src}/w/640 640w, {src}/w/960 960w, {src} 1000w"' in html
+        assert 'width="1000" height="750"' in html
+        assert html == f"<article>{render_image(doc['content'][0], config)}</article>"
+
+
+# --- Serving ---
+
+
+@pytest.fixture
+def client(storage: LocalFileStorage, repo: StubVersionRepo) -> TestClient:
+    index = DerivativeIndex(storage, repo, negative_ttl_seconds=0)
+    app = FastAPI()
+    app.include_router(router, prefix="/assets")
+    app.dependency_overrides[get_object_storage] = lambda: storage
+    app.dependency_overrides[get_version_repo] = lambda: repo
+    app.dependency_overrides[get_derivative_index] = lambda: index
+    return TestClient(app)
+
+
+class TestVariantRoute:
+    def test_variant_served_with_immutable_headers(
+        self, client: TestClient, storage: LocalFileStorage, repo: StubVersionRepo
+    ) -> None:
+        version = _store_version(storage, repo, _png(1000, 750))
+        manifest = generate_derivatives(storage, version.storage_key, version.mime_type)
+        assert manifest is not None
+        derivative = manifest.derivatives[1]
+
+        response = client.get(f"/assets/{version.asset_id}/v/{version.id}/w/640")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/webp"
+        assert response.headers["cache-control"] == CACHE_CONTROL_IMMUTABLE
+        assert response.headers["etag"] == build_etag(derivative.sha256)
+        assert response.headers["x-content-sha256"] == derivative.sha256
+        assert 'filename="photo-640w.webp"' in response.headers["content-disposition"]
+        assert len(response.content) == derivative.size_bytes
+
+        cached = client.get(
+            f"/assets/{version.asset_id}/v/{version.id}/w/640",
+            headers={"If-None-Match": response.headers["etag"]},
+        )
+        assert cached.status_code == 304
+
+    def test_unknown_width_or_missing_variants_404(
+        self, client: TestClient, storage: LocalFileStorage, repo: StubVersionRepo
+    ) -> None:
+        version = _store_version(storage, repo, _png(1000, 750))
+        url = f"/assets/{version.asset_id}/v/{version.id}/w"
+
+        assert client.get(f"{url}/640").status_code == 404  # not generated yet
+        generate_derivatives(storage, version.storage_key, version.mime_type)
+        assert client.get(f"{url}/500").status_code == 404
+        assert client.get(f"/assets/{uuid4()}/v/{version.id}/w/640").status_code == 404
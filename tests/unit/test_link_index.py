@@ -0,0 +1,104 @@
+"""Tests for PublicLinkIndex, the in-memory link lookup used by click tracking."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+import pytest
+
+from src.components.links import LinkService, PublicLinkIndex
+from src.domain.entities import LinkItem
+from tests.conftest import FakeClock
+
+
+class CountingLinkRepo:
+    """In-memory link repository that counts full reads."""
+
+    def __init__(self) -> None:
+        self.links: dict[UUID, LinkItem] = {}
+        self.reads = 0
+
+    def save(self, link: LinkItem) -> LinkItem:
+        self.links[link.id] = link
+        return link
+
+    def get_all(self) -> list[LinkItem]:
+        self.reads += 1
+        return list(self.links.values())
+
+    def delete(self, link_id: UUID) -> None:
+        self.links.pop(link_id, None)
+
+
+@pytest.fixture
+def repo() -> CountingLinkRepo:
+    repo = CountingLinkRepo()
+    repo.save(LinkItem(slug="promo", title="Promo", url="https://example.com/offer"))
+    repo.save(LinkItem(slug="old", title="Old", url="https://retired.example/", status="disabled"))
+    repo.save(
+        LinkItem(slug="team", title="Team", url="https://private.example/", visibility="private")
+    )
+    return repo
+
+
+@pytest.fixture
+def index(repo: CountingLinkRepo, clock: FakeClock[float]) -> PublicLinkIndex:
+    return PublicLinkIndex(repo, max_age_seconds=5.0, clock=clock)
+
+
+def test_lookups_by_slug_id_and_host(repo: CountingLinkRepo, index: PublicLinkIndex) -> None:
+    promo = next(link for link in repo.links.values() if link.slug == "promo")
+
+    assert index.get("promo") is promo
+    assert index.get(str(promo.id)) is promo
+    assert index.allows_host("example.com")
+    assert not index.allows_host("evil.example")
+    assert not index.allows_host(None)
+
+
+def test_only_active_public_links_are_indexed(index: PublicLinkIndex) -> None:
+    assert index.get("old") is None
+    assert index.get("team") is None
+    assert not index.allows_host("retired.example")
+    assert not index.allows_host("private.example")
+
+
+def test_clicks_do_not_rescan_the_repo(repo: CountingLinkRepo, index: PublicLinkIndex) -> None:
+    for _ in range(10):
+        index.get("promo")
+        index.allows_host("example.com")
+
+    assert repo.reads == 1
+
+
+def test_link_service_writes_invalidate(repo: CountingLinkRepo, index: PublicLinkIndex) -> None:
+    service = LinkService(repo=repo, index=index)
+    assert index.get("new") is None
+
+    link, errors = service.create(title="New", slug="new", url="https://new.example/")
+    assert errors == []
+    assert index.get("new") is not None
+    assert index.allows_host("new.example")
+
+    assert link is not None
+    service.update(link.id, {"status": "disabled"})
+    assert index.get("new") is None
+
+    promo = index.get("promo")
+    assert promo is not None
+    service.delete(promo.id)
+    assert not index.allows_host("example.com")
+
+
+def test_reloads_after_max_age(
+    repo: CountingLinkRepo, index: PublicLinkIndex, clock: FakeClock[float]
+) -> None:
+    assert index.get("direct") is None
+    # Written by another process, bypassing LinkService
+    repo.save(LinkItem(slug="direct", title="Direct", url="https://direct.example/"))
+
+    clock.now += 4.0
+    assert index.get("direct") is None
+    clock.now += 1.0
+    assert index.get("direct") is not None
+    assert repo.reads == 2
@@ -0,0 +1,245 @@
+"""
+Tests for the rendered SSR page cache (E1.2, E2.3).
+
+Test assertions:
+- TA-0003: Settings changes are reflected (cache purged on save)
+- TA-E2.3-01: Only content cacheable under R2 is stored
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.deps import get_content_repo, get_page_cache, get_site_settings_repo
+from src.api.routes.public_ssr import router
+from src.components.C2_PublicTemplates import (
+    InProcessPageCache,
+    generate_cache_tag,
+    generate_cache_tags,
+)
+from src.components.settings import SettingsService
+from src.domain.entities import ContentItem, SiteSettings
+from tests.conftest import FakeClock
+
+# --- Test Doubles ---
+
+
+class CountingSettingsRepo:
+    def __init__(self) -> None:
+        self._settings: SiteSettings | None = None
+        self.reads = 0
+
+    def get(self) -> SiteSettings | None:
+        self.reads += 1
+        return self._settings
+
+    def save(self, settings: SiteSettings) -> SiteSettings:
+        self._settings = settings
+        return settings
+
+
+class CountingContentRepo:
+    def __init__(self) -> None:
+        self._items: dict[str, ContentItem] = {}
+        self.reads = 0
+
+    def add(self, content: ContentItem) -> None:
+        self._items[f"{content.type}:{content.slug}"] = content
+
+    def get_by_slug(self, slug: str, item_type: str) -> ContentItem | None:
+        self.reads += 1
+        return self._items.get(f"{item_type}:{slug}")
+
+
+def _post(slug: str, published_at: datetime | None = None) -> ContentItem:
+    return ContentItem(
+        id=uuid4(),
+        type="post",
+        slug=slug,
+        title=f"Title {slug}",
+        status="published",
+        owner_user_id=uuid4(),
+        published_at=published_at or datetime.now(UTC) - timedelta(days=1),
+    )
+
+
+@pytest.fixture
+def cache() -> InProcessPageCache:
+    return InProcessPageCache()
+
+
+@pytest.fixture
+def settings_repo() -> CountingSettingsRepo:
+    return CountingSettingsRepo()
+
+
+@pytest.fixture
+def content_repo() -> CountingContentRepo:
+    return CountingContentRepo()
+
+
+@pytest.fixture
+def client(
+    cache: InProcessPageCache,
+    settings_repo: CountingSettingsRepo,
+    content_repo: CountingContentRepo,
+) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_page_cache] = lambda: cache
+    app.dependency_overrides[get_site_settings_repo] = lambda: settings_repo
+    app.dependency_overrides[get_content_repo] = lambda: content_repo
+    return TestClient(app)
+
+
+# --- Cache Mechanics ---
+
+
+class TestInProcessPageCache:
+    def test_lru_evicts_least_recently_used(self) -> None:
+        cache = InProcessPageCache(max_entries=2)
+        cache.put("a", "A", path="/a")
+        cache.put("b", "B", path="/b")
+        cache.get("a")
+        cache.put("c", "C", path="/c")
+
+        assert cache.get("a") == "A"
+        assert cache.get("b") is None
+        assert cache.get("c") == "C"
+
+    def test_entries_expire_after_ttl(self, clock: FakeClock[float]) -> None:
+        cache = InProcessPageCache(ttl_seconds=60, clock=clock)
+        cache.put("a", "A", path="/a")
+
+        clock.now += 59
+        assert cache.get("a") == "A"
+        clock.now += 2
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_id_tag_purges_only_that_content(self) -> None:
+        cache = InProcessPageCache()
+        content_id = str(uuid4())
+        cache.put("old", "X", path="/p/old", tags=generate_cache_tags("post", content_id, "old"))
+        cache.put("other", "Y", path="/p/other", tags=generate_cache_tags("post", "2", "other"))
+
+        cache.revalidate_tag(generate_cache_tag("post", content_id))
+
+        assert cache.get("old") is None
+        assert cache.get("other") == "Y"
+
+    def test_type_tag_purges_all_of_type(self) -> None:
+        cache = InProcessPageCache()
+        cache.put("a", "A", path="/p/a", tags=generate_cache_tags("post", "1", "a"))
+        cache.put("b", "B", path="/p/b", tags=generate_cache_tags("post", "2", "b"))
+
+        result = cache.revalidate_content("post", "1", "a")
+
+        assert result.success
+        assert len(cache) == 0
+
+    def test_revalidate_path(self) -> None:
+        cache = InProcessPageCache()
+        cache.put(("r", "ua-1"), "1", path="/r/doc")
+        cache.put(("r", "ua-2"), "2", path="/r/doc")
+
+        cache.revalidate_path("/r/doc")
+
+        assert len(cache) == 0
+
+    def test_settings_invalidation_clears_everything(self) -> None:
+        cache = InProcessPageCache()
+        cache.put("a", "A", path="/")
+        cache.put("b", "B", path="/p/b", tags=["content:post:all"])
+
+        cache.invalidate_settings()
+
+        assert len(cache) == 0
+
+
+# --- SSR Routes ---
+
+
+class TestSSRPageCaching:
+    def test_post_served_from_cache(
+        self, client: TestClient, content_repo: CountingContentRepo
+    ) -> None:
+        content_repo.add(_post("hello"))
+
+        first = client.get("/p/hello")
+        second = client.get("/p/hello")
+
+        assert first.status_code == second.status_code == 200
+        assert first.text == second.text
+        assert content_repo.reads == 1
+
+    def test_future_published_post_not_cached(
+        self, client: TestClient, content_repo: CountingContentRepo
+    ) -> None:
+        content_repo.add(_post("soon", published_at=datetime.now(UTC) + timedelta(days=1)))
+
+        client.get("/p/soon")
+        client.get("/p/soon")
+
+        assert content_repo.reads == 2
+
+    def test_missing_content_not_cached(
+        self, client: TestClient, cache: InProcessPageCache
+    ) -> None:
+        assert client.get("/p/nope").status_code == 404
+        assert len(cache) == 0
+
+    def test_content_revalidation_serves_fresh_html(
+        self, client: TestClient, content_repo: CountingContentRepo, cache: InProcessPageCache
+    ) -> None:
+        post = _post("hello")
+        content_repo.add(post)
+        client.get("/p/hello")
+
+        content_repo.add(post.model_copy(update={"title": "Updated Title"}))
+        cache.revalidate_tag(generate_cache_tag(post.type, str(post.id)))
+
+        assert "Updated Title" in client.get("/p/hello").text
+
+    def test_settings_save_purges_homepage(
+        self,
+        client: TestClient,
+        settings_repo: CountingSettingsRepo,
+        cache: InProcessPageCache,
+    ) -> None:
+        client.get("/")
+        client.get("/")
+        assert settings_repo.reads == 1
+
+        service = SettingsService(repo=settings_repo, cache_invalidator=cache)
+        service.update({"site_title": "Renamed Lab"})
+
+        assert "Renamed Lab" in client.get("/").text
+
+    def test_resource_cache_varies_by_embed_support(
+        self, client: TestClient, content_repo: CountingContentRepo
+    ) -> None:
+        content_repo.add(
+            ContentItem(
+                id=uuid4(),
+                type="resource_pdf",
+                slug="paper",
+                title="Paper",
+                status="published",
+                owner_user_id=uuid4(),
+                published_at=datetime.now(UTC) - timedelta(days=1),
+            )
+        )
+        desktop = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0"
+        iphone = "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) Safari/604.1"
+
+        client.get("/r/paper", headers={"user-agent": desktop})
+        client.get("/r/paper", headers={"user-agent": iphone})
+        client.get("/r/paper", headers={"user-agent": desktop})
+
+        assert content_repo.reads == 2
@@ -0,0 +1,150 @@
+"""Tests for the authenticated-principal cache."""
+
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.adapters.auth.principal_cache import PrincipalCache, invalidate_principal
+from src.adapters.auth.session_store import InMemorySessionStore
+from src.domain.entities import Session, User
+from tests.conftest import FakeClock
+
+
+@pytest.fixture
+def cache(clock: FakeClock[float]) -> PrincipalCache:
+    return PrincipalCache(ttl_seconds=30, clock=clock)
+
+
+def _user(roles: list[str] | None = None) -> User:
+    return User(
+        email=f"{uuid4().hex[:8]}@example.com",
+        display_name="User",
+        password_hash="x",
+        roles=roles or ["admin"],
+    )
+
+
+def test_hit_after_put(cache: PrincipalCache) -> None:
+    user = _user()
+    assert cache.get("tok") is None
+
+    assert cache.put("tok", user, generation=cache.generation)
+
+    cached = cache.get("tok")
+    assert cached is not None
+    assert cached.id == user.id
+    assert cached.roles == ["admin"]
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_entry_expires_after_ttl(cache: PrincipalCache, clock: FakeClock[float]) -> None:
+    cache.put("tok", _user(), generation=cache.generation)
+
+    clock.now += 29
+    assert cache.get("tok") is not None
+    clock.now += 2
+    assert cache.get("tok") is None
+    assert cache.stats().size == 0
+
+
+def test_entry_never_outlives_token(cache: PrincipalCache, clock: FakeClock[float]) -> None:
+    cache.put("tok", _user(), generation=cache.generation, token_expires_at=clock.now + 5)
+
+    clock.now += 6
+    assert cache.get("tok") is None
+
+
+def test_invalidate_user_drops_all_tokens(cache: PrincipalCache) -> None:
+    user, other = _user(), _user()
+    cache.put("a", user, generation=cache.generation)
+    cache.put("b", user, generation=cache.generation)
+    cache.put("c", other, generation=cache.generation)
+
+    assert cache.invalidate_user(user.id) == 2
+
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    assert cache.stats().invalidations == 2
+
+
+def test_put_after_invalidation_is_discarded(cache: PrincipalCache) -> None:
+    """A miss that read the user before a save must not cache the old state."""
+    user = _user()
+    generation = cache.generation  # miss starts resolving
+    invalidate_principal(user.id)  # concurrent save
+
+    assert cache.put("tok", user, generation=generation) is False
+    assert cache.get("tok") is None
+
+
+def test_cached_principal_is_a_copy(cache: PrincipalCache) -> None:
+    cache.put("tok", _user(), generation=cache.generation)
+
+    first = cache.get("tok")
+    assert first is not None
+    first.roles.append("viewer")
+
+    second = cache.get("tok")
+    assert second is not None
+    assert second.roles == ["admin"]
+
+
+def test_lru_bound(clock: FakeClock[float]) -> None:
+    cache = PrincipalCache(ttl_seconds=30, max_entries=2, clock=clock)
+    for token in ("a", "b"):
+        cache.put(token, _user(), generation=cache.generation)
+    cache.get("a")  # "b" is now least recently used
+    cache.put("c", _user(), generation=cache.generation)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats().evictions == 1
+
+
+def test_zero_ttl_disables(clock: FakeClock[float]) -> None:
+    cache = PrincipalCache(ttl_seconds=0, clock=clock)
+
+    assert cache.put("tok", _user(), generation=cache.generation) is False
+    assert cache.get("tok") is None
+
+
+def test_session_revocation_invalidates(cache: PrincipalCache) -> None:
+    user = _user()
+    cache.put("tok", user, generation=cache.generation)
+    store = InMemorySessionStore()
+    store.save("s", Session(id="s", user_id=user.id, token_hash="h", expires_at=user.created_at))
+
+    store.delete_by_user(user.id)
+
+    assert cache.get("tok") is None
+
+
+def test_version_change_drops_hit(clock: FakeClock[float]) -> None:
+    versions: dict[UUID, int] = {}
+    cache = PrincipalCache(ttl_seconds=30, clock=clock, version_source=versions.get)
+    user = _user()
+    versions[user.id] = 1
+    cache.put("tok", user, generation=cache.generation, version=cache.current_version(user.id))
+    assert cache.get("tok") is not None
+
+    versions[user.id] = 2  # saved by another process
+
+    assert cache.get("tok") is None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.stale, stats.size) == (1, 1, 1, 0)
+
+
+def test_version_read_before_load_keeps_racing_save_stale(clock: FakeClock[float]) -> None:
+    versions: dict[UUID, int] = {}
+    cache = PrincipalCache(ttl_seconds=30, clock=clock, version_source=versions.get)
+    user = _user()
+    versions[user.id] = 1
+    version = cache.current_version(user.id)
+    versions[user.id] = 2  # saved between the version read and the user load
+
+    cache.put("tok", user, generation=cache.generation, version=version)
+
+    assert cache.get("tok") is None
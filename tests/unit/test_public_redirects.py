@@ -7,6 +7,7 @@ Test assertions:
 
 from __future__ import annotations
 
+import threading
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
@@ -16,11 +17,17 @@ from fastapi.testclient import TestClient
 
 from src.api.deps import get_redirect_repo
 from src.api.routes.public_redirects import (
+    RedirectMiddleware,
     preserve_query_params,
     resolve_redirect,
     router,
 )
-from src.components.redirects import Redirect, RedirectConfig, RedirectService
+from src.components.redirects import (
+    CompiledRedirectIndex,
+    Redirect,
+    RedirectConfig,
+    RedirectService,
+)
 
 # --- In-Memory Repository for Testing ---
 
@@ -356,3 +363,116 @@ class TestEdgeCases:
         assert response.status_code == 200
         data = response.json()
         assert data["target"] == "/articles/new-post"
+
+
+# --- Redirect Middleware ---
+
+
+@pytest.fixture
+def index(test_repo: InMemoryRedirectRepo) -> CompiledRedirectIndex:
+    return CompiledRedirectIndex(test_repo)
+
+
+@pytest.fixture
+def site(index: CompiledRedirectIndex) -> TestClient:
+    """App with public pages behind RedirectMiddleware."""
+    app = FastAPI()
+
+    @app.get("/{path:path}")
+    def page(path: str) -> dict[str, str]:
+        return {"page": path}
+
+    @app.post("/{path:path}")
+    def submit(path: str) -> dict[str, str]:
+        return {"posted": path}
+
+    app.add_middleware(RedirectMiddleware, index_provider=lambda: index)
+    return TestClient(app)
+
+
+class TestRedirectMiddleware:
+    """Test TA-0046: Redirects are applied before routing."""
+
+    def test_redirect_applied_before_routing(
+        self, site: TestClient, test_repo: InMemoryRedirectRepo
+    ) -> None:
+        create_redirect(test_repo, "/old", "/new", status_code=302)
+
+        response = site.get("/OLD/", follow_redirects=False)
+
+        assert response.status_code == 302
+        assert response.headers["location"] == "/new"
+
+    def test_utm_params_preserved(self, site: TestClient, test_repo: InMemoryRedirectRepo) -> None:
+        create_redirect(test_repo, "/campaign", "/landing")
+
+        response = site.get("/campaign?utm_source=x&ref=y", follow_redirects=False)
+
+        assert response.status_code == 301
+        assert response.headers["location"] == "/landing?utm_source=x"
+
+    def test_non_redirected_path_passes_through(
+        self, site: TestClient, index: CompiledRedirectIndex
+    ) -> None:
+        for _ in range(3):
+            assert site.get("/about").json() == {"page": "about"}
+
+        stats = index.stats()
+        assert stats.misses == 3
+        assert stats.negative_cache_hits == 2
+        assert stats.hits == 0
+
+    def test_skipped_requests_are_not_looked_up(
+        self, site: TestClient, test_repo: InMemoryRedirectRepo, index: CompiledRedirectIndex
+    ) -> None:
+        create_redirect(test_repo, "/api/old", "/api/new")
+        create_redirect(test_repo, "/form", "/elsewhere")
+
+        assert site.get("/api/old").json() == {"page": "api/old"}
+        assert site.post("/form").json() == {"posted": "form"}
+        assert index.stats().misses == 0
+
+    def test_lookup_failure_passes_through(self) -> None:
+        app = FastAPI()
+
+        @app.get("/page")
+        def page() -> dict[str, bool]:
+            return {"ok": True}
+
+        def broken_index() -> CompiledRedirectIndex:
+            raise RuntimeError("no such table: redirects")
+
+        app.add_middleware(RedirectMiddleware, index_provider=broken_index)
+
+        assert TestClient(app).get("/page").json() == {"ok": True}
+
+    def test_table_load_runs_off_event_loop(
+        self, test_repo: InMemoryRedirectRepo, index: CompiledRedirectIndex
+    ) -> None:
+        loads: list[threading.Thread] = []
+        list_all = test_repo.list_all
+
+        def tracked_list_all() -> list[Redirect]:
+            loads.append(threading.current_thread())
+            return list_all()
+
+        test_repo.list_all = tracked_list_all  # type: ignore[method-assign]
+        loop_threads: list[threading.Thread] = []
+        app = FastAPI()
+
+        @app.get("/page")
+        async def page() -> dict[str, bool]:
+            loop_threads.append(threading.current_thread())
+            return {"ok": True}
+
+        app.add_middleware(RedirectMiddleware, index_provider=lambda: index)
+        client = TestClient(app)
+
+        assert not index.resolves_from_memory
+        assert client.get("/page").json() == {"ok": True}
+        assert index.resolves_from_memory
+        assert client.get("/page").json() == {"ok": True}
+
+        # Loaded once, in the threadpool; the second lookup stayed in memory
+        assert len(loads) == 1
+        assert loads[0] is not loop_threads[0]
@@ -0,0 +1,293 @@
+"""
+Tests for PublishWorker (E5.2).
+
+Test assertions:
+- TA-0029: Due jobs are claimed in batches and executed on time
+- Schedule changes wake the worker without polling
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.adapters.publish_worker import PublishWorker
+from src.components.scheduler import PublishJob, SchedulerService
+
+# --- Mock Implementations ---
+
+
+@dataclass
+class MemoryJobRepo:
+    """In-memory publish job repository with batch claims."""
+
+    jobs: dict[UUID, PublishJob] = field(default_factory=dict)
+    batch_claims: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def get_by_id(self, job_id: UUID) -> PublishJob | None:
+        return self.jobs.get(job_id)
+
+    def get_by_idempotency_key(self, content_id: UUID, publish_at_utc: datetime) -> None:
+        return None
+
+    def save(self, job: PublishJob) -> PublishJob:
+        with self.lock:
+            self.jobs[job.id] = job
+        return job
+
+    def delete(self, job_id: UUID) -> None:
+        self.jobs.pop(job_id, None)
+
+    def list_due_jobs(self, now_utc: datetime, limit: int = 10) -> list[PublishJob]:
+        due = [
+            j
+            for j in self.jobs.values()
+            if j.status in ("queued", "retry_wait")
+            and j.publish_at_utc <= now_utc
+            and (j.next_retry_at is None or j.next_retry_at <= now_utc)
+        ]
+        return sorted(due, key=lambda j: j.publish_at_utc)[:limit]
+
+    def claim_job(self, job_id: UUID, worker_id: str, now_utc: datetime) -> PublishJob | None:
+        raise AssertionError("worker must use batch claims")
+
+    def claim_due_jobs(self, worker_id: str, now_utc: datetime, limit: int) -> list[PublishJob]:
+        with self.lock:
+            self.batch_claims += 1
+            claimed = self.list_due_jobs(now_utc, limit)
+            for job in claimed:
+                job.status = "running"
+                job.claimed_by = worker_id
+            return claimed
+
+    def list_in_range(
+        self,
+        start_utc: datetime,
+        end_utc: datetime,
+        statuses: list[str] | None = None,
+    ) -> list[PublishJob]:
+        return []
+
+
+@dataclass
+class MockTimePort:
+    """Mock time port for testing."""
+
+    current_time: datetime = field(
+        default_factory=lambda: datetime(2024, 6, 15, 12, 0, 0, tzinfo=UTC)
+    )
+
+    def now_utc(self) -> datetime:
+        return self.current_time
+
+    def is_past_or_now(self, utc_dt: datetime) -> bool:
+        return utc_dt <= self.current_time
+
+    def is_future(self, utc_dt: datetime, grace_seconds: int = 0) -> bool:
+        return utc_dt > self.current_time - timedelta(seconds=grace_seconds)
+
+
+@dataclass
+class RecordingPublisher:
+    """Publisher that records calls and peak concurrency."""
+
+    delay: float = 0.0
+    calls: list[UUID] = field(default_factory=list)
+    active: int = 0
+    peak: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def publish(self, content_id: UUID) -> tuple[bool, str | None]:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+            self.calls.append(content_id)
+        return True, None
+
+
+def _wait_for(predicate: Callable[[], bool], timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+# --- Fixtures ---
+
+
+@pytest.fixture
+def repo() -> MemoryJobRepo:
+    return MemoryJobRepo()
+
+
+@pytest.fixture
+def time_port() -> MockTimePort:
+    return MockTimePort()
+
+
+@pytest.fixture
+def publisher() -> RecordingPublisher:
+    return RecordingPublisher()
+
+
+# --- Tests ---
+
+
+class TestPublishWorker:
+    """Heap bookkeeping and batch execution (deterministic clock)."""
+
+    @pytest.fixture
+    def service(
+        self,
+        repo: MemoryJobRepo,
+        time_port: MockTimePort,
+        publisher: RecordingPublisher,
+    ) -> SchedulerService:
+        return SchedulerService(repo=repo, publisher=publisher, time_port=time_port)
+
+    @pytest.fixture
+    def worker(self, service: SchedulerService, time_port: MockTimePort) -> PublishWorker:
+        return PublishWorker(service, batch_size=2, clock=time_port.now_utc)
+
+    def test_run_due_publishes_only_due_jobs(
+        self,
+        service: SchedulerService,
+        worker: PublishWorker,
+        repo: MemoryJobRepo,
+        time_port: MockTimePort,
+    ) -> None:
+        now = time_port.now_utc()
+        later = now + timedelta(hours=1)
+        for at in (now, now, now, later):
+            service.schedule(uuid4(), at)
+        worker.resync()
+
+        results = worker.run_due()
+
+        assert len(results) == 3
+        assert all(r.success for r in results)
+        assert repo.batch_claims == 2  # batches of 2 until a short batch
+        assert worker.next_due_at() == later
+        assert worker.stats().pending == 1
+
+    def test_notify_keeps_latest_due_time(
+        self,
+        worker: PublishWorker,
+        time_port: MockTimePort,
+    ) -> None:
+        job_id = uuid4()
+        first = time_port.now_utc() + timedelta(minutes=5)
+        second = first + timedelta(minutes=5)
+
+        worker.notify(job_id, first)
+        worker.notify(job_id, second)
+        assert worker.next_due_at() == second
+
+        worker.notify(job_id, None)
+        assert worker.next_due_at() is None
+
+    def test_publish_lag_metrics(
+        self,
+        service: SchedulerService,
+        worker: PublishWorker,
+        time_port: MockTimePort,
+    ) -> None:
+        service.schedule(uuid4(), time_port.now_utc())
+        time_port.current_time += timedelta(seconds=30)
+
+        worker.run_due()
+
+        stats = worker.stats()
+        assert stats.published == 1
+        assert stats.mean_lag_seconds == pytest.approx(30.0)
+        assert stats.lag_max_seconds == pytest.approx(30.0)
+
+
+class TestPublishWorkerThread:
+    """Background thread with the real clock."""
+
+    def test_schedule_wakes_worker(
+        self,
+        repo: MemoryJobRepo,
+        publisher: RecordingPublisher,
+    ) -> None:
+        worker_box: list[PublishWorker] = []
+        service = SchedulerService(
+            repo=repo,
+            publisher=publisher,
+            on_change=lambda job_id, due_at: worker_box[0].notify(job_id, due_at),
+        )
+        worker = PublishWorker(service, resync_seconds=3600)
+        worker_box.append(worker)
+        worker.start()
+        try:
+            service.schedule(uuid4(), datetime.now(UTC) + timedelta(milliseconds=200))
+
+            assert _wait_for(lambda: len(publisher.calls) == 1)
+            # Published on time, not on the next resync an hour away
+            assert worker.stats().lag_max_seconds < 2.0
+        finally:
+            worker.stop()
+        assert not worker.is_running
+
+    def test_concurrency_limit(
+        self,
+        repo: MemoryJobRepo,
+    ) -> None:
+        publisher = RecordingPublisher(delay=0.05)
+        service = SchedulerService(repo=repo, publisher=publisher)
+        now = datetime.now(UTC)
+        for _ in range(6):
+            service.schedule(uuid4(), now)
+
+        worker = PublishWorker(service, max_concurrency=2, batch_size=6)
+        worker.start()
+        try:
+            assert _wait_for(lambda: len(publisher.calls) == 6)
+        finally:
+            worker.stop()
+
+        assert publisher.peak == 2
+        assert worker.stats().published == 6
+
+    def test_resync_interval_counts_publish_time(
+        self,
+        repo: MemoryJobRepo,
+        time_port: MockTimePort,
+    ) -> None:
+        class SlowPublisher(RecordingPublisher):
+            def publish(self, content_id: UUID) -> tuple[bool, str | None]:
+                # The publish itself outlasts the resync interval
+                time_port.current_time += timedelta(seconds=61)
+                return super().publish(content_id)
+
+        service = SchedulerService(repo=repo, publisher=SlowPublisher(), time_port=time_port)
+        resyncs: list[int] = []
+        get_pending_jobs = service.get_pending_jobs
+
+        def counting_get_pending_jobs(limit: int) -> list[PublishJob]:
+            resyncs.append(limit)
+            return get_pending_jobs(limit=limit)
+
+        service.get_pending_jobs = counting_get_pending_jobs  # type: ignore[method-assign]
+        service.schedule(uuid4(), time_port.now_utc())
+
+        worker = PublishWorker(service, resync_seconds=60, clock=time_port.now_utc)
+        worker.start()
+        try:
+            assert _wait_for(lambda: len(resyncs) >= 2)
+        finally:
+            worker.stop()
+        assert worker.stats().batches == 1
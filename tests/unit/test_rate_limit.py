@@ -1,12 +1,18 @@
-from datetime import datetime, timedelta
-from unittest.mock import patch
-
 import pytest
 
+from src.adapters.rate_limiter import SlidingWindowRateLimiter
 from src.app_shell.rate_limit import RateLimiter
 from src.rules.models import RateLimitRules, RateLimitWindow
 
 
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
 @pytest.fixture
 def rules():
     return RateLimitRules(
@@ -30,39 +36,19 @@ def test_allow_request_basic(limiter):
     assert limiter.allow_request(key, window, limit) is False  # Limit reached
 
 
-def test_cleanup_window(limiter):
-    key = "test_window"
-    window = 1  # 1 second window
-    limit = 1
-
-    assert limiter.allow_request(key, window, limit) is True
-    assert limiter.allow_request(key, window, limit) is False
-
-    # Simulate time passing
-    # We can patch datetime in the module, but simpler to rely on small window sleep
-    # Or just mock datetime.
-    # But sleeping 1.1s is safe for unit test provided it's fast enough.
-    # Let's mock instead for robustness.
-
-    with patch("src.app_shell.rate_limit.datetime") as mock_dt:
-        start_time = datetime(2023, 1, 1, 12, 0, 0)
-        mock_dt.now.return_value = start_time
-
-        # Reset limiter wrapper logic to use mocked time?
-        # The limiter imports datetime.
-        # So key is already in history from line above? No, starting fresh check.
-
-        # New key for mocked test
-        key2 = "mocked"
+def test_cleanup_window(rules):
+    clock = FakeClock()
+    limiter = RateLimiter(rules, engine=SlidingWindowRateLimiter(clock=clock))
+    key = "mocked"
 
-        assert limiter.allow_request(key2, 60, 1) is True
-        assert limiter.allow_request(key2, 60, 1) is False
+    assert limiter.allow_request(key, 60, 1) is True
+    assert limiter.allow_request(key, 60, 1) is False
 
-        # Move forward 61 seconds
-        mock_dt.now.return_value = start_time + timedelta(seconds=61)
+    # Move forward 61 seconds
+    clock.now += 61
 
-        # Should be allowed again
-        assert limiter.allow_request(key2, 60, 1) is True
+    # Should be allowed again
+    assert limiter.allow_request(key, 60, 1) is True
 
 
 def test_check_login(limiter):
@@ -0,0 +1,152 @@
+"""
+Tests for the shared sliding-window rate limiter.
+
+Test assertions:
+- Limits are enforced over a trailing window with O(1) state per key
+- Idle keys are swept; the key table never exceeds its cap
+- Ingestion requests share one limiter instead of a fresh one per request
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from src.adapters.rate_limiter import SlidingWindowRateLimiter, get_shared_rate_limiter
+from src.api.deps import get_settings
+from src.api.routes import analytics_ingest
+from tests.conftest import FakeClock
+
+
+@pytest.fixture
+def limiter(clock: FakeClock[float]) -> SlidingWindowRateLimiter:
+    return SlidingWindowRateLimiter(clock=clock)
+
+
+# --- Window Semantics ---
+
+
+class TestSlidingWindow:
+    def test_hit_enforces_limit(self, limiter: SlidingWindowRateLimiter) -> None:
+        results = [limiter.hit("k", 3, 60) for _ in range(4)]
+
+        assert results == [True, True, True, False]
+
+    def test_previous_window_weighs_in(
+        self, limiter: SlidingWindowRateLimiter, clock: FakeClock[float]
+    ) -> None:
+        for _ in range(4):
+            limiter.hit("k", 4, 60)
+
+        # 15s into the next window: 4 * 0.75 = 3 still counted
+        clock.now += 75
+        assert limiter.hit("k", 4, 60) is True
+        assert limiter.hit("k", 4, 60) is False
+
+        # Two windows later the history has fully expired
+        clock.now += 120
+        assert limiter.peek("k", 4, 60) == (True, 4)
+
+    def test_peek_does_not_record(self, limiter: SlidingWindowRateLimiter) -> None:
+        for _ in range(5):
+            assert limiter.peek("k", 1, 60) == (True, 1)
+
+        limiter.record("k", 60)
+
+        assert limiter.peek("k", 1, 60) == (False, 0)
+
+    def test_window_sizes_counted_separately(self, limiter: SlidingWindowRateLimiter) -> None:
+        assert limiter.hit("k", 1, 60) is True
+        assert limiter.hit("k", 1, 3600) is True
+
+        # Neither check reset the other window's counters
+        assert limiter.hit("k", 1, 60) is False
+        assert limiter.hit("k", 1, 3600) is False
+
+        limiter.reset("k")
+        assert limiter.peek("k", 1, 60) == (True, 1)
+        assert limiter.peek("k", 1, 3600) == (True, 1)
+
+    def test_monotonic_clock_ignores_wall_clock(self, clock: FakeClock[float]) -> None:
+        limiter = SlidingWindowRateLimiter(clock=clock)
+        limiter.hit("k", 1, 60)
+
+        # A clock that never advances keeps the window closed
+        assert limiter.hit("k", 1, 60) is False
+
+    def test_non_positive_limit_denies(self, limiter: SlidingWindowRateLimiter) -> None:
+        assert limiter.hit("k", 0, 60) is False
+
+
+# --- Memory Bounds ---
+
+
+class TestKeyLifecycle:
+    def test_idle_keys_swept(self, clock: FakeClock[float]) -> None:
+        limiter = SlidingWindowRateLimiter(clock=clock, sweep_interval=30)
+        for i in range(100):
+            limiter.hit(f"ip-{i}", 5, 60)
+        assert len(limiter) == 100
+
+        clock.now += 121
+        limiter.hit("fresh", 5, 60)
+
+        assert len(limiter) == 1
+        assert limiter.stats().swept_keys == 100
+
+    def test_active_keys_survive_sweep(
+        self, limiter: SlidingWindowRateLimiter, clock: FakeClock[float]
+    ) -> None:
+        limiter.hit("busy", 5, 60)
+        clock.now += 61
+        limiter.hit("busy", 5, 60)
+
+        assert limiter.sweep() == 0
+        assert len(limiter) == 1
+
+    def test_key_cap_evicts_oldest(self, clock: FakeClock[float]) -> None:
+        capped = SlidingWindowRateLimiter(clock=clock, max_keys=3)
+        for i in range(5):
+            capped.hit(f"ip-{i}", 5, 60)
+
+        assert len(capped) == 3
+        assert capped.stats().evicted_keys == 2
+
+    def test_stats_count_decisions(self, limiter: SlidingWindowRateLimiter) -> None:
+        limiter.hit("k", 1, 60)
+        limiter.hit("k", 1, 60)
+
+        stats = limiter.stats()
+        assert (stats.keys, stats.allowed, stats.denied) == (1, 1, 1)
+
+    def test_peek_and_record_leave_decision_counters(
+        self, limiter: SlidingWindowRateLimiter
+    ) -> None:
+        limiter.record("k", 60)
+        limiter.peek("k", 1, 60)
+        limiter.peek("k", 5, 60)
+
+        stats = limiter.stats()
+        assert (stats.allowed, stats.denied) == (0, 0)
+
+
+# --- Shared Wiring ---
+
+
+class TestSharedLimiter:
+    def test_singleton(self) -> None:
+        assert get_shared_rate_limiter() is get_shared_rate_limiter()
+
+    def test_ingestion_limit_holds_across_requests(
+        self, monkeypatch: pytest.MonkeyPatch, limiter: SlidingWindowRateLimiter
+    ) -> None:
+        monkeypatch.setattr(analytics_ingest, "get_shared_rate_limiter", lambda: limiter)
+
+        first = analytics_ingest.get_ingestion_service(get_settings())
+        second = analytics_ingest.get_ingestion_service(get_settings())
+        config = analytics_ingest.IngestionConfig()
+        window = config.rate_limit_window_seconds
+        for _ in range(config.rate_limit_max_requests):
+            first._rate_limiter.record_request("1.2.3.4", window)
+
+        assert first.check_rate_limit("1.2.3.4") is False
+        assert second.check_rate_limit("1.2.3.4") is False
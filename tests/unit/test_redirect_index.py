@@ -0,0 +1,420 @@
+"""
+Tests for CompiledRedirectIndex (E7.2).
+
+Test assertions:
+- TA-0043: Loop detection prevents circular redirects
+- TA-0046: Redirects are applied in the routing path
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.components.redirects import (
+    CompiledRedirectIndex,
+    Redirect,
+    RedirectConfig,
+    RedirectIndexUnavailableError,
+    RedirectService,
+    find_loops,
+)
+from src.components.redirects import _index as index_module
+from tests.conftest import FakeClock
+
+# --- Counting Repository ---
+
+
+class CountingRedirectRepo:
+    """In-memory repository that counts reads."""
+
+    def __init__(self) -> None:
+        self._redirects: dict[UUID, Redirect] = {}
+        self.source_lookups = 0
+        self.list_calls = 0
+
+    def get_by_id(self, redirect_id: UUID) -> Redirect | None:
+        return self._redirects.get(redirect_id)
+
+    def get_by_source(self, source_path: str) -> Redirect | None:
+        self.source_lookups += 1
+        for redirect in self._redirects.values():
+            if redirect.source_path == source_path.lower():
+                return redirect
+        return None
+
+    def save(self, redirect: Redirect) -> Redirect:
+        self._redirects[redirect.id] = redirect
+        return redirect
+
+    def delete(self, redirect_id: UUID) -> None:
+        self._redirects.pop(redirect_id, None)
+
+    def list_all(self) -> list[Redirect]:
+        self.list_calls += 1
+        return list(self._redirects.values())
+
+
+class VersionedRedirectRepo(CountingRedirectRepo):
+    """Repository exposing a change marker, like the SQLite repo's version()."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+        self.version_calls = 0
+
+    def save(self, redirect: Redirect) -> Redirect:
+        self.writes += 1
+        return super().save(redirect)
+
+    def delete(self, redirect_id: UUID) -> None:
+        self.writes += 1
+        super().delete(redirect_id)
+
+    def version(self) -> int:
+        self.version_calls += 1
+        return self.writes
+
+
+class FailingRedirectRepo(CountingRedirectRepo):
+    """Repository whose table cannot be read."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.failing = True
+
+    def list_all(self) -> list[Redirect]:
+        if self.failing:
+            self.list_calls += 1
+            raise RuntimeError("no such table: redirects")
+        return super().list_all()
+
+
+def _rule(source: str, target: str, status_code: int = 301, enabled: bool = True) -> Redirect:
+    now = datetime.now(UTC)
+    return Redirect(
+        id=uuid4(),
+        source_path=source,
+        target_path=target,
+        status_code=status_code,
+        enabled=enabled,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def repo() -> CountingRedirectRepo:
+    return CountingRedirectRepo()
+
+
+@pytest.fixture
+def index(repo: CountingRedirectRepo) -> CompiledRedirectIndex:
+    return CompiledRedirectIndex(repo)
+
+
+@pytest.fixture
+def service(repo: CountingRedirectRepo, index: CompiledRedirectIndex) -> RedirectService:
+    return RedirectService(repo=repo, index=index)
+
+
+# --- Resolution ---
+
+
+class TestResolve:
+    def test_chain_collapsed_to_final_target(
+        self, repo: CountingRedirectRepo, index: CompiledRedirectIndex
+    ) -> None:
+        repo.save(_rule("/a", "/b"))
+        repo.save(_rule("/b", "/c", status_code=302))
+
+        assert index.resolve("/A/") == ("/c", 302)
+        assert index.resolve("/b") == ("/c", 302)
+        assert index.resolve("/c") is None
+
+    def test_lookups_do_not_touch_repo(
+        self, repo: CountingRedirectRepo, index: CompiledRedirectIndex
+    ) -> None:
+        repo.save(_rule("/a", "/b"))
+        repo.save(_rule("/b", "/c"))
+
+        for _ in range(10):
+            index.resolve("/a")
+            index.resolve("/missing")
+
+        assert repo.list_calls == 1
+        assert repo.source_lookups == 0
+
+    def test_disabled_rule_does_not_match_or_continue_chain(
+        self, repo: CountingRedirectRepo, index: CompiledRedirectIndex
+    ) -> None:
+        repo.save(_rule("/a", "/b"))
+        repo.save(_rule("/b", "/c", enabled=False))
+        repo.save(_rule("/x", "/y", enabled=False))
+
+        assert index.resolve("/a") == ("/b", 301)
+        assert index.resolve("/x") is None
+
+    def test_chain_capped_at_max_length(self, repo: CountingRedirectRepo) -> None:
+        for source, target in [("/a", "/b"), ("/b", "/c"), ("/c", "/d"), ("/d", "/e")]:
+            repo.save(_rule(source, target))
+        index = CompiledRedirectIndex(repo, RedirectConfig(max_chain_length=3))
+
+        assert index.resolve("/a") == ("/d", 301)
+
+    @pytest.mark.parametrize("path", ["/a", "/b", "/c", "/d"])
+    def test_matches_uncompiled_service(self, repo: CountingRedirectRepo, path: str) -> None:
+        repo.save(_rule("/a", "/b"))
+        repo.save(_rule("/b", "/a", status_code=302))
+        repo.save(_rule("/c", "/d"))
+        repo.save(_rule("/d", "/e", enabled=False))
+
+        compiled = RedirectService(repo=repo, index=CompiledRedirectIndex(repo))
+        assert compiled.resolve(path) == RedirectService(repo=repo).resolve(path)
+
+
+# --- Negative Cache ---
+
+
+class TestNegativeCache:
+    def test_repeated_miss_served_from_negative_cache(self, index: CompiledRedirectIndex) -> None:
+        assert index.resolve("/nothing-here") is None
+        assert index.resolve("/nothing-here") is None
+
+        stats = index.stats()
+        assert stats.misses == 2
+        assert stats.negative_cache_hits == 1
+        assert stats.negative_cache_size == 1
+
+    def test_rebuild_discards_cached_misses(
+        self, service: RedirectService, index: CompiledRedirectIndex
+    ) -> None:
+        assert index.resolve("/old") is None
+
+        service.create("/old", "/new")
+
+        assert index.resolve("/old") == ("/new", 301)
+        stats = index.stats()
+        assert stats.hits == 1
+        assert stats.rebuilds == 1
+
+    def test_misses_evicted_least_recently_used(
+        self, index: CompiledRedirectIndex, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(index_module, "NEGATIVE_CACHE_SIZE", 2)
+
+        for path in ("/a", "/b", "/a", "/c"):
+            index.resolve(path)
+        index.resolve("/a")
+        index.resolve("/c")
+
+        stats = index.stats()
+        assert stats.negative_cache_size == 2
+        # "/b" was least recently used when "/c" arrived; new misses still get cached
+        assert stats.negative_cache_hits == 3
+
+
+# --- Rebuild on Writes ---
+
+
+class TestRebuild:
+    def test_service_writes_rebuild_index(
+        self, service: RedirectService, index: CompiledRedirectIndex
+    ) -> None:
+        created, errors = service.create("/old", "/new")
+        assert errors == []
+        assert created is not None
+        assert index.resolve("/old") == ("/new", 301)
+
+        service.update(created.id, {"target_path": "/newer"})
+        assert index.resolve("/old") == ("/newer", 301)
+
+        service.update(created.id, {"enabled": False})
+        assert index.resolve("/old") is None
+
+        service.delete(created.id)
+        assert len(index) == 0
+
+    def test_validation_uses_index_lookups(
+        self, service: RedirectService, repo: CountingRedirectRepo
+    ) -> None:
+        service.create("/a", "/b")
+        service.create("/b", "/c")
+        lookups = repo.source_lookups
+
+        _, errors = service.create("/c", "/a")
+
+        assert any(e.code == "redirect_loop" for e in errors)
+        # Only the duplicate-source check reaches the repository
+        assert repo.source_lookups == lookups + 1
+
+
+# --- Writes From Other Processes ---
+
+
+class TestStaleness:
+    @pytest.fixture
+    def repo(self) -> VersionedRedirectRepo:
+        return VersionedRedirectRepo()
+
+    @pytest.fixture
+    def index(self, repo: VersionedRedirectRepo, clock: FakeClock[float]) -> CompiledRedirectIndex:
+        return CompiledRedirectIndex(repo, check_interval_seconds=2, clock=clock)
+
+    def test_external_write_picked_up_after_check_interval(
+        self, repo: VersionedRedirectRepo, index: CompiledRedirectIndex, clock: FakeClock[float]
+    ) -> None:
+        assert index.resolve("/old") is None
+
+        # Written by another worker: this process's index was not rebuilt
+        repo.save(_rule("/old", "/new"))
+        clock.now += 1
+        assert index.resolve("/old") is None
+
+        clock.now += 1
+        assert index.resolve("/old") == ("/new", 301)
+        assert index.stats().rebuilds == 1
+
+    def test_unchanged_version_does_not_recompile(
+        self, repo: VersionedRedirectRepo, index: CompiledRedirectIndex, clock: FakeClock[float]
+    ) -> None:
+        repo.save(_rule("/a", "/b"))
+        for _ in range(5):
+            index.resolve("/a")
+            clock.now += 3
+
+        assert repo.list_calls == 1
+        assert repo.version_calls == 5
+
+    def test_refresh_failure_keeps_previous_rules(
+        self, repo: VersionedRedirectRepo, index: CompiledRedirectIndex, clock: FakeClock[float]
+    ) -> None:
+        repo.save(_rule("/a", "/b"))
+        index.resolve("/a")
+
+        def broken() -> int:
+            raise RuntimeError("database is locked")
+
+        repo.version = broken  # type: ignore[method-assign]
+        clock.now += 2
+
+        assert index.resolve("/a") == ("/b", 301)
+
+
+class TestBackgroundRefresh:
+    @pytest.fixture
+    def repo(self) -> VersionedRedirectRepo:
+        return VersionedRedirectRepo()
+
+    @staticmethod
+    def _wait_for(condition: Callable[[], bool]) -> None:
+        deadline = time.monotonic() + 5
+        while not condition():
+            assert time.monotonic() < deadline, "background refresh did not run"
+            time.sleep(0.01)
+
+    def test_lookups_skip_version_check_once_started(
+        self, repo: VersionedRedirectRepo, clock: FakeClock[float]
+    ) -> None:
+        repo.save(_rule("/a", "/b"))
+        index = CompiledRedirectIndex(repo, check_interval_seconds=60, clock=clock)
+        index.start()
+        try:
+            self._wait_for(lambda: index.resolves_from_memory)
+            calls = repo.version_calls
+            for _ in range(5):
+                assert index.resolve("/a") == ("/b", 301)
+                clock.now += 3
+            assert repo.version_calls == calls
+        finally:
+            index.stop()
+
+        assert not index.is_running
+        assert not index.resolves_from_memory
+
+    def test_external_write_picked_up_by_refresher(self, repo: VersionedRedirectRepo) -> None:
+        index = CompiledRedirectIndex(repo, check_interval_seconds=0.01)
+        index.start()
+        try:
+            self._wait_for(lambda: index.resolves_from_memory)
+            assert index.resolve("/old") is None
+
+            # Written by another worker: this process's index was not rebuilt
+            repo.save(_rule("/old", "/new"))
+            self._wait_for(lambda: index.resolve("/old") is not None)
+            assert index.resolve("/old") == ("/new", 301)
+        finally:
+            index.stop()
+
+
+# --- Load Failures ---
+
+
+class TestLoadFailure:
+    def test_failed_load_not_retried_until_delay_passes(self, clock: FakeClock[float]) -> None:
+        repo = FailingRedirectRepo()
+        index = CompiledRedirectIndex(repo, retry_after_seconds=5, clock=clock)
+
+        with pytest.raises(RuntimeError, match="no such table"):
+            index.resolve("/a")
+        for _ in range(10):
+            with pytest.raises(RedirectIndexUnavailableError):
+                index.resolve("/a")
+        assert repo.list_calls == 1
+
+        repo.failing = False
+        repo.save(_rule("/a", "/b"))
+        clock.now += 5
+
+        assert index.resolve("/a") == ("/b", 301)
+
+    def test_rebuild_retries_immediately(self, clock: FakeClock[float]) -> None:
+        repo = FailingRedirectRepo()
+        index = CompiledRedirectIndex(repo, clock=clock)
+        with pytest.raises(RuntimeError):
+            index.resolve("/a")
+
+        repo.failing = False
+        repo.save(_rule("/a", "/b"))
+        index.rebuild()
+
+        assert index.resolve("/a") == ("/b", 301)
+
+
+# --- Loop Detection ---
+
+
+class TestFindLoops:
+    def test_acyclic_rules_have_no_loops(self) -> None:
+        assert find_loops([_rule("/a", "/b"), _rule("/b", "/c")]) == {}
+
+    def test_cycle_members_loop_to_themselves(self) -> None:
+        loops = find_loops([_rule("/a", "/b"), _rule("/b", "/c"), _rule("/c", "/a")])
+        assert loops == {"/a": "/a", "/b": "/b", "/c": "/c"}
+
+    def test_tail_reports_cycle_entry(self) -> None:
+        loops = find_loops(
+            [_rule("/t1", "/t2"), _rule("/t2", "/x"), _rule("/x", "/y"), _rule("/y", "/x")]
+        )
+        assert loops == {"/t1": "/x", "/t2": "/x", "/x": "/x", "/y": "/y"}
+
+    def test_self_loop_and_case_insensitivity(self) -> None:
+        loops = find_loops([_rule("/Self", "/self/"), _rule("/ok", "/done")])
+        assert loops == {"/self": "/self"}
+
+    def test_validate_all_reports_loops(
+        self, repo: CountingRedirectRepo, service: RedirectService
+    ) -> None:
+        repo.save(_rule("/a", "/b"))
+        repo.save(_rule("/b", "/a"))
+        repo.save(_rule("/ok", "/fine"))
+
+        issues = {r.source_path: errors for r, errors in service.validate_all()}
+
+        assert set(issues) == {"/a", "/b"}
+        assert issues["/a"][0].message == "Redirect would create a loop via /a"
+        assert repo.source_lookups == 0
@@ -7,16 +7,23 @@ Test assertions:
 
 from __future__ import annotations
 
+import copy
+
 import pytest
 
 from src.components.render_posts import (
+    ImageVariant,
     PostRenderer,
     RenderConfig,
+    RenderEngine,
+    ResponsiveImage,
     render_blockquote,
     render_bullet_list,
     render_code_block,
+    render_document,
     render_heading,
     render_image,
+    render_node,
     render_ordered_list,
     render_paragraph,
     render_post_body,
@@ -24,6 +31,18 @@ from src.components.render_posts import (
     render_text,
 )
 
+
+class StubImageSources:
+    """ResponsiveImagePort with one known image."""
+
+    def responsive_image(self, src: str) -> ResponsiveImage | None:
+        if src != "/assets/a/v/1":
+            return None
+        return ResponsiveImage(
+            width=1000, height=500, variants=(ImageVariant(url=f"{src}/w/320", width=320),)
+        )
+
+
 # --- Fixtures ---
 
 
@@ -209,6 +228,44 @@ class TestBasicRendering:
         assert 'width="100"' in result
         assert 'height="200"' in result
 
+    def test_render_image_with_variants(self) -> None:
+        """Known images get srcset, sizes and intrinsic dimensions."""
+        node = {"type": "image", "attrs": {"src": "/assets/a/v/1", "alt": "Chart"}}
+        config = RenderConfig(image_sources=StubImageSources())
+
+        result = render_image(node, config)
+
+        assert 'srcset="/assets/a/v/1/w/320 320w, /assets/a/v/1 1000w"' in result
+        assert 'sizes="(max-width: 768px) 100vw, 768px"' in result
+        assert 'width="1000"' in result
+        assert 'height="500"' in result
+        assert (
+            result
+            == render_document(
+                {"type": "doc", "content": [node]},
+                RenderConfig(wrap_in_article=False, image_sources=StubImageSources()),
+            ).html
+        )
+
+    def test_render_image_explicit_dimensions_win(self) -> None:
+        """Node width/height are kept over the intrinsic size."""
+        node = {"type": "image", "attrs": {"src": "/assets/a/v/1", "width": "400"}}
+
+        result = render_image(node, RenderConfig(image_sources=StubImageSources()))
+
+        assert 'width="400"' in result
+        assert "height=" not in result
+        assert "srcset=" in result
+
+    def test_render_image_unknown_src_unchanged(self) -> None:
+        """Images the source does not know render as before."""
+        node = {"type": "image", "attrs": {"src": "https://example.com/img.png"}}
+
+        result = render_image(node, RenderConfig(image_sources=StubImageSources()))
+
+        assert result == render_image(node)
+        assert "srcset" not in result
+
 
 # --- Text and Marks ---
 
@@ -549,3 +606,160 @@ class TestEdgeCases:
         result = render_rich_text(doc)
         assert result.count("<blockquote>") == 3
         assert "Deep" in result
+
+
+# --- Render Engine ---
+
+
+def _rich_doc() -> dict:
+    """Document exercising every node and mark type."""
+    return {
+        "type": "doc",
+        "content": [
+            {
+                "type": "heading",
+                "attrs": {"level": 1},
+                "content": [{"type": "text", "text": "Intro & Aims"}],
+            },
+            {
+                "type": "paragraph",
+                "content": [
+                    {"type": "text", "text": "Plain "},
+                    {
+                        "type": "text",
+                        "text": "bold",
+                        "marks": [{"type": "bold"}, {"type": "italic"}],
+                    },
+                    {"type": "hardBreak"},
+                    {
+                        "type": "text",
+                        "text": "link",
+                        "marks": [
+                            {"type": "link", "attrs": {"href": "https://x.test", "title": "T"}}
+                        ],
+                    },
+                    {
+                        "type": "text",
+                        "text": " bad",
+                        "marks": [{"type": "link", "attrs": {"href": "javascript:alert(1)"}}],
+                    },
+                ],
+            },
+            {
+                "type": "orderedList",
+                "attrs": {"start": 3},
+                "content": [
+                    {
+                        "type": "listItem",
+                        "content": [
+                            {"type": "paragraph", "content": [{"type": "text", "text": "a"}]}
+                        ],
+                    }
+                ],
+            },
+            {
+                "type": "bulletList",
+                "content": [{"type": "listItem", "content": [{"type": "text", "text": "b"}]}],
+            },
+            {
+                "type": "codeBlock",
+                "attrs": {"language": "py"},
+                "content": [{"type": "text", "text": "x < 1"}],
+            },
+            {"type": "image", "attrs": {"src": "/a.png", "alt": "A", "width": 10}},
+            {"type": "horizontalRule"},
+            {
+                "type": "heading",
+                "attrs": {"level": 9},
+                "content": [{"type": "text", "text": "Deep dive"}],
+            },
+            {"type": "mystery", "content": [{"type": "text", "text": "kept"}]},
+        ],
+    }
+
+
+class TestRenderEngine:
+    """Single-pass renderer and render cache."""
+
+    @pytest.mark.parametrize(
+        "config",
+        [RenderConfig(), RenderConfig(wrap_in_article=False, add_heading_ids=False)],
+    )
+    def test_matches_node_renderers(self, config: RenderConfig) -> None:
+        doc = _rich_doc()
+        expected = render_node(doc, config)
+        if config.wrap_in_article:
+            expected = f"<article>{expected}</article>"
+
+        result = render_document(doc, config)
+
+        assert result.html == expected
+        assert result.plain_text == "Intro & AimsPlain boldlink badabx < 1Deep divekept"
+
+    def test_headings_and_text_in_same_pass(self) -> None:
+        result = render_document(_rich_doc(), RenderConfig())
+
+        assert result.heading_list() == [
+            {"level": 1, "text": "Intro & Aims", "id": "intro-aims"},
+            {"level": 9, "text": "Deep dive", "id": "deep-dive"},
+        ]
+        assert '<h6 id="deep-dive">' in result.html
+
+    def test_deep_nesting_does_not_recurse(self) -> None:
+        node: dict = {"type": "text", "text": "core"}
+        for _ in range(5000):
+            node = {"type": "blockquote", "content": [node]}
+
+        result = render_document({"type": "doc", "content": [node]}, RenderConfig())
+
+        assert result.html.count("<blockquote>") == 5000
+        assert result.plain_text == "core"
+
+    def test_cache_hit_for_identical_document(self) -> None:
+        engine = RenderEngine()
+        doc = _rich_doc()
+
+        first = engine.render(doc, RenderConfig())
+        second = engine.render(copy.deepcopy(doc), RenderConfig())
+
+        assert second is first
+        assert engine.stats().hits == 1
+        assert engine.stats().misses == 1
+
+    def test_config_is_part_of_key(self) -> None:
+        engine = RenderEngine()
+        doc = _rich_doc()
+
+        engine.render(doc, RenderConfig())
+        bare = engine.render(doc, RenderConfig(wrap_in_article=False))
+
+        assert not bare.html.startswith("<article>")
+        assert engine.stats().misses == 2
+
+    def test_sanitize_cached_with_render(self) -> None:
+        engine = RenderEngine()
+        doc = {
+            "type": "doc",
+            "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": "ok"}]},
+                {"type": "table", "content": []},
+            ],
+        }
+
+        result = engine.render(doc, RenderConfig(), sanitize=True)
+
+        assert result.sanitized is not None
+        assert [n["type"] for n in result.sanitized["content"]] == ["paragraph"]
+        assert [c.code for c in result.changes] == ["stripped_node"]
+        assert result.html == "<article><p>ok</p></article>"
+
+    def test_lru_eviction(self) -> None:
+        engine = RenderEngine(max_entries=2)
+        for i in range(3):
+            engine.render(
+                {"type": "doc", "content": [{"type": "text", "text": str(i)}]}, RenderConfig()
+            )
+
+        stats = engine.stats()
+        assert stats.size == 2
+        assert stats.evictions == 1
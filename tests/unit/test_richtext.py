@@ -26,6 +26,7 @@ from src.components.richtext import (
     validate_schema,
     validate_size,
 )
+from src.core.services import richtext as legacy_richtext
 
 # --- Fixtures ---
 
@@ -284,6 +285,97 @@ class TestSanitizerStripping:
         assert any(e.code == "stripped_attribute" for e in errors)
 
 
+class TestHTMLSanitizerScan:
+    """Single-scan HTML sanitizer behaviour (TA-0021)."""
+
+    def test_repeated_warnings_deduplicated(self, config: RichTextConfig) -> None:
+        """Each distinct warning is reported once with a count."""
+        html = "<p>" + '<span style="color:red">x</span>' * 50 + "</p>"
+        sanitized, errors = sanitize_html(html, config)
+
+        assert sanitized == "<p>" + "x" * 50 + "</p>"
+        assert len(errors) == 1
+        assert errors[0].code == "stripped_tag"
+        assert errors[0].message == "Tag 'span' was stripped"
+        assert errors[0].count == 100
+
+    def test_comments_and_script_content_dropped(self, config: RichTextConfig) -> None:
+        """Comments and script/style bodies never reach the output."""
+        html = "<p>a<!-- <b>hidden</b> --></p><STYLE>p{}</STYLE><script>x<y</script>b"
+        sanitized, errors = sanitize_html(html, config)
+
+        assert sanitized == "<p>a</p>b"
+        assert {e.message for e in errors} == {
+            "Tag 'style' was stripped",
+            "Tag 'script' was stripped",
+        }
+
+    def test_stray_angle_bracket_escaped(self, config: RichTextConfig) -> None:
+        """Text '<' that is not a tag is escaped."""
+        sanitized, _ = sanitize_html("<p>1 < 2 and <3</p><<b>script>", config)
+
+        # Stripping <b> must not splice a new <script> tag together
+        assert sanitized == "<p>1 &lt; 2 and &lt;3</p>&lt;script>"
+
+    def test_uppercase_tags_normalized(self, config: RichTextConfig) -> None:
+        """Allowed tags match case-insensitively and are emitted lowercase."""
+        sanitized, _ = sanitize_html('<P>x</P><A HREF="https://example.com">y</A>', config)
+
+        assert sanitized.startswith('<p>x</p><a href="https://example.com"')
+        assert sanitized.endswith(">y</a>")
+
+    def test_dropped_link_drops_closing_tag(self, config: RichTextConfig) -> None:
+        """A removed <a> leaves no orphan </a>."""
+        html = '<a href="javascript:x">bad</a> <a href="/ok">good</a>'
+        sanitized, _ = sanitize_html(html, config)
+
+        assert sanitized.count("</a>") == 1
+        assert sanitized.startswith('bad <a href="/ok"')
+
+    def test_attribute_entities_not_double_escaped(self, config: RichTextConfig) -> None:
+        """Entity-encoded attribute values are escaped exactly once."""
+        html = '<a href="/search?a=1&amp;b=2" href="javascript:x">q</a>'
+        sanitized, errors = sanitize_html(html, config)
+
+        assert 'href="/search?a=1&amp;b=2"' in sanitized
+        assert "javascript" not in sanitized
+        assert errors == []
+
+    @pytest.mark.parametrize(
+        "href",
+        [
+            "java&#x09;script:alert(1)",
+            "java&#x0A;script:alert(1)",
+            "java&#0;script:alert(1)",
+            "&#0;javascript:alert(1)",
+            " javascript:alert(1)",
+            "&#x01;&#x20;javascript:alert(1)",
+            "java\tscript&colon;alert(1)",
+            "da&#x0D;ta:text/html,x",
+        ],
+    )
+    def test_obfuscated_scheme_dropped(self, config: RichTextConfig, href: str) -> None:
+        """Entity-encoded controls and whitespace cannot hide a forbidden scheme."""
+        sanitized, errors = sanitize_html(f'<a href="{href}">x</a><img src="{href}">', config)
+
+        assert sanitized == "x"
+        assert [e.count for e in errors if e.code == "unsafe_url"] == [1, 1]
+
+    def test_word_paste(self, config: RichTextConfig) -> None:
+        """Typical Word markup reduces to the allowed structure."""
+        html = (
+            '<p class="MsoNormal" style="margin:0"><b><span lang="EN-US" '
+            'style="font-family:&quot;Calibri&quot;">Title</span></b><o:p></o:p></p>'
+            "<!--[if !supportLists]--><p>item</p>"
+        )
+        sanitized, errors = sanitize_html(html, config)
+
+        assert sanitized == "<p>Title</p><p>item</p>"
+        counts = {e.message: e.count for e in errors}
+        assert counts["Tag 'span' was stripped"] == 2
+        assert counts["Tag 'o:p' was stripped"] == 2
+
+
 # --- TA-0022: Link Sanitization ---
 
 
@@ -309,6 +401,14 @@ class TestLinkSanitization:
         assert is_safe_url("JAVASCRIPT:alert()", config) is False
         assert is_safe_url("  javascript:void(0)", config) is False
 
+    def test_unsafe_url_with_ignored_characters(self, config: RichTextConfig) -> None:
+        """Characters browsers skip inside a scheme do not make it safe."""
+        assert is_safe_url("java\tscript:alert()", config) is False
+        assert is_safe_url("java\nscr\ript:alert()", config) is False
+        assert is_safe_url("\x00\x1fjavascript:alert()", config) is False
+        assert is_safe_url("java\ufffdscript:alert()", config) is False
+        assert is_safe_url("https://example.com/a b", config) is True
+
     def test_unsafe_data_url(self, config: RichTextConfig) -> None:
         """data: URLs are unsafe."""
         assert is_safe_url("data:text/html,<script>", config) is False
@@ -530,6 +630,22 @@ class TestRichTextService:
         assert count == 1
 
 
+class TestLegacyServiceDelegates:
+    """The legacy core service shares the component's sanitizer and URL check."""
+
+    def test_sanitize_html_uses_component_sanitizer(self) -> None:
+        html = '<p>a<!-- x --></p><a href="java&#x09;script:alert(1)">b</a><span>c</span>'
+        sanitized, errors = legacy_richtext.sanitize_html(html)
+
+        assert sanitized == "<p>a</p>bc"
+        assert {e.code for e in errors} == {"unsafe_url", "stripped_tag"}
+        assert all(isinstance(e, legacy_richtext.RichTextValidationError) for e in errors)
+
+    def test_is_safe_url_catches_obfuscated_scheme(self) -> None:
+        assert legacy_richtext.is_safe_url("java\tscript:alert()") is False
+        assert legacy_richtext.is_safe_url("https://example.com") is True
+
+
 # --- Edge Cases ---
 
 
@@ -651,6 +651,101 @@ class TestBatchProcessing:
 
         assert len(results) == 2
 
+    def test_run_due_jobs_claims_in_one_batch(
+        self,
+        repo: MockPublishJobRepo,
+        time_port: MockTimePort,
+        publisher: MockPublisher,
+    ) -> None:
+        """Repos with claim_due_jobs are asked once for the whole batch."""
+        batch_calls: list[int] = []
+
+        def claim_due_jobs(worker_id: str, now_utc: datetime, limit: int) -> list[PublishJob]:
+            batch_calls.append(limit)
+            due = repo.list_due_jobs(now_utc, limit)
+            return [j for j in due if repo.claim_job(j.id, worker_id, now_utc) is not None]
+
+        repo.claim_due_jobs = claim_due_jobs  # type: ignore[attr-defined]
+        service = SchedulerService(repo=repo, publisher=publisher, time_port=time_port)
+        for _ in range(3):
+            service.schedule(uuid4(), time_port.now_utc())
+
+        results = service.run_due_jobs("worker-1", max_jobs=10)
+
+        assert batch_calls == [10]
+        assert len(results) == 3
+        assert all(r.success for r in results)
+
+
+# --- Schedule Change Notifications ---
+
+
+class TestScheduleListener:
+    """on_change is told about every change to a job's due time."""
+
+    @pytest.fixture
+    def changes(self) -> list[tuple[UUID, datetime | None]]:
+        return []
+
+    @pytest.fixture
+    def notifying(
+        self,
+        repo: MockPublishJobRepo,
+        time_port: MockTimePort,
+        publisher: MockPublisher,
+        changes: list[tuple[UUID, datetime | None]],
+    ) -> SchedulerService:
+        return SchedulerService(
+            repo=repo,
+            publisher=publisher,
+            time_port=time_port,
+            on_change=lambda job_id, due_at: changes.append((job_id, due_at)),
+        )
+
+    def test_schedule_reschedule_unschedule(
+        self,
+        notifying: SchedulerService,
+        time_port: MockTimePort,
+        changes: list[tuple[UUID, datetime | None]],
+    ) -> None:
+        first = time_port.now_utc() + timedelta(hours=1)
+        second = first + timedelta(hours=1)
+
+        job, _ = notifying.schedule(uuid4(), first)
+        assert job is not None
+        notifying.reschedule(job.id, second)
+        notifying.unschedule(job.id)
+
+        assert changes == [(job.id, first), (job.id, second), (job.id, None)]
+
+    def test_schedule_without_notify(
+        self,
+        notifying: SchedulerService,
+        time_port: MockTimePort,
+        changes: list[tuple[UUID, datetime | None]],
+    ) -> None:
+        notifying.schedule(uuid4(), time_port.now_utc(), notify=False)
+
+        assert changes == []
+
+    def test_retry_reports_next_attempt(
+        self,
+        notifying: SchedulerService,
+        time_port: MockTimePort,
+        publisher: MockPublisher,
+        changes: list[tuple[UUID, datetime | None]],
+    ) -> None:
+        publisher.should_succeed = False
+        job, _ = notifying.schedule(uuid4(), time_port.now_utc())
+        assert job is not None
+        changes.clear()
+
+        notifying.run_due_jobs("worker-1")
+
+        stored = notifying.get_job(job.id)
+        assert stored is not None and stored.status == "retry_wait"
+        assert changes == [(job.id, stored.next_retry_at)]
+
 
 # --- Query Methods ---
 
@@ -0,0 +1,280 @@
+"""
+Tests for the materialized sitemap (E2.3, R2, T-0046).
+
+Test assertions:
+- TA-E2.3-03: Sitemap lists only live published content
+- Sitemaps past the URL limit are split behind a sitemap index
+- ETag / Last-Modified produce 304s for unchanged sitemaps
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.deps import get_sitemap_store
+from src.api.routes.public_ssr import router
+from src.components.C2_PublicTemplates import SitemapStore
+from tests.conftest import FakeClock
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+
+
+class CountingSource:
+    """Content source returning published refs, counting loads."""
+
+    def __init__(self) -> None:
+        self.refs: list[tuple[UUID, str, str, datetime | None, datetime | None]] = []
+        self.loads = 0
+
+    def add(self, slug: str, published_at: datetime = NOW - timedelta(days=1)) -> UUID:
+        content_id = uuid4()
+        self.refs.append((content_id, slug, "post", published_at, published_at))
+        return content_id
+
+    def list_published_refs(
+        self,
+    ) -> list[tuple[UUID, str, str, datetime | None, datetime | None]]:
+        self.loads += 1
+        return list(self.refs)
+
+
+class VersionedSource(CountingSource):
+    """Source exposing a change marker, like the SQLite repo's version()."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+        self.version_calls = 0
+
+    def add(self, slug: str, published_at: datetime = NOW - timedelta(days=1)) -> UUID:
+        self.writes += 1
+        return super().add(slug, published_at)
+
+    def version(self) -> int:
+        self.version_calls += 1
+        return self.writes
+
+
+def _item(content_id: UUID, slug: str, status: str = "published") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=content_id,
+        slug=slug,
+        type="post",
+        status=status,
+        published_at=NOW - timedelta(hours=1),
+        updated_at=NOW - timedelta(hours=1),
+    )
+
+
+@pytest.fixture
+def clock() -> FakeClock[datetime]:
+    return FakeClock(NOW)
+
+
+@pytest.fixture
+def source() -> CountingSource:
+    return CountingSource()
+
+
+@pytest.fixture
+def store(source: CountingSource, clock: FakeClock[datetime]) -> SitemapStore:
+    return SitemapStore(source, clock=clock)
+
+
+def _client(store: SitemapStore) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_sitemap_store] = lambda: store
+    return TestClient(app)
+
+
+# --- Store ---
+
+
+class TestSitemapStore:
+    def test_lists_every_published_item(self, store: SitemapStore, source: CountingSource) -> None:
+        for i in range(250):
+            source.add(f"post-{i}")
+
+        assert len(store.snapshot().rows) == 250
+
+    def test_loaded_once_and_updated_by_events(
+        self, store: SitemapStore, source: CountingSource
+    ) -> None:
+        content_id = source.add("first")
+        store.snapshot()
+
+        new_id = uuid4()
+        store.apply(_item(new_id, "second"))
+        store.apply(_item(content_id, "first", status="archived"))
+
+        slugs = [row[0] for row in store.snapshot().rows]
+        assert slugs == ["second"]
+        assert source.loads == 1
+
+    def test_future_item_appears_once_live(
+        self, store: SitemapStore, source: CountingSource, clock: FakeClock[datetime]
+    ) -> None:
+        source.add("later", published_at=NOW + timedelta(hours=2))
+        assert store.snapshot().rows == ()
+
+        clock.now = NOW + timedelta(hours=3)
+
+        assert [row[0] for row in store.snapshot().rows] == ["later"]
+
+    def test_remove_changes_digest_and_last_modified(
+        self, store: SitemapStore, source: CountingSource, clock: FakeClock[datetime]
+    ) -> None:
+        source.add("keep")
+        drop = source.add("drop")
+        before = store.snapshot()
+
+        clock.now = NOW + timedelta(minutes=5)
+        store.remove(drop)
+        after = store.snapshot()
+
+        assert after.digest != before.digest
+        assert after.last_modified > before.last_modified
+        assert [row[0] for row in after.rows] == ["keep"]
+
+
+class TestCrossWorkerResync:
+    @pytest.fixture
+    def source(self) -> VersionedSource:
+        return VersionedSource()
+
+    @pytest.fixture
+    def store(self, source: VersionedSource, clock: FakeClock[datetime]) -> SitemapStore:
+        return SitemapStore(source, clock=clock, check_interval_seconds=10)
+
+    def test_external_publish_picked_up_after_check_interval(
+        self, store: SitemapStore, source: VersionedSource, clock: FakeClock[datetime]
+    ) -> None:
+        source.add("first")
+        store.snapshot()
+
+        # Published by another worker: this process saw no apply() event
+        source.add("second")
+        clock.now = NOW + timedelta(seconds=5)
+        assert [row[0] for row in store.snapshot().rows] == ["first"]
+
+        clock.now = NOW + timedelta(seconds=10)
+        assert sorted(row[0] for row in store.snapshot().rows) == ["first", "second"]
+        assert source.loads == 2
+
+    def test_unchanged_version_skips_reload(
+        self, store: SitemapStore, source: VersionedSource, clock: FakeClock[datetime]
+    ) -> None:
+        source.add("first")
+        for i in range(5):
+            clock.now = NOW + timedelta(seconds=10 * i)
+            store.snapshot()
+
+        assert source.loads == 1
+        assert source.version_calls == 5
+
+    def test_unrelated_write_keeps_last_modified(
+        self, store: SitemapStore, source: VersionedSource, clock: FakeClock[datetime]
+    ) -> None:
+        source.add("first")
+        before = store.snapshot()
+
+        # A draft edit moves the marker without changing the published list
+        source.writes += 1
+        clock.now = NOW + timedelta(seconds=10)
+        after = store.snapshot()
+
+        assert source.loads == 2
+        assert after is before
+
+    def test_version_failure_keeps_current_list(
+        self, store: SitemapStore, source: VersionedSource, clock: FakeClock[datetime]
+    ) -> None:
+        source.add("first")
+        store.snapshot()
+
+        def broken() -> int:
+            raise RuntimeError("database is locked")
+
+        source.version = broken  # type: ignore[method-assign]
+        clock.now = NOW + timedelta(seconds=10)
+
+        assert [row[0] for row in store.snapshot().rows] == ["first"]
+
+
+# --- Endpoints ---
+
+
+class TestSitemapEndpoints:
+    def test_single_urlset_with_homepage(self, store: SitemapStore, source: CountingSource) -> None:
+        source.add("hello")
+
+        response = _client(store).get("/sitemap.xml")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/xml")
+        assert "<urlset" in response.text
+        assert response.text.count("<url>") == 2
+        assert "/p/hello</loc>" in response.text
+
+    def test_split_into_index_and_children(
+        self, source: CountingSource, clock: FakeClock[datetime]
+    ) -> None:
+        for i in range(5):
+            source.add(f"post-{i}", published_at=NOW - timedelta(days=i + 1))
+        store = SitemapStore(source, clock=clock, max_urls_per_sitemap=4)
+        client = _client(store)
+
+        index = client.get("/sitemap.xml")
+        assert "<sitemapindex" in index.text
+        assert index.text.count("<sitemap>") == 2
+
+        first = client.get("/sitemap-1.xml")
+        second = client.get("/sitemap-2.xml")
+        assert first.text.count("<url>") == 4
+        assert second.text.count("<url>") == 2
+        assert client.get("/sitemap-3.xml").status_code == 404
+
+    def test_if_none_match_returns_304(self, store: SitemapStore, source: CountingSource) -> None:
+        source.add("hello")
+        client = _client(store)
+        etag = client.get("/sitemap.xml").headers["etag"]
+
+        response = client.get("/sitemap.xml", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+    def test_etag_changes_after_publish(self, store: SitemapStore, source: CountingSource) -> None:
+        source.add("hello")
+        client = _client(store)
+        etag = client.get("/sitemap.xml").headers["etag"]
+
+        store.apply(_item(uuid4(), "fresh"))
+        response = client.get("/sitemap.xml", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert "/p/fresh</loc>" in response.text
+
+    def test_if_modified_since_returns_304(
+        self, store: SitemapStore, source: CountingSource
+    ) -> None:
+        source.add("hello")
+        client = _client(store)
+        last_modified = client.get("/sitemap.xml").headers["last-modified"]
+
+        current = client.get("/sitemap.xml", headers={"If-Modified-Since": last_modified})
+        stale = client.get(
+            "/sitemap.xml",
+            headers={"If-Modified-Since": format_datetime(NOW - timedelta(days=30), usegmt=True)},
+        )
+
+        assert current.status_code == 304
+        assert stale.status_code == 200
@@ -0,0 +1,70 @@
+"""
+Tests for cold-start import cost of the API and UI entry points.
+
+Each entry point is imported in a fresh interpreter and must not load the
+deferred heavy subsystems. The comparison against the committed baseline
+(scripts/startup_baseline.json) depends on the machine that recorded it, so
+it only runs with LAB_STARTUP_BENCH=1. Refresh the baseline with
+`python scripts/bench_startup.py --update-baseline` after an intentional change.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from scripts.bench_startup import (
+    DEFERRED_MODULES,
+    ENTRY_POINTS,
+    load_baseline,
+    loaded_modules,
+    median_profile,
+    parse_importtime,
+)
+
+# Module counts are stable per environment; import time is noisy on shared runners
+MAX_MODULE_GROWTH = 1.10
+MAX_TIME_FACTOR = 2.0
+
+
+def test_parse_importtime() -> None:
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   _io\n"
+        "import time:        30 |         30 |     src.api.routes.auth\n"
+        "import time:        50 |         80 |   src.api.routes\n"
+        "unrelated warning\n"
+    )
+
+    total, count, packages = parse_importtime(stderr)
+
+    assert (total, count) == (200, 3)
+    assert packages == {"_io": 120, "src.api.routes": 80}
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_heavy_subsystems_are_deferred(module: str) -> None:
+    loaded = loaded_modules(module)
+
+    assert not [name for name in DEFERRED_MODULES if name in loaded]
+
+
+@pytest.mark.skipif(
+    os.environ.get("LAB_STARTUP_BENCH") != "1",
+    reason="machine-specific baseline; set LAB_STARTUP_BENCH=1 to compare",
+)
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_startup_within_baseline(module: str) -> None:
+    baseline = load_baseline()[module]
+
+    profile = median_profile(module, runs=3)
+
+    assert profile.module_count <= baseline["module_count"] * MAX_MODULE_GROWTH, (
+        f"{module} imports {profile.module_count} modules "
+        f"(baseline {baseline['module_count']}); slowest: {profile.top(5)}"
+    )
+    assert profile.total_us <= baseline["total_us"] * MAX_TIME_FACTOR, (
+        f"{module} imports in {profile.total_us / 1000:.0f} ms "
+        f"(baseline {baseline['total_us'] / 1000:.0f} ms); slowest: {profile.top(5)}"
+    )
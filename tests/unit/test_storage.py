@@ -8,13 +8,22 @@ These tests ensure R2 invariant: AssetVersion bytes are immutable.
 from __future__ import annotations
 
 import hashlib
+import os
 from io import BytesIO
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from src.adapters import local_storage
+from src.adapters.integrity import IntegrityScrubber, VerifiedHashCache
 from src.adapters.local_storage import LocalFileStorage, create_local_storage
-from src.core.ports.storage import IntegrityError, KeyExistsError, KeyNotFoundError
+from src.core.ports.storage import (
+    IntegrityError,
+    KeyExistsError,
+    KeyNotFoundError,
+    ObjectTooLargeError,
+)
 
 
 @pytest.fixture
@@ -278,3 +287,193 @@ class TestFactoryFunction:
 
         storage = create_local_storage()
         assert storage.base_path == tmp_path
+
+
+class TestStreamingWrites:
+    """Chunked staging, early size abort, and content-addressed dedupe."""
+
+    def test_stage_hashes_while_spooling(self, storage: LocalFileStorage) -> None:
+        data = b"chunk" * 100_000
+
+        staged = storage.stage(BytesIO(data))
+
+        assert staged.size_bytes == len(data)
+        assert staged.sha256 == hashlib.sha256(data).hexdigest()
+        assert staged.path.read_bytes() == data
+
+    def test_oversize_aborts_before_reading_everything(self, storage: LocalFileStorage) -> None:
+        source = BytesIO(b"x" * (10 * 1024 * 1024))
+
+        with pytest.raises(ObjectTooLargeError):
+            storage.stage(source, max_bytes=100)
+
+        assert source.tell() < 10 * 1024 * 1024
+        assert list((storage.base_path / "_staging").iterdir()) == []
+
+    def test_stage_integrity_mismatch_cleans_up(self, storage: LocalFileStorage) -> None:
+        with pytest.raises(IntegrityError):
+            storage.stage(BytesIO(b"data"), expected_sha256="0" * 64)
+
+        assert list((storage.base_path / "_staging").iterdir()) == []
+
+    def test_identical_content_stored_once(self, storage: LocalFileStorage) -> None:
+        data = b"same bytes"
+
+        storage.put("a/one", data, "text/plain")
+        storage.put("b/two", data, "text/plain")
+
+        one, _ = storage._key_to_paths("a/one")
+        two, _ = storage._key_to_paths("b/two")
+        assert one.stat().st_ino == two.stat().st_ino
+        blobs = list((storage.base_path / "_sha256").rglob("*"))
+        assert len([b for b in blobs if b.is_file()]) == 1
+
+    def test_commit_to_existing_key_discards_staged(self, storage: LocalFileStorage) -> None:
+        storage.put("taken", b"first", "text/plain")
+        staged = storage.stage(BytesIO(b"second"))
+
+        with pytest.raises(KeyExistsError):
+            storage.commit_staged(staged, "taken", "text/plain")
+
+        assert not staged.path.exists()
+        assert storage.get("taken")[0] == b"first"
+
+    def test_metadata_write_is_atomic(
+        self, storage: LocalFileStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def torn_dump(data: object, f: Any) -> None:
+            f.write('{"key": "torn"')
+            raise OSError("disk full")
+
+        monkeypatch.setattr(local_storage.json, "dump", torn_dump)
+        with pytest.raises(OSError, match="disk full"):
+            storage.put("torn", b"bytes", "text/plain")
+
+        # Neither a truncated metadata file nor the temp file is left behind
+        _, meta_path = storage._key_to_paths("torn")
+        assert not meta_path.exists()
+        assert list(meta_path.parent.glob("*.part")) == []
+
+    def test_delete_releases_blob_after_last_key(self, storage: LocalFileStorage) -> None:
+        data = b"shared"
+        stored = storage.put("k1", data, "text/plain")
+        storage.put("k2", data, "text/plain")
+        blob = storage.base_path / "_sha256" / stored.sha256[:2] / stored.sha256
+
+        storage.delete("k1")
+        assert blob.exists()
+        assert storage.get("k2")[0] == data
+
+        storage.delete("k2")
+        assert not blob.exists()
+
+
+class TestVerificationCache:
+    """Verified-hash cache: I3 is checked once per unchanged file."""
+
+    def test_repeat_reads_skip_hashing(self, storage: LocalFileStorage) -> None:
+        storage.put("k", b"payload", "text/plain")
+
+        for _ in range(3):
+            assert storage.get("k")[0] == b"payload"
+            handle, _ = storage.get_stream("k")
+            with handle:
+                assert handle.read() == b"payload"
+
+        stats = storage.integrity_stats()
+        assert stats.full_verifications == 0  # primed when the bytes were written
+        assert stats.cached_verifications == 6
+
+    def test_stat_change_forces_full_verification(self, tmp_path: Path) -> None:
+        cold = LocalFileStorage(tmp_path)
+        cold.put("k", b"payload", "text/plain")
+        storage = LocalFileStorage(tmp_path)
+
+        storage.get("k")
+        storage.get("k")
+        os.utime(storage._key_to_paths("k")[0], ns=(1, 1))
+        storage.get("k")
+
+        stats = storage.integrity_stats()
+        assert stats.full_verifications == 2
+        assert stats.cached_verifications == 1
+
+    def test_corrupt_stream_rejected(self, storage: LocalFileStorage) -> None:
+        storage.put("k", b"payload", "text/plain")
+        data_path, _ = storage._key_to_paths("k")
+        data_path.write_bytes(b"tampered!")
+
+        with pytest.raises(IntegrityError):
+            storage.get_stream("k")
+        assert storage.integrity_stats().failures == 1
+
+    def test_reverify_after_expiry(self, tmp_path: Path) -> None:
+        now = [0.0]
+        cache = VerifiedHashCache(reverify_after_seconds=60, clock=lambda: now[0])
+        storage = LocalFileStorage(tmp_path, verify_cache=cache)
+        storage.put("k", b"payload", "text/plain")
+
+        storage.get("k")
+        now[0] = 61
+        storage.get("k")
+
+        assert cache.stats().full_verifications == 1
+
+    def test_lru_bounded(self, tmp_path: Path) -> None:
+        storage = LocalFileStorage(tmp_path, verify_cache=VerifiedHashCache(max_entries=2))
+        for i in range(5):
+            storage.put(f"k{i}", f"data-{i}".encode(), "text/plain")
+
+        assert len(storage.verify_cache) == 2
+
+
+class TestIntegrityScrubber:
+    """Scrubber finds corruption the stat-keyed cache cannot see."""
+
+    def _silently_corrupt(self, storage: LocalFileStorage, key: str) -> None:
+        data_path, _ = storage._key_to_paths(key)
+        st = data_path.stat()
+        with open(data_path, "r+b") as f:
+            f.write(b"X")
+        os.utime(data_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    def test_scrub_reports_corrupt_objects(self, storage: LocalFileStorage) -> None:
+        for i in range(5):
+            storage.put(f"assets/{i}/v1", f"content-{i}".encode(), "text/plain")
+        self._silently_corrupt(storage, "assets/3/v1")
+
+        # Unchanged stat: the cached verification still stands
+        storage.get("assets/3/v1")
+
+        report = IntegrityScrubber(storage).run_pass()
+
+        assert report.checked == 5
+        assert report.corrupt == ["assets/3/v1"]
+        with pytest.raises(IntegrityError):
+            storage.get("assets/3/v1")
+
+    def test_scrub_is_incremental(self, storage: LocalFileStorage) -> None:
+        for i in range(5):
+            storage.put(f"k{i}", f"content-{i}".encode(), "text/plain")
+        scrubber = IntegrityScrubber(storage, batch_size=2)
+
+        reports = [scrubber.run_once() for _ in range(3)]
+
+        assert [r.checked for r in reports] == [2, 2, 1]
+        assert [r.completed_pass for r in reports] == [False, False, True]
+        assert scrubber.passes_completed == 1
+        assert storage.integrity_stats().full_verifications == 5
+
+    def test_corrupt_keys_cleared_when_restored(self, tmp_path: Path) -> None:
+        storage = LocalFileStorage(tmp_path, allow_delete=True)
+        storage.put("k", b"payload", "text/plain")
+        data_path, _ = storage._key_to_paths("k")
+        data_path.write_bytes(b"tampered")
+        scrubber = IntegrityScrubber(storage)
+
+        scrubber.run_pass()
+        assert scrubber.corrupt_keys == {"k"}
+
+        data_path.write_bytes(b"payload")
+        scrubber.run_pass()
+        assert scrubber.corrupt_keys == frozenset()